@@ -0,0 +1,703 @@
+#!/usr/bin/env python3
+
+"""
+Test Impact Analysis
+Selects and runs the tests affected by a change, so an implementation
+iteration gets feedback from the relevant tests before the whole suite runs.
+
+Test files are mapped to the source files they exercise through the
+repository's import graph, built from each file's import statements and
+re-parsed only when a file changes. When a previous run recorded coverage per
+test (``pytest --cov --cov-context=test``), its ``.coverage`` data adds tests
+that reach a file without importing it. Affected tests run first and the rest
+of the suite only runs once they pass. Runs are split by test file across
+parallel pytest processes, like pytest-xdist's ``--dist loadfile``, balanced
+with the durations saved per test by earlier runs.
+"""
+
+import ast
+import asyncio
+import configparser
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+import tomllib
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pytest_report import (
+    JUNIT_ARGS,
+    MAX_OUTPUT_CHARS,
+    FailureGroup,
+    TestOutcome,
+    group_failures,
+    read_junit_report,
+)
+from subprocess_io import kill_process_group, read_lines
+
+logger = logging.getLogger(__name__)
+
+EXCLUDED_DIRS = frozenset(
+    {"build", "dist", "node_modules", "venv", "__pycache__", "site-packages"}
+)
+# Changes to these files can affect any test
+SUITE_CONFIG_FILES = frozenset(
+    {"pyproject.toml", "setup.cfg", "setup.py", "pytest.ini", ".pytest.ini", "tox.ini"}
+)
+# Files pytest reads its configuration from, in the order it looks for them,
+# with their ini section; pyproject.toml uses [tool.pytest.ini_options]
+PYTEST_CONFIG_FILES = (
+    ("pytest.ini", "pytest"),
+    (".pytest.ini", "pytest"),
+    ("pyproject.toml", None),
+    ("tox.ini", "pytest"),
+    ("setup.cfg", "tool:pytest"),
+)
+COVERAGE_FILE = ".coverage"
+TIMINGS_FILE = Path(".pytest_cache") / "test_timings.json"
+DEFAULT_PYTEST_ARGS = ("-x", "--tb=long")
+# Assumed duration of a test file without recorded timings
+DEFAULT_FILE_SECONDS = 1.0
+# pytest exit code when a run collected no tests
+NO_TESTS_COLLECTED = 5
+
+
+def is_test_file(path: str) -> bool:
+    """Return whether a path is a pytest test file."""
+    name = os.path.basename(path)
+    return name.endswith(".py") and (
+        name.startswith("test_") or name.endswith("_test.py")
+    )
+
+
+def module_names(path: str) -> list[str]:
+    """Return the dotted names a Python file can be imported as.
+
+    Besides its full name from the repository root, a file can be imported
+    by any trailing part of it when a parent directory is on ``sys.path``,
+    as in src layouts and test suites that extend ``sys.path``.
+    """
+    parts = list(Path(path).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return [".".join(parts[start:]) for start in range(len(parts))]
+
+
+def _imported_names(tree: ast.AST, path: str) -> set[str]:
+    """Return the modules a file may import, including parent packages."""
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                package = list(Path(path).parent.parts)
+                package = package[: max(len(package) - node.level + 1, 0)]
+                base = ".".join(package + ([node.module] if node.module else []))
+            else:
+                base = node.module or ""
+            if base:
+                names.add(base)
+            # Imported names may be submodules rather than attributes
+            names.update(
+                f"{base}.{alias.name}" if base else alias.name
+                for alias in node.names
+                if alias.name != "*"
+            )
+    # Importing a module runs its parent packages' __init__ too
+    for name in list(names):
+        parts = name.split(".")
+        names.update(".".join(parts[:end]) for end in range(1, len(parts)))
+    return names
+
+
+class ImportGraph:
+    """Import relationships between the Python files of a repository."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        # Per file: the (mtime, size) it was parsed at and the names it imports
+        self._files: dict[str, tuple[tuple[int, int], set[str]]] = {}
+        # Per module name: the files importing it
+        self._importers: dict[str, set[str]] = {}
+
+    @property
+    def files(self) -> list[str]:
+        """Python files in the repository, relative to its root."""
+        return sorted(self._files)
+
+    def refresh(self) -> None:
+        """Parse new and modified files and forget deleted ones."""
+        seen = set()
+        for path in self._python_files():
+            relative = path.relative_to(self.root).as_posix()
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            seen.add(relative)
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = self._files.get(relative)
+            if cached is None or cached[0] != version:
+                self._files[relative] = (version, self._parse(path, relative))
+        for relative in set(self._files) - seen:
+            del self._files[relative]
+
+        importers: dict[str, set[str]] = defaultdict(set)
+        for relative, (_, names) in self._files.items():
+            for name in names:
+                importers[name].add(relative)
+        self._importers = importers
+
+    def _python_files(self) -> Iterator[Path]:
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [
+                name
+                for name in dirnames
+                if name not in EXCLUDED_DIRS and not name.startswith(".")
+            ]
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    yield Path(dirpath) / filename
+
+    @staticmethod
+    def _parse(path: Path, relative: str) -> set[str]:
+        try:
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+        except (SyntaxError, ValueError, OSError) as e:
+            # An unparsable file cannot be analyzed; changes to it still
+            # select the tests that import it
+            logger.debug(f"Skipping imports of {relative}: {e}")
+            return set()
+        return _imported_names(tree, relative)
+
+    def dependents(self, paths: set[str]) -> set[str]:
+        """Return the files that import any of ``paths``, directly or not.
+
+        Deleted files are matched by name, so their former importers are
+        included too.
+        """
+        found: set[str] = set()
+        pending = list(paths)
+        while pending:
+            path = pending.pop()
+            for name in module_names(path):
+                for importer in self._importers.get(name, ()):
+                    if importer not in found and importer not in paths:
+                        found.add(importer)
+                        pending.append(importer)
+        return found
+
+
+@dataclass
+class TestSelection:
+    """Test files affected by a change, and the rest of the suite."""
+
+    __test__ = False
+
+    affected: list[str]
+    remaining: list[str]
+
+
+@dataclass
+class TestRunResult:
+    """Outcome of running a set of test files."""
+
+    __test__ = False
+
+    test_files: list[str]
+    returncode: int
+    # Tails of pytest's output, for failures the reports cannot show
+    stdout: str
+    stderr: str
+    duration: float
+    # Per-test outcomes from the run's JUnit reports
+    outcomes: list[TestOutcome] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return self.returncode == 0
+
+    @property
+    def durations(self) -> dict[str, float]:
+        """Seconds per test node ID."""
+        return {outcome.node_id: outcome.duration for outcome in self.outcomes}
+
+    @property
+    def failures(self) -> list[FailureGroup]:
+        """Failing tests grouped by the error they failed with."""
+        return group_failures(self.outcomes)
+
+    def merge(self, other: "TestRunResult") -> "TestRunResult":
+        """Combine the results of two runs into one."""
+        return TestRunResult(
+            test_files=self.test_files + other.test_files,
+            returncode=self.returncode or other.returncode,
+            stdout="\n".join(filter(None, [self.stdout, other.stdout])),
+            stderr="\n".join(filter(None, [self.stderr, other.stderr])),
+            duration=self.duration + other.duration,
+            outcomes=self.outcomes + other.outcomes,
+        )
+
+
+class TestTimings:
+    """Per-test durations saved between runs to balance parallel runs."""
+
+    __test__ = False
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.tests: dict[str, float] = {}
+        try:
+            self.tests = json.loads(path.read_text())["tests"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        self._file_totals = self._totals()
+
+    def _totals(self) -> dict[str, float]:
+        totals: dict[str, float] = defaultdict(float)
+        for node_id, seconds in self.tests.items():
+            totals[node_id.split("::", 1)[0]] += seconds
+        return totals
+
+    def file_duration(self, test_file: str) -> float:
+        """Return the expected duration of a test file."""
+        return self._file_totals.get(test_file, DEFAULT_FILE_SECONDS)
+
+    def update(self, durations: dict[str, float]) -> None:
+        """Record new durations and save them."""
+        if not durations:
+            return
+        self.tests.update(durations)
+        self._file_totals = self._totals()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps({"tests": self.tests}, indent=1))
+        except OSError as e:
+            logger.warning(f"Could not save test timings to {self.path}: {e}")
+
+
+def plan_shards(
+    test_files: list[str], workers: int, timings: TestTimings
+) -> list[list[str]]:
+    """Split test files into shards with similar expected durations.
+
+    The longest files are placed first, each on the least loaded shard.
+    """
+    shards: list[list[str]] = [[] for _ in range(min(workers, len(test_files)))]
+    loads = [0.0] * len(shards)
+    for test_file in sorted(test_files, key=timings.file_duration, reverse=True):
+        shard = loads.index(min(loads))
+        shards[shard].append(test_file)
+        loads[shard] += timings.file_duration(test_file)
+    return shards
+
+
+async def changed_files(repo_path: str | Path) -> list[str] | None:
+    """Return the files changed in a git work tree, including untracked ones.
+
+    Returns:
+        Paths relative to the repository, or None if git cannot tell
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            "status",
+            "--porcelain",
+            "--untracked-files=all",
+            "-z",
+            cwd=repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    stdout, _ = await process.communicate()
+    if process.returncode != 0:
+        return None
+
+    paths = []
+    entries = iter(stdout.decode(errors="replace").split("\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        paths.append(entry[3:])
+        if entry[0] in "RC":
+            # Renames and copies are followed by the original path
+            paths.append(next(entries, ""))
+    return [path for path in paths if path]
+
+
+class TestImpactAnalyzer:
+    """Maps changed files to the test files they affect."""
+
+    __test__ = False
+
+    def __init__(self, repo_path: str | Path):
+        self.root = Path(repo_path).resolve()
+        self.graph = ImportGraph(self.root)
+        self._coverage: tuple[float, dict[str, set[str]]] | None = None
+
+    def test_files(self) -> list[str]:
+        """Return the repository's test files within its configured testpaths."""
+        testpaths = self._testpaths()
+        return [
+            path
+            for path in self.graph.files
+            if is_test_file(path)
+            and (not testpaths or any(_within(path, test) for test in testpaths))
+        ]
+
+    def _testpaths(self) -> list[str]:
+        """Return pytest's configured testpaths, or [] if not configured.
+
+        Like pytest, only the first file that configures pytest is used, even
+        if it sets no testpaths.
+        """
+        for name, section in PYTEST_CONFIG_FILES:
+            options = _pytest_options(self.root / name, section)
+            if options is None:
+                continue
+            testpaths = options.get("testpaths", [])
+            if isinstance(testpaths, str):
+                testpaths = testpaths.split()
+            return [str(path).rstrip("/") for path in testpaths]
+        return []
+
+    def coverage_tests(self) -> dict[str, set[str]]:
+        """Return the test files that covered each source file in the last run.
+
+        Only available when that run recorded per-test contexts.
+        """
+        path = self.root / COVERAGE_FILE
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return {}
+        if self._coverage is not None and self._coverage[0] == mtime:
+            return self._coverage[1]
+
+        tests: dict[str, set[str]] = defaultdict(set)
+        try:
+            with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as db:
+                for table in ("line_bits", "arc"):
+                    try:
+                        rows = db.execute(
+                            f"SELECT DISTINCT file.path, context.context FROM {table}"
+                            f" JOIN file ON file.id = {table}.file_id"
+                            f" JOIN context ON context.id = {table}.context_id"
+                        ).fetchall()
+                    except sqlite3.OperationalError:
+                        continue
+                    for source, context in rows:
+                        # pytest-cov names contexts "<test node ID>|<phase>"
+                        if "::" not in context:
+                            continue
+                        try:
+                            source = (
+                                Path(source).resolve().relative_to(self.root).as_posix()
+                            )
+                        except ValueError:
+                            continue
+                        tests[source].add(context.split("::", 1)[0])
+        except sqlite3.Error as e:
+            logger.debug(f"Could not read coverage data from {path}: {e}")
+        self._coverage = (mtime, tests)
+        return tests
+
+    def select(self, changed: list[str] | None) -> TestSelection:
+        """Split the test suite into tests affected by a change and the rest.
+
+        Args:
+            changed: Changed files relative to the repository, or None if
+                the changes are not known and every test is affected
+
+        Returns:
+            Affected and remaining test files, each sorted
+        """
+        self.graph.refresh()
+        all_tests = self.test_files()
+        if changed is None or any(
+            os.path.basename(path) in SUITE_CONFIG_FILES for path in changed
+        ):
+            return TestSelection(affected=all_tests, remaining=[])
+
+        changed_python = {path for path in changed if path.endswith(".py")}
+        affected = changed_python | self.graph.dependents(changed_python)
+        coverage = self.coverage_tests()
+        for path in changed:
+            affected |= coverage.get(path, set())
+            # Fixtures from a conftest reach tests without being imported
+            if os.path.basename(path) == "conftest.py":
+                directory = os.path.dirname(path)
+                affected.update(test for test in all_tests if _within(test, directory))
+
+        selected = [test for test in all_tests if test in affected]
+        return TestSelection(
+            affected=selected,
+            remaining=[test for test in all_tests if test not in affected],
+        )
+
+
+_analyzers: dict[Path, TestImpactAnalyzer] = {}
+
+
+def get_analyzer(repo_path: str | Path) -> TestImpactAnalyzer:
+    """Return the shared analyzer for a repository.
+
+    Sharing it means later selections only re-parse the files that changed.
+    """
+    root = Path(repo_path).resolve()
+    if root not in _analyzers:
+        _analyzers[root] = TestImpactAnalyzer(root)
+    return _analyzers[root]
+
+
+async def _read_tail(stream: asyncio.StreamReader | None) -> str:
+    """Read a stream to its end, keeping only the last MAX_OUTPUT_CHARS."""
+    if stream is None:
+        return ""
+    tail = ""
+    dropped = 0
+    async for line in read_lines(stream, keepends=True):
+        tail += line.decode(errors="replace")
+        if len(tail) > MAX_OUTPUT_CHARS:
+            dropped += len(tail) - MAX_OUTPUT_CHARS
+            tail = tail[-MAX_OUTPUT_CHARS:]
+    return f"[{dropped} characters truncated]\n{tail}" if dropped else tail
+
+
+def _pytest_options(path: Path, section: str | None) -> dict | None:
+    """Return the pytest options in a config file, or None if it has none.
+
+    A pytest.ini file configures pytest even without a [pytest] section.
+    """
+    if section is None:
+        try:
+            with open(path, "rb") as f:
+                options = tomllib.load(f)["tool"]["pytest"]["ini_options"]
+        except (OSError, tomllib.TOMLDecodeError, KeyError, TypeError):
+            return None
+        return options if isinstance(options, dict) else None
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        if not parser.read(path):
+            return None
+    except configparser.Error:
+        return None
+    if parser.has_section(section):
+        return dict(parser[section])
+    return {} if path.name.endswith("pytest.ini") else None
+
+
+def _within(path: str, directory: str) -> bool:
+    return not directory or directory == "." or path.startswith(directory + "/")
+
+
+class TestImpactRunner:
+    """Runs affected tests first and the rest of the suite once they pass."""
+
+    __test__ = False
+
+    def __init__(
+        self,
+        repo_path: str | Path,
+        workers: int | None = None,
+        pytest_args: tuple[str, ...] = DEFAULT_PYTEST_ARGS,
+        timings_path: Path | None = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            repo_path: Repository the tests run in
+            workers: Parallel pytest processes; defaults to the CPU count
+            pytest_args: Arguments passed to every pytest process
+            timings_path: File the per-test durations are saved to
+        """
+        self.analyzer = get_analyzer(repo_path)
+        self.root = self.analyzer.root
+        self.workers = workers or os.cpu_count() or 1
+        self.pytest_args = pytest_args
+        self.timings = TestTimings(timings_path or self.root / TIMINGS_FILE)
+
+    async def run(
+        self, test_files: list[str], timeout: float | None = None
+    ) -> TestRunResult:
+        """Run test files across parallel pytest processes.
+
+        When there are several processes, each writes its coverage data, such
+        as from ``--cov`` in the repository's addopts, to its own temporary
+        file, since processes sharing ``.coverage`` corrupt it. Their data is
+        then combined into the repository's ``.coverage``, which later
+        selections read.
+
+        Args:
+            test_files: Test files relative to the repository
+            timeout: Seconds the whole run may take
+
+        Returns:
+            The combined result; a timed-out run has return code -1
+        """
+        start = time.time()
+        shards = plan_shards(test_files, self.workers, self.timings)
+        if not shards:
+            return TestRunResult(test_files, 0, "", "", 0.0)
+        logger.info(f"Running {len(test_files)} test files in {len(shards)} processes")
+
+        with tempfile.TemporaryDirectory(prefix="test-impact-") as reports:
+            tasks = [
+                asyncio.create_task(
+                    self._run_shard(
+                        shard,
+                        Path(reports) / f"shard-{index}.xml",
+                        Path(reports) / f"shard-{index}.coverage"
+                        if len(shards) > 1
+                        else None,
+                    )
+                )
+                for index, shard in enumerate(shards)
+            ]
+            try:
+                shard_results = await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+            except TimeoutError:
+                return TestRunResult(
+                    test_files,
+                    -1,
+                    "",
+                    f"Tests timed out after {timeout} seconds",
+                    time.time() - start,
+                )
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            outcomes = [
+                outcome
+                for index in range(len(shards))
+                for outcome in read_junit_report(Path(reports) / f"shard-{index}.xml")
+            ]
+            # Coverage run with parallel = true adds a suffix to the file names
+            await self._combine_coverage(
+                sorted(Path(reports).glob("shard-*.coverage*"))
+            )
+
+        self.timings.update({outcome.node_id: outcome.duration for outcome in outcomes})
+        failed = [code for code, _, _ in shard_results if code != 0]
+        return TestRunResult(
+            test_files=test_files,
+            returncode=failed[0] if failed else 0,
+            stdout="\n".join(stdout for _, stdout, _ in shard_results),
+            stderr="\n".join(filter(None, (stderr for _, _, stderr in shard_results))),
+            duration=time.time() - start,
+            outcomes=outcomes,
+        )
+
+    async def _run_shard(
+        self, test_files: list[str], report: Path, coverage_file: Path | None = None
+    ) -> tuple[int, str, str]:
+        """Run one pytest process.
+
+        Only the tails of its output are kept; the report has the details.
+
+        Args:
+            test_files: Test files the process runs
+            report: JUnit XML report the process writes
+            coverage_file: Coverage data file for the process, instead of the
+                repository's
+
+        Returns:
+            The return code and the tails of stdout and stderr
+        """
+        process = await asyncio.create_subprocess_exec(
+            "python",
+            "-m",
+            "pytest",
+            *self.pytest_args,
+            f"--junitxml={report}",
+            *JUNIT_ARGS,
+            "--",
+            *test_files,
+            cwd=self.root,
+            env=None
+            if coverage_file is None
+            else {**os.environ, "COVERAGE_FILE": str(coverage_file)},
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = await asyncio.gather(
+                _read_tail(process.stdout), _read_tail(process.stderr)
+            )
+            await process.wait()
+        finally:
+            await kill_process_group(process)
+        returncode = process.returncode or 0
+        if returncode == NO_TESTS_COLLECTED:
+            returncode = 0
+        return returncode, stdout, stderr
+
+    async def _combine_coverage(self, data_files: list[Path]) -> None:
+        """Add the shards' coverage data to the repository's ``.coverage``.
+
+        The data is appended, so tests that did not run keep the contexts
+        recorded for them by earlier runs.
+        """
+        if not data_files:
+            return
+        process = await asyncio.create_subprocess_exec(
+            "python",
+            "-m",
+            "coverage",
+            "combine",
+            "--append",
+            "--quiet",
+            *map(str, data_files),
+            cwd=self.root,
+            env={**os.environ, "COVERAGE_FILE": str(self.root / COVERAGE_FILE)},
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        try:
+            _, stderr = await process.communicate()
+        finally:
+            await kill_process_group(process)
+        if process.returncode != 0:
+            logger.warning(
+                f"Could not combine coverage data: {stderr.decode(errors='replace')}"
+            )
+
+    async def run_affected_first(
+        self, changed: list[str] | None, timeout: float | None = None
+    ) -> tuple[TestSelection, TestRunResult, TestRunResult | None]:
+        """Run the tests affected by a change, then the rest if they pass.
+
+        Failing affected tests are returned without running the rest of the
+        suite, so a broken change is reported as soon as its own tests fail.
+
+        Args:
+            changed: Changed files relative to the repository, or None if
+                the changes are not known and every test is affected
+            timeout: Seconds each of the two runs may take
+
+        Returns:
+            The selection, the result of the affected tests and the result
+            of the remaining tests, or None if they did not run
+        """
+        selection = self.analyzer.select(changed)
+        logger.info(
+            f"{len(selection.affected)} test files affected by the change, "
+            f"{len(selection.remaining)} remaining"
+        )
+        result = await self.run(selection.affected, timeout)
+        remaining = None
+        if result.passed and selection.remaining:
+            remaining = await self.run(selection.remaining, timeout)
+        return selection, result, remaining
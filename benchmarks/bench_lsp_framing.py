@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+"""
+LSP Framing Micro-benchmark
+Compares the buffered LSPFrameDecoder against the previous line-by-line header
+reader on large textDocument/references payloads.
+
+Usage:
+    python -m benchmarks.bench_lsp_framing --references 20000 --iterations 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import patch
+
+import lsp_jsonrpc
+from lsp_jsonrpc import LSPStreamReader, encode_lsp_message
+
+
+def build_references_response(count: int) -> dict[str, Any]:
+    """Build a textDocument/references response with ``count`` locations."""
+    return {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "result": [
+            {
+                "uri": f"file:///workspace/pkg/module_{i % 500}/file_{i}.py",
+                "range": {
+                    "start": {"line": i % 4000, "character": 8},
+                    "end": {"line": i % 4000, "character": 24},
+                },
+            }
+            for i in range(count)
+        ],
+    }
+
+
+async def _read_legacy(stream: asyncio.StreamReader) -> dict[str, Any]:
+    """Previous SimpleLSPClient._read_response: readline headers, str decode."""
+    headers = {}
+    while True:
+        line = await stream.readline()
+        line_str = line.decode().strip()
+        if not line_str:
+            break
+        key, value = line_str.split(":", 1)
+        headers[key.strip()] = value.strip()
+
+    content_bytes = await stream.readexactly(int(headers["Content-Length"]))
+    return json.loads(content_bytes.decode())
+
+
+async def _read_buffered(stream: asyncio.StreamReader) -> dict[str, Any]:
+    return await LSPStreamReader(stream).read_message()
+
+
+async def _time_reader(reader: Any, payload: bytes, iterations: int) -> float:
+    """Return the mean seconds per message for ``reader`` over ``payload``."""
+    elapsed = 0.0
+    for _ in range(iterations):
+        stream = asyncio.StreamReader(limit=len(payload) + 1)
+        stream.feed_data(payload)
+        stream.feed_eof()
+        start = time.perf_counter()
+        await reader(stream)
+        elapsed += time.perf_counter() - start
+    return elapsed / iterations
+
+
+def run_benchmark(references: int, iterations: int) -> dict[str, float]:
+    """Run every reader variant and return mean milliseconds per message."""
+    payload = encode_lsp_message(build_references_response(references))
+    results = {
+        "legacy_readline": asyncio.run(_time_reader(_read_legacy, payload, iterations))
+    }
+
+    with patch.object(lsp_jsonrpc, "orjson", None):
+        results["buffered_stdlib_json"] = asyncio.run(
+            _time_reader(_read_buffered, payload, iterations)
+        )
+
+    if lsp_jsonrpc.orjson is not None:
+        results["buffered_orjson"] = asyncio.run(
+            _time_reader(_read_buffered, payload, iterations)
+        )
+
+    return {name: seconds * 1000 for name, seconds in results.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark LSP message framing")
+    parser.add_argument(
+        "--references", type=int, default=20000, help="Locations per response"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=20, help="Messages decoded per variant"
+    )
+    args = parser.parse_args()
+
+    payload_size = len(encode_lsp_message(build_references_response(args.references)))
+    print(f"Payload: {args.references} references, {payload_size / 1024:.0f} KiB")
+
+    results = run_benchmark(args.references, args.iterations)
+    baseline = results["legacy_readline"]
+    for name, millis in results.items():
+        print(f"{name:24} {millis:8.2f} ms/msg  ({baseline / millis:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
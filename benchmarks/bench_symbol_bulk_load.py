@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""
+Symbol Bulk-Load Benchmark
+Compares re-indexing a repository through per-file insert_symbols calls against
+the staged rebuild_repository swap, on a database that already holds the
+repository plus a second one.
+
+Usage:
+    python -m benchmarks.bench_symbol_bulk_load --symbols 500000 --per-file 50
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from symbol_storage import SQLiteSymbolStorage, Symbol, SymbolKind
+
+KINDS = [SymbolKind.FUNCTION, SymbolKind.CLASS, SymbolKind.METHOD]
+
+
+def generate_file_batches(
+    repository_id: str, symbols: int, per_file: int
+) -> Iterator[list[Symbol]]:
+    """Yield synthetic per-file symbol batches totalling ``symbols`` rows."""
+    for file_index, start in enumerate(range(0, symbols, per_file)):
+        file_path = f"pkg/module_{file_index % 200}/file_{file_index}.py"
+        yield [
+            Symbol(
+                name=f"symbol_{i:08d}_{i % 97}",
+                kind=KINDS[i % len(KINDS)],
+                file_path=file_path,
+                line_number=i - start + 1,
+                column_number=4,
+                repository_id=repository_id,
+                docstring="Synthetic symbol" if i % 3 == 0 else None,
+            )
+            for i in range(start, min(start + per_file, symbols))
+        ]
+
+
+def reindex_per_file(
+    storage: SQLiteSymbolStorage, repository_id: str, symbols: int, per_file: int
+) -> None:
+    """Previous indexing path: clear the repository, then insert file by file."""
+    storage.delete_symbols_by_repository(repository_id)
+    for batch in generate_file_batches(repository_id, symbols, per_file):
+        storage.insert_symbols(batch)
+
+
+def reindex_staged(
+    storage: SQLiteSymbolStorage, repository_id: str, symbols: int, per_file: int
+) -> None:
+    """Staged path: load into the unindexed staging table, then swap."""
+    with storage.rebuild_repository(repository_id) as store_symbols:
+        for batch in generate_file_batches(repository_id, symbols, per_file):
+            store_symbols(batch)
+
+
+def _time_variant(reindex, db_path: Path, symbols: int, per_file: int) -> float:
+    """Seed a database and return the seconds taken to re-index one repository."""
+    storage = SQLiteSymbolStorage(db_path)
+    try:
+        for repository_id in ("bench-repo", "other-repo"):
+            reindex_staged(storage, repository_id, symbols // 2, per_file)
+
+        start = time.perf_counter()
+        reindex(storage, "bench-repo", symbols, per_file)
+        return time.perf_counter() - start
+    finally:
+        storage.close()
+
+
+def run_benchmark(symbols: int, per_file: int) -> dict[str, float]:
+    """Run both variants and return the rows per second each achieved."""
+    variants = {"per_file_insert": reindex_per_file, "staged_swap": reindex_staged}
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, reindex in variants.items():
+            seconds = _time_variant(
+                reindex, Path(temp_dir) / f"{name}.db", symbols, per_file
+            )
+            results[name] = symbols / seconds
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark symbol bulk loading")
+    parser.add_argument(
+        "--symbols", type=int, default=500000, help="Symbols in the re-indexed repo"
+    )
+    parser.add_argument(
+        "--per-file", type=int, default=50, help="Symbols inserted per file batch"
+    )
+    args = parser.parse_args()
+
+    print(f"Re-indexing {args.symbols} symbols in batches of {args.per_file}")
+    results = run_benchmark(args.symbols, args.per_file)
+    baseline = results["per_file_insert"]
+    for name, rows_per_second in results.items():
+        print(
+            f"{name:24} {rows_per_second:10.0f} rows/s  "
+            f"({rows_per_second / baseline:4.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
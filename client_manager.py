@@ -10,6 +10,8 @@ Design Focus:
 - Graceful vs forced disconnection strategies
 - Client notification and timeout handling
 - Connection state validation and cleanup
+- Concurrent broadcasts through bounded per-client send queues, so a slow
+  client neither delays the others nor buffers without limit
 """
 
 import asyncio
@@ -22,8 +24,14 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from metrics import Histogram
 from system_utils import SystemMonitor
 
+# Notifications waiting to be written to one client before it counts as slow
+DEFAULT_SEND_QUEUE_SIZE = 100
+# Longest a single write to a client may take
+DEFAULT_SEND_TIMEOUT_SECONDS = 5.0
+
 
 class ClientState(Enum):
     """Client connection states"""
@@ -45,6 +53,13 @@ class DisconnectionReason(Enum):
     PROTOCOL_VIOLATION = "protocol_violation"
 
 
+class SlowClientPolicy(Enum):
+    """What a broadcast does when a client's send queue is full"""
+
+    DROP = "drop"
+    DISCONNECT = "disconnect"
+
+
 @dataclass
 class ClientInfo:
     """Information about a connected client"""
@@ -59,6 +74,8 @@ class ClientInfo:
     bytes_sent: int
     bytes_received: int
     error_count: int
+    # Notifications discarded because the send queue was full
+    dropped_messages: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for status reporting"""
@@ -73,14 +90,27 @@ class ClientInfo:
             "bytes_sent": self.bytes_sent,
             "bytes_received": self.bytes_received,
             "error_count": self.error_count,
+            "dropped_messages": self.dropped_messages,
             "uptime": time.time() - self.connection_time,
         }
 
 
 class MCPClient:
-    """Represents an MCP client connection"""
+    """Represents an MCP client connection
+
+    Notifications are written in order by a sender task draining a bounded
+    queue, so callers never wait on the transport and a client that stops
+    reading can only hold ``send_queue_size`` messages.
+    """
 
-    def __init__(self, client_id: str, transport, logger: logging.Logger):
+    def __init__(
+        self,
+        client_id: str,
+        transport,
+        logger: logging.Logger,
+        send_queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT_SECONDS,
+    ):
         self.client_id = client_id
         self.transport = transport
         self.logger = logger
@@ -98,6 +128,11 @@ class MCPClient:
         )
         self._disconnect_callbacks: list[Callable] = []
         self._lock = threading.Lock()
+        self.send_timeout = send_timeout
+        self._send_queue: asyncio.Queue[
+            tuple[str, asyncio.Future[bool]]
+        ] = asyncio.Queue(maxsize=send_queue_size)
+        self._sender: asyncio.Task[None] | None = None
 
     def add_disconnect_callback(self, callback: Callable) -> None:
         """Add callback to be called on disconnect"""
@@ -129,6 +164,11 @@ class MCPClient:
         with self._lock:
             self.info.bytes_received += count
 
+    def increment_dropped(self) -> None:
+        """Increment dropped message counter"""
+        with self._lock:
+            self.info.dropped_messages += 1
+
     def increment_errors(self) -> None:
         """Increment error counter"""
         with self._lock:
@@ -143,17 +183,56 @@ class MCPClient:
                 f"Client {self.client_id} state: {old_state.value} → {state.value}"
             )
 
-    async def send_notification(self, method: str, params: dict[str, Any]) -> bool:
-        """Send MCP notification to client"""
+    @property
+    def queued_messages(self) -> int:
+        """Number of notifications waiting to be written"""
+        return self._send_queue.qsize()
+
+    def queue_notification(
+        self, method: str, params: dict[str, Any]
+    ) -> asyncio.Future[bool] | None:
+        """Queue an MCP notification without waiting for it to be written
+
+        Returns:
+            Future resolving to whether the write succeeded, or None if the
+            send queue is full and the notification was dropped
+        """
+        message = {"jsonrpc": "2.0", "method": method, "params": params}
+        return self._queue_message(json.dumps(message))
+
+    def _queue_message(self, message_str: str) -> asyncio.Future[bool] | None:
+        delivered: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
         try:
-            message = {"jsonrpc": "2.0", "method": method, "params": params}
-            message_str = json.dumps(message)
+            self._send_queue.put_nowait((message_str, delivered))
+        except asyncio.QueueFull:
+            self.increment_dropped()
+            return None
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(
+                self._drain_send_queue(), name=f"mcp-client-send-{self.client_id}"
+            )
+        return delivered
 
+    async def _drain_send_queue(self) -> None:
+        """Write queued messages in order; exits once the queue is empty"""
+        while not self._send_queue.empty():
+            message_str, delivered = self._send_queue.get_nowait()
+            success = False
+            try:
+                success = await self._write_message(message_str)
+            finally:
+                if not delivered.done():
+                    delivered.set_result(success)
+
+    async def _write_message(self, message_str: str) -> bool:
+        try:
             if hasattr(self.transport, "write"):
                 self.transport.write(message_str.encode() + b"\n")
-                await self.transport.drain()
+                await asyncio.wait_for(self.transport.drain(), self.send_timeout)
             elif hasattr(self.transport, "send"):
-                await self.transport.send(message_str)
+                await asyncio.wait_for(
+                    self.transport.send(message_str), self.send_timeout
+                )
             else:
                 self.logger.warning(
                     f"Unknown transport type for client {self.client_id}"
@@ -164,6 +243,13 @@ class MCPClient:
             self.update_activity()
             return True
 
+        except TimeoutError:
+            self.logger.warning(
+                f"Notification to client {self.client_id} timed out after "
+                f"{self.send_timeout}s"
+            )
+            self.increment_errors()
+            return False
         except Exception as e:
             self.logger.error(
                 f"Failed to send notification to client {self.client_id}: {e}"
@@ -171,6 +257,25 @@ class MCPClient:
             self.increment_errors()
             return False
 
+    def _fail_queued_messages(self) -> None:
+        """Resolve every queued notification as undelivered"""
+        if self._sender is not None and not self._sender.done():
+            self._sender.cancel()
+        while not self._send_queue.empty():
+            _, delivered = self._send_queue.get_nowait()
+            if not delivered.done():
+                delivered.set_result(False)
+
+    async def send_notification(self, method: str, params: dict[str, Any]) -> bool:
+        """Send MCP notification to client, after any already queued"""
+        delivered = self.queue_notification(method, params)
+        if delivered is None:
+            self.logger.warning(
+                f"Send queue full for client {self.client_id}, notification dropped"
+            )
+            return False
+        return await delivered
+
     async def send_shutdown_notification(
         self, reason: DisconnectionReason, grace_period: float
     ) -> bool:
@@ -188,6 +293,7 @@ class MCPClient:
         """Close the client connection"""
         try:
             self.set_state(ClientState.DISCONNECTING)
+            self._fail_queued_messages()
 
             # Call disconnect callbacks
             for callback in self._disconnect_callbacks:
@@ -219,14 +325,34 @@ class MCPClient:
 class ClientConnectionManager:
     """Manages all MCP client connections throughout their lifecycle"""
 
-    def __init__(self, logger: logging.Logger):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        send_queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT_SECONDS,
+        slow_client_policy: SlowClientPolicy = SlowClientPolicy.DROP,
+    ):
         self.logger = logger
+        self.send_queue_size = send_queue_size
+        self.send_timeout = send_timeout
+        self.slow_client_policy = slow_client_policy
         self._clients: dict[str, MCPClient] = {}
         self._client_groups: dict[str, set[str]] = {}  # Group name -> client IDs
         self._shutdown_in_progress = False
         self._closed = False
         self._lock = threading.Lock()
         self._system_monitor = SystemMonitor()
+        # Broadcast delivery statistics
+        self._delivery_latency = Histogram(
+            "mcp_client_delivery_seconds", "Broadcast delivery latency"
+        )
+        self._delivery_counts = {
+            "delivered": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "dropped": 0,
+            "slow_disconnects": 0,
+        }
 
     def add_client(
         self,
@@ -246,7 +372,13 @@ class ClientConnectionManager:
                 self.logger.warning(f"Client {client_id} already exists")
                 return self._clients[client_id]
 
-            client = MCPClient(client_id, transport, self.logger)
+            client = MCPClient(
+                client_id,
+                transport,
+                self.logger,
+                send_queue_size=self.send_queue_size,
+                send_timeout=self.send_timeout,
+            )
             client.info.protocol_version = protocol_version
             client.info.capabilities = capabilities or {}
             client.set_state(ClientState.CONNECTED)
@@ -304,21 +436,100 @@ class ClientConnectionManager:
             return list(self._clients.values())
 
     async def broadcast_notification(
-        self, method: str, params: dict[str, Any], group: str | None = None
+        self,
+        method: str,
+        params: dict[str, Any],
+        group: str | None = None,
+        timeout: float | None = None,
     ) -> dict[str, bool]:
-        """Broadcast notification to clients"""
+        """Broadcast notification to clients concurrently
+
+        The notification is queued for every client at once and delivered by
+        each client's sender, so a slow client does not delay the others.
+
+        Args:
+            method: Notification method
+            params: Notification parameters
+            group: Only notify clients in this group
+            timeout: Longest to wait for deliveries, defaults to the send
+                timeout; late deliveries still complete in the background
+
+        Returns:
+            Whether each client received the notification within the timeout
+        """
         if group:
             clients = self.get_clients_by_group(group)
         else:
             clients = self.get_all_clients()
 
-        results = {}
+        message_str = json.dumps({"jsonrpc": "2.0", "method": method, "params": params})
+        start = time.perf_counter()
+        results: dict[str, bool] = {}
+        pending: dict[asyncio.Future[bool], str] = {}
+        # Deliveries already counted as timed out when they complete later
+        timed_out: set[asyncio.Future[bool]] = set()
+        slow_clients = []
         for client in clients:
-            success = await client.send_notification(method, params)
-            results[client.client_id] = success
+            delivered = client._queue_message(message_str)
+            if delivered is None:
+                results[client.client_id] = False
+                self._count_delivery("dropped")
+                slow_clients.append(client)
+                continue
+            delivered.add_done_callback(
+                lambda future: self._record_delivery(future, start, timed_out)
+            )
+            pending[delivered] = client.client_id
+
+        if slow_clients:
+            self.logger.warning(
+                f"Send queues full for {len(slow_clients)} clients, "
+                f"{self.slow_client_policy.value} applied"
+            )
+            if self.slow_client_policy is SlowClientPolicy.DISCONNECT:
+                await asyncio.gather(
+                    *(self._disconnect_slow_client(client) for client in slow_clients)
+                )
+
+        if pending:
+            done, not_done = await asyncio.wait(
+                pending, timeout=self.send_timeout if timeout is None else timeout
+            )
+            for future in done:
+                results[pending[future]] = future.result()
+            for future in not_done:
+                results[pending[future]] = False
+                timed_out.add(future)
+                self._count_delivery("timed_out")
 
         return results
 
+    def _count_delivery(self, outcome: str) -> None:
+        with self._lock:
+            self._delivery_counts[outcome] += 1
+
+    def _record_delivery(
+        self,
+        delivered: asyncio.Future[bool],
+        start: float,
+        timed_out: set[asyncio.Future[bool]],
+    ) -> None:
+        """Record the outcome of one broadcast delivery"""
+        if delivered in timed_out:
+            timed_out.discard(delivered)
+            return
+        if delivered.cancelled() or not delivered.result():
+            self._count_delivery("failed")
+            return
+        self._count_delivery("delivered")
+        self._delivery_latency.observe(time.perf_counter() - start)
+
+    async def _disconnect_slow_client(self, client: MCPClient) -> None:
+        """Disconnect a client that is not keeping up with notifications"""
+        self._count_delivery("slow_disconnects")
+        await client.close_connection(DisconnectionReason.TIMEOUT)
+        self.remove_client(client.client_id, DisconnectionReason.TIMEOUT)
+
     async def graceful_shutdown(
         self, grace_period: float = 10.0, force_timeout: float = 5.0
     ) -> bool:
@@ -464,6 +675,7 @@ class ClientConnectionManager:
             total_bytes_received = 0
             total_pending_requests = 0
             total_errors = 0
+            total_queued_messages = 0
 
             for client in self._clients.values():
                 client_info = client.info.to_dict()
@@ -473,6 +685,7 @@ class ClientConnectionManager:
                 total_bytes_received += client.info.bytes_received
                 total_pending_requests += client.info.pending_requests
                 total_errors += client.info.error_count
+                total_queued_messages += client.queued_messages
 
             return {
                 "total_clients": len(self._clients),
@@ -487,9 +700,20 @@ class ClientConnectionManager:
                     "total_bytes_received": total_bytes_received,
                     "total_pending_requests": total_pending_requests,
                     "total_errors": total_errors,
+                    "total_queued_messages": total_queued_messages,
                 },
+                "delivery": self._delivery_status(),
             }
 
+    def _delivery_status(self) -> dict[str, Any]:
+        """Broadcast delivery counts and latency"""
+        latency = self._delivery_latency.summaries()
+        return {
+            **self._delivery_counts,
+            "slow_client_policy": self.slow_client_policy.value,
+            "latency_seconds": latency[0][1] if latency else None,
+        }
+
     def close(self) -> None:
         """Close the client manager (synchronous)"""
         self.logger.info("Closing client connection manager")
@@ -16,7 +16,8 @@ from typing import Any, ClassVar, Protocol
 
 from repository_manager import AbstractRepositoryManager
 from simple_lsp_client import SimpleLSPClient
-from symbol_storage import AbstractSymbolStorage
+from symbol_storage import AbstractSymbolStorage, AsyncSymbolStorage
+from tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,16 @@ class CodebaseTools:
 
         # SimpleLSPClient doesn't need caching - create fresh instances as needed
 
+    @property
+    def symbol_storage(self) -> AbstractSymbolStorage:
+        """Synchronous symbol storage backing the async facade."""
+        return self.async_symbol_storage.storage
+
+    @symbol_storage.setter
+    def symbol_storage(self, storage: AbstractSymbolStorage) -> None:
+        # Tool handlers run on the event loop, so they only use the async facade
+        self.async_symbol_storage = AsyncSymbolStorage(storage)
+
     def _user_friendly_to_lsp_position(self, line: int, column: int) -> dict:
         """Convert user-friendly (1-based) coordinates to LSP (0-based) coordinates."""
         return {
@@ -383,14 +394,15 @@ class CodebaseTools:
 
             # Get basic git info and check git responsiveness
             try:
-                result = subprocess.run(
-                    ["git", "rev-parse", "HEAD"],
-                    cwd=repository_workspace,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=10,
-                )
+                with tracer.span("git", "rev-parse"):
+                    result = subprocess.run(
+                        ["git", "rev-parse", "HEAD"],
+                        cwd=repository_workspace,
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                        timeout=10,
+                    )
                 current_commit = result.stdout.strip()
                 checks["git_responsive"] = True
                 checks["current_commit"] = current_commit
@@ -470,13 +482,14 @@ class CodebaseTools:
                     {"error": f"Repository '{repository_id}' not found", "symbols": []}
                 )
 
-            # Search symbols using symbol storage
-            symbols = self.symbol_storage.search_symbols(
-                repository_id=repository_id,
-                query=query,
-                symbol_kind=symbol_kind,
-                limit=limit,
-            )
+            # Search symbols off the event loop so slow queries don't stall it
+            with tracer.span("sqlite", "search_symbols"):
+                symbols = await self.async_symbol_storage.search_symbols(
+                    repository_id=repository_id,
+                    query=query,
+                    symbol_kind=symbol_kind,
+                    limit=limit,
+                )
 
             return json.dumps(
                 {
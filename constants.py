@@ -37,3 +37,6 @@ GITHUB_HTTPS_PREFIX = "https://github.com/"
 DATA_DIR = Path.home() / ".local" / "share" / "github-agent"
 LOGS_DIR = DATA_DIR / "logs"
 SYMBOLS_DB_PATH = DATA_DIR / "symbols.db"
+LLM_CACHE_DB_PATH = DATA_DIR / "llm_cache.db"
+LSP_CACHE_DIR = DATA_DIR / "lsp_cache"
+WORKER_SOCKETS_DIR = DATA_DIR / "sockets"
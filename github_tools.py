@@ -25,6 +25,7 @@ from repository_manager import (
     RepositoryConfig,
     RepositoryManager,
 )
+from tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,14 @@ logger = logging.getLogger(__name__)
 repo_manager: RepositoryManager | None = None
 
 
+def _github_request(
+    method: str, operation: str, url: str, **kwargs: Any
+) -> requests.Response:
+    """Call the GitHub REST API, timed as a ``github`` backend call"""
+    with tracer.span("github", operation, **{"http.method": method}):
+        return requests.request(method, url, **kwargs)
+
+
 def get_tools(repo_name: str, repo_path: str) -> list[dict]:
     """Get GitHub tool definitions for MCP registration
 
@@ -269,6 +278,7 @@ class GitHubAPIContext(AbstractGitHubAPIContext):
                 f"Failed to access GitHub repository {self.repo_name}: {e}"
             ) from e
 
+    @tracer.traced("git", "branch")
     def get_current_branch(self) -> str:
         """Get current branch name"""
         return (
@@ -279,6 +289,7 @@ class GitHubAPIContext(AbstractGitHubAPIContext):
             .strip()
         )
 
+    @tracer.traced("git", "rev-parse")
     def get_current_commit(self) -> str:
         """Get current commit hash"""
         return (
@@ -351,25 +362,32 @@ async def execute_find_pr_for_branch(repo_name: str, branch_name: str) -> str:
                 {"error": f"GitHub repository not configured for {repo_name}"}
             )
 
-        pulls = context.repo.get_pulls(state="all")
+        # PyGithub fetches pages lazily, so the whole scan is timed
+        with tracer.span("github", "find_pull_for_branch"):
+            pr = next(
+                (
+                    pull
+                    for pull in context.repo.get_pulls(state="all")
+                    if pull.head.ref == branch_name
+                ),
+                None,
+            )
 
-        # Look for matching branch
-        for pr in pulls:
-            if pr.head.ref == branch_name:
-                return json.dumps(
-                    {
-                        "found": True,
-                        "pr_number": pr.number,
-                        "title": pr.title,
-                        "state": pr.state,
-                        "url": pr.html_url,
-                        "author": pr.user.login,
-                        "base_branch": pr.base.ref,
-                        "head_branch": pr.head.ref,
-                        "repo": context.repo_name,
-                        "repo_config": repo_name,
-                    }
-                )
+        if pr is not None:
+            return json.dumps(
+                {
+                    "found": True,
+                    "pr_number": pr.number,
+                    "title": pr.title,
+                    "state": pr.state,
+                    "url": pr.html_url,
+                    "author": pr.user.login,
+                    "base_branch": pr.base.ref,
+                    "head_branch": pr.head.ref,
+                    "repo": context.repo_name,
+                    "repo_config": repo_name,
+                }
+            )
 
         return json.dumps(
             {
@@ -416,8 +434,11 @@ async def execute_get_pr_comments(repo_name: str, pr_number: int) -> str:
         pr_url = f"https://api.github.com/repos/{context.repo_name}/pulls/{pr_number}"
         logger.info(f"Making GitHub API call to get PR details: {pr_url}")
 
-        pr_response = requests.get(
-            pr_url, headers={"Authorization": f"token {context.github_token}"}
+        pr_response = _github_request(
+            "GET",
+            "get_pull",
+            pr_url,
+            headers={"Authorization": f"token {context.github_token}"},
         )
         logger.info(
             f"PR details API response: status={pr_response.status_code}, headers={dict(pr_response.headers)}"
@@ -438,8 +459,11 @@ async def execute_get_pr_comments(repo_name: str, pr_number: int) -> str:
         comments_url = pr_data["review_comments_url"]
         logger.info(f"Making GitHub API call to get review comments: {comments_url}")
 
-        comments_resp = requests.get(
-            comments_url, headers={"Authorization": f"token {context.github_token}"}
+        comments_resp = _github_request(
+            "GET",
+            "list_review_comments",
+            comments_url,
+            headers={"Authorization": f"token {context.github_token}"},
         )
         logger.info(
             f"Review comments API response: status={comments_resp.status_code}, headers={dict(comments_resp.headers)}"
@@ -460,7 +484,9 @@ async def execute_get_pr_comments(repo_name: str, pr_number: int) -> str:
             f"Making GitHub API call to get issue comments: {issue_comments_url}"
         )
 
-        issue_resp = requests.get(
+        issue_resp = _github_request(
+            "GET",
+            "list_issue_comments",
             issue_comments_url,
             headers={"Authorization": f"token {context.github_token}"},
         )
@@ -552,7 +578,9 @@ async def execute_post_pr_reply(repo_name: str, comment_id: int, message: str) -
 
         # Try to get original comment context
         comment_url = f"https://api.github.com/repos/{context.repo_name}/pulls/comments/{comment_id}"
-        comment_resp = requests.get(comment_url, headers=headers)
+        comment_resp = _github_request(
+            "GET", "get_comment", comment_url, headers=headers
+        )
 
         if comment_resp.status_code == 200:
             original_comment = comment_resp.json()
@@ -561,7 +589,9 @@ async def execute_post_pr_reply(repo_name: str, comment_id: int, message: str) -
         else:
             # Try as issue comment
             comment_url = f"https://api.github.com/repos/{context.repo_name}/issues/comments/{comment_id}"
-            comment_resp = requests.get(comment_url, headers=headers)
+            comment_resp = _github_request(
+                "GET", "get_comment", comment_url, headers=headers
+            )
             if comment_resp.status_code == 200:
                 original_comment = comment_resp.json()
                 issue_url = original_comment.get("issue_url", "")
@@ -577,7 +607,9 @@ async def execute_post_pr_reply(repo_name: str, comment_id: int, message: str) -
         try:
             reply_url = f"https://api.github.com/repos/{context.repo_name}/pulls/comments/{comment_id}/replies"
             reply_data = {"body": message}
-            reply_resp = requests.post(reply_url, headers=headers, json=reply_data)
+            reply_resp = _github_request(
+                "POST", "reply_to_comment", reply_url, headers=headers, json=reply_data
+            )
 
             if reply_resp.status_code in [200, 201]:
                 return json.dumps(
@@ -600,8 +632,12 @@ async def execute_post_pr_reply(repo_name: str, comment_id: int, message: str) -
                 issue_comment_data = {
                     "body": f"@{original_comment['user']['login']} {message}"
                 }
-                issue_resp = requests.post(
-                    issue_comment_url, headers=headers, json=issue_comment_data
+                issue_resp = _github_request(
+                    "POST",
+                    "create_issue_comment",
+                    issue_comment_url,
+                    headers=headers,
+                    json=issue_comment_data,
                 )
 
                 if issue_resp.status_code in [200, 201]:
@@ -676,7 +712,7 @@ async def get_artifact_id(
     """Get artifact ID for linter reports (supports both SwiftLint and Python linters)"""
     url = f"https://api.github.com/repos/{repo_name}/actions/runs/{run_id}/artifacts"
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(url, headers=headers)
+    response = _github_request("GET", "list_artifacts", url, headers=headers)
     logging.info(f"{response=}")
     response.raise_for_status()
 
@@ -806,7 +842,7 @@ async def download_and_extract_artifact(
         f"https://api.github.com/repos/{repo_name}/actions/artifacts/{artifact_id}/zip"
     )
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(url, headers=headers)
+    response = _github_request("GET", "download_artifact", url, headers=headers)
     response.raise_for_status()
 
     if extract_dir is None:
@@ -908,7 +944,9 @@ async def find_workflow_run(
     headers = {"Authorization": f"Bearer {token}"}
     params = {"head_sha": commit_sha}
 
-    response = requests.get(url, headers=headers, params=params)
+    response = _github_request(
+        "GET", "list_workflow_runs", url, headers=headers, params=params
+    )
     response.raise_for_status()
 
     runs_data = response.json()
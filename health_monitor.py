@@ -3,11 +3,17 @@ Health monitoring interface for MCP server shutdown verification.
 
 Provides external monitoring capabilities for process managers and monitoring
 systems to verify server status and shutdown progress.
+
+State is kept in memory and exposed as Prometheus metrics. The health file is
+rewritten only when the state changes, and the cheap resource counters are
+sampled at a configurable interval; the expensive scans of open files and
+connections run only when a report is written.
 """
 
 import json
 import os
 import threading
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -16,6 +22,11 @@ from typing import Any
 
 import psutil
 
+from metrics import MetricFamily, MetricsRegistry
+
+# How often memory and file descriptor counts are sampled
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 15.0
+
 
 class ServerStatus(Enum):
     """Server status states."""
@@ -96,9 +107,25 @@ class HealthReport:
 class HealthMonitor:
     """External health monitoring interface for the MCP server."""
 
-    def __init__(self, logger, health_file_path: str = "/tmp/mcp_server_health.json"):
+    def __init__(
+        self,
+        logger,
+        health_file_path: str = "/tmp/mcp_server_health.json",
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL_SECONDS,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            logger: Logger for status changes
+            health_file_path: File rewritten whenever the state changes
+            sample_interval: Seconds between resource samples
+            metrics: Registry to expose the state through; a private one is
+                created if not given
+        """
         self.logger = logger
         self.health_file_path = Path(health_file_path)
+        self.sample_interval = sample_interval
         self._status = ServerStatus.STARTING
         self._shutdown_phase = ShutdownPhase.NOT_STARTED
         self._start_time = datetime.now()
@@ -111,6 +138,16 @@ class HealthMonitor:
         self._lock = threading.RLock()
         self._monitoring_thread: threading.Thread | None = None
         self._should_monitor = True
+        # Set on every state change; wakes the thread to write the health file
+        self._changed = threading.Event()
+        self._changed.set()
+        self._process = psutil.Process()
+        self._open_fds = 0
+        self._errors_total = 0
+        self._warnings_total = 0
+        self._health_file_writes = 0
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.metrics.register_collector(self._collect_metrics)
 
         # Create health file directory
         self.health_file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -133,21 +170,31 @@ class HealthMonitor:
         self.logger.info("Health monitoring thread started")
 
     def _monitoring_loop(self):
-        """Main monitoring loop that runs in the background thread."""
-        import time
-
+        """Sample resources periodically and write the file on state changes."""
+        next_sample = 0.0
         while self._should_monitor:
             try:
-                # Update health status periodically
-                self._update_health_file()
-                time.sleep(1.0)  # Update every second
+                now = time.monotonic()
+                if now >= next_sample:
+                    self._sample_resources()
+                    next_sample = now + self.sample_interval
+                if self._changed.is_set():
+                    # Cleared first so changes made while writing are not lost
+                    self._changed.clear()
+                    self._update_health_file()
+                self._changed.wait(max(0.0, next_sample - time.monotonic()))
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
                 time.sleep(1.0)
 
+    def _mark_changed(self):
+        """Record a state change so the health file is rewritten."""
+        self._changed.set()
+
     def stop_monitoring(self):
         """Stop the health monitoring thread."""
         self._should_monitor = False
+        self._changed.set()
         if self._monitoring_thread and self._monitoring_thread.is_alive():
             self._monitoring_thread.join(timeout=2.0)
             if self._monitoring_thread.is_alive():
@@ -168,7 +215,7 @@ class HealthMonitor:
                 temp_file.parent.mkdir(parents=True, exist_ok=True)
 
                 with open(temp_file, "w") as f:
-                    json.dump(asdict(report), f, indent=2, default=str)
+                    json.dump(asdict(report), f, separators=(",", ":"), default=str)
 
                 # Verify temp file exists before moving
                 if not temp_file.exists():
@@ -177,6 +224,7 @@ class HealthMonitor:
                     )
 
                 temp_file.replace(self.health_file_path)
+                self._health_file_writes += 1
 
             except Exception as write_error:
                 # Clean up temp file if it exists
@@ -196,7 +244,8 @@ class HealthMonitor:
                 self.logger.info("Attempting direct health file write as fallback")
                 report = self._generate_health_report()
                 with open(self.health_file_path, "w") as f:
-                    json.dump(asdict(report), f, indent=2, default=str)
+                    json.dump(asdict(report), f, separators=(",", ":"), default=str)
+                self._health_file_writes += 1
                 self.logger.info("Direct health file write succeeded")
             except Exception as fallback_error:
                 self.logger.error(
@@ -239,8 +288,27 @@ class HealthMonitor:
                     warnings=[],
                 )
 
+    def _sample_resources(self):
+        """Sample the cheap per-process resource counters."""
+        try:
+            with self._process.oneshot():
+                rss = self._process.memory_info().rss
+                open_fds = (
+                    self._process.num_fds() if hasattr(self._process, "num_fds") else 0
+                )
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            self.logger.warning(f"Could not sample resources: {e}")
+            return
+        with self._lock:
+            self._resources.memory_usage_mb = rss / 1024 / 1024
+            self._open_fds = open_fds
+
     def _update_resource_status(self):
-        """Update resource status from system information."""
+        """Update resource status from system information.
+
+        Scans open files and connections, so it only runs when a report is
+        written.
+        """
         try:
             process = psutil.Process()
             memory_info = process.memory_info()
@@ -258,6 +326,8 @@ class HealthMonitor:
         with self._lock:
             old_status = self._status
             self._status = status
+            if status != old_status:
+                self._mark_changed()
             self.logger.info(
                 f"Server status changed: {old_status.value} -> {status.value}"
             )
@@ -267,6 +337,8 @@ class HealthMonitor:
         with self._lock:
             old_phase = self._shutdown_phase
             self._shutdown_phase = phase
+            if phase != old_phase:
+                self._mark_changed()
             self.logger.info(
                 f"Shutdown phase changed: {old_phase.value} -> {phase.value}"
             )
@@ -284,8 +356,11 @@ class HealthMonitor:
                     status=status,
                     last_seen=datetime.now(),
                 )
+                self._mark_changed()
             else:
                 worker = self._workers[worker_id]
+                if worker.pid != pid or worker.status != status:
+                    self._mark_changed()
                 worker.pid = pid
                 worker.status = status
                 worker.last_seen = datetime.now()
@@ -297,6 +372,7 @@ class HealthMonitor:
         with self._lock:
             if worker_id in self._workers:
                 self._workers[worker_id].shutdown_requested = True
+                self._mark_changed()
                 self.logger.debug(f"Worker {worker_id} shutdown requested")
 
     def set_worker_shutdown_completed(self, worker_id: str):
@@ -305,6 +381,7 @@ class HealthMonitor:
             if worker_id in self._workers:
                 self._workers[worker_id].shutdown_completed = True
                 self._workers[worker_id].status = "stopped"
+                self._mark_changed()
                 self.logger.debug(f"Worker {worker_id} shutdown completed")
 
     def add_client(self, client_id: str, worker_id: str):
@@ -316,10 +393,14 @@ class HealthMonitor:
                 connected_at=datetime.now(),
                 last_activity=datetime.now(),
             )
+            self._mark_changed()
             self.logger.debug(f"Client {client_id} connected to worker {worker_id}")
 
     def update_client_activity(self, client_id: str):
-        """Update client last activity time."""
+        """Update client last activity time.
+
+        Activity alone is not a state change and does not rewrite the file.
+        """
         with self._lock:
             if client_id in self._clients:
                 self._clients[client_id].last_activity = datetime.now()
@@ -329,6 +410,7 @@ class HealthMonitor:
         with self._lock:
             if client_id in self._clients:
                 self._clients[client_id].disconnect_requested = True
+                self._mark_changed()
                 self.logger.debug(f"Client {client_id} disconnect requested")
 
     def set_client_disconnected(self, client_id: str):
@@ -336,6 +418,7 @@ class HealthMonitor:
         with self._lock:
             if client_id in self._clients:
                 self._clients[client_id].disconnected = True
+                self._mark_changed()
                 self.logger.debug(f"Client {client_id} disconnected")
 
     def remove_client(self, client_id: str):
@@ -343,24 +426,28 @@ class HealthMonitor:
         with self._lock:
             if client_id in self._clients:
                 del self._clients[client_id]
+                self._mark_changed()
                 self.logger.debug(f"Client {client_id} removed from tracking")
 
     def set_resource_cleanup_requested(self):
         """Mark that resource cleanup was requested."""
         with self._lock:
             self._resources.cleanup_requested = True
+            self._mark_changed()
             self.logger.debug("Resource cleanup requested")
 
     def set_resource_cleanup_completed(self):
         """Mark that resource cleanup completed."""
         with self._lock:
             self._resources.cleanup_completed = True
+            self._mark_changed()
             self.logger.debug("Resource cleanup completed")
 
     def update_shutdown_progress(self, phase: str, progress: dict[str, Any]):
         """Update shutdown progress information."""
         with self._lock:
             self._shutdown_progress[phase] = {**progress, "timestamp": datetime.now()}
+            self._mark_changed()
             self.logger.debug(f"Shutdown progress updated for {phase}: {progress}")
 
     def add_error(self, error: str):
@@ -370,6 +457,8 @@ class HealthMonitor:
             self._errors.append(f"[{timestamp}] {error}")
             # Keep only last 20 errors
             self._errors = self._errors[-20:]
+            self._errors_total += 1
+            self._mark_changed()
             self.logger.error(f"Health monitor recorded error: {error}")
 
     def add_warning(self, warning: str):
@@ -379,6 +468,8 @@ class HealthMonitor:
             self._warnings.append(f"[{timestamp}] {warning}")
             # Keep only last 20 warnings
             self._warnings = self._warnings[-20:]
+            self._warnings_total += 1
+            self._mark_changed()
             self.logger.warning(f"Health monitor recorded warning: {warning}")
 
     def get_current_status(self) -> dict[str, Any]:
@@ -394,6 +485,63 @@ class HealthMonitor:
                 "uptime_seconds": (datetime.now() - self._start_time).total_seconds(),
             }
 
+    def render_metrics(self) -> str:
+        """Render the current state in the Prometheus text format."""
+        return self.metrics.render()
+
+    def _collect_metrics(self) -> list[MetricFamily]:
+        """Expose the in-memory state and the latest resource sample."""
+        status = MetricFamily("mcp_server_status", "gauge", "Current server status")
+        phase = MetricFamily("mcp_shutdown_phase", "gauge", "Current shutdown phase")
+        workers = MetricFamily("mcp_workers", "gauge", "Tracked workers by status")
+        clients = MetricFamily("mcp_clients", "gauge", "Connected clients")
+        errors = MetricFamily("mcp_errors_total", "counter", "Recorded errors")
+        warnings = MetricFamily("mcp_warnings_total", "counter", "Recorded warnings")
+        writes = MetricFamily(
+            "mcp_health_file_writes_total", "counter", "Health file rewrites"
+        )
+        uptime = MetricFamily("mcp_uptime_seconds", "gauge", "Seconds since start")
+        memory = MetricFamily(
+            "process_resident_memory_bytes", "gauge", "Sampled resident memory"
+        )
+        fds = MetricFamily("process_open_fds", "gauge", "Sampled open descriptors")
+        with self._lock:
+            for server_status in ServerStatus:
+                status.add(
+                    int(server_status == self._status), status=server_status.value
+                )
+            for shutdown_phase in ShutdownPhase:
+                phase.add(
+                    int(shutdown_phase == self._shutdown_phase),
+                    phase=shutdown_phase.value,
+                )
+            worker_counts: dict[str, int] = {}
+            for worker in self._workers.values():
+                worker_counts[worker.status] = worker_counts.get(worker.status, 0) + 1
+            for worker_status, count in sorted(worker_counts.items()):
+                workers.add(count, status=worker_status)
+            clients.add(
+                sum(not client.disconnected for client in self._clients.values())
+            )
+            errors.add(self._errors_total)
+            warnings.add(self._warnings_total)
+            writes.add(self._health_file_writes)
+            uptime.add((datetime.now() - self._start_time).total_seconds())
+            memory.add(self._resources.memory_usage_mb * 1024 * 1024)
+            fds.add(self._open_fds)
+        return [
+            status,
+            phase,
+            workers,
+            clients,
+            errors,
+            warnings,
+            writes,
+            uptime,
+            memory,
+            fds,
+        ]
+
     def is_shutdown_complete(self) -> bool:
         """Check if shutdown is complete."""
         with self._lock:
@@ -444,18 +592,31 @@ def read_health_status(
 
 
 def is_server_healthy(
-    health_file_path: str = "/tmp/mcp_server_health.json", max_age_seconds: float = 10.0
+    health_file_path: str = "/tmp/mcp_server_health.json",
+    max_age_seconds: float | None = None,
 ) -> bool:
-    """Check if server is healthy based on health file."""
+    """Check if server is healthy based on health file.
+
+    The file is only rewritten on state changes, so an old report is not
+    stale by itself; instead the process that wrote it must still be alive.
+
+    Args:
+        health_file_path: Health file written by the server
+        max_age_seconds: Also reject reports older than this many seconds
+    """
     health = read_health_status(health_file_path)
     if not health:
         return False
 
     try:
-        # Check if health report is recent
         timestamp = datetime.fromisoformat(health["timestamp"])
-        age = (datetime.now() - timestamp).total_seconds()
-        if age > max_age_seconds:
+        if max_age_seconds is not None:
+            age = (datetime.now() - timestamp).total_seconds()
+            if age > max_age_seconds:
+                return False
+
+        pid = health.get("pid")
+        if pid is not None and not psutil.pid_exists(pid):
             return False
 
         # Check server status
@@ -1,9 +1,12 @@
 """Agent personas for the LangGraph workflow, bridging with existing implementations."""
 
+import asyncio
 import logging
 from typing import Any
 
+from .enums import ModelRouter
 from .interfaces import BaseAgentInterface
+from .model_calls import cached_model_call
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +14,9 @@ logger = logging.getLogger(__name__)
 class LangGraphAgent:
     """Base class for LangGraph-compatible agents."""
 
+    # Backend the persona's calls are scheduled on
+    backend = ModelRouter.OLLAMA
+
     def __init__(self, base_agent: BaseAgentInterface, agent_type: str):
         """Initialize with a base agent.
 
@@ -22,19 +28,25 @@ class LangGraphAgent:
         self.agent_type = agent_type
         self.persona = base_agent.persona
 
-    async def analyze(self, prompt: str) -> str:
+    async def analyze(self, prompt: str, use_cache: bool = True) -> str:
         """Analyze using the agent's persona.
 
         Args:
             prompt: Analysis prompt
+            use_cache: False to ask the persona even if the prompt was seen before
 
         Returns:
             Analysis result
         """
         try:
-            # Use the base agent's persona
-            response = self.persona.ask(prompt)
-            return response
+            # Use the base agent's persona, off the event loop
+            return await cached_model_call(
+                self.backend,
+                lambda: asyncio.to_thread(self.persona.ask, prompt),
+                prompt,
+                system_prompt=getattr(self.persona, "system_prompt", None),
+                use_cache=use_cache,
+            )
         except Exception as e:
             logger.error(f"{self.agent_type} analysis error: {e}")
             return f"Error: {e}"
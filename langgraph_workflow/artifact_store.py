@@ -0,0 +1,247 @@
+"""Content-addressed storage for large workflow state values.
+
+Documents, generated code and agent analyses can be megabytes of text, and
+the checkpointer re-serializes the whole state after every node. Large
+values are therefore written once to a content-addressed store and the state
+holds an ``Artifact`` with their digest instead. Node handlers get a state
+that loads a value from the store the first time it is read, so handlers
+read and write these fields as plain strings. Content no checkpoint refers
+to any more is deleted when old checkpoints are pruned.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .config import WORKFLOW_CONFIG
+from .enums import ArtifactType
+from .workflow_state import Artifact
+
+logger = logging.getLogger(__name__)
+
+# State fields stored in the artifact store once they reach the minimum size
+OFFLOADED_FIELDS: dict[str, ArtifactType] = {
+    "code_context_document": ArtifactType.CODE_CONTEXT,
+    "design_constraints_document": ArtifactType.DESIGN,
+    "design_document": ArtifactType.DESIGN,
+    "synthesis_document": ArtifactType.SYNTHESIS,
+    "skeleton_code": ArtifactType.SKELETON,
+    "test_code": ArtifactType.TEST,
+    "implementation_code": ArtifactType.IMPLEMENTATION,
+}
+# State fields whose values (one per agent) are offloaded individually
+OFFLOADED_MAPPINGS: dict[str, ArtifactType] = {
+    "agent_analyses": ArtifactType.ANALYSIS,
+}
+# Values shorter than this stay inline; a reference is not worth the read
+DEFAULT_MIN_SIZE = 1024
+# Unreferenced content stored more recently than this is not collected, since
+# a node stores its output before the checkpoint referring to it is written
+GC_GRACE_SECONDS = 60 * 60
+# A SHA-256 digest as it appears in serialized checkpoint data
+DIGEST_PATTERN = re.compile(rb"[0-9a-f]{64}")
+
+
+class ArtifactMissingError(LookupError):
+    """Raised when the state refers to content missing from the store."""
+
+    pass
+
+
+class ArtifactStore:
+    """Stores text by its SHA-256 digest, each distinct value once."""
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        min_size: int = DEFAULT_MIN_SIZE,
+        gc_grace_seconds: float = GC_GRACE_SECONDS,
+    ):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the content; defaults to ``objects`` in
+                the configured artifacts root
+            min_size: Values shorter than this many characters stay inline
+            gc_grace_seconds: Time since content was last stored before it
+                may be collected
+        """
+        self.root = Path(
+            root or Path(WORKFLOW_CONFIG["paths"]["artifacts_root"]) / "objects"
+        )
+        self.min_size = min_size
+        self.gc_grace_seconds = gc_grace_seconds
+
+    def path_for(self, digest: str) -> Path:
+        """Return where the content with a digest is stored."""
+        return self.root / digest[:2] / digest
+
+    def put(self, content: str) -> str:
+        """Store content unless already present.
+
+        Returns:
+            The content's SHA-256 digest
+        """
+        data = content.encode()
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        try:
+            # Stored again, so garbage collection treats it as recent
+            os.utime(path)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write under a temporary name so readers never see partial content
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Return stored content.
+
+        Raises:
+            ArtifactMissingError: If no content with the digest is stored
+        """
+        try:
+            return self.path_for(digest).read_text()
+        except FileNotFoundError:
+            raise ArtifactMissingError(
+                f"Artifact {digest} not found in {self.root}"
+            ) from None
+
+    def collect_garbage(self, digests: Iterable[str]) -> int:
+        """Delete content that no checkpoint refers to any more.
+
+        Content stored within the grace period is kept.
+
+        Args:
+            digests: Digests of content no longer referenced
+
+        Returns:
+            Number of stored values deleted
+        """
+        cutoff = time.time() - self.gc_grace_seconds
+        deleted = 0
+        for digest in digests:
+            path = self.path_for(digest)
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    deleted += 1
+            except FileNotFoundError:
+                continue
+        if deleted:
+            logger.debug(f"Deleted {deleted} unreferenced artifacts from {self.root}")
+        return deleted
+
+    def offload(self, key: str, value: Any, artifact_type: ArtifactType) -> Any:
+        """Replace a large string with a reference to it in the store."""
+        if not isinstance(value, str) or len(value) < self.min_size:
+            return value
+        digest = self.put(value)
+        return Artifact(
+            key=key,
+            path=str(self.path_for(digest)),
+            type=artifact_type,
+            content_digest=digest,
+        )
+
+    def resolve(self, value: Any) -> Any:
+        """Replace references in a value, or in a mapping's values, by content."""
+        if isinstance(value, Artifact) and value.content_digest:
+            return self.get(value.content_digest)
+        if isinstance(value, dict) and any(
+            isinstance(item, Artifact) for item in value.values()
+        ):
+            return {key: self.resolve(item) for key, item in value.items()}
+        return value
+
+    def lazy(self, state: dict) -> "LazyState":
+        """Wrap a state so references are loaded when first read."""
+        return state if isinstance(state, LazyState) else LazyState(self, state)
+
+    def offload_state(self, state: dict) -> "LazyState":
+        """Replace the state's large values by references to the store.
+
+        Values that were never read are still references and are left as is;
+        rewriting unchanged content is skipped since its digest exists.
+        """
+        lazy = self.lazy(state)
+        for key, artifact_type in OFFLOADED_FIELDS.items():
+            if key in lazy:
+                value = dict.__getitem__(lazy, key)
+                dict.__setitem__(lazy, key, self.offload(key, value, artifact_type))
+        for key, artifact_type in OFFLOADED_MAPPINGS.items():
+            mapping = dict.get(lazy, key)
+            if isinstance(mapping, dict):
+                dict.__setitem__(
+                    lazy,
+                    key,
+                    {
+                        name: self.offload(f"{key}.{name}", value, artifact_type)
+                        for name, value in mapping.items()
+                    },
+                )
+        return lazy
+
+    def load_state(self, state: dict) -> dict:
+        """Return a copy of the state with every reference loaded."""
+        return {key: self.resolve(value) for key, value in state.items()}
+
+
+def referenced_digests(data: Iterable[bytes | str | None]) -> set[str]:
+    """Return the content digests found in serialized checkpoint data.
+
+    The data is searched rather than deserialized, so a reference is found
+    however its value was encoded. A string that merely looks like a digest
+    only keeps the matching content a little longer.
+    """
+    digests: set[str] = set()
+    for value in data:
+        if isinstance(value, str):
+            value = value.encode()
+        if value:
+            digests.update(match.decode() for match in DIGEST_PATTERN.findall(value))
+    return digests
+
+
+class LazyState(dict):
+    """Workflow state that loads stored values on first read.
+
+    Reading a field through ``state[key]`` or ``state.get(key)`` replaces a
+    reference by its content, so later reads and in-place changes see the
+    loaded value. Iterating the state or its ``items()`` gives the stored
+    values, references included, which is what gets checkpointed.
+    """
+
+    def __init__(self, store: ArtifactStore, state: dict):
+        super().__init__(state)
+        self.store = store
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        resolved = self.store.resolve(value)
+        if resolved is not value:
+            super().__setitem__(key, resolved)
+        return resolved
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def copy(self) -> "LazyState":
+        return LazyState(self.store, self)
+
+
+# Shared store, so all workflows deduplicate content against each other
+artifact_store = ArtifactStore()
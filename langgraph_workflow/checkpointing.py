@@ -0,0 +1,471 @@
+"""Shared, tuned SQLite checkpointers for workflows.
+
+Each checkpoint database gets one connection per process, shared by every
+workflow using it, with write-ahead logging and relaxed syncing so the
+writes after every node are cheap. The synchronous saver serializes all use
+of its connection behind a lock and runs its async methods on a worker
+thread, so compiled workflows can be invoked with ``invoke`` and
+``ainvoke`` alike. Async servers get one ``AsyncSqliteSaver`` per event loop
+instead.
+
+Both savers prune old checkpoints of a thread every few writes, keeping only
+the most recent ones, and return the freed pages to the file system. Content
+in the artifact store that only the pruned checkpoints referred to is
+deleted with them.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from collections import Counter
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from .artifact_store import ArtifactStore, artifact_store, referenced_digests
+
+logger = logging.getLogger(__name__)
+
+# Applied to every connection; auto_vacuum only takes effect on new databases
+PRAGMAS = (
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA mmap_size={256 * 1024 * 1024}",
+)
+# Seconds to wait for another process holding the write lock
+BUSY_TIMEOUT = 30.0
+# Most recent checkpoints kept per thread and namespace. Pruning drops the
+# parents of the oldest kept checkpoint, so the workflow state must not use
+# DeltaChannel, which rebuilds values from the parent chain.
+KEEP_CHECKPOINTS = 10
+# Prune a thread after this many checkpoints were written to it
+PRUNE_INTERVAL = 20
+
+_OLD_CHECKPOINTS = """
+thread_id = ? AND (checkpoint_ns, checkpoint_id) IN (
+    SELECT checkpoint_ns, checkpoint_id FROM (
+        SELECT checkpoint_ns, checkpoint_id, ROW_NUMBER() OVER (
+            PARTITION BY checkpoint_ns ORDER BY checkpoint_id DESC
+        ) AS position
+        FROM checkpoints WHERE thread_id = ?
+    )
+    WHERE position > ?
+)
+"""
+_ORPHANED_WRITES = """
+thread_id = ? AND (checkpoint_ns, checkpoint_id) NOT IN (
+    SELECT checkpoint_ns, checkpoint_id FROM checkpoints WHERE thread_id = ?
+)
+"""
+_DELETE_OLD_CHECKPOINTS = f"DELETE FROM checkpoints WHERE {_OLD_CHECKPOINTS}"
+_SELECT_OLD_CHECKPOINTS = f"SELECT checkpoint FROM checkpoints WHERE {_OLD_CHECKPOINTS}"
+_DELETE_ORPHANED_WRITES = f"DELETE FROM writes WHERE {_ORPHANED_WRITES}"
+_SELECT_ORPHANED_WRITES = f"SELECT value FROM writes WHERE {_ORPHANED_WRITES}"
+_SELECT_ALL_DATA = (
+    "SELECT checkpoint FROM checkpoints UNION ALL SELECT value FROM writes"
+)
+_INCREMENTAL_VACUUM = "PRAGMA incremental_vacuum"
+_DATABASE_FILE = "PRAGMA database_list"
+
+
+def _prune_parameters(thread_id: str, keep: int) -> tuple[tuple, tuple]:
+    return (thread_id, thread_id, keep), (thread_id, thread_id)
+
+
+def _keep_for(strategy: str) -> int:
+    """Checkpoints kept per namespace by a base-class pruning strategy."""
+    if strategy == "keep_latest":
+        return 1
+    if strategy == "delete":
+        return 0
+    raise ValueError(f"Unknown pruning strategy: {strategy}")
+
+
+def _database(path: str | Path) -> str:
+    """Return the key identifying a database, creating its directory."""
+    if str(path) == ":memory:":
+        return ":memory:"
+    path = Path(path).resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return str(path)
+
+
+def _referenced_elsewhere(database: str) -> set[str] | None:
+    """Return the digests referenced by the other databases next to one.
+
+    Workflows with different checkpoint databases share the artifact store,
+    so content is only collected if none of them refers to it.
+
+    Returns:
+        The referenced digests, or None if a database could not be read
+    """
+    if not database:
+        return set()
+    digests: set[str] = set()
+    for path in Path(database).parent.glob("*.db"):
+        if str(path) == database:
+            continue
+        try:
+            with closing(
+                sqlite3.connect(
+                    f"{path.as_uri()}?mode=ro", uri=True, timeout=BUSY_TIMEOUT
+                )
+            ) as conn:
+                tables = conn.execute(
+                    "SELECT COUNT(*) FROM sqlite_master "
+                    "WHERE type = 'table' AND name IN ('checkpoints', 'writes')"
+                ).fetchone()[0]
+                if tables == 2:
+                    digests |= referenced_digests(
+                        row[0] for row in conn.execute(_SELECT_ALL_DATA)
+                    )
+        except sqlite3.Error as e:
+            logger.debug(f"Not collecting artifacts, cannot read {path}: {e}")
+            return None
+    return digests
+
+
+def _collect_artifacts(
+    artifacts: ArtifactStore, candidates: set[str], database: str
+) -> None:
+    """Delete the candidates from the store unless another database uses them."""
+    elsewhere = _referenced_elsewhere(database)
+    if elsewhere is not None:
+        artifacts.collect_garbage(candidates - elsewhere)
+
+
+class _PruneSchedule:
+    """Counts checkpoints written per thread to prune them periodically."""
+
+    def __init__(self, keep: int, prune_every: int):
+        self.keep = keep
+        self.prune_every = prune_every
+        self._writes: Counter[str] = Counter()
+        self._writes_lock = threading.Lock()
+
+    def due(self, thread_id: str) -> bool:
+        """Record a checkpoint written to a thread; True when it needs pruning."""
+        with self._writes_lock:
+            self._writes[thread_id] += 1
+            return self._writes[thread_id] % self.prune_every == 0
+
+
+class PruningSqliteSaver(SqliteSaver):
+    """SQLite saver that prunes old checkpoints and also supports async use.
+
+    The connection may be shared across threads: every statement runs under
+    the saver's lock. Async methods run the synchronous ones on a worker
+    thread instead of raising.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        keep: int = KEEP_CHECKPOINTS,
+        prune_every: int = PRUNE_INTERVAL,
+        artifacts: ArtifactStore | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the saver.
+
+        Args:
+            conn: Connection opened with ``check_same_thread=False``
+            keep: Most recent checkpoints kept per thread and namespace
+            prune_every: Checkpoints written to a thread between prunings
+            artifacts: Store whose content the pruned checkpoints referred
+                to; None keeps all stored content
+            **kwargs: Passed on to ``SqliteSaver``
+        """
+        super().__init__(conn, **kwargs)
+        self.schedule = _PruneSchedule(keep, prune_every)
+        self.artifacts = artifacts
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = str(config["configurable"]["thread_id"])
+        if self.schedule.due(thread_id):
+            self.prune_thread(thread_id)
+        return next_config
+
+    def prune_thread(self, thread_id: str, keep: int | None = None) -> int:
+        """Delete all but the most recent checkpoints of a thread.
+
+        Args:
+            thread_id: Thread to prune
+            keep: Checkpoints kept per namespace; defaults to the saver's
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        keep = self.schedule.keep if keep is None else keep
+        checkpoints, writes = _prune_parameters(thread_id, keep)
+        collect = self.artifacts is not None
+        dropped: list[bytes] = []
+        with self.cursor() as cur:
+            if collect:
+                dropped += [
+                    row[0] for row in cur.execute(_SELECT_OLD_CHECKPOINTS, checkpoints)
+                ]
+            deleted = cur.execute(_DELETE_OLD_CHECKPOINTS, checkpoints).rowcount
+            if collect:
+                dropped += [
+                    row[0] for row in cur.execute(_SELECT_ORPHANED_WRITES, writes)
+                ]
+            cur.execute(_DELETE_ORPHANED_WRITES, writes)
+        if deleted:
+            with self.cursor() as cur:
+                cur.execute(_INCREMENTAL_VACUUM).fetchall()
+            logger.debug(f"Pruned {deleted} checkpoints of thread {thread_id}")
+        candidates = referenced_digests(dropped)
+        if self.artifacts is not None and candidates:
+            with self.cursor() as cur:
+                candidates -= referenced_digests(
+                    row[0] for row in cur.execute(_SELECT_ALL_DATA)
+                )
+                database = cur.execute(_DATABASE_FILE).fetchone()[2]
+            _collect_artifacts(self.artifacts, candidates, database)
+        return deleted
+
+    def prune(
+        self, thread_ids: Sequence[str], *, strategy: str = "keep_latest"
+    ) -> None:
+        keep = _keep_for(strategy)
+        for thread_id in thread_ids:
+            self.prune_thread(thread_id, keep)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,  # noqa: A002
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        # Read the page at once so the lock is not held between iterations
+        checkpoints = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint in checkpoints:
+            yield checkpoint
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    async def aprune(
+        self, thread_ids: Sequence[str], *, strategy: str = "keep_latest"
+    ) -> None:
+        await asyncio.to_thread(self.prune, thread_ids, strategy=strategy)
+
+    async def aget_delta_channel_history(
+        self, *, config: RunnableConfig, channels: Sequence[str]
+    ) -> Mapping[str, Any]:
+        return await asyncio.to_thread(
+            lambda: self.get_delta_channel_history(config=config, channels=channels)
+        )
+
+
+def connect(path: str | Path) -> sqlite3.Connection:
+    """Open a checkpoint database for use from any thread, with PRAGMAS applied."""
+    conn = sqlite3.connect(
+        _database(path), timeout=BUSY_TIMEOUT, check_same_thread=False
+    )
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+_savers: dict[tuple[int, str], PruningSqliteSaver] = {}
+_savers_lock = threading.Lock()
+
+
+def get_checkpointer(path: str | Path) -> PruningSqliteSaver:
+    """Return this process's shared saver for a checkpoint database."""
+    # Keyed by process as well, so forked workers open their own connection
+    key = (os.getpid(), _database(path))
+    with _savers_lock:
+        saver = _savers.get(key)
+        if saver is None:
+            saver = _savers[key] = PruningSqliteSaver(
+                connect(key[1]), artifacts=artifact_store
+            )
+            logger.info(f"Opened checkpoint database {key[1]}")
+        return saver
+
+
+def close_checkpointers() -> None:
+    """Close the shared savers' connections; later calls open new ones."""
+    with _savers_lock:
+        for saver in _savers.values():
+            saver.conn.close()
+        _savers.clear()
+
+
+class AsyncPruningSqliteSaver(AsyncSqliteSaver):
+    """Async SQLite saver that prunes old checkpoints.
+
+    Bound to the event loop it was created on.
+    """
+
+    def __init__(
+        self,
+        conn: aiosqlite.Connection,
+        keep: int = KEEP_CHECKPOINTS,
+        prune_every: int = PRUNE_INTERVAL,
+        artifacts: ArtifactStore | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the saver.
+
+        Args:
+            conn: Open connection
+            keep: Most recent checkpoints kept per thread and namespace
+            prune_every: Checkpoints written to a thread between prunings
+            artifacts: Store whose content the pruned checkpoints referred
+                to; None keeps all stored content
+            **kwargs: Passed on to ``AsyncSqliteSaver``
+        """
+        super().__init__(conn, **kwargs)
+        self.schedule = _PruneSchedule(keep, prune_every)
+        self.artifacts = artifacts
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        next_config = await super().aput(config, checkpoint, metadata, new_versions)
+        thread_id = str(config["configurable"]["thread_id"])
+        if self.schedule.due(thread_id):
+            await self.aprune_thread(thread_id)
+        return next_config
+
+    async def aprune_thread(self, thread_id: str, keep: int | None = None) -> int:
+        """Delete all but the most recent checkpoints of a thread.
+
+        Args:
+            thread_id: Thread to prune
+            keep: Checkpoints kept per namespace; defaults to the saver's
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        await self.setup()
+        keep = self.schedule.keep if keep is None else keep
+        checkpoints, writes = _prune_parameters(thread_id, keep)
+        collect = self.artifacts is not None
+        dropped: list[bytes] = []
+        async with self.lock:
+            if collect:
+                rows = await self.conn.execute_fetchall(
+                    _SELECT_OLD_CHECKPOINTS, checkpoints
+                )
+                dropped += [row[0] for row in rows]
+            async with self.conn.execute(
+                _DELETE_OLD_CHECKPOINTS, checkpoints
+            ) as cursor:
+                deleted = cursor.rowcount
+            if collect:
+                rows = await self.conn.execute_fetchall(_SELECT_ORPHANED_WRITES, writes)
+                dropped += [row[0] for row in rows]
+            async with self.conn.execute(_DELETE_ORPHANED_WRITES, writes):
+                pass
+            await self.conn.commit()
+            if deleted:
+                await self.conn.execute_fetchall(_INCREMENTAL_VACUUM)
+                await self.conn.commit()
+            candidates = referenced_digests(dropped)
+            if candidates:
+                rows = await self.conn.execute_fetchall(_SELECT_ALL_DATA)
+                candidates -= referenced_digests(row[0] for row in rows)
+                rows = await self.conn.execute_fetchall(_DATABASE_FILE)
+                database = next(iter(rows))[2]
+        if deleted:
+            logger.debug(f"Pruned {deleted} checkpoints of thread {thread_id}")
+        if self.artifacts is not None and candidates:
+            await asyncio.to_thread(
+                _collect_artifacts, self.artifacts, candidates, database
+            )
+        return deleted
+
+    async def aprune(
+        self, thread_ids: Sequence[str], *, strategy: str = "keep_latest"
+    ) -> None:
+        keep = _keep_for(strategy)
+        for thread_id in thread_ids:
+            await self.aprune_thread(thread_id, keep)
+
+
+_async_savers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, AsyncPruningSqliteSaver]
+] = weakref.WeakKeyDictionary()
+
+
+async def get_async_checkpointer(path: str | Path) -> AsyncPruningSqliteSaver:
+    """Return the running event loop's shared async saver for a database."""
+    database = _database(path)
+    savers = _async_savers.setdefault(asyncio.get_running_loop(), {})
+    if database not in savers:
+        conn = await aiosqlite.connect(database, timeout=BUSY_TIMEOUT)
+        for pragma in PRAGMAS:
+            await conn.execute(pragma)
+        if database in savers:
+            # Another task connected while this one was waiting
+            await conn.close()
+        else:
+            savers[database] = AsyncPruningSqliteSaver(conn, artifacts=artifact_store)
+            logger.info(f"Opened async checkpoint database {database}")
+    return savers[database]
+
+
+async def close_async_checkpointers() -> None:
+    """Close the running event loop's shared async savers."""
+    savers = _async_savers.pop(asyncio.get_running_loop(), {})
+    for saver in savers.values():
+        await saver.conn.close()
@@ -0,0 +1,226 @@
+"""Async runner for the Claude Code CLI.
+
+Claude runs can take minutes, so the CLI is run as an asyncio subprocess
+rather than with a blocking ``subprocess.run`` that would freeze the event
+loop. Output is streamed line by line as Claude writes it, a successful
+version probe is cached per CLI path, and every run holds a Claude slot from
+the model scheduler. A run that is cancelled, for example because the workflow is
+aborted, or that times out has its whole process group killed.
+"""
+
+import asyncio
+import logging
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+# Add parent directory to path to import the shared subprocess helpers
+sys.path.append(str(Path(__file__).parent.parent))
+
+from subprocess_io import kill_process_group, read_lines  # noqa: E402
+
+from .config import get_claude_cli_path, get_claude_cli_timeout  # noqa: E402
+from .enums import ModelRouter  # noqa: E402
+from .model_calls import model_slot  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Seconds the --version probe may take
+VERSION_CHECK_TIMEOUT = 5.0
+
+
+class ClaudeCLIError(RuntimeError):
+    """Raised when the Claude CLI is unavailable or a run fails."""
+
+    pass
+
+
+class ClaudeCLI:
+    """Runs prompts through the Claude Code CLI without blocking the event loop"""
+
+    def __init__(self, cli_path: str | None = None):
+        """Initialize the runner.
+
+        Args:
+            cli_path: Claude CLI executable; defaults to the configured path
+        """
+        self._cli_path = cli_path
+        # Version per CLI path, so each path is only probed once it works
+        self._versions: dict[str, str] = {}
+        # Concurrent first runs wait for one probe instead of each starting one
+        self._probe_lock = asyncio.Lock()
+
+    @property
+    def cli_path(self) -> str:
+        """Claude CLI executable used for runs."""
+        return self._cli_path or get_claude_cli_path()
+
+    async def version(self, refresh: bool = False) -> str:
+        """Return the Claude CLI version, probing the CLI on first use.
+
+        Only a successful probe is cached, so a CLI installed or fixed after
+        a failed probe is picked up by the next call.
+
+        Args:
+            refresh: Probe again instead of using the cached result
+
+        Returns:
+            Version string printed by ``claude --version``
+
+        Raises:
+            ClaudeCLIError: If the CLI is missing or does not respond
+        """
+        cli_path = self.cli_path
+        if not refresh and cli_path in self._versions:
+            return self._versions[cli_path]
+        async with self._probe_lock:
+            # A probe that finished while this call waited answers it too
+            if refresh or cli_path not in self._versions:
+                self._versions[cli_path] = await self._probe_version(cli_path)
+            return self._versions[cli_path]
+
+    async def _probe_version(self, cli_path: str) -> str:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                cli_path,
+                "--version",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+        except OSError as e:
+            raise ClaudeCLIError(f"Claude CLI not available: {e}") from e
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), VERSION_CHECK_TIMEOUT
+            )
+        except TimeoutError:
+            raise ClaudeCLIError(
+                f"Claude CLI did not respond within {VERSION_CHECK_TIMEOUT}s"
+            ) from None
+        finally:
+            await kill_process_group(process)
+        if process.returncode != 0:
+            raise ClaudeCLIError(
+                f"Claude CLI version check failed: {stderr.decode(errors='replace')}"
+            )
+        version = stdout.decode(errors="replace").strip()
+        logger.info(f"Claude CLI available: {version}")
+        return version
+
+    async def is_available(self) -> bool:
+        """Return whether the CLI is installed and is Claude Code."""
+        try:
+            return "Claude Code" in await self.version()
+        except ClaudeCLIError:
+            return False
+
+    async def stream(
+        self, prompt: str, cwd: str | None = None, timeout: float | None = None
+    ) -> AsyncIterator[str]:
+        """Run a prompt, yielding Claude's output line by line.
+
+        The run waits for a Claude slot first; its timeout starts once the
+        slot is held, so time spent queued behind other Claude calls does not
+        count. Its process is killed if the caller stops iterating early, is
+        cancelled or the run times out.
+
+        Args:
+            prompt: Prompt written to the CLI's stdin
+            cwd: Directory Claude runs in, such as the repository to analyze
+            timeout: Seconds the CLI may run; no limit if None
+
+        Yields:
+            Output lines without trailing newlines
+
+        Raises:
+            ClaudeCLIError: If the CLI is unavailable, exits with an error or
+                times out
+        """
+        await self.version()
+        async with model_slot(ModelRouter.CLAUDE_CODE):
+            deadline = (
+                None if timeout is None else asyncio.get_running_loop().time() + timeout
+            )
+            process = await asyncio.create_subprocess_exec(
+                self.cli_path,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                start_new_session=True,
+            )
+            assert process.stdin is not None
+            assert process.stdout is not None and process.stderr is not None
+            # Write the prompt and drain stderr alongside stdout so neither
+            # pipe can fill up and block the CLI
+            stdin_task = asyncio.create_task(self._write_prompt(process, prompt))
+            stderr_task = asyncio.create_task(process.stderr.read())
+            lines = read_lines(process.stdout)
+            try:
+                # The deadline only interrupts waits on the CLI, never the
+                # caller's code running between yielded lines
+                while True:
+                    async with asyncio.timeout_at(deadline):
+                        line = await anext(lines, None)
+                    if line is None:
+                        break
+                    yield line.decode(errors="replace")
+                async with asyncio.timeout_at(deadline):
+                    returncode = await process.wait()
+                    stderr = (await stderr_task).decode(errors="replace").strip()
+            except TimeoutError:
+                raise ClaudeCLIError(
+                    f"Claude CLI timed out after {timeout} seconds"
+                ) from None
+            finally:
+                await kill_process_group(process)
+                stdin_task.cancel()
+                stderr_task.cancel()
+
+        if returncode != 0:
+            raise ClaudeCLIError(
+                f"Claude CLI failed with return code {returncode}: "
+                f"{stderr or 'Unknown error'}"
+            )
+
+    @staticmethod
+    async def _write_prompt(process: asyncio.subprocess.Process, prompt: str) -> None:
+        assert process.stdin is not None
+        try:
+            process.stdin.write(prompt.encode())
+            await process.stdin.drain()
+            process.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            # The CLI exited before reading the whole prompt; its exit
+            # status reports the failure
+            pass
+
+    async def run(
+        self, prompt: str, cwd: str | None = None, timeout: float | None = None
+    ) -> str:
+        """Run a prompt and return Claude's full output.
+
+        Args:
+            prompt: Prompt written to the CLI's stdin
+            cwd: Directory Claude runs in, such as the repository to analyze
+            timeout: Seconds the CLI may run once it holds a Claude slot;
+                defaults to the configured timeout
+
+        Returns:
+            Claude's output with surrounding whitespace removed
+
+        Raises:
+            ClaudeCLIError: If the CLI is unavailable, fails or times out
+        """
+        if timeout is None:
+            timeout = get_claude_cli_timeout()
+        lines: list[str] = []
+        async for line in self.stream(prompt, cwd, timeout):
+            logger.debug(f"claude: {line}")
+            lines.append(line)
+        return "\n".join(lines).strip()
+
+
+# Shared runner, so the version probe is cached for the whole process
+claude_cli = ClaudeCLI()
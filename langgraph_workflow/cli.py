@@ -23,7 +23,8 @@ from langchain_ollama import ChatOllama
 
 from .config import get_ollama_base_url, get_ollama_model
 from .enhanced_workflow import create_enhanced_workflow
-from .enums import WorkflowStep
+from .enums import ModelRouter, WorkflowStep
+from .model_calls import cached_model_call
 from .tests.mocks import create_mock_dependencies
 
 # Set up logging
@@ -34,12 +35,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def extract_feature_from_prd(prd_content: str, feature_name: str) -> str | None:
+async def extract_feature_from_prd(
+    prd_content: str, feature_name: str, use_cache: bool = True
+) -> str | None:
     """Extract a specific feature from a PRD document using LLM.
 
     Args:
         prd_content: Full PRD content
         feature_name: Name/title of the feature to extract
+        use_cache: False to query the model even if this extraction is cached
 
     Returns:
         Feature description or None if not found
@@ -74,11 +78,19 @@ Feature Extract:"""
             model=ollama_model,
         )
 
-        response = await ollama_client.ainvoke(
-            [HumanMessage(content=extraction_prompt)]
-        )
+        async def extract() -> str:
+            response = await ollama_client.ainvoke(
+                [HumanMessage(content=extraction_prompt)]
+            )
+            return str(response.content).strip() if response.content else ""
 
-        extracted_content = str(response.content).strip() if response.content else ""
+        extracted_content = await cached_model_call(
+            ModelRouter.OLLAMA,
+            extract,
+            extraction_prompt,
+            model=ollama_model,
+            use_cache=use_cache,
+        )
         logger.info("✅ Successfully extracted feature using Ollama")
 
     except Exception as e:
@@ -225,7 +237,7 @@ class WorkflowCLI:
             else:
                 logger.info("✅ Workflow resumed and completed successfully")
 
-            return final_state
+            return self.workflow.artifacts.load_state(final_state)
 
         except Exception as e:
             logger.error(f"❌ Workflow resumption failed: {e}")
@@ -278,7 +290,7 @@ class WorkflowCLI:
             logger.info("🔄 Restoring workflow state...")
 
             # Return the state at the target step
-            return target_checkpoint.state
+            return self.workflow.artifacts.load_state(target_checkpoint.state)
 
         except Exception as e:
             logger.error(f"❌ Rollback failed: {e}")
@@ -244,6 +244,7 @@ async def demo_standard_workflows():
         requires_pr_feedback=True,
         pre_commit_checks=[CodeQualityCheck.LINT, CodeQualityCheck.TEST],
         lint_commands=["echo 'Running lint check...'", "echo 'Lint passed!'"],
+        fix_commands=[],
         test_commands=["echo 'Running tests...'", "echo 'All tests passed!'"],
         pr_feedback_prompt="Process this feedback: {comments}",
         pr_reply_template="✅ Addressed: {outcome} at {timestamp}",
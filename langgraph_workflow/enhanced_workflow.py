@@ -5,11 +5,14 @@ with integrated standard workflows for code quality and PR feedback.
 """
 
 import logging
-from pathlib import Path
 from typing import Any
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph
 
+from .artifact_store import ArtifactStore, artifact_store
+from .checkpointing import get_checkpointer
+from .config import get_checkpoint_path
 from .enums import (
     FeedbackGateStatus,
     ModelRouter,
@@ -38,7 +41,9 @@ class EnhancedMultiAgentWorkflow:
         codebase_analyzer: Any,
         github_integration: Any = None,
         thread_id: str | None = None,
-        checkpoint_path: str = "enhanced_workflow_state.db",
+        checkpoint_path: str | None = None,
+        artifacts: ArtifactStore | None = None,
+        checkpointer: BaseCheckpointSaver | None = None,
     ):
         """Initialize the enhanced workflow.
 
@@ -48,14 +53,22 @@ class EnhancedMultiAgentWorkflow:
             codebase_analyzer: Codebase analysis interface
             github_integration: GitHub integration for PR feedback
             thread_id: Thread ID for state persistence
-            checkpoint_path: Path to SQLite checkpoint database
+            checkpoint_path: Path to SQLite checkpoint database; defaults to
+                one under the configured checkpoints directory
+            artifacts: Store for large state values; defaults to the shared store
+            checkpointer: Saver to checkpoint with; defaults to the process's
+                shared saver for ``checkpoint_path``
         """
         self.repo_path = repo_path
         self.agents = agents
         self.codebase_analyzer = codebase_analyzer
         self.github_integration = github_integration
         self.thread_id = thread_id or "enhanced-workflow"
-        self.checkpoint_path = checkpoint_path
+        self.checkpoint_path = checkpoint_path or get_checkpoint_path(
+            "enhanced_workflow_state"
+        )
+        self.artifacts = artifacts or artifact_store
+        self.checkpointer = checkpointer
 
         # Compatibility attribute for old run.py
         from pathlib import Path
@@ -91,7 +104,7 @@ class EnhancedMultiAgentWorkflow:
 
             # Create configured handler with standard workflow integration
             configured_handler = self._create_configured_handler(
-                node_def.handler, node_def.config
+                node_def.handler, node_def.config, step
             )
 
             # Add to workflow graph
@@ -128,16 +141,26 @@ class EnhancedMultiAgentWorkflow:
         logger.info("✅ Enhanced workflow graph built successfully")
         return workflow
 
-    def _create_configured_handler(self, original_handler, config):
+    def _create_configured_handler(self, original_handler, config, step):
         """Create a configured handler for the workflow node."""
         from datetime import datetime
 
         from .enums import QualityLevel
+        from .model_calls import node_scheduling
         from .node_config import StandardWorkflows
 
         async def configured_handler(state: dict) -> dict:
             """Enhanced node handler that integrates standard workflows."""
-
+            # Large documents are checkpointed as references to the artifact
+            # store and only loaded when the node reads them
+            state = self.artifacts.lazy(state)
+            # Model calls made by this node are prioritized by step and
+            # shared fairly with other workflow threads
+            with node_scheduling(step, state.get("thread_id")):
+                result_state = await run_node(state)
+            return self.artifacts.offload_state(result_state)
+
+        async def run_node(state: dict) -> dict:
             # 1. Setup phase
             state["model_router"] = config.get_model_router()
 
@@ -207,17 +230,9 @@ class EnhancedMultiAgentWorkflow:
 
     def _setup_checkpointing(self):
         """Set up workflow checkpointing."""
-        import sqlite3
-
-        from langgraph.checkpoint.sqlite import SqliteSaver
-
-        # Create checkpoint directory if needed
-        checkpoint_dir = Path(self.checkpoint_path).parent
-        checkpoint_dir.mkdir(parents=True, exist_ok=True)
-
-        # Initialize SQLite checkpointer
-        conn = sqlite3.connect(self.checkpoint_path)
-        self.checkpointer = SqliteSaver(conn)
+        # Workflows on the same database share one connection
+        if self.checkpointer is None:
+            self.checkpointer = get_checkpointer(self.checkpoint_path)
         self.app = self.graph.compile(checkpointer=self.checkpointer)
 
         logger.info(f"📁 Checkpointing enabled: {self.checkpoint_path}")
@@ -317,7 +332,7 @@ class EnhancedMultiAgentWorkflow:
             # Log final results
             self._log_workflow_results(final_state)
 
-            return final_state
+            return self.artifacts.load_state(final_state)
 
         except Exception as e:
             logger.error(f"❌ Enhanced workflow execution failed: {e}")
@@ -497,7 +512,7 @@ class EnhancedMultiAgentWorkflow:
         if WorkflowStep.EXTRACT_CODE_CONTEXT in self.node_definitions:
             node_def = self.node_definitions[WorkflowStep.EXTRACT_CODE_CONTEXT]
             configured_handler = self._create_configured_handler(
-                node_def.handler, node_def.config
+                node_def.handler, node_def.config, WorkflowStep.EXTRACT_CODE_CONTEXT
             )
             return await configured_handler(state)
         return state
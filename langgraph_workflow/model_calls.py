@@ -0,0 +1,102 @@
+"""Scheduling and caching of model calls in the LangGraph workflow.
+
+Every Ollama and Claude call in the workflow holds a slot from the
+process-wide model scheduler shared with the multi-agent workflow. Slots are
+limited by ``resource_limits`` in the workflow config, handed out to later
+workflow steps first, and shared fairly between workflow threads. Calls that
+repeat an earlier prompt are answered from the shared response cache without
+taking a slot.
+"""
+
+import sys
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import AbstractAsyncContextManager, contextmanager
+from pathlib import Path
+
+# Add parent directory to path to import the shared model scheduler
+sys.path.append(str(Path(__file__).parent.parent))
+
+from llm_cache import llm_cache  # noqa: E402
+from model_scheduler import model_scheduler, scheduling_context  # noqa: E402
+
+from .config import WORKFLOW_CONFIG  # noqa: E402
+from .enums import ModelRouter, WorkflowStep  # noqa: E402
+
+_limits = WORKFLOW_CONFIG["resource_limits"]
+model_scheduler.set_limit(ModelRouter.OLLAMA.value, _limits["max_ollama_concurrent"])
+model_scheduler.set_limit(
+    ModelRouter.CLAUDE_CODE.value, _limits["max_claude_concurrent"]
+)
+
+# Later steps are closer to a finished workflow, so their calls go first
+STEP_PRIORITY = {step: rank for rank, step in enumerate(WorkflowStep)}
+
+
+def model_slot(backend: ModelRouter) -> AbstractAsyncContextManager[None]:
+    """Hold a slot for one model call on ``backend``.
+
+    Claude API and Claude CLI calls share the Claude limit.
+
+    Args:
+        backend: Backend the call is made to
+
+    Returns:
+        Async context manager held for the duration of the call
+    """
+    return model_scheduler.slot(backend.value)
+
+
+async def cached_model_call(
+    backend: ModelRouter,
+    call: Callable[[], Awaitable[str]],
+    prompt: str,
+    model: str | None = None,
+    system_prompt: str | None = None,
+    temperature: float | None = None,
+    use_cache: bool = True,
+) -> str:
+    """Make a model call in a ``backend`` slot unless its response is cached.
+
+    Args:
+        backend: Backend the call is made to
+        call: Makes the model call when invoked
+        prompt: Prompt the call sends
+        model: Model name, if the backend has a choice of models
+        system_prompt: System prompt the model is given
+        temperature: Sampling temperature, if set
+        use_cache: False to always make the call
+
+    Returns:
+        The model's response
+    """
+
+    async def scheduled_call() -> str:
+        async with model_slot(backend):
+            return await call()
+
+    return await llm_cache.call_async(
+        backend.value,
+        scheduled_call,
+        prompt,
+        model=model,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        use_cache=use_cache,
+    )
+
+
+@contextmanager
+def node_scheduling(step: WorkflowStep, thread_id: str | None) -> Iterator[None]:
+    """Schedule the model calls made while running a workflow node.
+
+    Args:
+        step: Node being run; later steps get higher priority
+        thread_id: Workflow thread the calls are shared fairly by
+    """
+    with scheduling_context(owner=thread_id, priority=STEP_PRIORITY[step]):
+        yield
+
+
+def model_call_stats() -> dict:
+    """Return limits, load and queue times per model backend."""
+    return model_scheduler.stats()
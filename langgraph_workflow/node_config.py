@@ -2,16 +2,36 @@
 
 import asyncio
 import logging
+import os
+import shlex
+import sys
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
-from .enums import AgentType, ArtifactName, ModelRouter
+# Add parent directory to path to import the shared test impact analysis and
+# subprocess helpers
+sys.path.append(str(Path(__file__).parent.parent))
+
+from affected_tests import TestImpactRunner, get_analyzer  # noqa: E402
+from subprocess_io import kill_process_group, read_lines  # noqa: E402
+
+from .enums import AgentType, ArtifactName, ModelRouter  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
+# Replaced in fix, lint and type check commands by the changed Python files,
+# or by "." when the changed files are not known
+CHANGED_FILES_PLACEHOLDER = "{files}"
+TYPE_CHECK_COMMAND = f"python -m mypy {CHANGED_FILES_PLACEHOLDER}"
+# Replaced in test commands by the test files affected by the changed files;
+# once those pass, the command runs again for the remaining test files
+TESTS_PLACEHOLDER = "{tests}"
+
 
 class OutputLocation(str, Enum):
     """Where to store node outputs."""
@@ -92,13 +112,19 @@ class NodeConfig:
 
     # Code quality configuration
     pre_commit_checks: list[CodeQualityCheck] = field(default_factory=list)
-    test_commands: list[str] = field(default_factory=lambda: ["python -m pytest"])
+    test_commands: list[str] = field(
+        default_factory=lambda: ["python -m pytest {tests}"]
+    )
     lint_commands: list[str] = field(
-        default_factory=lambda: [
-            "scripts/ruff-autofix.sh",
-            "scripts/run-code-checks.sh",
-        ]
+        default_factory=lambda: ["scripts/run-code-checks.sh {files}"]
+    )
+    # Commands that rewrite files (FORMAT and LINT checks); run one at a time
+    # before the other checks, which run concurrently
+    fix_commands: list[str] = field(
+        default_factory=lambda: ["scripts/ruff-autofix.sh {files}"]
     )
+    max_parallel_checks: int | None = None  # Defaults to the CPU count
+    fail_fast: bool = False  # Stop the remaining checks after a failure
 
     # PR feedback configuration
     pr_feedback_prompt: str = ""  # How to process PR comments
@@ -142,29 +168,62 @@ class StandardWorkflows:
     """Composable standard workflow components."""
 
     @staticmethod
-    async def run_command(command: str, cwd: str | None = None) -> CommandResult:
-        """Run a shell command and return structured result."""
-        import time
-
+    async def run_command(
+        command: str, cwd: str | None = None, label: str | None = None
+    ) -> CommandResult:
+        """Run a shell command and return structured result.
+
+        Output is logged line by line as the command writes it. The command's
+        process group is killed if the caller is cancelled.
+
+        Args:
+            command: Shell command to run
+            cwd: Working directory
+            label: Prefix for the command's logged output
+        """
         start_time = time.time()
+        prefix = label or command
+
+        async def read_output(stream: asyncio.StreamReader | None) -> str:
+            output = bytearray()
+            if stream is not None:
+                async for line in read_lines(stream, keepends=True):
+                    output += line
+                    text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+                    logger.debug(f"[{prefix}] {text}")
+            return output.decode("utf-8", errors="replace")
 
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
+            spawn = asyncio.ensure_future(
+                asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd,
+                    start_new_session=True,
+                )
             )
-
-            stdout, stderr = await process.communicate()
-            duration = time.time() - start_time
+            try:
+                process = await asyncio.shield(spawn)
+            except asyncio.CancelledError:
+                # Cancelling the spawn itself would only kill the shell and
+                # leave its children running, so finish it and kill the group
+                await kill_process_group(await spawn)
+                raise
+            try:
+                stdout, stderr = await asyncio.gather(
+                    read_output(process.stdout), read_output(process.stderr)
+                )
+                await process.wait()
+            finally:
+                await kill_process_group(process)
 
             return CommandResult(
                 command=command,
                 returncode=process.returncode or 0,
-                stdout=stdout.decode("utf-8") if stdout else "",
-                stderr=stderr.decode("utf-8") if stderr else "",
-                duration=duration,
+                stdout=stdout,
+                stderr=stderr,
+                duration=time.time() - start_time,
             )
 
         except Exception as e:
@@ -177,53 +236,257 @@ class StandardWorkflows:
                 duration=duration,
             )
 
+    @staticmethod
+    def _changed_python_files(
+        repo_path: str, changed_files: list[str] | None
+    ) -> list[str] | None:
+        """Return the changed Python files that still exist.
+
+        Returns:
+            The files, or None if the changed files are not known and the
+            whole repository should be checked
+        """
+        if not changed_files:
+            return None
+        return [
+            path
+            for path in changed_files
+            if path.endswith((".py", ".pyi"))
+            and os.path.exists(os.path.join(repo_path, path))
+        ]
+
+    @staticmethod
+    def _pytest_args(command: str) -> tuple[str, ...] | None:
+        """Return the arguments of a ``pytest ... {tests}`` command.
+
+        Returns:
+            The arguments before ``{tests}``, or None if the command is not a
+            plain pytest command ending in ``{tests}``
+        """
+        try:
+            words = shlex.split(command)
+        except ValueError:
+            return None
+        for prefix in (["python", "-m", "pytest"], ["pytest"]):
+            if words[: len(prefix)] == prefix:
+                args = words[len(prefix) :]
+                if args.count(TESTS_PLACEHOLDER) == 1 and args[-1] == TESTS_PLACEHOLDER:
+                    return tuple(args[:-1])
+        return None
+
+    @staticmethod
+    async def run_test_command(
+        command: str, repo_path: str, changed_files: list[str] | None
+    ) -> CommandResult:
+        """Run a ``{tests}`` command for the affected tests, then for the rest.
+
+        The remaining tests only run once the affected ones pass, so a
+        broken change fails fast and the two runs never share pytest's cache
+        or coverage data. Plain pytest commands run through the test impact
+        runner, which also spreads each run across parallel processes.
+
+        Args:
+            command: Test command containing ``{tests}``
+            repo_path: Repository the tests run in
+            changed_files: Files changed by the node, relative to the
+                repository; empty or None treats every test as affected
+
+        Returns:
+            The combined result of both runs
+        """
+        pytest_args = StandardWorkflows._pytest_args(command)
+        if pytest_args is not None:
+            start_time = time.time()
+            runner = TestImpactRunner(repo_path, pytest_args=pytest_args)
+            try:
+                _, result, remaining = await runner.run_affected_first(
+                    changed_files or None
+                )
+            except Exception as e:
+                # Reported like a command that could not start
+                return CommandResult(
+                    command=command,
+                    returncode=1,
+                    stdout="",
+                    stderr=str(e),
+                    duration=time.time() - start_time,
+                )
+            if remaining is not None:
+                result = result.merge(remaining)
+            return CommandResult(
+                command=command,
+                returncode=result.returncode,
+                stdout=result.stdout,
+                stderr=result.stderr,
+                duration=result.duration,
+            )
+
+        selection = get_analyzer(repo_path).select(changed_files or None)
+        logger.info(
+            f"{len(selection.affected)} test files affected by the changes, "
+            f"{len(selection.remaining)} remaining"
+        )
+        runs: list[CommandResult] = []
+        for test_files in (selection.affected, selection.remaining):
+            if not test_files:
+                continue
+            runs.append(
+                await StandardWorkflows.run_command(
+                    command.replace(
+                        TESTS_PLACEHOLDER,
+                        " ".join(shlex.quote(path) for path in test_files),
+                    ),
+                    cwd=repo_path,
+                    label=CodeQualityCheck.TEST.value,
+                )
+            )
+            if runs[-1].failed:
+                break
+        return CommandResult(
+            command=command,
+            returncode=runs[-1].returncode if runs else 0,
+            stdout="".join(run.stdout for run in runs),
+            stderr="".join(run.stderr for run in runs),
+            duration=sum(run.duration for run in runs),
+        )
+
+    @staticmethod
+    def _record_result(
+        results: CodeQualityResult, check: CodeQualityCheck, result: CommandResult
+    ) -> None:
+        """Add a command result to the results for its check."""
+        recorded, name = {
+            CodeQualityCheck.FORMAT: (results.format_results, "Format"),
+            CodeQualityCheck.LINT: (results.lint_results, "Lint check"),
+            CodeQualityCheck.TEST: (results.test_results, "Test"),
+            CodeQualityCheck.TYPE_CHECK: (results.type_check_results, "Type check"),
+        }[check]
+        recorded.append(result)
+        if result.failed:
+            logger.error(f"❌ {name} failed: {result.command}")
+            logger.error(f"Error: {result.stderr}")
+            results.overall_success = False
+        else:
+            logger.info(f"✅ {name} passed: {result.command} ({result.duration:.1f}s)")
+
     @staticmethod
     async def run_code_quality_checks(
         config: NodeConfig, repo_path: str, changed_files: list[str] | None = None
     ) -> CodeQualityResult:
-        """Run standard code quality checks."""
+        """Run standard code quality checks.
+
+        Fix commands run first when the format or lint check is selected,
+        one at a time, since they rewrite files. Lint, test and type check
+        commands then run concurrently, at most ``config.max_parallel_checks``
+        at once. Fix, lint and type check commands containing ``{files}``
+        only check the changed Python files and are skipped when none
+        changed. Test commands containing ``{tests}`` run the tests affected
+        by the changes first and the remaining tests once those pass, as one
+        check.
+
+        Args:
+            config: Node configuration selecting the checks and commands
+            repo_path: Repository the commands run in
+            changed_files: Files changed by the node, relative to the
+                repository; empty or None checks the whole repository
+
+        Returns:
+            Results per check, in configuration order
+        """
         results = CodeQualityResult()
 
         logger.info("🔍 Running code quality checks...")
 
-        # Run lint checks
-        if CodeQualityCheck.LINT in config.pre_commit_checks:
-            for cmd in config.lint_commands:
-                logger.info(f"Running lint: {cmd}")
-                result = await StandardWorkflows.run_command(cmd, cwd=repo_path)
-                results.lint_results.append(result)
-                if result.failed:
-                    logger.error(f"❌ Lint check failed: {cmd}")
-                    logger.error(f"Error: {result.stderr}")
-                    results.overall_success = False
+        python_files = StandardWorkflows._changed_python_files(repo_path, changed_files)
+        files_arg = (
+            " ".join(shlex.quote(path) for path in python_files)
+            if python_files is not None
+            else "."
+        )
+
+        def file_commands(commands: list[str]) -> list[str]:
+            selected = []
+            for command in commands:
+                if CHANGED_FILES_PLACEHOLDER not in command:
+                    selected.append(command)
+                elif python_files == []:
+                    logger.info(f"No changed Python files, skipping: {command}")
                 else:
-                    logger.info(f"✅ Lint check passed: {cmd}")
+                    selected.append(
+                        command.replace(CHANGED_FILES_PLACEHOLDER, files_arg)
+                    )
+            return selected
+
+        # Run fixes before anything reads the files they rewrite. Lint runs
+        # them too, as autofixing used to be one of the lint commands
+        if {CodeQualityCheck.FORMAT, CodeQualityCheck.LINT} & set(
+            config.pre_commit_checks
+        ):
+            for cmd in file_commands(config.fix_commands):
+                logger.info(f"Running format: {cmd}")
+                result = await StandardWorkflows.run_command(
+                    cmd, cwd=repo_path, label="format"
+                )
+                StandardWorkflows._record_result(
+                    results, CodeQualityCheck.FORMAT, result
+                )
+                if result.failed and config.fail_fast:
+                    break
 
-        # Run tests
+        checks: list[tuple[CodeQualityCheck, str]] = []
+        if CodeQualityCheck.LINT in config.pre_commit_checks:
+            checks += [
+                (CodeQualityCheck.LINT, cmd)
+                for cmd in file_commands(config.lint_commands)
+            ]
         if CodeQualityCheck.TEST in config.pre_commit_checks:
-            for cmd in config.test_commands:
-                logger.info(f"Running test: {cmd}")
-                result = await StandardWorkflows.run_command(cmd, cwd=repo_path)
-                results.test_results.append(result)
-                if result.failed:
-                    logger.error(f"❌ Test failed: {cmd}")
-                    logger.error(f"Error: {result.stderr}")
-                    results.overall_success = False
+            checks += [(CodeQualityCheck.TEST, cmd) for cmd in config.test_commands]
+        if CodeQualityCheck.TYPE_CHECK in config.pre_commit_checks:
+            checks += [
+                (CodeQualityCheck.TYPE_CHECK, cmd)
+                for cmd in file_commands([TYPE_CHECK_COMMAND])
+            ]
+        if not results.overall_success and config.fail_fast:
+            logger.error("❌ Format failed, skipping remaining checks")
+            checks = []
+
+        limit = asyncio.Semaphore(config.max_parallel_checks or os.cpu_count() or 1)
+
+        async def run_check(index: int) -> tuple[int, CommandResult]:
+            check, cmd = checks[index]
+            async with limit:
+                logger.info(f"Running {check.value}: {cmd}")
+                if check == CodeQualityCheck.TEST and TESTS_PLACEHOLDER in cmd:
+                    result = await StandardWorkflows.run_test_command(
+                        cmd, repo_path, changed_files
+                    )
                 else:
-                    logger.info(f"✅ Test passed: {cmd}")
+                    result = await StandardWorkflows.run_command(
+                        cmd, cwd=repo_path, label=check.value
+                    )
+            return index, result
 
-        # Run type checks
-        if CodeQualityCheck.TYPE_CHECK in config.pre_commit_checks:
-            type_check_cmd = "python -m mypy ."
-            logger.info(f"Running type check: {type_check_cmd}")
-            result = await StandardWorkflows.run_command(type_check_cmd, cwd=repo_path)
-            results.type_check_results.append(result)
-            if result.failed:
-                logger.error(f"❌ Type check failed: {type_check_cmd}")
-                logger.error(f"Error: {result.stderr}")
-                results.overall_success = False
-            else:
-                logger.info(f"✅ Type check passed: {type_check_cmd}")
+        tasks = [asyncio.create_task(run_check(index)) for index in range(len(checks))]
+        finished: dict[int, CommandResult] = {}
+        try:
+            for next_finished in asyncio.as_completed(tasks):
+                index, result = await next_finished
+                finished[index] = result
+                if result.failed and config.fail_fast:
+                    logger.error(
+                        f"❌ {checks[index][1]} failed, stopping remaining checks"
+                    )
+                    results.overall_success = False
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Report in configuration order rather than completion order
+        for index, (check, _) in enumerate(checks):
+            if index in finished:
+                StandardWorkflows._record_result(results, check, finished[index])
 
         if results.overall_success:
             logger.info("✅ All code quality checks passed")
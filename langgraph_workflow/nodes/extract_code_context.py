@@ -304,53 +304,14 @@ async def _call_claude_code_agent(prompt: str, repo_path: str) -> str:
     This calls the Claude CLI directly with the comprehensive analysis prompt,
     allowing Claude to access and analyze the actual codebase.
     """
-    import subprocess
-
-    from ..config import get_claude_cli_path, get_claude_cli_timeout
+    from ..claude_cli import claude_cli
 
     try:
         logger.info("🤖 Calling Claude CLI for comprehensive codebase analysis")
 
-        # First, check if Claude CLI is available
-        try:
-            version_check = subprocess.run(
-                [get_claude_cli_path(), "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if version_check.returncode != 0:
-                raise RuntimeError(
-                    f"Claude CLI version check failed: {version_check.stderr}"
-                )
-
-            logger.info(f"Claude CLI available: {version_check.stdout.strip()}")
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            raise RuntimeError(
-                f"Claude CLI not available or not responding: {e}"
-            ) from e
-
-        # Call Claude CLI with the comprehensive analysis prompt
-        claude_result = subprocess.run(
-            [get_claude_cli_path()],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=get_claude_cli_timeout(),
-            cwd=repo_path,  # Set working directory to repository path
-        )
-
-        if claude_result.returncode != 0:
-            error_msg = (
-                claude_result.stderr.strip()
-                if claude_result.stderr
-                else "Unknown error"
-            )
-            raise RuntimeError(
-                f"Claude CLI failed with return code {claude_result.returncode}: {error_msg}"
-            )
-
-        analysis_result = claude_result.stdout.strip()
+        # Runs in the repository without blocking the event loop; the
+        # process is killed if the workflow is aborted
+        analysis_result = await claude_cli.run(prompt, cwd=repo_path)
 
         if not analysis_result:
             raise RuntimeError("Claude CLI returned empty analysis")
@@ -358,10 +319,6 @@ async def _call_claude_code_agent(prompt: str, repo_path: str) -> str:
         logger.info(f"✅ Claude CLI analysis completed ({len(analysis_result)} chars)")
         return analysis_result
 
-    except subprocess.TimeoutExpired as e:
-        raise RuntimeError(
-            f"Claude CLI analysis timed out after {get_claude_cli_timeout()} seconds"
-        ) from e
     except Exception as e:
         logger.error(f"Error calling Claude CLI: {e}")
         raise RuntimeError(f"Claude CLI analysis failed: {e}") from e
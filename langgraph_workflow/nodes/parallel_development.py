@@ -9,6 +9,7 @@ import logging
 from pathlib import Path
 
 from ..enums import AgentType, ArtifactName, ModelRouter
+from ..model_calls import model_slot
 from ..node_config import CodeQualityCheck, NodeConfig, NodeDefinition, OutputLocation
 
 logger = logging.getLogger(__name__)
@@ -106,7 +107,8 @@ Focus on ensuring the feature is thoroughly tested and meets quality standards."
         "python -m pytest tests/ -v",
         "python -m pytest tests/integration/ -v",
     ],
-    lint_commands=["scripts/ruff-autofix.sh", "scripts/run-code-checks.sh"],
+    fix_commands=["scripts/ruff-autofix.sh {files}"],
+    lint_commands=["scripts/run-code-checks.sh {files}"],
     # PR feedback configuration
     pr_feedback_prompt="""Review and address the following implementation feedback from PR comments:
 
@@ -190,7 +192,8 @@ async def parallel_development_handler(state: dict) -> dict:
         )
         tasks.append(task)
 
-    # Wait for all agents to complete
+    # Wait for all agents to complete; each holds an Ollama slot while it
+    # works, so the fan-out stays within max_ollama_concurrent
     results = await asyncio.gather(*tasks)
 
     # Combine results
@@ -250,20 +253,21 @@ async def _execute_agent_development(
 ) -> dict:
     """Execute development task for a specific agent."""
 
-    logger.info(f"🤖 {agent_type} working on {assignment}")
+    async with model_slot(ModelRouter.OLLAMA):
+        logger.info(f"🤖 {agent_type} working on {assignment}")
 
-    # Simulate processing time
-    await asyncio.sleep(0.2)
+        # Simulate processing time
+        await asyncio.sleep(0.2)
 
-    # Mock agent development (replace with real agent calls)
-    if agent_type == AgentType.SENIOR_ENGINEER:
-        return await _mock_senior_engineer_implementation(context)
-    elif agent_type == AgentType.FAST_CODER:
-        return await _mock_fast_coder_implementation(context)
-    elif agent_type == AgentType.TEST_FIRST:
-        return await _mock_test_first_implementation(context)
-    else:
-        return {"code": "# No implementation", "files": []}
+        # Mock agent development (replace with real agent calls)
+        if agent_type == AgentType.SENIOR_ENGINEER:
+            return await _mock_senior_engineer_implementation(context)
+        elif agent_type == AgentType.FAST_CODER:
+            return await _mock_fast_coder_implementation(context)
+        elif agent_type == AgentType.TEST_FIRST:
+            return await _mock_test_first_implementation(context)
+        else:
+            return {"code": "# No implementation", "files": []}
 
 
 async def _mock_senior_engineer_implementation(context: dict) -> dict:
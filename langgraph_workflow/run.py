@@ -18,12 +18,15 @@ from langgraph_workflow import (
 )
 
 # Set up logging
+from langgraph_workflow.artifact_store import artifact_store
+from langgraph_workflow.claude_cli import claude_cli
 from langgraph_workflow.config import (
     WORKFLOW_CONFIG,
     get_checkpoint_path,
     get_ollama_base_url,
     get_ollama_model,
 )
+from langgraph_workflow.model_calls import cached_model_call, llm_cache
 from langgraph_workflow.startup_validation import (
     check_mock_mode,
     run_startup_validation,
@@ -46,7 +49,7 @@ logger = logging.getLogger(__name__)
 
 
 async def extract_feature_from_prd(
-    prd_content: str, feature_name: str, debug: bool = False
+    prd_content: str, feature_name: str, debug: bool = False, use_cache: bool = True
 ) -> str | None:
     """Extract a specific feature from a PRD document using LLM.
 
@@ -54,12 +57,12 @@ async def extract_feature_from_prd(
         prd_content: Full PRD content
         feature_name: Name/title of the feature to extract
         debug: Enable verbose output
+        use_cache: False to query the models even if this extraction is cached
 
     Returns:
         Feature description or None if not found
     """
     import os
-    import subprocess
 
     # Create prompt for feature extraction
     extraction_prompt = f"""You are a technical document analyzer. Extract the specific feature information from this PRD document.
@@ -95,10 +98,19 @@ Feature Extract:"""
 
         from langchain_core.messages import HumanMessage
 
-        response = await ollama_client.ainvoke(
-            [HumanMessage(content=extraction_prompt)]
+        async def extract_with_ollama() -> str:
+            response = await ollama_client.ainvoke(
+                [HumanMessage(content=extraction_prompt)]
+            )
+            return str(response.content).strip() if response.content else ""
+
+        extracted_content = await cached_model_call(
+            ModelRouter.OLLAMA,
+            extract_with_ollama,
+            extraction_prompt,
+            model=ollama_model,
+            use_cache=use_cache,
         )
-        extracted_content = str(response.content).strip() if response.content else ""
 
         if extracted_content and len(extracted_content) > 10:
             logger.info("✅ Successfully extracted feature using Ollama")
@@ -131,34 +143,23 @@ Feature Extract:"""
 
     # Fall back to Claude CLI if available
     try:
-        # Check if Claude CLI is available
-        claude_result = subprocess.run(
-            ["claude", "--version"], capture_output=True, text=True, timeout=5
-        )
-        use_claude_cli = (
-            claude_result.returncode == 0 and "Claude Code" in claude_result.stdout
-        )
-
-        if use_claude_cli:
+        if await claude_cli.is_available():
             logger.info("Attempting feature extraction with Claude CLI")
-            claude_result = subprocess.run(
-                ["claude"],
-                input=extraction_prompt,
-                capture_output=True,
-                text=True,
-                timeout=30,
+            # The runner holds the Claude slot itself, so only the cache is
+            # wrapped around it here
+            extracted_content = await llm_cache.call_async(
+                ModelRouter.CLAUDE_CODE.value,
+                lambda: claude_cli.run(extraction_prompt, timeout=30),
+                extraction_prompt,
+                model="claude-cli",
+                use_cache=use_cache,
             )
+            logger.info("Successfully extracted feature using Claude CLI")
 
-            if claude_result.returncode == 0:
-                extracted_content = claude_result.stdout.strip()
-                logger.info("Successfully extracted feature using Claude CLI")
-
-                # Check if feature was not found
-                if extracted_content == "FEATURE_NOT_FOUND":
-                    return None
-                return extracted_content
-            else:
-                logger.warning(f"Claude CLI failed: {claude_result.stderr}")
+            # Check if feature was not found
+            if extracted_content == "FEATURE_NOT_FOUND":
+                return None
+            return extracted_content
 
     except Exception as e:
         logger.warning(f"Claude CLI failed: {e}")
@@ -172,11 +173,19 @@ Feature Extract:"""
         if api_key:
             logger.info("Attempting feature extraction with Claude API")
             claude_model = ChatAnthropic()  # type: ignore
-            response = await claude_model.ainvoke(
-                [HumanMessage(content=extraction_prompt)]
-            )
-            extracted_content = (
-                str(response.content).strip() if response.content else ""
+
+            async def extract_with_claude_api() -> str:
+                response = await claude_model.ainvoke(
+                    [HumanMessage(content=extraction_prompt)]
+                )
+                return str(response.content).strip() if response.content else ""
+
+            extracted_content = await cached_model_call(
+                ModelRouter.CLAUDE_CODE,
+                extract_with_claude_api,
+                extraction_prompt,
+                model=claude_model.model,
+                use_cache=use_cache,
             )
 
             if extracted_content:
@@ -431,6 +440,9 @@ async def run_workflow(
             # Normal full execution
             result = await workflow.app.ainvoke(initial_state, config)
 
+    # Nodes return large documents as references to the artifact store
+    result = artifact_store.load_state(result)
+
     # Print results
     print("\n" + "=" * 60)
     print("WORKFLOW COMPLETE")
@@ -671,7 +683,9 @@ async def execute_single_step(
 
     # Execute the step
     print(f"📍 Initial phase: {initial_state.get('current_phase', 'Unknown')}")
-    result_state = await step_methods[step_name](initial_state)
+    result_state = artifact_store.load_state(
+        await step_methods[step_name](initial_state)
+    )
 
     # Restore logging level
     enhanced_logger.setLevel(original_level)
@@ -7,10 +7,10 @@ the multi-agent workflow with a web UI for monitoring and interaction.
 
 import logging
 import os
+from contextlib import asynccontextmanager
 from uuid import uuid4
 
 from dotenv import load_dotenv
-from langgraph.checkpoint.sqlite import SqliteSaver
 
 from langgraph_workflow import (
     EnhancedMultiAgentWorkflow,
@@ -20,6 +20,10 @@ from langgraph_workflow import (
     WorkflowPhase,
     WorkflowState,
 )
+from langgraph_workflow.checkpointing import (
+    close_async_checkpointers,
+    get_async_checkpointer,
+)
 from langgraph_workflow.config import get_checkpoint_path
 from langgraph_workflow.tests.mocks import create_mock_dependencies
 
@@ -137,10 +141,17 @@ def create_api_app():
     from fastapi import FastAPI, HTTPException
     from pydantic import BaseModel
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        # Requests share one checkpoint connection on the server's event loop
+        await close_async_checkpointers()
+
     app = FastAPI(
         title="Multi-Agent Workflow API",
         description="API for the LangGraph multi-agent development workflow",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     class WorkflowRequest(BaseModel):
@@ -180,12 +191,14 @@ def create_api_app():
         try:
             # Create workflow with mock dependencies (production mode disabled until dependencies are implemented)
             mock_deps = create_mock_dependencies(thread_id)
+            checkpoint_path = get_checkpoint_path("api_state")
             EnhancedMultiAgentWorkflow(
                 repo_path=repo_path,
                 thread_id=thread_id,
                 agents=mock_deps["agents"],
                 codebase_analyzer=mock_deps["codebase_analyzer"],
-                checkpoint_path=get_checkpoint_path("api_state"),
+                checkpoint_path=checkpoint_path,
+                checkpointer=await get_async_checkpointer(checkpoint_path),
             )
 
             # Note: In production, this would be queued or run in background
@@ -206,18 +219,18 @@ def create_api_app():
         """Get the status of a workflow."""
         try:
             # Load checkpoint to get current state
-            with SqliteSaver.from_conn_string(
+            checkpointer = await get_async_checkpointer(
                 get_checkpoint_path("api_state")
-            ) as checkpointer:
-                from langchain_core.runnables import RunnableConfig
+            )
+            from langchain_core.runnables import RunnableConfig
 
-                config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
-                checkpoint = checkpointer.get(config)
+            config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+            checkpoint = await checkpointer.aget(config)
 
-                if not checkpoint:
-                    raise HTTPException(status_code=404, detail="Workflow not found")
+            if not checkpoint:
+                raise HTTPException(status_code=404, detail="Workflow not found")
 
-                state = checkpoint.get("channel_values", {})
+            state = checkpoint.get("channel_values", {})
 
             return {
                 "thread_id": thread_id,
@@ -267,12 +280,15 @@ def create_api_app():
         try:
             # Load workflow with mock dependencies (production mode disabled until dependencies are implemented)
             mock_deps = create_mock_dependencies(thread_id)
+            checkpoint_path = get_checkpoint_path("api_state")
+            checkpointer = await get_async_checkpointer(checkpoint_path)
             workflow = EnhancedMultiAgentWorkflow(
                 repo_path=repo_path,
                 thread_id=thread_id,
                 agents=mock_deps["agents"],
                 codebase_analyzer=mock_deps["codebase_analyzer"],
-                checkpoint_path=get_checkpoint_path("api_state"),
+                checkpoint_path=checkpoint_path,
+                checkpointer=checkpointer,
             )
 
             # Get the step method
@@ -284,18 +300,15 @@ def create_api_app():
                 )
 
             # Load current state from checkpoint
-            with SqliteSaver.from_conn_string(
-                get_checkpoint_path("api_state")
-            ) as checkpointer:
-                from langchain_core.runnables import RunnableConfig
+            from langchain_core.runnables import RunnableConfig
 
-                config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
-                checkpoint = checkpointer.get(config)
+            config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+            checkpoint = await checkpointer.aget(config)
 
-                if not checkpoint:
-                    raise HTTPException(status_code=404, detail="Workflow not found")
+            if not checkpoint:
+                raise HTTPException(status_code=404, detail="Workflow not found")
 
-                current_state = checkpoint.get("channel_values", {})
+            current_state = checkpoint.get("channel_values", {})
 
             # Execute the step
             updated_state = await step_method(current_state)
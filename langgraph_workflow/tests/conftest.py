@@ -21,6 +21,38 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def disable_llm_cache(monkeypatch):
+    """Keep tests from reading or writing the persistent LLM response cache."""
+    from llm_cache import llm_cache
+
+    monkeypatch.setattr(llm_cache, "enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def temporary_artifact_store(monkeypatch, tmp_path):
+    """Keep offloaded state values out of the shared artifact store."""
+    from langgraph_workflow.artifact_store import artifact_store
+
+    monkeypatch.setattr(artifact_store, "root", tmp_path / "artifact_objects")
+
+
+@pytest.fixture(autouse=True)
+def temporary_checkpoints(monkeypatch, tmp_path):
+    """Keep default checkpoint databases and their shared savers per test."""
+    from langgraph_workflow.checkpointing import close_checkpointers
+
+    def checkpoint_path(name: str = "agent_state") -> str:
+        return str(tmp_path / f"{name}.db")
+
+    for module in ("enhanced_workflow", "run"):
+        monkeypatch.setattr(
+            f"langgraph_workflow.{module}.get_checkpoint_path", checkpoint_path
+        )
+    yield
+    close_checkpointers()
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers."""
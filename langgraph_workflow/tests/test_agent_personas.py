@@ -1,7 +1,13 @@
 """Tests for agent personas and their behaviors - using proper mocking per CLAUDE.md."""
 
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
+from llm_cache import ResponseCache
+
+from .. import model_calls
 from ..agent_personas import (
     ArchitectAgent,
     FastCoderAgent,
@@ -38,6 +44,21 @@ class TestLangGraphAgent(unittest.IsolatedAsyncioTestCase):
         # Verify call was tracked
         self.assertIn(("ask", prompt), self.mock_base_agent.call_history)
 
+    async def test_analyze_cached(self):
+        """Test a repeated prompt is answered from the response cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ResponseCache(Path(tmp_dir) / "llm_cache.db", enabled=True)
+            with patch.object(model_calls, "llm_cache", cache):
+                first = await self.agent.analyze("Cached prompt")
+                second = await self.agent.analyze("Cached prompt")
+                await self.agent.analyze("Cached prompt", use_cache=False)
+            cache.close()
+
+        self.assertEqual(first, second)
+        self.assertEqual(
+            self.mock_base_agent.call_history.count(("ask", "Cached prompt")), 2
+        )
+
     async def test_analyze_with_error(self):
         """Test analysis with error handling."""
         # CORRECT: Configure our mock to simulate error
@@ -0,0 +1,150 @@
+"""Tests for offloading large state values to the artifact store."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from ..artifact_store import ArtifactMissingError, ArtifactStore
+from ..enhanced_workflow import EnhancedMultiAgentWorkflow
+from ..enums import AgentType, ArtifactType, WorkflowStep
+from ..node_config import NodeConfig
+from ..run import execute_single_step
+from ..workflow_state import Artifact
+from .mocks import create_mock_agents
+
+DESIGN = "# Design\n" + "The design in detail.\n" * 200
+CODE = "def feature():\n    pass\n" * 200
+
+
+class TestArtifactStore(unittest.TestCase):
+    """Test storing and loading content by digest."""
+
+    def setUp(self):
+        """Create an empty store."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ArtifactStore(Path(self.temp_dir.name) / "objects")
+
+    def tearDown(self):
+        """Remove the store."""
+        self.temp_dir.cleanup()
+
+    def test_content_stored_once(self):
+        """Test identical content is stored under one digest."""
+        digest = self.store.put(DESIGN)
+
+        self.assertEqual(self.store.put(DESIGN), digest)
+        self.assertEqual(self.store.get(digest), DESIGN)
+        self.assertEqual(len(list(self.store.root.rglob("*"))), 2)  # dir and file
+
+    def test_missing_content_raises(self):
+        """Test reading an unknown digest raises."""
+        with self.assertRaises(ArtifactMissingError):
+            self.store.get("0" * 64)
+
+    def test_large_values_offloaded(self):
+        """Test large documents and analyses become references, small ones stay."""
+        state = self.store.offload_state(
+            {
+                "design_document": DESIGN,
+                "skeleton_code": "class Small: ...",
+                "agent_analyses": {
+                    AgentType.ARCHITECT: DESIGN,
+                    AgentType.TEST_FIRST: "",
+                },
+                "feature_description": DESIGN,
+            }
+        )
+        stored = dict(state.items())
+
+        self.assertIsInstance(stored["design_document"], Artifact)
+        self.assertEqual(stored["design_document"].type, ArtifactType.DESIGN)
+        self.assertEqual(stored["skeleton_code"], "class Small: ...")
+        self.assertIsInstance(stored["agent_analyses"][AgentType.ARCHITECT], Artifact)
+        self.assertEqual(stored["agent_analyses"][AgentType.TEST_FIRST], "")
+        self.assertEqual(stored["feature_description"], DESIGN)
+
+    def test_values_loaded_on_read(self):
+        """Test handlers read references as their content."""
+        state = self.store.offload_state(
+            {"design_document": DESIGN, "agent_analyses": {"architect": DESIGN}}
+        )
+        reloaded = self.store.lazy(dict(state.items()))
+
+        self.assertEqual(reloaded["design_document"], DESIGN)
+        self.assertEqual(reloaded.get("agent_analyses"), {"architect": DESIGN})
+        self.assertIsNone(reloaded.get("test_code"))
+        self.assertEqual(
+            self.store.load_state(dict(state.items()))["design_document"], DESIGN
+        )
+
+    def test_checkpoint_shrinks(self):
+        """Test the serialized state no longer carries the documents."""
+        state = {"design_document": DESIGN, "implementation_code": CODE}
+        serializer = JsonPlusSerializer()
+
+        inline = serializer.dumps_typed(state)[1]
+        offloaded = serializer.dumps_typed(dict(self.store.offload_state(state)))[1]
+
+        self.assertLess(len(offloaded) * 5, len(inline))
+
+
+class TestConfiguredHandler(unittest.IsolatedAsyncioTestCase):
+    """Test node handlers see loaded values and return references."""
+
+    async def test_node_reads_and_writes_plain_strings(self):
+        """Test a node reads an offloaded document and its output is offloaded."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = ArtifactStore(Path(temp_dir) / "objects")
+            workflow = EnhancedMultiAgentWorkflow(
+                repo_path=temp_dir,
+                agents=create_mock_agents(),  # type: ignore
+                codebase_analyzer=None,
+                checkpoint_path=str(Path(temp_dir) / "state.db"),
+                artifacts=store,
+            )
+            seen = {}
+
+            async def handler(state: dict) -> dict:
+                seen["design"] = state["design_document"]
+                state["implementation_code"] = CODE
+                return state
+
+            configured = workflow._create_configured_handler(
+                handler, NodeConfig(), WorkflowStep.PARALLEL_DEVELOPMENT
+            )
+            input_state = dict(store.offload_state({"design_document": DESIGN}))
+            result = await configured(input_state)
+
+            self.assertEqual(seen["design"], DESIGN)
+            self.assertIsInstance(dict(result.items())["implementation_code"], Artifact)
+            self.assertEqual(result["implementation_code"], CODE)
+
+
+class OffloadingWorkflow(EnhancedMultiAgentWorkflow):
+    """Workflow whose design step returns its document offloaded, as nodes do."""
+
+    async def create_design_document(self, state: dict) -> dict:
+        return self.artifacts.offload_state({**state, "design_document": DESIGN})
+
+
+class TestSingleStep(unittest.IsolatedAsyncioTestCase):
+    """Test states returned by step execution are loaded."""
+
+    async def test_single_step_returns_loaded_documents(self):
+        """Test a single step returns documents, not references to them."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = await execute_single_step(
+                OffloadingWorkflow,
+                WorkflowStep.CREATE_DESIGN_DOCUMENT.value,
+                temp_dir,
+                checkpoint_path=str(Path(temp_dir) / "state.db"),
+                input_state={"thread_id": "step", "repo_path": temp_dir},
+            )
+
+        self.assertEqual(dict(result.items())["design_document"], DESIGN)
+
+
+if __name__ == "__main__":
+    unittest.main()
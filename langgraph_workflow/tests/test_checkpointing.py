@@ -0,0 +1,212 @@
+"""Tests for the shared, tuned SQLite checkpointers."""
+
+import asyncio
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, TypedDict
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import StateGraph
+
+from ..artifact_store import ArtifactStore
+from ..checkpointing import (
+    close_async_checkpointers,
+    close_checkpointers,
+    get_async_checkpointer,
+    get_checkpointer,
+)
+from ..enhanced_workflow import EnhancedMultiAgentWorkflow
+from .mocks import create_mock_agents
+
+
+class CounterState(TypedDict):
+    count: int
+
+
+class DocumentState(TypedDict):
+    count: int
+    design_document: Any
+
+
+def compile_counter(checkpointer):
+    """Compile a one-node graph that increments a counter."""
+    graph = StateGraph(CounterState)
+    graph.add_node("increment", lambda state: {"count": state["count"] + 1})
+    graph.set_entry_point("increment")
+    graph.set_finish_point("increment")
+    return graph.compile(checkpointer=checkpointer)
+
+
+def compile_documents(checkpointer, store: ArtifactStore):
+    """Compile a graph writing a new, offloaded design document version."""
+
+    def revise(state):
+        count = state["count"] + 1
+        revised = {"count": count, "design_document": f"Version {count}\n" * 200}
+        return dict(store.offload_state(revised).items())
+
+    graph = StateGraph(DocumentState)
+    graph.add_node("revise", revise)
+    graph.set_entry_point("revise")
+    graph.set_finish_point("revise")
+    return graph.compile(checkpointer=checkpointer)
+
+
+def document_path(store: ArtifactStore, version: int) -> Path:
+    content = f"Version {version}\n" * 200
+    return store.path_for(hashlib.sha256(content.encode()).hexdigest())
+
+
+def config(thread_id: str) -> RunnableConfig:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+class TestSharedCheckpointer(unittest.TestCase):
+    """Test the process-wide synchronous saver."""
+
+    def setUp(self):
+        """Create a directory for the databases."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "state.db"
+
+    def tearDown(self):
+        """Close the shared connections and remove the databases."""
+        close_checkpointers()
+        self.temp_dir.cleanup()
+
+    def count_checkpoints(self, saver, thread_id: str) -> int:
+        return saver.conn.execute(
+            "SELECT COUNT(*) FROM checkpoints WHERE thread_id = ?", (thread_id,)
+        ).fetchone()[0]
+
+    def test_connection_tuned(self):
+        """Test the connection uses WAL, relaxed syncing and incremental vacuum."""
+        conn = get_checkpointer(self.path).conn
+
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+        self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)
+        self.assertGreater(conn.execute("PRAGMA mmap_size").fetchone()[0], 0)
+
+    def test_workflows_share_one_connection(self):
+        """Test workflows on the same database reuse its saver."""
+
+        def workflow(path):
+            return EnhancedMultiAgentWorkflow(
+                repo_path=self.temp_dir.name,
+                agents=create_mock_agents(),  # type: ignore
+                codebase_analyzer=None,
+                checkpoint_path=str(path),
+            )
+
+        first = workflow(self.path)
+
+        self.assertIs(workflow(self.path).checkpointer, first.checkpointer)
+        self.assertIsNot(
+            workflow(self.path.with_name("other.db")).checkpointer,
+            first.checkpointer,
+        )
+
+    def test_old_checkpoints_pruned_periodically(self):
+        """Test a thread keeps only its recent checkpoints and its latest state."""
+        saver = get_checkpointer(self.path)
+        saver.schedule.keep = 3
+        saver.schedule.prune_every = 4
+        app = compile_counter(saver)
+
+        for count in range(6):
+            app.invoke({"count": count}, config("thread"))
+        app.invoke({"count": 0}, config("other"))
+
+        self.assertLessEqual(self.count_checkpoints(saver, "thread"), 3 + 3)
+        self.assertEqual(app.get_state(config("thread")).values["count"], 6)
+
+        self.assertGreater(saver.prune_thread("thread", keep=1), 0)
+        self.assertEqual(self.count_checkpoints(saver, "thread"), 1)
+        self.assertEqual(self.count_checkpoints(saver, "other"), 3)
+        self.assertEqual(app.get_state(config("thread")).values["count"], 6)
+
+    def test_unreferenced_artifacts_collected_with_pruned_checkpoints(self):
+        """Test pruning deletes stored documents no checkpoint refers to."""
+        store = ArtifactStore(Path(self.temp_dir.name) / "objects", gc_grace_seconds=0)
+        saver = get_checkpointer(self.path)
+        saver.artifacts = store
+        app = compile_documents(saver, store)
+        for count in range(4):
+            app.invoke({"count": count}, config("thread"))
+        # Another workflow's database still refers to the first version
+        other = get_checkpointer(self.path.with_name("other.db"))
+        compile_documents(other, store).invoke({"count": 0}, config("thread"))
+
+        saver.prune_thread("thread", keep=1)
+
+        kept = {
+            version for version in range(1, 5) if document_path(store, version).exists()
+        }
+        self.assertEqual(kept, {1, 4})
+
+    def test_async_invocation(self):
+        """Test the shared saver supports invoking workflows asynchronously."""
+        saver = get_checkpointer(self.path)
+        app = compile_counter(saver)
+
+        async def run():
+            await app.ainvoke({"count": 1}, config("thread"))
+            return [checkpoint async for checkpoint in saver.alist(config("thread"))]
+
+        checkpoints = asyncio.run(run())
+
+        self.assertEqual(checkpoints[0].checkpoint["channel_values"]["count"], 2)
+
+
+class TestAsyncCheckpointer(unittest.IsolatedAsyncioTestCase):
+    """Test the per-event-loop async saver."""
+
+    async def asyncSetUp(self):
+        """Create a directory for the database."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "state.db"
+
+    async def asyncTearDown(self):
+        """Close the loop's connections and remove the database."""
+        await close_async_checkpointers()
+        self.temp_dir.cleanup()
+
+    async def test_saver_shared_and_pruned(self):
+        """Test the loop's saver is reused and prunes old checkpoints."""
+        saver = await get_async_checkpointer(self.path)
+        self.assertIs(await get_async_checkpointer(self.path), saver)
+        app = compile_counter(saver)
+
+        for count in range(3):
+            await app.ainvoke({"count": count}, config("thread"))
+        deleted = await saver.aprune_thread("thread", keep=1)
+
+        checkpoints = [c async for c in saver.alist(config("thread"))]
+        self.assertGreater(deleted, 0)
+        self.assertEqual(len(checkpoints), 1)
+        self.assertEqual(checkpoints[0].checkpoint["channel_values"]["count"], 3)
+        async with saver.conn.execute("PRAGMA journal_mode") as cursor:
+            row = await cursor.fetchone()
+        assert row is not None
+        self.assertEqual(row[0], "wal")
+
+    async def test_unreferenced_artifacts_collected(self):
+        """Test async pruning deletes stored documents only pruned ones used."""
+        store = ArtifactStore(Path(self.temp_dir.name) / "objects", gc_grace_seconds=0)
+        saver = await get_async_checkpointer(self.path)
+        saver.artifacts = store
+        app = compile_documents(saver, store)
+        for count in range(3):
+            await app.ainvoke({"count": count}, config("thread"))
+
+        await saver.aprune_thread("thread", keep=1)
+
+        self.assertFalse(document_path(store, 1).exists())
+        self.assertTrue(document_path(store, 3).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
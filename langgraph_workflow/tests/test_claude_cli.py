@@ -0,0 +1,186 @@
+"""Tests for the async Claude CLI runner."""
+
+import asyncio
+import os
+import stat
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from ..claude_cli import ClaudeCLI, ClaudeCLIError
+from ..enums import ModelRouter
+from ..model_calls import model_slot
+
+FAKE_CLAUDE = """#!/bin/sh
+if [ "$1" = "--version" ]; then
+  echo probe >> "{probe_log}"
+  if [ -e "{broken_flag}" ]; then
+    echo "not installed" >&2
+    exit 1
+  fi
+  sleep 0.1
+  echo "1.0.0 (Claude Code)"
+  exit 0
+fi
+prompt=$(cat)
+case "$prompt" in
+  fail*) echo "bad prompt" >&2; exit 2;;
+  long*) head -c 200000 /dev/zero | tr '\\0' x; echo; echo after;;
+  hang*) echo $$ > "{pid_file}"; echo started; sleep 30;;
+  pwd*) pwd;;
+  *) echo "first: $prompt"; echo "second";;
+esac
+"""
+
+
+def _process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class TestClaudeCLI(unittest.IsolatedAsyncioTestCase):
+    """Test running prompts through a fake Claude CLI."""
+
+    def setUp(self):
+        """Write the fake CLI into a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.temp_dir.name)
+        self.probe_log = self.dir / "probes.log"
+        self.pid_file = self.dir / "claude.pid"
+        self.broken_flag = self.dir / "broken"
+        cli_path = self.dir / "claude"
+        cli_path.write_text(
+            FAKE_CLAUDE.format(
+                probe_log=self.probe_log,
+                pid_file=self.pid_file,
+                broken_flag=self.broken_flag,
+            )
+        )
+        cli_path.chmod(cli_path.stat().st_mode | stat.S_IEXEC)
+        self.claude = ClaudeCLI(str(cli_path))
+
+    def tearDown(self):
+        """Remove the fake CLI."""
+        self.temp_dir.cleanup()
+
+    async def _wait_for_pid(self) -> int:
+        for _ in range(100):
+            if self.pid_file.exists() and self.pid_file.read_text().strip():
+                return int(self.pid_file.read_text())
+            await asyncio.sleep(0.02)
+        self.fail("Fake Claude CLI did not start")
+
+    async def test_run_returns_output(self):
+        """Test the prompt is sent on stdin and the output collected."""
+        result = await self.claude.run("analyze this")
+
+        self.assertEqual(result, "first: analyze this\nsecond")
+
+    async def test_stream_yields_lines(self):
+        """Test output is streamed line by line."""
+        lines = [line async for line in self.claude.stream("hello")]
+
+        self.assertEqual(lines, ["first: hello", "second"])
+
+    async def test_runs_in_working_directory(self):
+        """Test Claude runs in the given directory."""
+        result = await self.claude.run("pwd", cwd=str(self.dir))
+
+        self.assertEqual(Path(result).resolve(), self.dir.resolve())
+
+    async def test_version_probed_once(self):
+        """Test the version check is cached across runs."""
+        await self.claude.run("one")
+        await self.claude.run("two")
+
+        self.assertTrue(await self.claude.is_available())
+        self.assertEqual(self.probe_log.read_text().count("probe"), 1)
+
+    async def test_stream_handles_lines_beyond_reader_limit(self):
+        """Test a line longer than the StreamReader limit is streamed whole."""
+        lines = [line async for line in self.claude.stream("long")]
+
+        self.assertEqual(lines, ["x" * 200000, "after"])
+
+    async def test_concurrent_version_probes_coalesce(self):
+        """Test concurrent first runs share one version probe."""
+        versions = await asyncio.gather(*(self.claude.version() for _ in range(5)))
+
+        self.assertEqual(set(versions), {"1.0.0 (Claude Code)"})
+        self.assertEqual(self.probe_log.read_text().count("probe"), 1)
+
+    async def test_failed_version_probe_not_cached(self):
+        """Test a CLI that starts working after a failed probe is found."""
+        self.broken_flag.touch()
+        self.assertFalse(await self.claude.is_available())
+
+        self.broken_flag.unlink()
+
+        self.assertTrue(await self.claude.is_available())
+        self.assertEqual(self.probe_log.read_text().count("probe"), 2)
+
+    async def test_failure_raises_with_stderr(self):
+        """Test a failing run raises with the CLI's error output."""
+        with self.assertRaises(ClaudeCLIError) as context:
+            await self.claude.run("fail please")
+
+        self.assertIn("return code 2", str(context.exception))
+        self.assertIn("bad prompt", str(context.exception))
+
+    async def test_missing_cli_unavailable(self):
+        """Test a missing CLI is reported as unavailable."""
+        missing = ClaudeCLI(str(self.dir / "no-such-claude"))
+
+        self.assertFalse(await missing.is_available())
+        with self.assertRaises(ClaudeCLIError):
+            await missing.run("anything")
+
+    async def test_timeout_kills_process(self):
+        """Test a run over its timeout raises and its process is killed."""
+        start = time.perf_counter()
+        with self.assertRaises(ClaudeCLIError) as context:
+            await self.claude.run("hang", timeout=0.5)
+
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertIn("timed out", str(context.exception))
+        self.assertFalse(_process_exists(await self._wait_for_pid()))
+
+    async def test_timeout_starts_once_slot_held(self):
+        """Test time queued behind another Claude call does not count."""
+        await self.claude.version()
+        release = asyncio.Event()
+
+        async def hold_slot():
+            async with model_slot(ModelRouter.CLAUDE_CODE):
+                await release.wait()
+
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+        run = asyncio.create_task(self.claude.run("hello", timeout=0.5))
+        await asyncio.sleep(1)
+        self.assertFalse(run.done())
+
+        release.set()
+        await holder
+
+        self.assertEqual(await run, "first: hello\nsecond")
+
+    async def test_cancellation_kills_process(self):
+        """Test cancelling a run, as an aborted workflow does, kills the CLI."""
+        task = asyncio.create_task(self.claude.run("hang"))
+        pid = await self._wait_for_pid()
+        self.assertTrue(_process_exists(pid))
+
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertFalse(_process_exists(pid))
+
+
+if __name__ == "__main__":
+    unittest.main()
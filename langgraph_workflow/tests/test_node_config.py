@@ -0,0 +1,223 @@
+"""Tests for the code quality gate in StandardWorkflows."""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ..node_config import CodeQualityCheck, NodeConfig, StandardWorkflows
+
+
+class TestCodeQualityChecks(unittest.IsolatedAsyncioTestCase):
+    """Test concurrent, file-restricted code quality checks."""
+
+    def setUp(self):
+        """Create a repository directory with a changed Python file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repo = Path(self.temp_dir.name)
+        (self.repo / "module.py").write_text("x = 1\n")
+        (self.repo / "notes.md").write_text("notes\n")
+
+    def tearDown(self):
+        """Remove the repository directory."""
+        self.temp_dir.cleanup()
+
+    async def _run(self, changed_files=None, **config_args):
+        # The default autofix script is not part of the temporary repository
+        config_args.setdefault("fix_commands", [])
+        config = NodeConfig(**config_args)
+        return await StandardWorkflows.run_code_quality_checks(
+            config, str(self.repo), changed_files=changed_files
+        )
+
+    async def test_checks_run_concurrently(self):
+        """Test lint, test and type checks overlap instead of queuing."""
+        start = time.perf_counter()
+        results = await self._run(
+            pre_commit_checks=[CodeQualityCheck.LINT, CodeQualityCheck.TEST],
+            lint_commands=["sleep 0.5", "sleep 0.5"],
+            test_commands=["sleep 0.5"],
+            max_parallel_checks=3,
+        )
+
+        self.assertLess(time.perf_counter() - start, 1.2)
+        self.assertTrue(results.overall_success)
+        self.assertEqual(len(results.lint_results), 2)
+        self.assertEqual(len(results.test_results), 1)
+
+    async def test_results_in_configuration_order(self):
+        """Test results are reported in the order the commands are configured."""
+        results = await self._run(
+            pre_commit_checks=[CodeQualityCheck.TEST],
+            test_commands=["sleep 0.3; echo slow", "echo fast"],
+        )
+
+        self.assertEqual(
+            [result.stdout.strip() for result in results.test_results],
+            ["slow", "fast"],
+        )
+
+    async def test_failure_fails_gate(self):
+        """Test a failing check fails the gate but others still run."""
+        results = await self._run(
+            pre_commit_checks=[CodeQualityCheck.LINT, CodeQualityCheck.TEST],
+            lint_commands=["echo lint error >&2; exit 1"],
+            test_commands=["sleep 0.2; echo tests ran"],
+        )
+
+        self.assertFalse(results.overall_success)
+        self.assertIn("lint error", results.lint_results[0].stderr)
+        self.assertEqual(results.test_results[0].stdout.strip(), "tests ran")
+
+    async def test_fail_fast_stops_remaining_checks(self):
+        """Test fail-fast kills slow checks after the first failure."""
+        start = time.perf_counter()
+        results = await self._run(
+            pre_commit_checks=[CodeQualityCheck.LINT, CodeQualityCheck.TEST],
+            lint_commands=["exit 1"],
+            test_commands=["sleep 10"],
+            fail_fast=True,
+        )
+
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertFalse(results.overall_success)
+        self.assertEqual(len(results.lint_results), 1)
+        self.assertEqual(results.test_results, [])
+
+    async def test_checks_restricted_to_changed_files(self):
+        """Test file commands only get changed Python files."""
+        results = await self._run(
+            changed_files=["module.py", "notes.md", "deleted.py"],
+            pre_commit_checks=[CodeQualityCheck.LINT],
+            lint_commands=["echo {files}"],
+        )
+
+        self.assertEqual(results.lint_results[0].stdout.strip(), "module.py")
+
+    async def test_whole_repository_when_changes_unknown(self):
+        """Test file commands check the whole repository without changed files."""
+        results = await self._run(
+            changed_files=[],
+            pre_commit_checks=[CodeQualityCheck.LINT],
+            lint_commands=["echo {files}"],
+        )
+
+        self.assertEqual(results.lint_results[0].stdout.strip(), ".")
+
+    async def test_file_commands_skipped_without_python_changes(self):
+        """Test file commands are skipped when no Python files changed."""
+        results = await self._run(
+            changed_files=["notes.md"],
+            pre_commit_checks=[CodeQualityCheck.LINT, CodeQualityCheck.TYPE_CHECK],
+            lint_commands=["echo {files}", "echo always"],
+        )
+
+        self.assertEqual(
+            [result.command for result in results.lint_results], ["echo always"]
+        )
+        self.assertEqual(results.type_check_results, [])
+
+    async def test_fix_commands_run_before_checks(self):
+        """Test format commands finish before the checks read the files."""
+        results = await self._run(
+            changed_files=["module.py"],
+            pre_commit_checks=[CodeQualityCheck.FORMAT, CodeQualityCheck.LINT],
+            fix_commands=["sleep 0.2; echo 'x = 2' > {files}"],
+            lint_commands=["cat {files}"],
+        )
+
+        self.assertTrue(results.format_results[0].succeeded)
+        self.assertEqual(results.lint_results[0].stdout.strip(), "x = 2")
+
+    async def test_lint_runs_fix_commands(self):
+        """Test selecting lint alone still autofixes before checking."""
+        results = await self._run(
+            changed_files=["module.py"],
+            pre_commit_checks=[CodeQualityCheck.LINT],
+            fix_commands=["echo 'x = 2' > {files}"],
+            lint_commands=["cat {files}"],
+        )
+
+        self.assertEqual(len(results.format_results), 1)
+        self.assertEqual(results.lint_results[0].stdout.strip(), "x = 2")
+
+    async def test_output_lines_beyond_reader_limit(self):
+        """Test a command's output is kept whole when a line exceeds 64 KiB."""
+        result = await StandardWorkflows.run_command(
+            "head -c 200000 /dev/zero | tr '\\0' x; echo; echo after",
+            cwd=str(self.repo),
+        )
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.stdout, "x" * 200000 + "\nafter\n")
+
+    def _write_tests(self, module_test: str = "") -> None:
+        tests = self.repo / "tests"
+        tests.mkdir()
+        (tests / "test_module.py").write_text(f"import module\n{module_test}")
+        # Leaves a marker behind, to show whether the remaining tests ran
+        (tests / "test_other.py").write_text(
+            "from pathlib import Path\n\n\n"
+            "def test_other():\n"
+            "    Path('other_ran').touch()\n"
+        )
+
+    async def test_affected_tests_run_before_the_rest(self):
+        """Test {tests} expands to affected test files, then the remaining ones."""
+        self._write_tests()
+
+        results = await self._run(
+            changed_files=["module.py"],
+            pre_commit_checks=[CodeQualityCheck.TEST],
+            test_commands=["echo {tests}"],
+        )
+
+        self.assertEqual(len(results.test_results), 1)
+        self.assertEqual(
+            results.test_results[0].stdout.split(),
+            ["tests/test_module.py", "tests/test_other.py"],
+        )
+
+    async def test_failing_affected_tests_skip_the_rest(self):
+        """Test the remaining tests only run once the affected ones pass."""
+        self._write_tests()
+
+        results = await self._run(
+            changed_files=["module.py"],
+            pre_commit_checks=[CodeQualityCheck.TEST],
+            test_commands=["echo {tests} >> ran.txt && false"],
+        )
+
+        self.assertFalse(results.overall_success)
+        self.assertEqual(
+            (self.repo / "ran.txt").read_text().split(), ["tests/test_module.py"]
+        )
+
+    async def test_pytest_command_runs_through_impact_runner(self):
+        """Test a pytest {tests} command runs the rest only after affected tests."""
+        self._write_tests("\n\ndef test_module():\n    assert module.x == 2\n")
+
+        with patch.dict(os.environ, {"PYTEST_DISABLE_PLUGIN_AUTOLOAD": "1"}):
+            failed = await self._run(
+                changed_files=["module.py"],
+                pre_commit_checks=[CodeQualityCheck.TEST],
+                test_commands=["python -m pytest -p no:cacheprovider -q {tests}"],
+            )
+            self.assertFalse(failed.overall_success)
+            self.assertIn("test_module", failed.test_results[0].stdout)
+            self.assertFalse((self.repo / "other_ran").exists())
+
+            (self.repo / "module.py").write_text("x = 2\n")
+            passed = await self._run(
+                changed_files=["module.py"],
+                pre_commit_checks=[CodeQualityCheck.TEST],
+                test_commands=["python -m pytest -p no:cacheprovider -q {tests}"],
+            )
+            self.assertTrue(passed.overall_success)
+            self.assertTrue((self.repo / "other_ran").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -53,11 +53,13 @@ class WorkflowState(TypedDict):
     messages_window: Annotated[list[BaseMessage], lambda x, y: y[-10:]]  # Keep last 10
     summary_log: str
 
-    # Artifacts and documents
+    # Artifacts and documents. Large documents, code and analyses are
+    # checkpointed as Artifact references to the artifact store; node
+    # handlers see them loaded as strings.
     artifacts_index: dict[str, str]  # key -> path mapping
-    code_context_document: str | None
-    design_constraints_document: str | None
-    design_document: str | None
+    code_context_document: str | Artifact | None
+    design_constraints_document: str | Artifact | None
+    design_document: str | Artifact | None
     arbitration_log: list[Arbitration]
 
     # Git integration
@@ -67,14 +69,14 @@ class WorkflowState(TypedDict):
     pr_number: int | None
 
     # Agent outputs
-    agent_analyses: dict[AgentType, str]  # agent_type -> analysis
-    synthesis_document: str | None
+    agent_analyses: dict[AgentType, str | Artifact]  # agent_type -> analysis
+    synthesis_document: str | Artifact | None
     conflicts: list[dict[str, Any]]
 
     # Implementation artifacts
-    skeleton_code: str | None
-    test_code: str | None
-    implementation_code: str | None
+    skeleton_code: str | Artifact | None
+    test_code: str | Artifact | None
+    implementation_code: str | Artifact | None
     patch_queue: list[str]  # Paths to patches
 
     # Quality and status
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+
+"""
+LLM Response Cache
+Content-addressed cache of model responses shared by the LangGraph and
+multi-agent workflows.
+
+Re-running or resuming a workflow sends the same prompts to the same
+personas again. Responses are stored in SQLite under ``DATA_DIR``, keyed by
+a hash of backend, model, system prompt, temperature and prompt, so repeated
+calls are answered without waiting for the model. Entries expire after a TTL
+and the least recently used ones are evicted once the cache outgrows its size
+limit. Setting ``LLM_CACHE`` to ``off`` disables the cache; single calls opt
+out with ``use_cache=False``.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from constants import LLM_CACHE_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+# Environment variable that disables the cache when set to "off"
+LLM_CACHE_ENV = "LLM_CACHE"
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+def cache_key(
+    backend: str,
+    prompt: str,
+    model: str | None = None,
+    system_prompt: str | None = None,
+    temperature: float | None = None,
+) -> str:
+    """Return the cache key of a model call.
+
+    Args:
+        backend: Backend the call is made to, such as ``ollama``
+        prompt: Prompt sent to the model
+        model: Model name, if the backend has a choice of models
+        system_prompt: System prompt the model is given
+        temperature: Sampling temperature, if set
+
+    Returns:
+        Hex SHA-256 digest identifying the call
+    """
+    payload = json.dumps(
+        {
+            "backend": backend,
+            "model": model,
+            "system_prompt": system_prompt,
+            "temperature": temperature,
+            "prompt": hashlib.sha256(prompt.encode()).hexdigest(),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed cache of model responses"""
+
+    def __init__(
+        self,
+        db_path: str | Path = LLM_CACHE_DB_PATH,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        enabled: bool | None = None,
+    ):
+        """Initialize the cache; the database is opened on first use.
+
+        Args:
+            db_path: SQLite database file
+            ttl_seconds: Age after which entries are ignored, or None to keep them
+            max_bytes: Total response size above which old entries are evicted
+            enabled: Whether calls are cached; defaults to the ``LLM_CACHE`` setting
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        if enabled is None:
+            enabled = os.environ.get(LLM_CACHE_ENV, "on").lower() != "off"
+        self.enabled = enabled
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=30.0,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    backend TEXT NOT NULL,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_last_used "
+                "ON responses(last_used)"
+            )
+            self._connection = conn
+        return self._connection
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for a key, or None on a miss."""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._get_connection()
+                row = conn.execute(
+                    "SELECT response, created_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and self._expired(row[1], now):
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    return None
+                conn.execute(
+                    "UPDATE responses SET last_used = ? WHERE key = ?", (now, key)
+                )
+                self.hits += 1
+                return str(row[0])
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            return None
+
+    def put(
+        self, key: str, response: str, backend: str, model: str | None = None
+    ) -> None:
+        """Store a response, evicting old entries if the cache is too large.
+
+        Empty responses are not stored.
+        """
+        if not response:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._get_connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, backend, model, response, size, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, backend, model, response, len(response), now, now),
+                )
+                self._evict(conn, now)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache store failed: {e}")
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at >= self.ttl_seconds
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the limit"""
+        if self.ttl_seconds is not None:
+            cursor = conn.execute(
+                "DELETE FROM responses WHERE created_at <= ?",
+                (now - self.ttl_seconds,),
+            )
+            self.evictions += cursor.rowcount
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[
+            0
+        ]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+        logger.debug(f"Evicted {len(evicted)} LLM cache entries over the size limit")
+
+    def call(
+        self,
+        backend: str,
+        call: Callable[[], str],
+        prompt: str,
+        model: str | None = None,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Return the cached response to a prompt, or make the call and cache it.
+
+        Args:
+            backend: Backend the call is made to, such as ``ollama``
+            call: Makes the model call when invoked
+            prompt: Prompt the call sends
+            model: Model name, if the backend has a choice of models
+            system_prompt: System prompt the model is given
+            temperature: Sampling temperature, if set
+            use_cache: False to always make the call and not store its response
+
+        Returns:
+            The model's response
+        """
+        if not (use_cache and self.enabled):
+            return call()
+        key = cache_key(backend, prompt, model, system_prompt, temperature)
+        cached = self.get(key)
+        if cached is not None:
+            logger.info(f"Using cached {backend} response")
+            return cached
+        response = call()
+        self.put(key, response, backend, model)
+        return response
+
+    async def call_async(
+        self,
+        backend: str,
+        call: Callable[[], Awaitable[str]],
+        prompt: str,
+        model: str | None = None,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Async version of ``call`` for calls that return an awaitable.
+
+        The SQLite lookup and store run in a worker thread so they do not
+        block the event loop.
+        """
+        if not (use_cache and self.enabled):
+            return await call()
+        key = cache_key(backend, prompt, model, system_prompt, temperature)
+        cached = await asyncio.to_thread(self.get, key)
+        if cached is not None:
+            logger.info(f"Using cached {backend} response")
+            return cached
+        response = await call()
+        await asyncio.to_thread(self.put, key, response, backend, model)
+        return response
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._get_connection().execute("DELETE FROM responses")
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit and miss counts and the cache's current size."""
+        lookups = self.hits + self.misses
+        stats: dict[str, Any] = {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+        if self._connection is not None:
+            with self._lock:
+                entries, size = self._connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+            stats.update(entries=entries, bytes=size)
+        return stats
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Process-wide cache used by the workflows' model calls
+llm_cache = ResponseCache()
@@ -1,23 +1,36 @@
 """
 JSON-RPC 2.0 Protocol Implementation for LSP
 
-This module leverages python-lsp-jsonrpc package for all core functionality
-and provides only minimal compatibility wrappers where needed.
+This module leverages python-lsp-jsonrpc package for message serialization
+and provides only minimal compatibility wrappers where needed. Incoming
+Content-Length framed messages are decoded incrementally by LSPFrameDecoder,
+which uses orjson when it is installed.
 """
 
+import asyncio
 import io
 import json
 import logging
 import uuid
 from typing import Any
 
-from pylsp_jsonrpc.streams import JsonRpcStreamReader, JsonRpcStreamWriter
+from pylsp_jsonrpc.streams import JsonRpcStreamWriter
 
 from lsp_constants import (
     JsonRPCMessage,
     LSPErrorCode,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+HEADER_TERMINATOR = b"\r\n\r\n"
+CONTENT_LENGTH_HEADER = "Content-Length"
+DEFAULT_READ_CHUNK_SIZE = 64 * 1024
+MAX_HEADER_SIZE = 8 * 1024
+
 
 class JSONRPCError(Exception):
     """Exception for JSON-RPC protocol errors."""
@@ -29,6 +42,167 @@ class JSONRPCError(Exception):
         super().__init__(f"JSON-RPC Error {code.value}: {message}")
 
 
+def _loads(payload: bytes | bytearray | memoryview) -> Any:
+    """Decode a JSON body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    # The stdlib parser does not accept memoryview objects
+    if isinstance(payload, memoryview):
+        payload = payload.tobytes()
+    return json.loads(payload)
+
+
+def _dumps(message: Any) -> bytes:
+    """Encode a JSON body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(message)
+    return json.dumps(message, separators=(",", ":")).encode("utf-8")
+
+
+def _parse_headers(raw_headers: bytes | memoryview) -> dict[str, str]:
+    """Parse the header block of an LSP frame (without the terminator)."""
+    try:
+        header_text = str(raw_headers, "utf-8")
+    except UnicodeDecodeError as e:
+        raise JSONRPCError(
+            LSPErrorCode.PARSE_ERROR, f"Message parsing error: {e}"
+        ) from e
+
+    headers = {}
+    for line in header_text.split("\r\n"):
+        if ":" in line:
+            key, value = line.split(":", 1)
+            headers[key.strip()] = value.strip()
+    return headers
+
+
+def _content_length(headers: dict[str, str]) -> int:
+    """Return the validated Content-Length of an LSP frame."""
+    if CONTENT_LENGTH_HEADER not in headers:
+        raise JSONRPCError(LSPErrorCode.PARSE_ERROR, "Missing Content-Length header")
+    try:
+        length = int(headers[CONTENT_LENGTH_HEADER])
+    except ValueError as e:
+        raise JSONRPCError(
+            LSPErrorCode.PARSE_ERROR, f"Invalid Content-Length header: {e}"
+        ) from e
+    if length < 0:
+        raise JSONRPCError(
+            LSPErrorCode.PARSE_ERROR, f"Invalid Content-Length header: {length}"
+        )
+    return length
+
+
+def encode_lsp_message(message: dict[str, Any]) -> bytes:
+    """Serialize a message into a Content-Length framed LSP payload."""
+    body = _dumps(message)
+    return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+class LSPFrameDecoder:
+    """Incremental decoder for Content-Length framed LSP messages.
+
+    Incoming bytes are appended to a single growing buffer. Complete frames are
+    sliced out through a memoryview and decoded with exactly one JSON parse, so
+    large responses are never copied into intermediate strings.
+    """
+
+    def __init__(self, max_header_size: int = MAX_HEADER_SIZE):
+        self._buffer = bytearray()
+        self._max_header_size = max_header_size
+        # Headers of the frame currently being assembled, once they are complete
+        self._headers: dict[str, str] | None = None
+        self._body_length = 0
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Number of received bytes not yet consumed by a complete frame."""
+        return len(self._buffer)
+
+    def feed(self, data: bytes | bytearray | memoryview) -> None:
+        """Append raw bytes received from the server."""
+        self._buffer += data
+
+    def next_frame(self) -> tuple[dict[str, str], Any] | None:
+        """Return the next complete ``(headers, message)`` pair, if available."""
+        if self._headers is None:
+            header_end = self._buffer.find(HEADER_TERMINATOR)
+            if header_end == -1:
+                if len(self._buffer) > self._max_header_size:
+                    raise JSONRPCError(
+                        LSPErrorCode.PARSE_ERROR,
+                        f"LSP header exceeds {self._max_header_size} bytes",
+                    )
+                return None
+
+            with memoryview(self._buffer) as view, view[:header_end] as raw:
+                headers = _parse_headers(raw)
+            self._body_length = _content_length(headers)
+            self._headers = headers
+            del self._buffer[: header_end + len(HEADER_TERMINATOR)]
+
+        if len(self._buffer) < self._body_length:
+            return None
+
+        headers = self._headers
+        error: Exception | None = None
+        message: Any = None
+        with memoryview(self._buffer) as view, view[: self._body_length] as body:
+            try:
+                message = _loads(body)
+            except ValueError as e:
+                error = e
+
+        # Consume the frame even if its body was malformed so the stream resyncs
+        del self._buffer[: self._body_length]
+        self._headers = None
+        self._body_length = 0
+
+        if error is not None:
+            raise JSONRPCError(
+                LSPErrorCode.PARSE_ERROR, f"Invalid JSON in LSP message: {error}"
+            ) from error
+        return headers, message
+
+    def decode(self, data: bytes | bytearray | memoryview) -> list[Any]:
+        """Feed ``data`` and return every message it completed."""
+        self.feed(data)
+        messages = []
+        while (frame := self.next_frame()) is not None:
+            messages.append(frame[1])
+        return messages
+
+
+class LSPStreamReader:
+    """Reads framed LSP messages from an asyncio stream in large chunks."""
+
+    def __init__(
+        self,
+        stream: asyncio.StreamReader,
+        chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+    ):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = LSPFrameDecoder()
+
+    async def read_message(self) -> Any:
+        """Return the next complete message from the stream.
+
+        Raises:
+            EOFError: If the stream closes before a full message is received
+            JSONRPCError: If the stream contains a malformed frame
+        """
+        while True:
+            frame = self._decoder.next_frame()
+            if frame is not None:
+                return frame[1]
+
+            chunk = await self._stream.read(self._chunk_size)
+            if not chunk:
+                raise EOFError("LSP stream closed before a complete message")
+            self._decoder.feed(chunk)
+
+
 # Simple compatibility classes that just wrap dictionaries
 class JSONRPCMessage:
     """Base class for JSON-RPC messages - minimal wrapper around dict."""
@@ -195,57 +369,32 @@ class JSONRPCProtocol:
         return self._stream_buffer.read()
 
     def parse_lsp_message(self, raw_data: bytes) -> tuple[dict[str, str], str]:
-        """Parse LSP message using python-lsp-jsonrpc with validation."""
-        try:
-            # First validate the basic structure before using the reader
-            header_end = raw_data.find(b"\r\n\r\n")
-            if header_end == -1:
-                raise JSONRPCError(
-                    LSPErrorCode.PARSE_ERROR, "Invalid LSP message format"
-                )
-
-            header_data = raw_data[:header_end].decode("utf-8")
-            content_data = raw_data[header_end + 4 :].decode("utf-8")
-
-            # Parse and validate headers
-            headers = {}
-            for line in header_data.split("\r\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    headers[key.strip()] = value.strip()
-
-            # Validate content length (tests expect this validation)
-            if "Content-Length" not in headers:
-                raise JSONRPCError(
-                    LSPErrorCode.PARSE_ERROR, "Missing Content-Length header"
-                )
-
-            expected_length = int(headers["Content-Length"])
-            if len(content_data.encode("utf-8")) != expected_length:
-                raise JSONRPCError(LSPErrorCode.PARSE_ERROR, "Content length mismatch")
-
-            # Now use JsonRpcStreamReader for actual parsing
-            stream = io.BytesIO(raw_data)
-            reader = JsonRpcStreamReader(stream)
-
-            messages = []
-
-            def consume_message(msg):
-                messages.append(msg)
-
-            reader.listen(consume_message)
-
-            if not messages:
-                raise JSONRPCError(
-                    LSPErrorCode.PARSE_ERROR, "No valid JSON-RPC message found"
-                )
-
-            return headers, content_data
-
-        except (UnicodeDecodeError, ValueError) as e:
-            raise JSONRPCError(
-                LSPErrorCode.PARSE_ERROR, f"Message parsing error: {e}"
-            ) from e
+        """Parse a single complete LSP message, validating its framing."""
+        header_end = raw_data.find(HEADER_TERMINATOR)
+        if header_end == -1:
+            raise JSONRPCError(LSPErrorCode.PARSE_ERROR, "Invalid LSP message format")
+
+        with memoryview(raw_data) as view:
+            with view[:header_end] as raw_headers:
+                headers = _parse_headers(raw_headers)
+            expected_length = _content_length(headers)
+
+            with view[header_end + len(HEADER_TERMINATOR) :] as body:
+                if body.nbytes != expected_length:
+                    raise JSONRPCError(
+                        LSPErrorCode.PARSE_ERROR, "Content length mismatch"
+                    )
+                try:
+                    content_data = str(body, "utf-8")
+                    _loads(body)
+                except ValueError as e:
+                    # UnicodeDecodeError and JSONDecodeError are both ValueErrors
+                    raise JSONRPCError(
+                        LSPErrorCode.PARSE_ERROR,
+                        f"No valid JSON-RPC message found: {e}",
+                    ) from e
+
+        return headers, content_data
 
     def is_request(self, message: JsonRPCMessage) -> bool:
         """Check if message is a request."""
@@ -40,7 +40,9 @@ class LSPServerFactory:
             from pylsp_manager import PylspManager
 
             logger.info(f"Creating pylsp manager for workspace: {workspace_path}")
-            pylsp_manager: LSPServerManager = PylspManager(workspace_path, python_path)
+            pylsp_manager: LSPServerManager = PylspManager(
+                workspace_path, python_path, **kwargs
+            )
             # Availability check is performed during manager initialization
             return pylsp_manager
 
@@ -61,6 +63,31 @@ class LSPServerFactory:
                 f"Supported types: {supported_types}"
             )
 
+    @staticmethod
+    def warm_workspace_cache(
+        server_type: str, workspace_path: str, python_path: str, **kwargs: Any
+    ) -> bool:
+        """
+        Prepare a workspace and pre-populate the server's persistent cache.
+
+        This blocks for as long as the warm-up takes, so callers on an event
+        loop should run it in a worker thread.
+
+        Args:
+            server_type: Type of LSP server (pylsp, pyright)
+            workspace_path: Path to the workspace/project
+            python_path: Path to the Python interpreter
+            **kwargs: Additional server-specific options
+
+        Returns:
+            True if a persistent cache was warmed
+        """
+        manager = LSPServerFactory.create_server_manager(
+            server_type, workspace_path, python_path, **kwargs
+        )
+        manager.prepare_workspace()
+        return manager.warm_cache()
+
     @staticmethod
     def get_default_server_type() -> str:
         """Get the default LSP server type for Python projects."""
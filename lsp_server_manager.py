@@ -64,3 +64,15 @@ class LSPServerManager(ABC):
     def cleanup_workspace(self) -> bool:
         """Clean up workspace artifacts."""
         pass
+
+    def get_server_environment(self) -> dict[str, str] | None:
+        """Get the environment for the server process (None inherits ours)."""
+        return None
+
+    def warm_cache(self) -> bool:
+        """Pre-populate the server's persistent analysis cache.
+
+        Returns:
+            True if a cache was warmed, False if the server has no persistent cache
+        """
+        return False
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+
+"""
+MCP Gateway
+Single-port reverse proxy in the master that routes ``/mcp/{repo}/`` to the
+worker serving that repository.
+
+Clients only need the gateway's address instead of every worker's port.
+Upstream requests go through the master's shared worker sessions, so
+connections are kept alive and reused across requests, and responses
+are streamed through chunk by chunk so SSE events reach the client as soon as
+the worker emits them.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+from multidict import CIMultiDict
+
+from metrics import PROMETHEUS_CONTENT_TYPE, MetricFamily, MetricsRegistry
+from tracing import REQUEST_ID_HEADER, new_request_id
+from worker_transport import WorkerTransport
+
+logger = logging.getLogger(__name__)
+
+# Environment variable selecting the gateway port; "0" disables the gateway
+GATEWAY_PORT_ENV = "MCP_GATEWAY_PORT"
+# Just below the worker port range so it never collides with a worker
+DEFAULT_GATEWAY_PORT = 8079
+GATEWAY_HOST = "0.0.0.0"
+
+# Sent to workers so they advertise gateway URLs instead of their own port
+FORWARDED_PREFIX_HEADER = "X-Forwarded-Prefix"
+FORWARDED_HOST_HEADER = "X-Forwarded-Host"
+
+# Per-connection headers that must not be forwarded (RFC 9110 section 7.6.1);
+# request bodies are re-sent by the client session, which sets its own length
+_HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+_DROPPED_REQUEST_HEADERS = _HOP_BY_HOP_HEADERS | {"host", "content-length"}
+
+
+def gateway_port_from_env() -> int | None:
+    """Return the configured gateway port, or None if the gateway is disabled."""
+    value = os.environ.get(GATEWAY_PORT_ENV, "").strip()
+    if not value:
+        return DEFAULT_GATEWAY_PORT
+    try:
+        port = int(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid {GATEWAY_PORT_ENV}={value!r}, "
+            f"using port {DEFAULT_GATEWAY_PORT}"
+        )
+        return DEFAULT_GATEWAY_PORT
+    return port or None
+
+
+@dataclass(frozen=True)
+class Upstream:
+    """Where the gateway forwards requests for one repository."""
+
+    base_url: str
+    ready: bool
+    unix_socket: Path | None = None
+
+
+@dataclass
+class RepositoryRequestMetrics:
+    """Request counters for one repository's traffic through the gateway."""
+
+    requests: int = 0
+    active: int = 0
+    # Responses with a 5xx status, including upstream failures
+    errors: int = 0
+    # Requests rejected because the worker was not ready
+    rejected: int = 0
+    # Time until the worker's response headers arrived
+    response_seconds_total: float = 0.0
+    response_seconds_max: float = 0.0
+    bytes_streamed: int = 0
+
+    def record_response(self, seconds: float) -> None:
+        """Record how long the worker took to start responding."""
+        self.response_seconds_total += seconds
+        self.response_seconds_max = max(self.response_seconds_max, seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the counters plus the mean response time."""
+        completed = self.requests - self.active - self.rejected
+        return {
+            "requests": self.requests,
+            "active": self.active,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "response_seconds_avg": (
+                self.response_seconds_total / completed if completed > 0 else None
+            ),
+            "response_seconds_max": self.response_seconds_max,
+            "bytes_streamed": self.bytes_streamed,
+        }
+
+
+class MCPGateway:
+    """Reverse proxy routing ``/mcp/{repo}/`` to per-repository workers"""
+
+    def __init__(
+        self,
+        resolve: Callable[[str], Upstream | None],
+        repositories: Callable[[], list[str]],
+        transport: WorkerTransport,
+        host: str = GATEWAY_HOST,
+        port: int = DEFAULT_GATEWAY_PORT,
+        registry: MetricsRegistry | None = None,
+    ):
+        """Initialize the gateway.
+
+        Args:
+            resolve: Returns the upstream for a repository name, or None if
+                the repository is unknown; called per request so worker
+                replacements and config reloads take effect immediately
+            repositories: Returns the names of all routable repositories
+            transport: Shared worker sessions used for upstream requests
+            host: Interface to listen on
+            port: Port to listen on
+            registry: Master metrics served at ``/metrics``; the gateway's
+                request counters are added to it
+        """
+        self.resolve = resolve
+        self.repositories = repositories
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.metrics: dict[str, RepositoryRequestMetrics] = {}
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.registry.register_collector(self._collect_metrics)
+        self.response_latency = self.registry.histogram(
+            "mcp_gateway_response_seconds",
+            "Time until worker response headers arrived",
+            ["repository"],
+        )
+        self.app = self._create_app()
+        self._runner: web.AppRunner | None = None
+
+    def _create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/mcp/", self._handle_index)
+        app.router.add_get("/gateway/metrics", self._handle_metrics)
+        app.router.add_get("/metrics", self._handle_prometheus_metrics)
+        app.router.add_route("*", "/mcp/{repo}", self._handle_proxy)
+        app.router.add_route("*", "/mcp/{repo}/{tail:.*}", self._handle_proxy)
+        return app
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"MCP gateway listening on http://localhost:{self.port}/mcp/")
+
+    async def close(self) -> None:
+        """Stop listening; the shared worker sessions belong to the master."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_index(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "repositories": {
+                    name: f"/mcp/{name}/" for name in sorted(self.repositories())
+                }
+            }
+        )
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {name: metrics.to_dict() for name, metrics in self.metrics.items()}
+        )
+
+    async def _handle_prometheus_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.registry.render().encode(),
+            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+        )
+
+    def _collect_metrics(self) -> list[MetricFamily]:
+        """Expose the per-repository request counters."""
+        requests = MetricFamily(
+            "mcp_gateway_requests_total", "counter", "Requests routed to a repository"
+        )
+        active = MetricFamily(
+            "mcp_gateway_active_requests", "gauge", "Requests or streams in progress"
+        )
+        errors = MetricFamily(
+            "mcp_gateway_errors_total", "counter", "Responses with a 5xx status"
+        )
+        rejected = MetricFamily(
+            "mcp_gateway_rejected_total",
+            "counter",
+            "Requests rejected because the worker was not ready",
+        )
+        streamed = MetricFamily(
+            "mcp_gateway_streamed_bytes_total", "counter", "Response bytes relayed"
+        )
+        for repo, metrics in list(self.metrics.items()):
+            requests.add(metrics.requests, repository=repo)
+            active.add(metrics.active, repository=repo)
+            errors.add(metrics.errors, repository=repo)
+            rejected.add(metrics.rejected, repository=repo)
+            streamed.add(metrics.bytes_streamed, repository=repo)
+        return [requests, active, errors, rejected, streamed]
+
+    async def _handle_proxy(self, request: web.Request) -> web.StreamResponse:
+        repo = request.match_info["repo"]
+        upstream = self.resolve(repo)
+        if upstream is None:
+            return web.json_response(
+                {
+                    "error": f"Unknown repository: {repo}",
+                    "available_repositories": sorted(self.repositories()),
+                },
+                status=404,
+            )
+
+        metrics = self.metrics.setdefault(repo, RepositoryRequestMetrics())
+        metrics.requests += 1
+        if not upstream.ready:
+            metrics.rejected += 1
+            return web.json_response(
+                {"error": f"Worker for {repo} is not ready"},
+                status=503,
+                headers={"Retry-After": "1"},
+            )
+
+        metrics.active += 1
+        try:
+            response = await self._forward(request, repo, upstream, metrics)
+        finally:
+            metrics.active -= 1
+        if response.status >= 500:
+            metrics.errors += 1
+        return response
+
+    async def _forward(
+        self,
+        request: web.Request,
+        repo: str,
+        upstream: Upstream,
+        metrics: RepositoryRequestMetrics,
+    ) -> web.StreamResponse:
+        """Send the request to the worker and stream its response back."""
+        url = f"{upstream.base_url}/mcp/{request.match_info.get('tail', '')}"
+        headers = CIMultiDict(
+            (name, value)
+            for name, value in request.headers.items()
+            if name.lower() not in _DROPPED_REQUEST_HEADERS
+        )
+        headers[FORWARDED_PREFIX_HEADER] = f"/mcp/{repo}"
+        headers[FORWARDED_HOST_HEADER] = request.host
+        # Lets the client's request be found in the worker's logs and spans
+        request_id = headers.setdefault(REQUEST_ID_HEADER, new_request_id())
+        body = await request.read() if request.body_exists else None
+
+        response: web.StreamResponse | None = None
+        start = time.perf_counter()
+        try:
+            async with self.transport.session(upstream.unix_socket).request(
+                request.method,
+                url,
+                params=request.query,
+                headers=headers,
+                data=body,
+                allow_redirects=False,
+                # Bodies pass through untouched, keeping Content-Encoding valid
+                auto_decompress=False,
+            ) as upstream_response:
+                elapsed = time.perf_counter() - start
+                metrics.record_response(elapsed)
+                self.response_latency.observe(elapsed, repository=repo)
+                response = web.StreamResponse(
+                    status=upstream_response.status,
+                    reason=upstream_response.reason,
+                    headers=CIMultiDict(
+                        (name, value)
+                        for name, value in upstream_response.headers.items()
+                        if name.lower() not in _HOP_BY_HOP_HEADERS
+                    ),
+                )
+                await response.prepare(request)
+                # Relay each chunk as it arrives; buffering would hold back SSE
+                async for chunk in upstream_response.content.iter_any():
+                    await response.write(chunk)
+                    metrics.bytes_streamed += len(chunk)
+                await response.write_eof()
+                return response
+        except (aiohttp.ClientError, ConnectionResetError, TimeoutError) as e:
+            if response is not None and response.prepared:
+                # Either side closed mid-stream, e.g. a client leaving an SSE
+                # stream; the headers are sent, so ending it is all that is left
+                logger.debug(f"Gateway stream {request_id} for {repo} ended: {e!r}")
+                return response
+            logger.warning(f"Gateway request {request_id} to {repo} failed: {e!r}")
+            return web.json_response(
+                {"error": f"Worker for {repo} is unreachable: {e}"}, status=502
+            )
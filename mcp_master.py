@@ -17,11 +17,10 @@ import logging
 import os
 import signal
 import socket
-import subprocess
 import sys
 import time
 import traceback
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -32,6 +31,8 @@ from dotenv import load_dotenv
 import github_tools
 from codebase_tools import CodebaseTools
 from constants import LOGS_DIR, Language
+from mcp_gateway import MCPGateway, Upstream, gateway_port_from_env
+from metrics import MetricFamily, MetricsRegistry, process_collector
 from python_symbol_extractor import PythonSymbolExtractor
 from repository_indexer import PythonRepositoryIndexer
 from repository_manager import RepositoryConfig, RepositoryManager
@@ -44,6 +45,24 @@ from shutdown_simple import (
 from startup_orchestrator import CodebaseStartupOrchestrator
 from symbol_storage import ProductionSymbolStorage, SQLiteSymbolStorage
 from system_utils import MicrosecondFormatter, log_system_state
+from worker_health import (
+    LIVENESS_FAILURE_THRESHOLD,
+    LIVENESS_LATENCY_THRESHOLD_SECONDS,
+    PROBE_INTERVAL_SECONDS,
+    READY_POLL_INTERVAL_SECONDS,
+    STARTUP_GRACE_SECONDS,
+    WORKER_READY_TIMEOUT_SECONDS,
+    RestartBackoff,
+    probe_endpoint,
+)
+from worker_output import WORKER_OUTPUT_LINE_LIMIT, WorkerOutputPump
+from worker_prefork import WorkerHandle, WorkerZygote, prefork_enabled
+from worker_transport import (
+    WorkerTransport,
+    create_listen_socket,
+    unix_sockets_enabled,
+    worker_socket_path,
+)
 
 # Configure logging with enhanced microsecond precision
 
@@ -52,6 +71,9 @@ LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
 GLOBAL_LOG_LEVEL = logging.DEBUG
 
+# Time a replaced worker gets to finish in-flight requests during a rolling restart
+WORKER_DRAIN_TIMEOUT_SECONDS = 30
+
 
 def setup_enhanced_logging(
     logger: logging.Logger, log_file_path: Path | None = None
@@ -108,10 +130,24 @@ class WorkerProcess:
     """Information about a worker process"""
 
     repository_config: RepositoryConfig
-    process: subprocess.Popen[bytes] | None = None
+    process: WorkerHandle | None = None
+    output: WorkerOutputPump | None = None
+    # Set when the worker listens on a Unix domain socket instead of its port
+    unix_socket: Path | None = None
     start_time: float | None = None
+    # Startup measurements of the most recent launch
+    spawn_seconds: float | None = None
+    ready_seconds: float | None = None
     restart_count: int = 0
-    max_restarts: int = 5
+    backoff: RestartBackoff = field(default_factory=RestartBackoff)
+    # Probe state, reset on every start
+    ready: bool = False
+    liveness_failures: int = 0
+    last_probe_latency: float | None = None
+    # Set while the master is deliberately stopping the process
+    stopping: bool = False
+    exit_watcher: asyncio.Task[None] | None = None
+    restart_task: asyncio.Task[None] | None = None
 
     @property
     def repo_name(self) -> str:
@@ -138,54 +174,6 @@ class WorkerProcess:
         return self.repository_config.python_path
 
 
-def is_port_free(port: int) -> bool:
-    """Check if a port is available for binding"""
-    logger.debug(f"is_port_free: Checking port {port}")
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            logger.debug(f"is_port_free: Created socket for port {port}")
-            s.bind(("0.0.0.0", port))
-            logger.debug(
-                f"is_port_free: Successfully bound to port {port} - PORT IS FREE"
-            )
-            return True
-    except OSError as e:
-        logger.debug(f"is_port_free: Port {port} is in use: {e}")
-        return False
-
-
-async def wait_for_port_free(port: int, timeout: int = 30) -> bool:
-    """Wait for a port to become available, with timeout"""
-    logger.debug(
-        f"wait_for_port_free: Starting to wait for port {port} with timeout {timeout}s"
-    )
-    start_time = time.time()
-
-    check_count = 0
-    while time.time() - start_time < timeout:
-        check_count += 1
-        elapsed = time.time() - start_time
-        logger.debug(
-            f"wait_for_port_free: Check #{check_count} for port {port} after {elapsed:.1f}s"
-        )
-
-        if is_port_free(port):
-            logger.debug(
-                f"wait_for_port_free: Port {port} is now available after {elapsed:.1f}s and {check_count} checks"
-            )
-            return True
-
-        logger.debug(f"wait_for_port_free: Port {port} still not free, sleeping 1s...")
-        await asyncio.sleep(1.0)  # Check every 1 second
-        logger.debug(f"wait_for_port_free: Woke up from sleep for port {port}")
-
-    final_elapsed = time.time() - start_time
-    logger.error(
-        f"wait_for_port_free: Timeout waiting for port {port} after {final_elapsed:.1f}s and {check_count} checks"
-    )
-    return False
-
-
 class MCPMaster:
     """Master process for managing multiple MCP worker processes"""
 
@@ -198,6 +186,9 @@ class MCPMaster:
         codebase_tools: CodebaseTools,
         shutdown_coordinator: SimpleShutdownCoordinator,
         health_monitor: SimpleHealthMonitor,
+        prefork: bool = False,
+        gateway_port: int | None = None,
+        unix_sockets: bool = False,
     ):
         self.repository_manager = repository_manager
         self.workers = workers
@@ -207,19 +198,51 @@ class MCPMaster:
         self.shutdown_coordinator = shutdown_coordinator
         self.health_monitor = health_monitor
         self.running = False
+        # Launch workers by forking a zygote that preloaded the worker modules
+        self.prefork = prefork
+        self.zygote: WorkerZygote | None = None
+        # Single-port gateway routing /mcp/{repo}/ to workers; None disables it
+        self.gateway_port = gateway_port
+        self.gateway: MCPGateway | None = None
+        # Served at the gateway's /metrics; worker gauges are read on scrape
+        self.metrics = MetricsRegistry()
+        self.metrics.register_collector(process_collector())
+        self.metrics.register_collector(self._collect_worker_metrics)
+        # Long-lived sessions for every master-to-worker request
+        self.transport = WorkerTransport()
+        # Listening sockets of TCP worker ports, shared by every worker on a port
+        self._listeners: dict[int, socket.socket] = {}
+        if unix_sockets and gateway_port is None:
+            # Clients could not reach socket-only workers without the gateway
+            logger.warning("Unix socket workers need the gateway, using TCP ports")
+            unix_sockets = False
+        self.unix_sockets = unix_sockets
+        if unix_sockets:
+            for worker in workers.values():
+                worker.unix_socket = worker_socket_path(worker.repo_name)
+        # Configuration reloads are applied one at a time
+        self._reload_lock = asyncio.Lock()
+        self._reload_tasks: set[asyncio.Task[None]] = set()
 
         # Use system-appropriate log location
         self.log_dir = LOGS_DIR
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-    async def initialize_repository_indexes(self) -> None:
-        """Initialize repository indexes using the startup orchestrator."""
+    async def initialize_repository_indexes(
+        self, repositories: list[RepositoryConfig] | None = None
+    ) -> None:
+        """Initialize repository indexes using the startup orchestrator.
+
+        Args:
+            repositories: Repositories to index; defaults to all configured ones
+        """
 
         try:
             logger.info("Initializing repository indexes...")
 
             # Get list of repository configurations
-            repositories = list(self.repository_manager.repositories.values())
+            if repositories is None:
+                repositories = list(self.repository_manager.repositories.values())
 
             # Run startup orchestration
             result = await self.startup_orchestrator.initialize_repositories(
@@ -277,50 +300,151 @@ class MCPMaster:
             logger.error(f"❌ Service validation failed: {e}")
             raise RuntimeError(f"Service validation failed: {e}") from e
 
-    def start_worker(self, worker: WorkerProcess) -> bool:
-        """Start a worker process for a repository"""
-        try:
-            if worker.process and worker.process.poll() is None:
-                logger.warning(f"Worker for {worker.repo_name} is already running")
-                return True
+    def _worker_launch_environment(self) -> tuple[str, dict[str, str]]:
+        """Return the Python executable and environment used to run workers"""
+        # Use the virtual environment Python explicitly
+        venv_python = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), ".venv", "bin", "python"
+        )
+        python_executable = (
+            venv_python if os.path.exists(venv_python) else sys.executable
+        )
 
-            # Command to start worker process
-            # Use the virtual environment Python explicitly
-            venv_python = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), ".venv", "bin", "python"
-            )
-            python_executable = (
-                venv_python if os.path.exists(venv_python) else sys.executable
-            )
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.getcwd()
+        return python_executable, env
 
-            # Use repository config to generate command arguments
-            cmd = [
-                python_executable,
-                "mcp_worker.py",
-                *worker.repository_config.to_args(),
-            ]
+    async def _start_zygote(self) -> None:
+        """Start the worker zygote, falling back to plain launches on failure"""
+        python_executable, env = self._worker_launch_environment()
+        zygote = WorkerZygote(python_executable, env, os.getcwd())
+        try:
+            await zygote.start()
+            self.zygote = zygote
+        except Exception as e:
+            logger.warning(
+                f"Worker zygote failed to start, launching workers directly: {e}"
+            )
 
-            # Set up environment
-            env = os.environ.copy()
-            env["PYTHONPATH"] = os.getcwd()
+    def _new_worker(self, config: RepositoryConfig, **fields: Any) -> WorkerProcess:
+        """Create a worker for a repository using the configured transport"""
+        unix_socket = worker_socket_path(config.name) if self.unix_sockets else None
+        return WorkerProcess(
+            repository_config=config, unix_socket=unix_socket, **fields
+        )
 
-            # Check if port is available before starting
-            if not is_port_free(worker.port):
-                logger.error(
-                    f"Port {worker.port} is not available for {worker.repo_name}"
+    def _worker_url(self, worker: WorkerProcess, path: str) -> str:
+        """Return the URL of one of a worker's HTTP endpoints"""
+        return self.transport.base_url(worker.port, worker.unix_socket) + path
+
+    def _worker_session(self, worker: WorkerProcess) -> aiohttp.ClientSession:
+        """Return the shared session that reaches a worker"""
+        return self.transport.session(worker.unix_socket)
+
+    def _worker_listener(self, port: int) -> socket.socket:
+        """Return the listening socket of a worker port, binding it on first use
+
+        A worker replacing another on the same port accepts from this same
+        socket, so connections queued when the old worker exits are taken by
+        the replacement instead of being reset.
+
+        Raises:
+            OSError: If the port cannot be bound
+        """
+        listener = self._listeners.get(port)
+        if listener is None:
+            listener = create_listen_socket(port)
+            self._listeners[port] = listener
+        return listener
+
+    def _release_listener(self, port: int) -> None:
+        """Close a port's listening socket once no configured worker uses it"""
+        if any(w.port == port and w.unix_socket is None for w in self.workers.values()):
+            return
+        listener = self._listeners.pop(port, None)
+        if listener is not None:
+            listener.close()
+
+    async def _launch_worker_process(self, worker: WorkerProcess) -> WorkerHandle:
+        """Fork the worker from the zygote if available, else exec a new Python"""
+        worker_args = ["mcp_worker.py", *worker.repository_config.to_args()]
+        listener = None
+        if worker.unix_socket is not None:
+            worker_args += ["--unix-socket", str(worker.unix_socket)]
+        else:
+            listener = self._worker_listener(worker.port)
+        if self.zygote is not None and self.zygote.is_running:
+            try:
+                return await self.zygote.spawn(
+                    worker_args, limit=WORKER_OUTPUT_LINE_LIMIT, listener=listener
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Zygote spawn failed for {worker.repo_name}, "
+                    f"launching directly: {e}"
                 )
-                return False
-
-            # Start the process
-            worker.process = subprocess.Popen(
-                cmd,
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=os.getcwd(),
+
+        pass_fds: tuple[int, ...] = ()
+        if listener is not None:
+            worker_args += ["--listen-fd", str(listener.fileno())]
+            pass_fds = (listener.fileno(),)
+        python_executable, env = self._worker_launch_environment()
+        return await asyncio.create_subprocess_exec(
+            python_executable,
+            *worker_args,
+            env=env,
+            pass_fds=pass_fds,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=os.getcwd(),
+            limit=WORKER_OUTPUT_LINE_LIMIT,
+        )
+
+    async def start_worker(self, worker: WorkerProcess) -> bool:
+        """Start a worker process for a repository
+
+        TCP workers serve on the master's listening socket for their port,
+        which may already be shared with a worker this one replaces.
+        """
+        try:
+            if worker.process and worker.process.returncode is None:
+                logger.warning(f"Worker for {worker.repo_name} is already running")
+                return True
+
+            # Bind the port before starting; socket workers take over their
+            # path atomically and need no free port
+            if worker.unix_socket is None:
+                try:
+                    self._worker_listener(worker.port)
+                except OSError as e:
+                    logger.error(
+                        f"Port {worker.port} is not available for "
+                        f"{worker.repo_name}: {e}"
+                    )
+                    return False
+
+            # Release the previous run's output pump before starting a new one
+            if worker.output is not None:
+                await worker.output.close()
+
+            # Start the process; its output is drained continuously so a chatty
+            # worker never blocks on a full pipe buffer
+            launch_start = time.time()
+            worker.process = await self._launch_worker_process(worker)
+            worker.spawn_seconds = time.time() - launch_start
+            worker.ready_seconds = None
+            worker.output = WorkerOutputPump(
+                worker.repo_name, self.log_dir / f"{worker.repo_name}.output.log"
             )
+            worker.output.start(worker.process)
 
             worker.start_time = time.time()
+            worker.stopping = False
+            worker.ready = False
+            worker.liveness_failures = 0
+            worker.exit_watcher = asyncio.create_task(
+                self._watch_worker_exit(worker, worker.process)
+            )
             logger.info(
                 f"Started worker for {worker.repo_name} on port {worker.port} (PID: {worker.process.pid})"
             )
@@ -337,13 +461,15 @@ class MCPMaster:
     async def stop_worker(self, worker: WorkerProcess, timeout: int = 5) -> bool:
         """Stop a worker process with timeout (simplified for individual worker shutdown)"""
         try:
-            if not worker.process or worker.process.poll() is not None:
+            if not worker.process or worker.process.returncode is not None:
                 logger.info(f"Worker for {worker.repo_name} is already stopped")
                 worker.process = None
                 return True
 
             pid = worker.process.pid
             logger.info(f"Stopping worker {worker.repo_name} (PID: {pid})")
+            worker.stopping = True
+            worker.ready = False
 
             # Send SIGTERM for graceful shutdown
             worker.process.terminate()
@@ -400,76 +526,386 @@ class MCPMaster:
             return False
 
         # Check if process is still alive
-        poll_result = worker.process.poll()
-        if poll_result is not None:
+        exit_code = worker.process.returncode
+        if exit_code is not None:
             logger.warning(
-                f"Worker for {worker.repo_name} is not running (exit code: {poll_result})"
+                f"Worker for {worker.repo_name} is not running (exit code: {exit_code})"
             )
-            # Log any output from the failed process
-            try:
-                stdout, stderr = worker.process.communicate(timeout=1)
-                if stdout:
-                    logger.error(f"Worker {worker.repo_name} STDOUT: {stdout.decode()}")
-                if stderr:
-                    logger.error(f"Worker {worker.repo_name} STDERR: {stderr.decode()}")
-            except Exception as e:
-                logger.debug(f"Failed to read worker output: {e}")
+            # Log the last output lines captured from the failed process
+            if worker.output is not None and worker.output.tail:
+                logger.error(
+                    f"Worker {worker.repo_name} output before exit "
+                    f"(full log: {worker.output.log_path}):\n"
+                    f"{worker.output.format_tail()}"
+                )
             return False
 
-        # TODO: Add health check HTTP endpoint call
-        # For now, just check if process is running
+        # Hung-but-alive workers are caught by the liveness probes in
+        # monitor_workers, which restart them once the threshold is reached
+        return worker.liveness_failures < LIVENESS_FAILURE_THRESHOLD
+
+    async def _watch_worker_exit(
+        self, worker: WorkerProcess, process: WorkerHandle
+    ) -> None:
+        """Schedule a restart as soon as a worker process exits on its own."""
+        await process.wait()
+        if (
+            worker.stopping
+            or worker.process is not process
+            or not self.running
+            or self.shutdown_coordinator.is_shutting_down()
+        ):
+            return
+
+        # Let the pump read the final lines so the logged tail is complete
+        if worker.output is not None:
+            await worker.output.close()
+        worker.ready = False
+        self.is_worker_healthy(worker)
+        self._schedule_restart(worker, f"process exited with code {process.returncode}")
+
+    def _schedule_restart(self, worker: WorkerProcess, reason: str) -> None:
+        """Start a backoff restart for a worker unless one is already pending."""
+        if worker.restart_task is not None and not worker.restart_task.done():
+            return
+        worker.restart_task = asyncio.create_task(
+            self._restart_worker(worker, reason),
+            name=f"restart-{worker.repo_name}",
+        )
+
+    async def _restart_worker(self, worker: WorkerProcess, reason: str) -> None:
+        """Restart a worker after its exponential backoff delay."""
+        uptime = time.time() - worker.start_time if worker.start_time else None
+        delay = worker.backoff.next_delay(uptime)
+        logger.warning(
+            f"Worker for {worker.repo_name} is unhealthy ({reason}), "
+            f"restarting in {delay:.1f}s"
+        )
+        await asyncio.sleep(delay)
+        if not self.running or self.shutdown_coordinator.is_shutting_down():
+            return
+
+        # stop_worker returns once the process has exited, and the master
+        # keeps the port's listening socket, so the replacement can serve on
+        # it immediately; a port the master cannot bind fails start_worker
+        # and the next probe sweep retries with a longer backoff
+        if not await self.stop_worker(worker):
+            logger.error(f"Could not stop {worker.repo_name}, skipping restart")
+            return
+
+        if await self.start_worker(worker):
+            worker.restart_count += 1
+            logger.info(
+                f"Restarted worker for {worker.repo_name} "
+                f"(restart count: {worker.restart_count})"
+            )
+        else:
+            logger.error(f"Failed to restart worker for {worker.repo_name}")
+
+    async def probe_worker(self, worker: WorkerProcess) -> None:
+        """Probe one worker's liveness and readiness and act on the result."""
+        if worker.restart_task is not None and not worker.restart_task.done():
+            return
+        if not worker.process or worker.process.returncode is not None:
+            self._schedule_restart(worker, "process not running")
+            return
+
+        session = self._worker_session(worker)
+        liveness, readiness = await asyncio.gather(
+            probe_endpoint(
+                session,
+                self._worker_url(worker, "/health"),
+                latency_threshold=LIVENESS_LATENCY_THRESHOLD_SECONDS,
+            ),
+            probe_endpoint(session, self._worker_url(worker, "/ready")),
+        )
+        worker.last_probe_latency = liveness.latency
+
+        if readiness.ok != worker.ready:
+            worker.ready = readiness.ok
+            if readiness.ok and worker.ready_seconds is None:
+                worker.ready_seconds = time.time() - (worker.start_time or 0)
+            logger.info(
+                f"Worker for {worker.repo_name} is "
+                f"{'ready' if readiness.ok else 'not ready'}"
+            )
+
+        if liveness.ok:
+            worker.liveness_failures = 0
+            return
+
+        uptime = time.time() - (worker.start_time or 0)
+        if not worker.ready and uptime < STARTUP_GRACE_SECONDS:
+            logger.debug(
+                f"Worker for {worker.repo_name} not answering yet after "
+                f"{uptime:.1f}s: {liveness.error}"
+            )
+            return
+
+        worker.liveness_failures += 1
+        logger.warning(
+            f"Liveness probe failed for {worker.repo_name} "
+            f"({worker.liveness_failures}/{LIVENESS_FAILURE_THRESHOLD}): "
+            f"{liveness.error}"
+        )
+        if worker.liveness_failures >= LIVENESS_FAILURE_THRESHOLD:
+            self._schedule_restart(
+                worker, f"{worker.liveness_failures} consecutive liveness failures"
+            )
+
+    async def wait_for_workers_ready(
+        self, timeout: float = WORKER_READY_TIMEOUT_SECONDS
+    ) -> None:
+        """Wait concurrently for every started worker to report ready
+
+        Records and logs each worker's time from launch to readiness.
+        """
+        starting = [w for w in self.workers.values() if w.process is not None]
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self._wait_worker_ready(w) for w in starting)),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            logger.warning(f"Not all workers became ready within {timeout:.0f}s")
+
+        for worker in starting:
+            spawn = f"{worker.spawn_seconds or 0:.2f}s"
+            if worker.ready_seconds is None:
+                logger.warning(f"  - {worker.repo_name}: spawned in {spawn}, not ready")
+            else:
+                logger.info(
+                    f"  - {worker.repo_name}: spawned in {spawn}, "
+                    f"ready in {worker.ready_seconds:.2f}s"
+                )
+
+    async def _wait_worker_ready(self, worker: WorkerProcess) -> bool:
+        """Poll /ready until the worker's own process answers ready
+
+        The reported pid is checked because during a rolling restart the old
+        and the new process share the port or socket path and either may
+        answer.
+
+        Returns:
+            True once ready, False if the process exited first
+        """
+        process = worker.process
+        session = self._worker_session(worker)
+        url = self._worker_url(worker, "/ready")
+        while self.running and process is not None and process.returncode is None:
+            result = await probe_endpoint(session, url)
+            if (
+                result.ok
+                and result.payload
+                and result.payload.get("pid") == process.pid
+            ):
+                worker.ready = True
+                worker.ready_seconds = time.time() - (worker.start_time or 0)
+                return True
+            await asyncio.sleep(READY_POLL_INTERVAL_SECONDS)
+        return False
+
+    async def rolling_restart(
+        self, worker: WorkerProcess, config: RepositoryConfig | None = None
+    ) -> bool:
+        """Replace a worker, keeping the old one serving until the new one is ready
+
+        The replacement is started next to the old worker, on its new port or
+        on the same listening socket as the old worker, and the old worker is
+        only drained once the replacement reports ready. On a shared socket,
+        connections still queued when the old worker exits are accepted by the
+        replacement; requests the old worker already accepted get the drain
+        timeout to finish. If the replacement never becomes ready it is
+        stopped and the old worker keeps serving.
+
+        Args:
+            worker: Worker to replace
+            config: Configuration for the replacement; defaults to the current one
+
+        Returns:
+            True if the replacement took over
+        """
+        config = config or worker.repository_config
+        replacement = self._new_worker(config, restart_count=worker.restart_count + 1)
+        shared_port = (
+            (worker.unix_socket is not None or config.port == worker.port)
+            and worker.process is not None
+            and worker.process.returncode is None
+        )
+        logger.info(
+            f"Rolling restart of {worker.repo_name} on port {config.port}"
+            f"{' (shared with the running worker)' if shared_port else ''}"
+        )
+
+        ready = False
+        try:
+            if await self.start_worker(replacement):
+                ready = await asyncio.wait_for(
+                    self._wait_worker_ready(replacement),
+                    timeout=WORKER_READY_TIMEOUT_SECONDS,
+                )
+        except TimeoutError:
+            pass
+        finally:
+            if not ready:
+                await self._discard_worker(replacement)
+                if not shared_port:
+                    self._release_listener(replacement.port)
+
+        if not ready:
+            logger.error(
+                f"Replacement worker for {worker.repo_name} did not become ready, "
+                f"keeping the current worker"
+            )
+            return False
+
+        # Swap before draining so probes and routing see only the replacement
+        self.workers[config.name] = replacement
+        if worker.restart_task is not None and not worker.restart_task.done():
+            worker.restart_task.cancel()
+
+        if shared_port:
+            # A /shutdown request could reach either process on the shared
+            # port or socket, so the old worker is drained with SIGTERM instead
+            await self.stop_worker(worker, timeout=WORKER_DRAIN_TIMEOUT_SECONDS)
+        else:
+            await self.shutdown_worker(worker)
+            self._release_listener(worker.port)
+        if worker.output is not None:
+            await worker.output.close()
+            worker.output = None
+
+        logger.info(
+            f"Worker for {config.name} replaced "
+            f"(PID {replacement.process.pid if replacement.process else None}, "
+            f"ready in {replacement.ready_seconds or 0:.2f}s)"
+        )
         return True
 
+    async def _discard_worker(self, worker: WorkerProcess) -> None:
+        """Stop a worker that never took traffic and release its output pump"""
+        await self.stop_worker(worker)
+        if worker.output is not None:
+            await worker.output.close()
+            worker.output = None
+
+    async def _add_worker(self, config: RepositoryConfig) -> None:
+        """Start a worker for a newly configured repository"""
+        worker = self._new_worker(config)
+        self.workers[config.name] = worker
+        if not await self.start_worker(worker):
+            logger.error(f"Failed to start worker for added repository {config.name}")
+            return
+        try:
+            await asyncio.wait_for(
+                self._wait_worker_ready(worker), timeout=WORKER_READY_TIMEOUT_SECONDS
+            )
+        except TimeoutError:
+            logger.warning(f"Worker for added repository {config.name} not ready")
+        logger.info(
+            f"Added worker for {config.name}: http://localhost:{config.port}/mcp/"
+        )
+
+    async def _remove_worker(self, worker: WorkerProcess) -> None:
+        """Drain and stop the worker of a repository removed from the config"""
+        # Stop probing first so the drain is not mistaken for a crash
+        self.workers.pop(worker.repo_name, None)
+        if worker.restart_task is not None and not worker.restart_task.done():
+            worker.restart_task.cancel()
+
+        await self.shutdown_worker(worker)
+        if worker.output is not None:
+            await worker.output.close()
+            worker.output = None
+        await self.transport.discard(worker.unix_socket)
+        self._release_listener(worker.port)
+
+        try:
+            # A large repository's symbols take a while to delete; keep the
+            # event loop serving probes and the gateway meanwhile
+            await asyncio.to_thread(
+                self.symbol_storage.delete_symbols_by_repository, worker.repo_name
+            )
+        except Exception as e:
+            logger.warning(f"Failed to delete symbols of {worker.repo_name}: {e}")
+        logger.info(f"Removed worker for {worker.repo_name}")
+
+    async def reload_workers(self) -> None:
+        """Reconcile the running workers with the current repository configuration
+
+        Added repositories get a new worker, removed ones are drained through
+        their /shutdown endpoint, and repositories whose configuration changed
+        are replaced with a rolling restart. Removals run first so a port freed
+        by one repository can be reused by another.
+        """
+        async with self._reload_lock:
+            if not self.running or self.shutdown_coordinator.is_shutting_down():
+                return
+
+            configs = dict(self.repository_manager.repositories)
+            added = [c for name, c in configs.items() if name not in self.workers]
+            removed = [w for name, w in self.workers.items() if name not in configs]
+            changed = [
+                (self.workers[name], config)
+                for name, config in configs.items()
+                if name in self.workers
+                and self.workers[name].repository_config != config
+            ]
+            if not (added or removed or changed):
+                logger.info("Configuration reloaded, no worker changes needed")
+                return
+
+            logger.info(
+                f"Applying configuration reload: added={[c.name for c in added]}, "
+                f"removed={[w.repo_name for w in removed]}, "
+                f"changed={[c.name for _, c in changed]}"
+            )
+
+            await asyncio.gather(*(self._remove_worker(w) for w in removed))
+
+            # Workers answer codebase queries from the index, so index new or
+            # moved repositories before their workers start
+            to_index = added + [
+                config
+                for worker, config in changed
+                if config.workspace != worker.workspace
+            ]
+            if to_index:
+                await self.initialize_repository_indexes(to_index)
+
+            await asyncio.gather(
+                *(self._add_worker(config) for config in added),
+                *(self.rolling_restart(worker, config) for worker, config in changed),
+            )
+
+    def _on_config_reloaded(self) -> None:
+        """Reload callback; runs on the configuration watcher thread"""
+        if self.running:
+            self.loop.call_soon_threadsafe(self._schedule_reload)
+
+    def _schedule_reload(self) -> None:
+        """Start a worker reload on the event loop"""
+        task = asyncio.create_task(self.reload_workers(), name="reload-workers")
+        self._reload_tasks.add(task)
+        task.add_done_callback(self._reload_tasks.discard)
+
     async def monitor_workers(self) -> None:
-        """Monitor worker processes and restart if needed"""
+        """Probe all workers concurrently and restart hung or crashed ones
+
+        Crashes are also detected immediately by each worker's exit watcher;
+        the probe sweep catches workers that are alive but no longer serving.
+        """
         logger.debug("Worker monitoring task started")
         try:
             while self.running:
                 try:
-                    for repo_name, worker in self.workers.items():
-                        if not self.is_worker_healthy(worker):
-                            if worker.restart_count < worker.max_restarts:
-                                logger.warning(
-                                    f"Worker for {repo_name} is unhealthy, restarting..."
-                                )
-                                await self.stop_worker(worker)
-
-                                # Wait for port to be properly released before restarting
-                                logger.debug(
-                                    f"Waiting for port {worker.port} to be released..."
-                                )
-                                port_available = await wait_for_port_free(
-                                    worker.port, timeout=15
-                                )
-                                if not port_available:
-                                    logger.error(
-                                        f"Port {worker.port} still not available after 15s, skipping restart for {repo_name}"
-                                    )
-                                    continue
-
-                                if self.start_worker(worker):
-                                    worker.restart_count += 1
-                                    logger.info(
-                                        f"Restarted worker for {repo_name} (restart count: {worker.restart_count})"
-                                    )
-                                else:
-                                    logger.error(
-                                        f"Failed to restart worker for {repo_name}"
-                                    )
-                            else:
-                                logger.error(
-                                    f"Worker for {repo_name} exceeded max restarts ({worker.max_restarts})"
-                                )
-
-                    # Sleep in smaller chunks to allow for faster cancellation
-                    sleep_remaining = 30  # 30 seconds total, 1 second chunks
-                    while sleep_remaining > 0 and self.running:
-                        await asyncio.sleep(1)
-                        sleep_remaining -= 1
-
+                    await asyncio.gather(
+                        *(self.probe_worker(worker) for worker in self.workers.values())
+                    )
                 except Exception as e:
                     logger.error(f"Error in worker monitoring: {e}")
-                    await asyncio.sleep(5)
+
+                await asyncio.sleep(PROBE_INTERVAL_SECONDS)
         finally:
             logger.debug("Worker monitoring task ending")
 
@@ -491,6 +927,60 @@ class MCPMaster:
             except Exception as e:
                 logger.debug(f"Could not wake up main loop: {e}")
 
+    def _gateway_upstream(self, repo_name: str) -> Upstream | None:
+        """Return the gateway upstream for a repository's current worker"""
+        worker = self.workers.get(repo_name)
+        if worker is None:
+            return None
+        return Upstream(self._worker_url(worker, ""), worker.ready, worker.unix_socket)
+
+    def _collect_worker_metrics(self) -> list[MetricFamily]:
+        """Expose worker probe state from the monitor's latest results"""
+        up = MetricFamily("mcp_worker_up", "gauge", "Whether the worker process runs")
+        ready = MetricFamily(
+            "mcp_worker_ready", "gauge", "Whether the worker passes readiness"
+        )
+        restarts = MetricFamily(
+            "mcp_worker_restarts_total", "counter", "Worker restarts by the master"
+        )
+        failures = MetricFamily(
+            "mcp_worker_liveness_failures",
+            "gauge",
+            "Consecutive failed liveness probes",
+        )
+        latency = MetricFamily(
+            "mcp_worker_probe_latency_seconds",
+            "gauge",
+            "Latency of the latest successful probe",
+        )
+        for repo_name, worker in list(self.workers.items()):
+            running = worker.process is not None and worker.process.returncode is None
+            up.add(int(running), repository=repo_name)
+            ready.add(int(worker.ready), repository=repo_name)
+            restarts.add(worker.restart_count, repository=repo_name)
+            failures.add(worker.liveness_failures, repository=repo_name)
+            if worker.last_probe_latency is not None:
+                latency.add(worker.last_probe_latency, repository=repo_name)
+        return [up, ready, restarts, failures, latency]
+
+    async def _start_gateway(self) -> None:
+        """Start the single-port gateway; workers stay reachable without it"""
+        if self.gateway_port is None:
+            return
+        gateway = MCPGateway(
+            self._gateway_upstream,
+            lambda: list(self.workers),
+            self.transport,
+            port=self.gateway_port,
+            registry=self.metrics,
+        )
+        try:
+            await gateway.start()
+            self.gateway = gateway
+        except OSError as e:
+            await gateway.close()
+            logger.error(f"Failed to start gateway on port {self.gateway_port}: {e}")
+
     async def start(self) -> bool:
         """Start the master process"""
         logger.info("Starting MCP Master Process")
@@ -511,20 +1001,40 @@ class MCPMaster:
         signal.signal(signal.SIGTERM, self.signal_handler)
         signal.signal(signal.SIGINT, self.signal_handler)
 
-        # Start all workers
+        # Start all workers concurrently; with prefork they are forked from a
+        # zygote that has already imported the worker modules
         self.running = True
-        failed_workers = []
+        if self.prefork:
+            await self._start_zygote()
 
-        for repo_name, worker in self.workers.items():
-            if not self.start_worker(worker):
-                failed_workers.append(repo_name)
+        startup_start = time.time()
+        results = await asyncio.gather(
+            *(self.start_worker(worker) for worker in self.workers.values())
+        )
+        failed_workers = [
+            repo_name
+            for repo_name, started in zip(self.workers, results, strict=True)
+            if not started
+        ]
 
         if failed_workers:
             logger.error(f"Failed to start workers for: {failed_workers}")
 
+        await self.wait_for_workers_ready()
+        logger.info(
+            f"Worker startup took {time.time() - startup_start:.2f}s "
+            f"({'prefork' if self.zygote else 'exec'} launch)"
+        )
+
         # Start monitoring task
         monitor_task = asyncio.create_task(self.monitor_workers())
 
+        await self._start_gateway()
+
+        # Apply repositories.json edits without restarting the master
+        self.repository_manager.add_reload_callback(self._on_config_reloaded)
+        self.repository_manager.start_watching_config()
+
         # Log startup summary
         running_workers = [
             name
@@ -534,7 +1044,16 @@ class MCPMaster:
         logger.info(f"Master process started with {len(running_workers)} workers:")
         for repo_name, worker in self.workers.items():
             if repo_name in running_workers:
-                logger.info(f"  - {repo_name}: http://localhost:{worker.port}/mcp/")
+                if worker.unix_socket is not None and self.gateway is not None:
+                    endpoint = f"http://localhost:{self.gateway.port}/mcp/{repo_name}/"
+                else:
+                    endpoint = f"http://localhost:{worker.port}/mcp/"
+                logger.info(f"  - {repo_name}: {endpoint}")
+        if self.gateway is not None:
+            logger.info(
+                f"Gateway: http://localhost:{self.gateway.port}/mcp/{{repository}}/"
+            )
+            logger.info(f"Metrics: http://localhost:{self.gateway.port}/metrics")
 
         # Wait for shutdown signal using shutdown manager
         logger.debug("About to wait for shutdown signal...")
@@ -585,6 +1104,26 @@ class MCPMaster:
         """Shutdown all workers using new worker-controlled approach"""
         logger.info("Starting worker-controlled shutdown for all workers")
 
+        # Stop routing client traffic to workers that are about to drain
+        if self.gateway is not None:
+            await self.gateway.close()
+            self.gateway = None
+
+        # Let an in-progress configuration reload finish swapping workers so
+        # no replacement is left running outside self.workers
+        for task in list(self._reload_tasks):
+            try:
+                await asyncio.wait_for(task, timeout=WORKER_READY_TIMEOUT_SECONDS)
+            except (TimeoutError, asyncio.CancelledError):
+                pass
+            except Exception as e:
+                logger.error(f"Configuration reload failed during shutdown: {e}")
+
+        # Pending backoff restarts must not revive workers being shut down
+        for worker in self.workers.values():
+            if worker.restart_task is not None and not worker.restart_task.done():
+                worker.restart_task.cancel()
+
         if not self.workers:
             logger.info("No workers to shut down")
             return True
@@ -596,6 +1135,20 @@ class MCPMaster:
         success_count = sum(1 for result in results if result is True)
         total_count = len(self.workers)
 
+        # Flush the tail of every worker's output and close its log file
+        for worker in self.workers.values():
+            if worker.output is not None:
+                await worker.output.close()
+                worker.output = None
+
+        if self.zygote is not None:
+            await self.zygote.close()
+            self.zygote = None
+        await self.transport.close()
+        for listener in self._listeners.values():
+            listener.close()
+        self._listeners.clear()
+
         logger.info(
             f"Worker shutdown complete: {success_count}/{total_count} successful"
         )
@@ -619,25 +1172,29 @@ class MCPMaster:
         """Shutdown single worker using worker-controlled approach"""
         logger.info(f"Starting worker-controlled shutdown for {worker.repo_name}")
 
-        if not worker.process or worker.process.poll() is not None:
+        process = worker.process
+        if not process or process.returncode is not None:
             logger.info(f"Worker {worker.repo_name} already stopped")
             return True
 
+        worker.stopping = True
+        worker.ready = False
+
         # Phase 1: Request graceful shutdown via HTTP
+        timeout = 120  # 2 minutes
         shutdown_request_sent = False
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"http://localhost:{worker.port}/shutdown",
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Sent shutdown request to {worker.repo_name}")
-                        shutdown_request_sent = True
-                    else:
-                        logger.warning(
-                            f"Shutdown request failed for {worker.repo_name}: {response.status}"
-                        )
+            async with self._worker_session(worker).post(
+                self._worker_url(worker, "/shutdown"),
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Sent shutdown request to {worker.repo_name}")
+                    shutdown_request_sent = True
+                else:
+                    logger.warning(
+                        f"Shutdown request failed for {worker.repo_name}: {response.status}"
+                    )
         except Exception as e:
             logger.warning(
                 f"Failed to send shutdown request to {worker.repo_name}: {e}"
@@ -649,31 +1206,27 @@ class MCPMaster:
                 f"Skipping graceful wait for {worker.repo_name} since shutdown request failed"
             )
         else:
-            # Phase 2: Wait for graceful exit (2 minutes)
+            # Phase 2: Wait for graceful exit (2 minutes); the worker's
+            # listening socket is closed once its process has exited
             logger.info(f"Waiting for {worker.repo_name} to shut down gracefully...")
-            start_time = time.time()
-            timeout = 120  # 2 minutes
-
-            while time.time() - start_time < timeout:
-                # Check if process has exited
-                if worker.process.poll() is not None:
-                    # Verify port is released
-                    if is_port_free(worker.port):
-                        logger.info(f"✓ Worker {worker.repo_name} shut down gracefully")
-                        worker.process = None
-                        return True
-                await asyncio.sleep(1)
+            try:
+                await asyncio.wait_for(
+                    self._wait_for_process_exit(process), timeout=timeout
+                )
+                logger.info(f"✓ Worker {worker.repo_name} shut down gracefully")
+                worker.process = None
+                return True
+            except TimeoutError:
+                pass
 
         # Phase 3: SIGTERM escalation (only after timeout)
         logger.warning(
             f"Worker {worker.repo_name} didn't shutdown in {timeout}s, sending SIGTERM"
         )
-        worker.process.terminate()
+        process.terminate()
 
         try:
-            await asyncio.wait_for(
-                self._wait_for_process_exit(worker.process), timeout=30
-            )
+            await asyncio.wait_for(self._wait_for_process_exit(process), timeout=30)
             logger.info(f"✓ Worker {worker.repo_name} terminated after SIGTERM")
             worker.process = None
             return True
@@ -682,27 +1235,14 @@ class MCPMaster:
 
         # Phase 4: SIGKILL (last resort)
         logger.error(f"Force killing worker {worker.repo_name}")
-        if worker.process:
-            worker.process.kill()
-            await self._wait_for_process_exit(worker.process)
+        process.kill()
+        await self._wait_for_process_exit(process)
         worker.process = None
         return True
 
-    async def _wait_for_process_exit(self, process: subprocess.Popen[bytes]) -> int:
-        """Async wrapper for process.wait() with polling"""
-        while True:
-            if process.poll() is not None:
-                return process.returncode
-            await asyncio.sleep(0.1)  # Poll every 100ms
-
-    async def _wait_for_port_release(self, port: int, timeout: float = 5.0) -> bool:
-        """Wait for a port to be released after process termination"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if is_port_free(port):
-                return True
-            await asyncio.sleep(0.2)  # Check every 200ms
-        return False
+    async def _wait_for_process_exit(self, process: WorkerHandle) -> int:
+        """Wait for a worker process to exit and return its exit code"""
+        return await process.wait()
 
     def status(self) -> dict:
         """Get status of all workers"""
@@ -711,6 +1251,11 @@ class MCPMaster:
                 "running": self.running,
                 "workers_count": len(self.workers),
                 "config_path": "repositories.json",  # Default config path
+                "gateway": (
+                    f"http://localhost:{self.gateway_port}/mcp/"
+                    if self.gateway_port is not None
+                    else None
+                ),
             },
             "workers": {},
         }
@@ -722,10 +1267,20 @@ class MCPMaster:
                 "workspace": worker.repository_config.workspace,
                 "description": worker.repository_config.description,
                 "running": is_healthy,
+                "ready": worker.ready,
+                "spawn_seconds": worker.spawn_seconds,
+                "ready_seconds": worker.ready_seconds,
+                "last_probe_latency": worker.last_probe_latency,
                 "pid": worker.process.pid if worker.process else None,
+                "unix_socket": str(worker.unix_socket) if worker.unix_socket else None,
                 "start_time": worker.start_time,
                 "restart_count": worker.restart_count,
                 "endpoint": f"http://localhost:{worker.repository_config.port}/mcp/",
+                "gateway_requests": (
+                    self.gateway.metrics[repo_name].to_dict()
+                    if self.gateway is not None and repo_name in self.gateway.metrics
+                    else None
+                ),
             }
 
         return status
@@ -852,6 +1407,9 @@ async def main() -> None:
             codebase_tools=codebase_tools,
             shutdown_coordinator=shutdown_coordinator,
             health_monitor=health_monitor,
+            prefork=prefork_enabled(),
+            gateway_port=gateway_port_from_env(),
+            unix_sockets=unix_sockets_enabled(),
         )
 
     except Exception as e:
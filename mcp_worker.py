@@ -13,11 +13,13 @@ This worker process:
 
 import argparse
 import asyncio
+import contextlib
 import json
 import logging
 import os
 import queue
 import signal
+import socket
 import sys
 import traceback
 from datetime import datetime
@@ -27,7 +29,7 @@ import uvicorn
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 import github_tools
 from codebase_tools import CodebaseTools, create_simple_lsp_client
@@ -45,14 +47,64 @@ from github_tools import (
 )
 
 # Import shared functionality
+from lsp_server_factory import LSPServerFactory
+from metrics import PROMETHEUS_CONTENT_TYPE, MetricsRegistry, process_collector
 from repository_manager import RepositoryConfig, RepositoryManager
 from shutdown_simple import SimpleShutdownCoordinator
-from symbol_storage import ProductionSymbolStorage, SQLiteSymbolStorage
+from symbol_storage import (
+    DEFAULT_READ_POOL_SIZE,
+    ProductionSymbolStorage,
+    SQLiteSymbolStorage,
+)
 from system_utils import MicrosecondFormatter, log_system_state
+from tracing import REQUEST_ID_HEADER, RequestIdFilter, new_request_id, tracer
+from worker_transport import create_listen_socket
 
 # Tool modules for dynamic dispatch
 TOOL_MODULES = [github_tools]
 
+# JSON-RPC methods the worker handles; metrics and traces report any other
+# method name sent by a client as "other" so clients cannot grow the label set
+MCP_METHODS = frozenset(
+    {"initialize", "notifications/initialized", "tools/list", "tools/call"}
+)
+OTHER_LABEL = "other"
+
+
+def method_label(method: str) -> str:
+    """Return the metric label for a JSON-RPC method name."""
+    return method if method in MCP_METHODS else OTHER_LABEL
+
+
+def create_unix_listen_socket(path: str) -> tuple[socket.socket, int]:
+    """Bind and listen on the worker's Unix domain socket
+
+    The socket is bound under a temporary name and renamed over ``path`` once
+    it is listening, so a replacement worker takes over new connections in one
+    atomic step while the old one finishes those it already accepted.
+
+    Returns:
+        The listening socket and the inode of its filesystem entry, which
+        tells whether ``path`` still belongs to this worker
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        sock.bind(temp_path)
+        os.chmod(temp_path, 0o600)
+        sock.listen(socket.SOMAXCONN)
+        inode = os.stat(temp_path).st_ino
+        os.replace(temp_path, path)
+    except OSError:
+        sock.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+    return sock, inode
+
 
 class MCPWorker:
     """Worker process for handling a single repository with both GitHub and codebase tools"""
@@ -74,10 +126,18 @@ class MCPWorker:
         repository_config: RepositoryConfig,
         db_path: str | None = None,
         github_context: AbstractGitHubAPIContext | None = None,
+        unix_socket: str | None = None,
+        listen_fd: int | None = None,
     ):
         # Store repository configuration
         self.repo_config = repository_config
         self.db_path = db_path
+        # Listen on this Unix domain socket instead of the TCP port
+        self.unix_socket = unix_socket
+        self._unix_socket_inode: int | None = None
+        # TCP listening socket inherited from the master, shared with any
+        # worker replacing this one
+        self.listen_fd = listen_fd
 
         # Initialize logger first
         self.logger = logging.getLogger(f"worker-{repository_config.name}")
@@ -111,6 +171,19 @@ class MCPWorker:
         self.language = repository_config.language
         self.python_path = repository_config.python_path
 
+        # Served at /metrics; updating them only touches memory
+        self.metrics = MetricsRegistry()
+        self.metrics.register_collector(process_collector())
+        self.metrics.register_collector(tracer.registry.collect)
+        self.mcp_requests = self.metrics.counter(
+            "mcp_worker_requests_total", "MCP JSON-RPC requests by method", ["method"]
+        )
+        # Tool names reported in traces; unregistered ones are reported as "other"
+        self.tool_names = frozenset(
+            [name for module in TOOL_MODULES for name in module.TOOL_HANDLERS]
+            + list(CodebaseTools.TOOL_HANDLERS)
+        )
+
         # Set up enhanced logging for this worker (use system-appropriate location)
         log_dir = LOGS_DIR
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -125,7 +198,8 @@ class MCPWorker:
 
         # Detailed formatter with microseconds
         detailed_formatter = MicrosecondFormatter(
-            "%(asctime)s [%(levelname)8s] %(name)s.%(funcName)s:%(lineno)d - %(message)s"
+            "%(asctime)s [%(levelname)8s] [%(request_id)s] "
+            "%(name)s.%(funcName)s:%(lineno)d - %(message)s"
         )
 
         # Console formatter with microseconds
@@ -137,12 +211,14 @@ class MCPWorker:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(console_formatter)
         console_handler.setLevel(logging.INFO)
+        console_handler.addFilter(RequestIdFilter())
         self.logger.addHandler(console_handler)
 
         # Add file handler
         file_handler = logging.FileHandler(log_dir / f"{self.repo_name}.log")
         file_handler.setFormatter(detailed_formatter)
         file_handler.setLevel(logging.DEBUG)
+        file_handler.addFilter(RequestIdFilter())
         self.logger.addHandler(file_handler)
 
         self.logger.info(
@@ -214,6 +290,7 @@ class MCPWorker:
         # Server instance for shutdown
         self.server: uvicorn.Server | None = None
         self.shutdown_event = asyncio.Event()
+        self._lsp_warmup_task: asyncio.Task[None] | None = None
 
         # Initialize symbol storage for Python repositories
         self.symbol_storage = None
@@ -249,11 +326,17 @@ class MCPWorker:
     def _initialize_symbol_storage(self) -> None:
         """Initialize symbol storage for codebase tools."""
         try:
-            # Use the provided database path or default to production storage
+            # Use the provided database path or default to production storage.
+            # Reads use a pool of query-only connections so symbol searches
+            # never queue behind indexing writes.
             if self.db_path:
-                self.symbol_storage = SQLiteSymbolStorage(self.db_path)
+                self.symbol_storage = SQLiteSymbolStorage(
+                    self.db_path, read_pool_size=DEFAULT_READ_POOL_SIZE
+                )
             else:
-                self.symbol_storage = ProductionSymbolStorage()
+                self.symbol_storage = ProductionSymbolStorage(
+                    read_pool_size=DEFAULT_READ_POOL_SIZE
+                )
             # Don't create schema here - master already did that
 
             self.logger.info(
@@ -272,6 +355,28 @@ class MCPWorker:
 
     # LSP server startup removed - SimpleLSPClient handles LSP processes on-demand
 
+    async def _warm_lsp_cache(self) -> None:
+        """Pre-index the repository and its python_path environment for LSP.
+
+        The cache persists under DATA_DIR, so after a restart this only
+        re-parses files that changed and first-query latency stays close to
+        steady state. Runs in a thread so the worker keeps serving requests.
+        """
+        if self.language != Language.PYTHON or not self.repo_config.lsp_enabled:
+            return
+
+        try:
+            warmed = await asyncio.to_thread(
+                LSPServerFactory.warm_workspace_cache,
+                self.repo_config.lsp_server.value,
+                self.repo_path,
+                self.python_path,
+            )
+            self.logger.info(f"LSP cache warm-up finished (warmed={warmed})")
+        except Exception as e:
+            # A cold cache only costs latency, never correctness
+            self.logger.warning(f"LSP cache warm-up failed: {e}")
+
     def _setup_repository_manager(self) -> None:
         """Set up a temporary repository manager for this worker's repository"""
         self.logger.debug("Setting up github_tools module...")
@@ -350,7 +455,13 @@ class MCPWorker:
                 "description": self.description,
                 "version": "2.0.0",
                 "status": "running",
-                "endpoints": {"health": "/health", "mcp": "/mcp/"},
+                "endpoints": {
+                    "health": "/health",
+                    "ready": "/ready",
+                    "metrics": "/metrics",
+                    "stats": "/stats",
+                    "mcp": "/mcp/",
+                },
                 "tool_categories": ["github", "codebase"],
             }
 
@@ -368,6 +479,40 @@ class MCPWorker:
                 "tool_categories": ["github", "codebase"],
             }
 
+        # Readiness endpoint: the master only routes and counts a worker as up
+        # once it is serving, and stops treating it as ready while draining
+        @app.get("/ready")
+        async def readiness_check() -> JSONResponse:
+            server_started = bool(self.server is not None and self.server.started)
+            shutting_down = self.shutdown_event.is_set()
+            warmup_task = self._lsp_warmup_task
+            ready = server_started and not shutting_down
+            return JSONResponse(
+                status_code=200 if ready else 503,
+                content={
+                    "ready": ready,
+                    "repository": self.repo_name,
+                    # Lets the master tell workers sharing a port apart
+                    "pid": os.getpid(),
+                    "server_started": server_started,
+                    "shutting_down": shutting_down,
+                    "symbol_storage": self.symbol_storage is not None,
+                    "lsp_cache_warm": warmup_task is not None and warmup_task.done(),
+                },
+            )
+
+        # Prometheus metrics endpoint
+        @app.get("/metrics")
+        async def metrics() -> Response:
+            return Response(
+                content=self.metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE
+            )
+
+        # Latency summaries per request method, tool and backend call
+        @app.get("/stats")
+        async def stats() -> dict[str, Any]:
+            return {"repository": self.repo_name, **tracer.stats()}
+
         # Graceful shutdown endpoint
         @app.post("/shutdown")
         async def graceful_shutdown() -> dict[str, Any]:
@@ -387,11 +532,19 @@ class MCPWorker:
             client_host = request.client.host if request.client else "unknown"
             self.logger.info(f"SSE connection from {client_host}")
 
+            # Behind the master's gateway, clients must post back through it
+            forwarded_prefix = request.headers.get("x-forwarded-prefix")
+            forwarded_host = request.headers.get("x-forwarded-host")
+            if forwarded_prefix and forwarded_host:
+                post_url = f"http://{forwarded_host}{forwarded_prefix}/"
+            else:
+                post_url = f"http://localhost:{self.port}/mcp/"
+
             async def generate_sse():
                 try:
                     # Send endpoint event with POST URL
                     yield "event: endpoint\n"
-                    yield f"data: http://localhost:{self.port}/mcp/\n\n"
+                    yield f"data: {post_url}\n\n"
 
                     # Process queued messages and keep connection alive
                     keepalive_counter = 0
@@ -431,272 +584,279 @@ class MCPWorker:
 
         # MCP POST endpoint
         @app.post("/mcp/")
-        async def mcp_post_endpoint(request: Request) -> dict[str, Any]:
+        async def mcp_post_endpoint(
+            request: Request, http_response: Response
+        ) -> dict[str, Any]:
             """Handle POST requests (JSON-RPC MCP protocol)"""
-            try:
-                body = await request.json()
-                self.logger.info(f"Received MCP request: {body.get('method')}")
-
-                if body.get("method") == "initialize":
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": body.get("id", 1),
-                        "result": {
-                            "protocolVersion": "2024-11-05",
-                            "capabilities": {
-                                "tools": {"listChanged": False},
-                                "prompts": {"listChanged": False},
-                                "resources": {"subscribe": False, "listChanged": False},
-                                "experimental": {},
-                            },
-                            "serverInfo": {
-                                "name": f"mcp-agent-{self.repo_name}",
-                                "version": "2.0.0",
-                                "description": f"GitHub Pull Request management, code review, CI/CD build analysis, codebase health checks, and Git repository tools for {self.repo_name}. Provides GitHub API integration, build log parsing, linter analysis, test failure extraction, PR comment management, local Git operations, and repository analysis.",
+            request_id = request.headers.get(REQUEST_ID_HEADER) or new_request_id()
+            http_response.headers[REQUEST_ID_HEADER] = request_id
+            # The request span is entered once the method is known
+            with contextlib.ExitStack() as trace:
+                try:
+                    body = await request.json()
+                    method = str(body.get("method"))
+                    trace.enter_context(
+                        tracer.request(method_label(method), request_id)
+                    )
+                    self.logger.info(f"Received MCP request: {method}")
+                    self.mcp_requests.inc(method=method_label(method))
+
+                    if body.get("method") == "initialize":
+                        response = {
+                            "jsonrpc": "2.0",
+                            "id": body.get("id", 1),
+                            "result": {
+                                "protocolVersion": "2024-11-05",
+                                "capabilities": {
+                                    "tools": {"listChanged": False},
+                                    "prompts": {"listChanged": False},
+                                    "resources": {
+                                        "subscribe": False,
+                                        "listChanged": False,
+                                    },
+                                    "experimental": {},
+                                },
+                                "serverInfo": {
+                                    "name": f"mcp-agent-{self.repo_name}",
+                                    "version": "2.0.0",
+                                    "description": f"GitHub Pull Request management, code review, CI/CD build analysis, codebase health checks, and Git repository tools for {self.repo_name}. Provides GitHub API integration, build log parsing, linter analysis, test failure extraction, PR comment management, local Git operations, and repository analysis.",
+                                },
                             },
-                        },
-                    }
-                    return response
-
-                elif body.get("method") == "notifications/initialized":
-                    self.logger.info("Received initialized notification")
-                    return {"status": "ok"}
+                        }
+                        return response
+
+                    elif body.get("method") == "notifications/initialized":
+                        self.logger.info("Received initialized notification")
+                        return {"status": "ok"}
+
+                    elif body.get("method") == "tools/list":
+                        # Dynamically collect tools from all registered modules
+                        all_tools = []
+                        for module in TOOL_MODULES:
+                            all_tools.extend(
+                                module.get_tools(self.repo_name, self.repo_path)
+                            )
 
-                elif body.get("method") == "tools/list":
-                    # Dynamically collect tools from all registered modules
-                    all_tools = []
-                    for module in TOOL_MODULES:
+                        # Add codebase tools from the instance
                         all_tools.extend(
-                            module.get_tools(self.repo_name, self.repo_path)
+                            self.codebase_tools_instance.get_tools(
+                                self.repo_name, self.repo_path
+                            )
                         )
 
-                    # Add codebase tools from the instance
-                    all_tools.extend(
-                        self.codebase_tools_instance.get_tools(
-                            self.repo_name, self.repo_path
-                        )
-                    )
+                        response = {
+                            "jsonrpc": "2.0",
+                            "id": body.get("id", 1),
+                            "result": {"tools": all_tools},
+                        }
+                        return response
 
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": body.get("id", 1),
-                        "result": {"tools": all_tools},
-                    }
-                    return response
+                    elif body.get("method") == "tools/call":
+                        # Handle tool execution for this repository
+                        tool_name = body.get("params", {}).get("name")
+                        tool_args = body.get("params", {}).get("arguments", {})
 
-                elif body.get("method") == "tools/call":
-                    # Handle tool execution for this repository
-                    tool_name = body.get("params", {}).get("name")
-                    tool_args = body.get("params", {}).get("arguments", {})
+                        self.logger.info(
+                            f"Tool call '{tool_name}' with args: {tool_args}"
+                        )
 
-                    self.logger.info(f"Tool call '{tool_name}' with args: {tool_args}")
+                        tool_label = str(tool_name)
+                        if tool_label not in self.tool_names:
+                            tool_label = OTHER_LABEL
+                        with tracer.tool(tool_label):
+                            result = await self._dispatch_tool_call(
+                                tool_name, tool_args
+                            )
 
-                    result = None
+                        response = {
+                            "jsonrpc": "2.0",
+                            "id": body.get("id", 1),
+                            "result": {"content": [{"type": "text", "text": result}]},
+                        }
+                        return response
 
-                    # Handle special cases that need custom parameter processing
-                    if tool_name == "github_find_pr_for_branch":
-                        branch_name = tool_args.get("branch_name")
-                        if not branch_name:
-                            # Auto-detect current branch
-                            current_branch_result = await execute_get_current_branch(
-                                self.repo_name
-                            )
-                            current_branch_data = json.loads(current_branch_result)
-                            if current_branch_data.get("error"):
-                                result = json.dumps(
-                                    {
-                                        "error": f"Failed to get current branch: {current_branch_data.get('error')}"
-                                    }
-                                )
-                            else:
-                                branch_name = current_branch_data.get("branch")
-                                result = await execute_find_pr_for_branch(
-                                    self.repo_name, branch_name
-                                )
-                        else:
-                            result = await execute_find_pr_for_branch(
-                                self.repo_name, branch_name
-                            )
+                    return {
+                        "jsonrpc": "2.0",
+                        "id": body.get("id", 1),
+                        "error": {"code": -32601, "message": "Method not found"},
+                    }
 
-                    elif tool_name == "github_get_pr_comments":
-                        pr_number = tool_args.get("pr_number")
-                        if not pr_number:
-                            # Auto-detect PR for current branch
-                            current_branch_result = await execute_get_current_branch(
-                                self.repo_name
-                            )
-                            current_branch_data = json.loads(current_branch_result)
-                            if current_branch_data.get("error"):
-                                result = json.dumps(
-                                    {
-                                        "error": f"Failed to get current branch: {current_branch_data.get('error')}"
-                                    }
-                                )
-                            else:
-                                branch_name = current_branch_data.get("branch")
-                                find_pr_result = await execute_find_pr_for_branch(
-                                    self.repo_name, branch_name
-                                )
-                                find_pr_data = json.loads(find_pr_result)
-                                if find_pr_data.get("error"):
-                                    result = json.dumps(
-                                        {
-                                            "error": f"No PR found for current branch '{branch_name}': {find_pr_data.get('error')}"
-                                        }
-                                    )
-                                else:
-                                    pr_number = find_pr_data.get("number")
-                                    result = await execute_get_pr_comments(
-                                        self.repo_name, pr_number
-                                    )
-                        else:
-                            result = await execute_get_pr_comments(
-                                self.repo_name, pr_number
-                            )
+                except Exception as e:
+                    self.logger.error(f"Error handling MCP request: {e}")
+                    return {
+                        "jsonrpc": "2.0",
+                        "id": 1,
+                        "error": {"code": -32603, "message": f"Internal error: {e!s}"},
+                    }
 
-                    elif tool_name == "github_get_build_status":
-                        commit_sha = tool_args.get("commit_sha")
-                        if not commit_sha:
-                            # Auto-detect current commit
-                            current_commit_result = await execute_get_current_commit(
-                                self.repo_name
-                            )
-                            current_commit_data = json.loads(current_commit_result)
-                            if current_commit_data.get("error"):
-                                result = json.dumps(
-                                    {
-                                        "error": f"Failed to get current commit: {current_commit_data.get('error')}"
-                                    }
-                                )
-                            else:
-                                commit_sha = current_commit_data.get("sha")
-                                result = await execute_get_build_status(
-                                    self.repo_name, commit_sha
-                                )
-                        else:
-                            result = await execute_get_build_status(
-                                self.repo_name, commit_sha
-                            )
+        return app
 
-                    elif tool_name == "github_check_ci_lint_errors_not_local":
-                        build_id = tool_args.get("build_id")
-                        self.logger.info(
-                            f"Calling lint errors with language: {self.language.value}"
+    async def _dispatch_tool_call(
+        self, tool_name: str, tool_args: dict[str, Any]
+    ) -> str:
+        """Run a tool for this repository and return its JSON result"""
+        result: str | None = None
+
+        # Handle special cases that need custom parameter processing
+        if tool_name == "github_find_pr_for_branch":
+            branch_name = tool_args.get("branch_name")
+            if not branch_name:
+                # Auto-detect current branch
+                current_branch_result = await execute_get_current_branch(self.repo_name)
+                current_branch_data = json.loads(current_branch_result)
+                if current_branch_data.get("error"):
+                    result = json.dumps(
+                        {
+                            "error": f"Failed to get current branch: {current_branch_data.get('error')}"
+                        }
+                    )
+                else:
+                    branch_name = current_branch_data.get("branch")
+                    result = await execute_find_pr_for_branch(
+                        self.repo_name, branch_name
+                    )
+            else:
+                result = await execute_find_pr_for_branch(self.repo_name, branch_name)
+
+        elif tool_name == "github_get_pr_comments":
+            pr_number = tool_args.get("pr_number")
+            if not pr_number:
+                # Auto-detect PR for current branch
+                current_branch_result = await execute_get_current_branch(self.repo_name)
+                current_branch_data = json.loads(current_branch_result)
+                if current_branch_data.get("error"):
+                    result = json.dumps(
+                        {
+                            "error": f"Failed to get current branch: {current_branch_data.get('error')}"
+                        }
+                    )
+                else:
+                    branch_name = current_branch_data.get("branch")
+                    find_pr_result = await execute_find_pr_for_branch(
+                        self.repo_name, branch_name
+                    )
+                    find_pr_data = json.loads(find_pr_result)
+                    if find_pr_data.get("error"):
+                        result = json.dumps(
+                            {
+                                "error": f"No PR found for current branch '{branch_name}': {find_pr_data.get('error')}"
+                            }
                         )
-                        result = await execute_github_check_ci_lint_errors_not_local(
-                            self.repo_name, self.language.value, build_id
+                    else:
+                        pr_number = find_pr_data.get("number")
+                        result = await execute_get_pr_comments(
+                            self.repo_name, pr_number
                         )
+            else:
+                result = await execute_get_pr_comments(self.repo_name, pr_number)
+
+        elif tool_name == "github_get_build_status":
+            commit_sha = tool_args.get("commit_sha")
+            if not commit_sha:
+                # Auto-detect current commit
+                current_commit_result = await execute_get_current_commit(self.repo_name)
+                current_commit_data = json.loads(current_commit_result)
+                if current_commit_data.get("error"):
+                    result = json.dumps(
+                        {
+                            "error": f"Failed to get current commit: {current_commit_data.get('error')}"
+                        }
+                    )
+                else:
+                    commit_sha = current_commit_data.get("sha")
+                    result = await execute_get_build_status(self.repo_name, commit_sha)
+            else:
+                result = await execute_get_build_status(self.repo_name, commit_sha)
 
-                    elif tool_name == "github_check_ci_build_and_test_errors_not_local":
-                        build_id = tool_args.get("build_id")
-                        result = await execute_github_check_ci_build_and_test_errors_not_local(
-                            self.repo_name, self.language.value, build_id
-                        )
+        elif tool_name == "github_check_ci_lint_errors_not_local":
+            build_id = tool_args.get("build_id")
+            self.logger.info(
+                f"Calling lint errors with language: {self.language.value}"
+            )
+            result = await execute_github_check_ci_lint_errors_not_local(
+                self.repo_name, self.language.value, build_id
+            )
 
-                    elif tool_name == "search_symbols":
-                        query = tool_args.get("query")
-                        symbol_kind = tool_args.get("symbol_kind")
-                        limit = tool_args.get("limit", 50)
+        elif tool_name == "github_check_ci_build_and_test_errors_not_local":
+            build_id = tool_args.get("build_id")
+            result = await execute_github_check_ci_build_and_test_errors_not_local(
+                self.repo_name, self.language.value, build_id
+            )
 
-                        if not query:
-                            result = json.dumps(
-                                {
-                                    "error": "Query parameter is required for symbol search"
-                                }
-                            )
-                        elif not self.symbol_storage:
-                            result = json.dumps(
-                                {
-                                    "error": "Symbol storage not available for this repository"
-                                }
-                            )
-                        else:
-                            result = await self.codebase_tools_instance.execute_tool(
-                                tool_name,
-                                repository_id=self.repo_name,
-                                query=query,
-                                symbol_kind=symbol_kind,
-                                limit=limit,
-                            )
+        elif tool_name == "search_symbols":
+            query = tool_args.get("query")
+            symbol_kind = tool_args.get("symbol_kind")
+            limit = tool_args.get("limit", 50)
 
-                    # If no special handling was needed, use module dispatch
-                    if result is None:
-                        # Check if this is a codebase tool
-                        codebase_tool_handlers = {
-                            "codebase_health_check",
-                            "find_definition",
-                            "find_references",
-                            "find_hover",
-                        }
+            if not query:
+                result = json.dumps(
+                    {"error": "Query parameter is required for symbol search"}
+                )
+            elif not self.symbol_storage:
+                result = json.dumps(
+                    {"error": "Symbol storage not available for this repository"}
+                )
+            else:
+                result = await self.codebase_tools_instance.execute_tool(
+                    tool_name,
+                    repository_id=self.repo_name,
+                    query=query,
+                    symbol_kind=symbol_kind,
+                    limit=limit,
+                )
+
+        # If no special handling was needed, use module dispatch
+        if result is None:
+            # Check if this is a codebase tool
+            codebase_tool_handlers = {
+                "codebase_health_check",
+                "find_definition",
+                "find_references",
+                "find_hover",
+            }
 
-                        if tool_name in codebase_tool_handlers:
-                            # Use the CodebaseTools instance
-                            # Ensure repository_id from self.repo_name takes precedence
-                            codebase_args = {
+            if tool_name in codebase_tool_handlers:
+                # Use the CodebaseTools instance
+                # Ensure repository_id from self.repo_name takes precedence
+                codebase_args = {
+                    **tool_args,
+                    "repository_id": self.repo_name,
+                }
+                result = await self.codebase_tools_instance.execute_tool(
+                    tool_name,
+                    **codebase_args,
+                )
+            else:
+                # Try to find the tool in any of the registered modules
+                for module in TOOL_MODULES:
+                    if tool_name in module.TOOL_HANDLERS:
+                        # Standard tools that just need repo_name and repo_path
+                        if tool_name in [
+                            "git_get_current_branch",
+                            "git_get_current_commit",
+                        ]:
+                            result = await module.execute_tool(
+                                tool_name,
+                                repo_name=self.repo_name,
+                                repository_workspace=self.repo_path,
                                 **tool_args,
-                                "repository_id": self.repo_name,
-                            }
-                            result = await self.codebase_tools_instance.execute_tool(
+                            )
+                        elif tool_name == "github_post_pr_reply":
+                            # This tool only needs repo_name, not repo_path
+                            result = await module.execute_tool(
                                 tool_name,
-                                **codebase_args,
+                                repo_name=self.repo_name,
+                                **tool_args,
                             )
                         else:
-                            # Try to find the tool in any of the registered modules
-                            for module in TOOL_MODULES:
-                                if tool_name in module.TOOL_HANDLERS:
-                                    # Standard tools that just need repo_name and repo_path
-                                    if tool_name in [
-                                        "git_get_current_branch",
-                                        "git_get_current_commit",
-                                    ]:
-                                        result = await module.execute_tool(
-                                            tool_name,
-                                            repo_name=self.repo_name,
-                                            repository_workspace=self.repo_path,
-                                            **tool_args,
-                                        )
-                                    elif tool_name == "github_post_pr_reply":
-                                        # This tool only needs repo_name, not repo_path
-                                        result = await module.execute_tool(
-                                            tool_name,
-                                            repo_name=self.repo_name,
-                                            **tool_args,
-                                        )
-                                    else:
-                                        # For other tools, pass all args as-is
-                                        result = await module.execute_tool(
-                                            tool_name, **tool_args
-                                        )
-                                    break
-
-                        # If tool not found in any module
-                        if result is None:
-                            result = json.dumps(
-                                {"error": f"Tool '{tool_name}' not implemented"}
-                            )
+                            # For other tools, pass all args as-is
+                            result = await module.execute_tool(tool_name, **tool_args)
+                        break
 
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": body.get("id", 1),
-                        "result": {"content": [{"type": "text", "text": result}]},
-                    }
-                    return response
-
-                return {
-                    "jsonrpc": "2.0",
-                    "id": body.get("id", 1),
-                    "error": {"code": -32601, "message": "Method not found"},
-                }
-
-            except Exception as e:
-                self.logger.error(f"Error handling MCP request: {e}")
-                return {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "error": {"code": -32603, "message": f"Internal error: {e!s}"},
-                }
-
-        return app
+            # If tool not found in any module
+            if result is None:
+                result = json.dumps({"error": f"Tool '{tool_name}' not implemented"})
+        return result
 
     def signal_handler(self, signum: int, frame: Any) -> None:
         """Handle shutdown signals"""
@@ -727,7 +887,10 @@ class MCPWorker:
 
         self.logger.info(f"Starting worker for {self.repo_name} on port {self.port}")
         self.logger.info(f"Repository path: {self.repo_path}")
-        self.logger.info(f"MCP endpoint: http://localhost:{self.port}/mcp/")
+        if self.unix_socket:
+            self.logger.info(f"MCP endpoint: unix:{self.unix_socket} /mcp/")
+        else:
+            self.logger.info(f"MCP endpoint: http://localhost:{self.port}/mcp/")
 
         # Log initial system state
         log_system_state(self.logger, f"WORKER_{self.repo_name.upper()}_STARTING")
@@ -770,8 +933,11 @@ class MCPWorker:
             if self.server is not None:
                 # Run server in background and wait for shutdown event
                 self.logger.info("Creating server and shutdown tasks...")
-                server_task = asyncio.create_task(self.server.serve())
+                server_task = asyncio.create_task(
+                    self.server.serve(sockets=[self._create_server_socket()])
+                )
                 shutdown_task = asyncio.create_task(self.shutdown_event.wait())
+                self._lsp_warmup_task = asyncio.create_task(self._warm_lsp_cache())
                 self.logger.debug("Server and shutdown tasks created successfully")
 
                 # Wait for either server to complete or shutdown event
@@ -801,8 +967,30 @@ class MCPWorker:
         finally:
             # Ensure cleanup happens
             self.logger.info("Performing final cleanup...")
+            self._remove_unix_socket()
             self.shutdown_coordinator.initiate_shutdown("server_stopped")
 
+    def _create_server_socket(self) -> socket.socket:
+        """Create the listening socket for the configured transport"""
+        if self.listen_fd is not None:
+            return socket.socket(fileno=self.listen_fd)
+        if not self.unix_socket:
+            return create_listen_socket(self.port)
+        sock, self._unix_socket_inode = create_unix_listen_socket(self.unix_socket)
+        return sock
+
+    def _remove_unix_socket(self) -> None:
+        """Unlink the Unix socket unless a replacement worker already owns it"""
+        if not self.unix_socket or self._unix_socket_inode is None:
+            return
+        try:
+            if os.stat(self.unix_socket).st_ino == self._unix_socket_inode:
+                os.unlink(self.unix_socket)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Failed to remove socket {self.unix_socket}: {e}")
+
     async def shutdown_sequence(self):
         """Worker's graceful shutdown process"""
         self.logger.info("Beginning graceful shutdown...")
@@ -862,6 +1050,15 @@ def main() -> None:
     parser.add_argument(
         "--python-path", required=True, help="Path to Python executable"
     )
+    parser.add_argument(
+        "--unix-socket",
+        help="Listen on this Unix domain socket instead of the TCP port",
+    )
+    parser.add_argument(
+        "--listen-fd",
+        type=int,
+        help="Serve on this inherited listening socket instead of binding the port",
+    )
 
     logger.info("Parsing arguments...")
     args = parser.parse_args()
@@ -881,7 +1078,11 @@ def main() -> None:
     try:
         repository_config = RepositoryConfig.from_args(args)
         logger.info("Creating worker instance...")
-        worker = MCPWorker(repository_config)
+        worker = MCPWorker(
+            repository_config,
+            unix_socket=args.unix_socket,
+            listen_fd=args.listen_fd,
+        )
         worker.logger.info("Worker instance created successfully")
     except Exception as e:
         logger.error(f"Failed to create worker: {e}")
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+
+"""
+In-Memory Metrics
+Counters, gauges, latency histograms and scrape-time collectors rendered in the Prometheus text
+exposition format for the master's and workers' ``/metrics`` endpoints.
+
+Updating a counter or gauge only touches memory. Values derived from state
+that is already tracked elsewhere, such as worker probe results, are produced
+by collectors that run only when the endpoint is scraped.
+"""
+
+import bisect
+import math
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import psutil
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = tuple[str, ...]
+
+
+def log_buckets(
+    minimum: float = 0.0001, maximum: float = 100.0, per_decade: int = 5
+) -> tuple[float, ...]:
+    """Return log-spaced bucket bounds between ``minimum`` and ``maximum``.
+
+    Like an HDR histogram, every bucket has the same relative width, so
+    sub-millisecond and multi-second latencies are resolved equally well.
+    """
+    decades = math.log10(maximum / minimum)
+    steps = round(decades * per_decade)
+    return tuple(
+        float(f"{minimum * 10 ** (step / per_decade):.3g}") for step in range(steps + 1)
+    )
+
+
+# 100 microseconds to 100 seconds, five buckets per decade
+DEFAULT_LATENCY_BUCKETS = log_buckets()
+
+
+@dataclass
+class MetricFamily:
+    """A metric and its samples, as produced at scrape time."""
+
+    name: str
+    type: str
+    help: str
+    samples: list[tuple[str, dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, suffix: str = "", **labels: str) -> None:
+        """Add a sample, optionally under a suffixed name such as ``_count``."""
+        self.samples.append((self.name + suffix, labels, value))
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+class _LabelledMetric(ABC):
+    """Thread-safe metric keyed by label values."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues) -> dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+    @abstractmethod
+    def collect(self) -> MetricFamily:
+        """Return the metric's current samples."""
+
+
+class _ScalarMetric(_LabelledMetric):
+    """Single value per label set."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for a label set, 0 if never set."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.help)
+        with self._lock:
+            for key, value in self._values.items():
+                family.add(value, **self._labels(key))
+        return family
+
+
+class Counter(_ScalarMetric):
+    """Monotonically increasing count."""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for a label set."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_ScalarMetric):
+    """Value that can go up and down."""
+
+    type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the gauge for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge for a label set."""
+        self.inc(-amount, **labels)
+
+
+@dataclass
+class _HistogramSeries:
+    """Bucket counts of one label set; the last bucket is +Inf."""
+
+    counts: list[int]
+    count: int = 0
+    sum: float = 0.0
+    max: float = 0.0
+
+
+class Histogram(_LabelledMetric):
+    """Distribution of observed values, such as latencies in seconds."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = _HistogramSeries([0] * (len(self.buckets) + 1))
+                self._series[key] = series
+            series.counts[index] += 1
+            series.count += 1
+            series.sum += value
+            series.max = max(series.max, value)
+
+    def _quantile(self, series: _HistogramSeries, q: float) -> float:
+        """Estimate a quantile by interpolating within its bucket."""
+        rank = q * series.count
+        cumulative = 0
+        for index, count in enumerate(series.counts):
+            if count and cumulative + count >= rank:
+                if index == len(self.buckets):
+                    return series.max
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                estimate = lower + (upper - lower) * (rank - cumulative) / count
+                return min(estimate, series.max)
+            cumulative += count
+        return series.max
+
+    def summaries(self) -> list[tuple[dict[str, str], dict[str, Any]]]:
+        """Return count, mean, max and estimated percentiles per label set."""
+        with self._lock:
+            snapshot = [
+                (key, _HistogramSeries(list(s.counts), s.count, s.sum, s.max))
+                for key, s in self._series.items()
+            ]
+        return [
+            (
+                self._labels(key),
+                {
+                    "count": series.count,
+                    "mean": series.sum / series.count if series.count else None,
+                    "p50": self._quantile(series, 0.5),
+                    "p90": self._quantile(series, 0.9),
+                    "p99": self._quantile(series, 0.99),
+                    "max": series.max,
+                },
+            )
+            for key, series in snapshot
+        ]
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.help)
+        with self._lock:
+            for key, series in self._series.items():
+                labels = self._labels(key)
+                cumulative = 0
+                for bound, count in zip(
+                    (*self.buckets, math.inf), series.counts, strict=True
+                ):
+                    cumulative += count
+                    family.add(cumulative, "_bucket", **labels, le=_format_value(bound))
+                family.add(series.sum, "_sum", **labels)
+                family.add(series.count, "_count", **labels)
+        return family
+
+
+class MetricsRegistry:
+    """Holds a process's metrics and renders them on scrape."""
+
+    def __init__(self) -> None:
+        self._metrics: list[_LabelledMetric] = []
+        self._collectors: list[Collector] = []
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Counter:
+        """Create and register a counter."""
+        counter = Counter(name, documentation, labelnames)
+        with self._lock:
+            self._metrics.append(counter)
+        return counter
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Gauge:
+        """Create and register a gauge."""
+        gauge = Gauge(name, documentation, labelnames)
+        with self._lock:
+            self._metrics.append(gauge)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        histogram = Histogram(name, documentation, labelnames, buckets)
+        with self._lock:
+            self._metrics.append(histogram)
+        return histogram
+
+    def register_collector(self, collector: Collector) -> None:
+        """Register a function that produces metric families on each scrape."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self) -> list[MetricFamily]:
+        """Return every metric family, running the collectors."""
+        with self._lock:
+            metrics = list(self._metrics)
+            collectors = list(self._collectors)
+        families = [metric.collect() for metric in metrics]
+        for collector in collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        return render_families(self.collect())
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_families(families: Iterable[MetricFamily]) -> str:
+    """Render metric families in the Prometheus text exposition format."""
+    lines = []
+    for family in families:
+        lines.append(f"# HELP {family.name} {family.help}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for name, labels, value in family.samples:
+            if labels:
+                rendered = ",".join(
+                    f'{key}="{_escape_label_value(str(label))}"'
+                    for key, label in labels.items()
+                )
+                name = f"{name}{{{rendered}}}"
+            lines.append(f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def process_collector() -> Collector:
+    """Return a collector for this process's memory, file descriptors and CPU.
+
+    Only cheap per-process counters are read; nothing scans open files or
+    the system's connection tables.
+    """
+    process = psutil.Process(os.getpid())
+
+    def collect() -> list[MetricFamily]:
+        memory = MetricFamily(
+            "process_resident_memory_bytes", "gauge", "Resident memory size in bytes"
+        )
+        cpu = MetricFamily(
+            "process_cpu_seconds_total", "counter", "User and system CPU time"
+        )
+        start_time = MetricFamily(
+            "process_start_time_seconds", "gauge", "Start time since the epoch"
+        )
+        families = [memory, cpu, start_time]
+        try:
+            with process.oneshot():
+                memory.add(process.memory_info().rss)
+                times = process.cpu_times()
+                cpu.add(times.user + times.system)
+                start_time.add(process.create_time())
+                if hasattr(process, "num_fds"):
+                    fds = MetricFamily(
+                        "process_open_fds", "gauge", "Open file descriptors"
+                    )
+                    fds.add(process.num_fds())
+                    families.append(fds)
+        except psutil.Error:
+            return []
+        return families
+
+    return collect
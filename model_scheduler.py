@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+
+"""
+Model Call Scheduler
+Process-wide concurrency limits for LLM calls (Ollama, Claude, Amp) shared by
+the LangGraph and multi-agent workflows.
+
+Each backend has a limit on calls in flight. Calls over the limit wait in a
+queue ordered by priority, so later workflow phases finish before new work
+starts; among equal priorities the owner (workflow thread) with the fewest
+running calls goes first, so one workflow cannot starve the others. Time
+spent waiting is recorded per backend.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from metrics import MetricFamily, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# Calls in flight per backend unless configured otherwise
+DEFAULT_BACKEND_LIMITS = {"ollama": 4, "claude_code": 1, "amp": 4}
+DEFAULT_OWNER = "default"
+
+# Scheduling defaults for calls made in this context, set by workflow code
+# around a node or round so model call sites need not pass them
+_current_owner: ContextVar[str] = ContextVar("model_owner", default=DEFAULT_OWNER)
+_current_priority: ContextVar[int] = ContextVar("model_priority", default=0)
+
+T = TypeVar("T")
+
+
+@contextmanager
+def scheduling_context(
+    owner: str | None = None, priority: int | None = None
+) -> Iterator[None]:
+    """Set the owner and priority of model calls made in this context.
+
+    Args:
+        owner: Workflow or thread the calls belong to, for fair sharing
+        priority: Higher priorities are served first
+    """
+    owner_token = _current_owner.set(owner) if owner is not None else None
+    priority_token = _current_priority.set(priority) if priority is not None else None
+    try:
+        yield
+    finally:
+        if priority_token is not None:
+            _current_priority.reset(priority_token)
+        if owner_token is not None:
+            _current_owner.reset(owner_token)
+
+
+@dataclass
+class _Waiter:
+    priority: int
+    owner: str
+    sequence: int
+    granted: asyncio.Future[None]
+    enqueued: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _Backend:
+    limit: int
+    running: int = 0
+    running_by_owner: Counter[str] = field(default_factory=Counter)
+    waiting: list[_Waiter] = field(default_factory=list)
+    calls: int = 0
+
+
+class ModelScheduler:
+    """Limits concurrent model calls per backend"""
+
+    def __init__(
+        self,
+        limits: dict[str, int] | None = None,
+        default_limit: int = 1,
+        registry: MetricsRegistry | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            limits: Calls in flight per backend name
+            default_limit: Limit for backends not in ``limits``
+            registry: Registry the queue-time histogram is created in
+        """
+        self.default_limit = default_limit
+        self._backends = {
+            backend: _Backend(limit=limit) for backend, limit in (limits or {}).items()
+        }
+        self._sequence = itertools.count()
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.queue_time = self.registry.histogram(
+            "model_call_queue_seconds",
+            "Time model calls waited for a free slot",
+            ["backend"],
+        )
+        self.registry.register_collector(self._collect_metrics)
+
+    def _backend(self, backend: str) -> _Backend:
+        if backend not in self._backends:
+            self._backends[backend] = _Backend(limit=self.default_limit)
+        return self._backends[backend]
+
+    def set_limit(self, backend: str, limit: int) -> None:
+        """Change how many calls a backend may have in flight."""
+        if limit < 1:
+            raise ValueError(f"Limit for {backend} must be at least 1, got {limit}")
+        state = self._backend(backend)
+        state.limit = limit
+        self._dispatch(backend, state)
+
+    @asynccontextmanager
+    async def slot(
+        self, backend: str, priority: int | None = None, owner: str | None = None
+    ) -> AsyncIterator[None]:
+        """Hold one of the backend's slots for the duration of a model call.
+
+        Args:
+            backend: Backend name, such as ``ollama``
+            priority: Higher is served first; defaults to the context priority
+            owner: Workflow the call belongs to; defaults to the context owner
+        """
+        owner = owner if owner is not None else _current_owner.get()
+        priority = priority if priority is not None else _current_priority.get()
+        state = self._backend(backend)
+
+        if state.running < state.limit and not state.waiting:
+            self._start(backend, state, owner, 0.0)
+        else:
+            waiter = _Waiter(
+                priority=priority,
+                owner=owner,
+                sequence=next(self._sequence),
+                granted=asyncio.get_running_loop().create_future(),
+            )
+            state.waiting.append(waiter)
+            logger.debug(
+                f"{backend} call for {owner} queued behind {state.running} running, "
+                f"{len(state.waiting) - 1} waiting"
+            )
+            try:
+                await waiter.granted
+            except asyncio.CancelledError:
+                if waiter in state.waiting:
+                    state.waiting.remove(waiter)
+                elif not waiter.granted.cancelled():
+                    # Granted just as we were cancelled: hand the slot on
+                    self._finish(backend, state, owner)
+                raise
+
+        try:
+            yield
+        finally:
+            self._finish(backend, state, owner)
+
+    async def run(
+        self,
+        backend: str,
+        call: Callable[[], Awaitable[T]],
+        priority: int | None = None,
+        owner: str | None = None,
+    ) -> T:
+        """Run a model call once the backend has a free slot.
+
+        Args:
+            backend: Backend name, such as ``ollama``
+            call: Starts the model call when invoked
+            priority: Higher is served first; defaults to the context priority
+            owner: Workflow the call belongs to; defaults to the context owner
+
+        Returns:
+            The call's result
+        """
+        async with self.slot(backend, priority, owner):
+            return await call()
+
+    def _start(self, backend: str, state: _Backend, owner: str, waited: float) -> None:
+        state.running += 1
+        state.running_by_owner[owner] += 1
+        state.calls += 1
+        self.queue_time.observe(waited, backend=backend)
+
+    def _finish(self, backend: str, state: _Backend, owner: str) -> None:
+        state.running -= 1
+        state.running_by_owner[owner] -= 1
+        if state.running_by_owner[owner] <= 0:
+            del state.running_by_owner[owner]
+        self._dispatch(backend, state)
+
+    def _dispatch(self, backend: str, state: _Backend) -> None:
+        """Grant free slots to the best waiting calls"""
+        state.waiting = [w for w in state.waiting if not w.granted.done()]
+        while state.running < state.limit and state.waiting:
+            waiter = min(
+                state.waiting,
+                key=lambda w: (
+                    -w.priority,
+                    state.running_by_owner[w.owner],
+                    w.sequence,
+                ),
+            )
+            state.waiting.remove(waiter)
+            self._start(
+                backend, state, waiter.owner, time.perf_counter() - waiter.enqueued
+            )
+            waiter.granted.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        """Return limits, current load and queue-time summary per backend."""
+        queue_times = {
+            labels["backend"]: summary
+            for labels, summary in self.queue_time.summaries()
+        }
+        return {
+            backend: {
+                "limit": state.limit,
+                "running": state.running,
+                "waiting": len(state.waiting),
+                "calls": state.calls,
+                "queue_seconds": queue_times.get(backend),
+            }
+            for backend, state in self._backends.items()
+        }
+
+    def _collect_metrics(self) -> list[MetricFamily]:
+        limit = MetricFamily(
+            "model_call_limit", "gauge", "Model calls allowed in flight"
+        )
+        running = MetricFamily("model_calls_running", "gauge", "Model calls in flight")
+        waiting = MetricFamily(
+            "model_calls_waiting", "gauge", "Model calls waiting for a slot"
+        )
+        for backend, state in self._backends.items():
+            limit.add(state.limit, backend=backend)
+            running.add(state.running, backend=backend)
+            waiting.add(len(state.waiting), backend=backend)
+        return [limit, running, waiting]
+
+
+# Process-wide scheduler; every model call in the workflows goes through it
+model_scheduler = ModelScheduler(DEFAULT_BACKEND_LIMITS)
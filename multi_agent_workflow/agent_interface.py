@@ -5,9 +5,12 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable
 from typing import Any
 
+from agent_runner import AMP_BACKEND, model_slot
 from amp_cli_wrapper import AmpCLI
 from coding_personas import CodingPersonas
 
+from llm_cache import llm_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,12 +28,51 @@ class AgentInterface(ABC):
         self.persona = persona_factory()
         logger.info(f"Initialized {agent_type} agent")
 
-    def analyze_task(self, context: dict[str, Any], task_spec: str) -> dict[str, Any]:
+    def _can_use_cache(self, use_cache: bool) -> bool:
+        """Return whether a persona call may be answered from the cache.
+
+        The cache key only covers the prompt, so only calls that start a new
+        Amp conversation are cached. A call that continues a conversation
+        depends on the earlier turns and always goes to the persona.
+        """
+        return use_cache and not self.persona.has_conversation
+
+    def _ask(self, prompt: str, use_cache: bool = True) -> str:
+        """Ask the persona, answering repeated prompts from the response cache."""
+        response: str = llm_cache.call(
+            AMP_BACKEND,
+            lambda: self.persona.ask(prompt),
+            prompt,
+            system_prompt=self.persona.system_prompt,
+            use_cache=self._can_use_cache(use_cache),
+        )
+        return response
+
+    async def _ask_async(self, prompt: str, use_cache: bool = True) -> str:
+        """Async version of ``_ask``; the persona call holds an Amp slot."""
+
+        async def ask() -> str:
+            async with model_slot():
+                return await self.persona.ask_async(prompt)
+
+        response: str = await llm_cache.call_async(
+            AMP_BACKEND,
+            ask,
+            prompt,
+            system_prompt=self.persona.system_prompt,
+            use_cache=self._can_use_cache(use_cache),
+        )
+        return response
+
+    def analyze_task(
+        self, context: dict[str, Any], task_spec: str, use_cache: bool = True
+    ) -> dict[str, Any]:
         """Analyze a task and produce agent-specific analysis.
 
         Args:
             context: Shared context including codebase info
             task_spec: Task specification to analyze
+            use_cache: False to ask the persona even if the prompt was seen before
 
         Returns:
             Analysis results including content and metadata
@@ -43,7 +85,7 @@ class AgentInterface(ABC):
         )
 
         try:
-            response = self.persona.ask(prompt)
+            response = self._ask(prompt, use_cache)
 
             # Log the raw response for debugging
             logger.debug(
@@ -78,13 +120,17 @@ class AgentInterface(ABC):
         pass
 
     def review_peer_output(
-        self, peer_analyses: dict[str, str], context: dict[str, Any]
+        self,
+        peer_analyses: dict[str, str],
+        context: dict[str, Any],
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """Review other agents' analyses and provide feedback.
 
         Args:
             peer_analyses: Analyses from other agents
             context: Shared context
+            use_cache: False to ask the persona even if the prompt was seen before
 
         Returns:
             Review results including feedback and agreement/disagreement
@@ -97,7 +143,7 @@ class AgentInterface(ABC):
         )
 
         try:
-            response = self.persona.ask(prompt)
+            response = self._ask(prompt, use_cache)
 
             # Log the raw response for debugging
             logger.debug(
@@ -126,13 +172,17 @@ class AgentInterface(ABC):
             }
 
     def incorporate_human_feedback(
-        self, feedback_items: list[dict], context: dict[str, Any]
+        self,
+        feedback_items: list[dict],
+        context: dict[str, Any],
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """Process human feedback and update analysis.
 
         Args:
             feedback_items: List of human feedback items
             context: Shared context
+            use_cache: False to ask the persona even if the prompt was seen before
 
         Returns:
             Updated analysis incorporating feedback
@@ -145,7 +195,7 @@ class AgentInterface(ABC):
         )
 
         try:
-            response = self.persona.ask(prompt)
+            response = self._ask(prompt, use_cache)
 
             # Log the raw response for debugging
             logger.debug(
@@ -182,17 +232,21 @@ class AgentInterface(ABC):
 
     def cleanup(self):
         """Clean up the persona resources."""
+        logger.info(
+            f"{self.agent_type} Amp CLI processes: {self.persona.process_stats}"
+        )
         if hasattr(self.persona, "_cleanup"):
             self.persona._cleanup()
 
     async def implement_code(
-        self, context: dict[str, Any], prompt: str
+        self, context: dict[str, Any], prompt: str, use_cache: bool = True
     ) -> dict[str, Any]:
         """Implement code based on design specifications.
 
         Args:
             context: Task context
             prompt: Implementation prompt
+            use_cache: False to ask the persona even if the prompt was seen before
 
         Returns:
             Implementation result with code content
@@ -202,8 +256,7 @@ class AgentInterface(ABC):
             f"{self.agent_type} implement code prompt (length={len(prompt)}):\n{prompt}\n============================"
         )
 
-        # Make it async-compatible but actually synchronous
-        result = self.persona.ask(prompt)
+        result = await self._ask_async(prompt, use_cache)
 
         # Log the raw response for debugging
         logger.debug(
@@ -212,12 +265,15 @@ class AgentInterface(ABC):
 
         return {"content": result, "status": "success"}
 
-    async def review_code(self, context: dict[str, Any], prompt: str) -> dict[str, Any]:
+    async def review_code(
+        self, context: dict[str, Any], prompt: str, use_cache: bool = True
+    ) -> dict[str, Any]:
         """Review code implementation.
 
         Args:
             context: Task context
             prompt: Review prompt
+            use_cache: False to ask the persona even if the prompt was seen before
 
         Returns:
             Review result with suggestions
@@ -227,7 +283,7 @@ class AgentInterface(ABC):
             f"{self.agent_type} review code prompt (length={len(prompt)}):\n{prompt}\n============================"
         )
 
-        result = self.persona.ask(prompt)
+        result = await self._ask_async(prompt, use_cache)
 
         # Log the raw response for debugging
         logger.debug(
@@ -248,7 +304,11 @@ class AgentInterface(ABC):
         return {"content": result, "suggestions": suggestions, "status": "success"}
 
     async def refine_implementation(
-        self, context: dict[str, Any], original: dict, suggestions: list
+        self,
+        context: dict[str, Any],
+        original: dict,
+        suggestions: list,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """Refine implementation based on review suggestions.
 
@@ -256,6 +316,7 @@ class AgentInterface(ABC):
             context: Task context
             original: Original implementation
             suggestions: Review suggestions
+            use_cache: False to ask the persona even if the prompt was seen before
 
         Returns:
             Refined implementation
@@ -275,7 +336,7 @@ Please provide the improved implementation addressing these suggestions."""
             f"{self.agent_type} refine implementation prompt (length={len(prompt)}):\n{prompt}\n============================"
         )
 
-        result = self.persona.ask(prompt)
+        result = await self._ask_async(prompt, use_cache)
 
         # Log the raw response for debugging
         logger.debug(
@@ -285,13 +346,14 @@ Please provide the improved implementation addressing these suggestions."""
         return {"content": result, "status": "success"}
 
     async def create_tests(
-        self, context: dict[str, Any], prompt: str
+        self, context: dict[str, Any], prompt: str, use_cache: bool = True
     ) -> dict[str, Any]:
         """Create tests for implemented features.
 
         Args:
             context: Task context
             prompt: Test creation prompt
+            use_cache: False to ask the persona even if the prompt was seen before
 
         Returns:
             Test creation result
@@ -301,7 +363,7 @@ Please provide the improved implementation addressing these suggestions."""
             f"{self.agent_type} create tests prompt (length={len(prompt)}):\n{prompt}\n============================"
         )
 
-        result = self.persona.ask(prompt)
+        result = await self._ask_async(prompt, use_cache)
 
         # Log the raw response for debugging
         logger.debug(
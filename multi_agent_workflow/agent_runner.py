@@ -0,0 +1,137 @@
+"""Concurrent execution of agent calls for the multi-agent workflow.
+
+Synchronous persona calls block on the Amp CLI, so they run in a bounded
+thread pool, and each round fans out to all its agents at once. A round then
+takes as long as its slowest agent rather than the sum of all of them, and an
+agent that hangs is timed out without holding up the others.
+
+Every Amp call takes a slot from the process-wide model scheduler, which
+bounds how many run at once across all rounds and workflows.
+"""
+
+import asyncio
+import logging
+import sys
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+# Add parent directory to path to import the shared model scheduler
+sys.path.append(str(Path(__file__).parent.parent))
+
+from model_scheduler import model_scheduler  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# One worker thread per agent in a full round
+MAX_CONCURRENT_AGENTS = 4
+# Longest a single agent call may take before the round gives up on it
+DEFAULT_AGENT_TIMEOUT_SECONDS = 1800.0
+# Model scheduler backend for persona calls
+AMP_BACKEND = "amp"
+
+T = TypeVar("T")
+
+_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_AGENTS, thread_name_prefix="agent"
+)
+model_scheduler.set_limit(AMP_BACKEND, MAX_CONCURRENT_AGENTS)
+# Calls whose caller stopped waiting, kept until their thread returns
+_abandoned_calls: set[asyncio.Task[Any]] = set()
+
+
+class AgentTimeoutError(Exception):
+    """Raised when an agent does not respond within its timeout."""
+
+    pass
+
+
+@asynccontextmanager
+async def model_slot() -> AsyncIterator[None]:
+    """Hold an Amp slot in the model scheduler for one persona call."""
+    async with model_scheduler.slot(AMP_BACKEND):
+        yield
+
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking agent call in the agent thread pool.
+
+    The call waits for an Amp slot before it takes a thread. A thread cannot
+    be interrupted, so if the caller is cancelled or times out once the call
+    has started, the slot is only released when the thread returns.
+
+    Args:
+        func: Blocking function, such as a persona's ``ask``
+        *args: Arguments for ``func``
+
+    Returns:
+        The function's result
+    """
+    loop = asyncio.get_running_loop()
+    thread_call: asyncio.Future[T] | None = None
+
+    async def call_in_slot() -> T:
+        nonlocal thread_call
+        async with model_slot():
+            thread_call = loop.run_in_executor(_executor, func, *args)
+            return await thread_call
+
+    call = asyncio.create_task(call_in_slot())
+    try:
+        return await asyncio.shield(call)
+    except asyncio.CancelledError:
+        if thread_call is None:
+            # Still waiting for a slot, so nothing is running yet
+            call.cancel()
+        else:
+            _abandoned_calls.add(call)
+            call.add_done_callback(_forget_abandoned_call)
+        raise
+
+
+def _forget_abandoned_call(call: asyncio.Task[Any]) -> None:
+    """Drop an abandoned call once its thread has returned."""
+    _abandoned_calls.discard(call)
+    if not call.cancelled() and call.exception() is not None:
+        logger.debug(f"Abandoned agent call failed: {call.exception()}")
+
+
+async def gather_agents(
+    calls: dict[str, Awaitable[T]],
+    timeout: float | None = DEFAULT_AGENT_TIMEOUT_SECONDS,
+) -> dict[str, T | Exception]:
+    """Await agent calls concurrently, each under its own timeout.
+
+    A failing or timed out agent does not affect the others: its exception
+    is returned in place of its result. Cancelling the caller cancels every
+    call still running.
+
+    Args:
+        calls: Pending call per agent name
+        timeout: Seconds each call may take, or None to wait indefinitely
+
+    Returns:
+        Result or exception per agent name, in the order of ``calls``
+    """
+
+    async def run_one(agent_name: str, call: Awaitable[T]) -> T:
+        try:
+            return await asyncio.wait_for(call, timeout)
+        except TimeoutError:
+            logger.error(f"{agent_name} did not respond within {timeout}s")
+            raise AgentTimeoutError(
+                f"{agent_name} did not respond within {timeout}s"
+            ) from None
+
+    results = await asyncio.gather(
+        *(run_one(agent_name, call) for agent_name, call in calls.items()),
+        return_exceptions=True,
+    )
+    outcomes: dict[str, T | Exception] = {}
+    for agent_name, result in zip(calls, results, strict=True):
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+        outcomes[agent_name] = result
+    return outcomes
@@ -22,15 +22,33 @@ Usage:
     # Context managers for automatic cleanup
     with AmpCLI(system_prompt="Be concise.") as amp:
         response = amp.ask("Explain quantum computing")
+
+    # Async use: stream lines as they arrive, with a timeout
+    async for line in amp.stream("Explain quantum computing"):
+        print(line)
+    response = await amp.ask_async("Summarize that", timeout=600)
 """
 
+import asyncio
 import atexit
+import logging
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
+import time
 import uuid
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
+
+# Add parent directory to path to import the shared subprocess helpers
+sys.path.append(str(Path(__file__).parent.parent))
+
+from subprocess_io import kill_process_group, read_lines  # noqa: E402
+
+logger = logging.getLogger(__name__)
 
 
 class AmpCLIError(Exception):
@@ -59,11 +77,25 @@ class AmpCLI:
         self._work_dir: Path | None = None
         self._original_cwd: str | None = None
         self._thread_id: str | None = None
+        # Amp CLI process timings; spawn and first output are only
+        # measurable for streamed (async) processes
+        self._process_count = 0
+        self._total_seconds = 0.0
+        self._streamed_count = 0
+        self._spawn_seconds = 0.0
+        self._first_output_seconds = 0.0
 
         if isolated:
             self._setup_isolation()
             atexit.register(self._cleanup)
 
+        # Built once rather than copied for every command
+        self._env = os.environ.copy()
+        if isolated:
+            # Add instance-specific environment variables for additional isolation
+            self._env["AMP_INSTANCE_ID"] = self._instance_id
+            self._env["AMP_WORK_DIR"] = str(self._work_dir)
+
     def _create_new_thread(self) -> str:
         """Create a new Amp thread for isolation."""
         try:
@@ -128,21 +160,15 @@ class AmpCLI:
         Raises:
             AmpCLIError: If the command fails
         """
+        start = time.perf_counter()
         try:
-            env = os.environ.copy()
-
-            # Add instance-specific environment variables for additional isolation
-            if self._isolated:
-                env["AMP_INSTANCE_ID"] = self._instance_id
-                env["AMP_WORK_DIR"] = str(self._work_dir)
-
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
                 check=True,
                 cwd=self._work_dir if self._isolated else None,
-                env=env,
+                env=self._env,
             )
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
@@ -152,6 +178,86 @@ class AmpCLI:
             raise AmpCLIError(
                 "Amp CLI not found. Make sure 'amp' is installed and in PATH."
             ) from None
+        finally:
+            self._record_process(total=time.perf_counter() - start)
+
+    async def _stream_amp_command(self, cmd: list[str]) -> AsyncIterator[str]:
+        """
+        Run an Amp CLI command, yielding output lines as they are written.
+
+        The process and any tools it started are killed if the caller stops
+        iterating early, is cancelled or times out.
+
+        Args:
+            cmd: Command list to execute
+
+        Yields:
+            Output lines without trailing newlines
+
+        Raises:
+            AmpCLIError: If the command fails
+        """
+        start = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self._work_dir if self._isolated else None,
+                env=self._env,
+                start_new_session=True,
+            )
+        except FileNotFoundError:
+            raise AmpCLIError(
+                "Amp CLI not found. Make sure 'amp' is installed and in PATH."
+            ) from None
+        spawn = time.perf_counter() - start
+        first_output: float | None = None
+
+        assert process.stdout is not None and process.stderr is not None
+        # Drain stderr alongside stdout so a chatty stderr cannot block the CLI
+        stderr_task = asyncio.create_task(process.stderr.read())
+        try:
+            async for line in read_lines(process.stdout):
+                if first_output is None:
+                    first_output = time.perf_counter() - start
+                yield line.decode(errors="replace")
+            returncode = await process.wait()
+            stderr = (await stderr_task).decode(errors="replace").strip()
+        finally:
+            await kill_process_group(process)
+            stderr_task.cancel()
+            self._record_process(
+                spawn=spawn,
+                first_output=first_output,
+                total=time.perf_counter() - start,
+            )
+
+        if returncode != 0:
+            raise AmpCLIError(f"Amp CLI command failed: {stderr or 'Unknown error'}")
+
+    def _record_process(
+        self,
+        total: float,
+        spawn: float | None = None,
+        first_output: float | None = None,
+    ) -> None:
+        """Record the timings of one Amp CLI process."""
+        self._process_count += 1
+        self._total_seconds += total
+        if spawn is not None:
+            self._streamed_count += 1
+            self._spawn_seconds += spawn
+            # A process with no output counts its whole runtime
+            self._first_output_seconds += (
+                first_output if first_output is not None else total
+            )
+        logger.debug(
+            f"amp process {self._process_count} for {self._instance_id}: "
+            f"spawn={spawn if spawn is not None else 'n/a'} "
+            f"first_output={first_output if first_output is not None else 'n/a'} "
+            f"total={total:.3f}s"
+        )
 
     def _format_message(self, message: str) -> str:
         """
@@ -183,8 +289,10 @@ class AmpCLI:
         formatted_message = self._format_message(message)
 
         if self._isolated:
-            # Create a new thread for isolated execution
-            self._thread_id = self._create_new_thread()
+            # Create a new thread for isolated execution, unless one was
+            # created ahead of time by warm_up()
+            if self._thread_id is None or self._has_conversation:
+                self._thread_id = self._create_new_thread()
             # Use the created thread for the initial message too
             cmd = [
                 "amp",
@@ -251,6 +359,105 @@ class AmpCLI:
         else:
             return self.prompt(message)
 
+    async def warm_up(self) -> None:
+        """
+        Create the Amp thread for the next conversation ahead of time.
+
+        The Amp CLI runs one process per prompt, so the warm session is the
+        thread: creating it early takes one process spawn off the first
+        prompt's latency.
+
+        Raises:
+            AmpCLIError: If the thread cannot be created
+        """
+        if self._isolated and self._thread_id is None:
+            lines = [
+                line
+                async for line in self._stream_amp_command(["amp", "threads", "new"])
+            ]
+            self._thread_id = "\n".join(lines).strip()
+
+    async def stream(self, message: str) -> AsyncIterator[str]:
+        """
+        Ask Amp a question, yielding the response line by line.
+
+        Like ask(), this starts a conversation or continues the current one.
+
+        Args:
+            message: The prompt to send to Amp
+
+        Yields:
+            Response lines as the CLI writes them
+
+        Raises:
+            AmpCLIError: If the CLI command fails
+        """
+        formatted_message = self._format_message(message)
+
+        if self._isolated:
+            if not self._has_conversation:
+                await self.warm_up()
+            cmd = [
+                "amp",
+                "threads",
+                "continue",
+                str(self._thread_id),
+                "-x",
+                formatted_message,
+            ]
+        elif self._has_conversation:
+            cmd = ["amp", "threads", "continue", "-x", formatted_message]
+        else:
+            cmd = ["amp", "-x", formatted_message]
+
+        async for line in self._stream_amp_command(cmd):
+            yield line
+        self._has_conversation = True
+
+    async def ask_async(self, message: str, timeout: float | None = None) -> str:
+        """
+        Ask Amp a question without blocking the event loop.
+
+        Args:
+            message: The prompt to send to Amp
+            timeout: Seconds to wait for the full response; the CLI process
+                is killed when it expires
+
+        Returns:
+            The response from Amp
+
+        Raises:
+            AmpCLIError: If the CLI command fails
+            TimeoutError: If the response takes longer than timeout
+        """
+
+        async def collect() -> str:
+            return "\n".join([line async for line in self.stream(message)]).strip()
+
+        return await asyncio.wait_for(collect(), timeout)
+
+    @property
+    def process_stats(self) -> dict[str, Any]:
+        """
+        Get Amp CLI process counts and mean timings for this instance.
+
+        Spawn and first-output means only cover async (streamed) calls.
+        """
+        streamed = self._streamed_count
+        return {
+            "processes": self._process_count,
+            "mean_seconds": (
+                self._total_seconds / self._process_count
+                if self._process_count
+                else 0.0
+            ),
+            "streamed_processes": streamed,
+            "mean_spawn_seconds": self._spawn_seconds / streamed if streamed else 0.0,
+            "mean_first_output_seconds": (
+                self._first_output_seconds / streamed if streamed else 0.0
+            ),
+        }
+
     def reset_conversation(self) -> None:
         """Reset the conversation state."""
         self._has_conversation = False
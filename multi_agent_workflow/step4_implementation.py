@@ -35,6 +35,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from agent_runner import gather_agents
 from common_utils import (
     add_common_arguments,
     print_step_header,
@@ -42,11 +43,17 @@ from common_utils import (
 )
 from workflow_orchestrator import WorkflowOrchestrator
 
+from affected_tests import TestImpactRunner, changed_files
+
 # Import MCP GitHub tools
 from github_tools import execute_tool
+from pytest_report import FailureGroup, format_failures, summarize
 
 logger = logging.getLogger(__name__)
 
+# Seconds each test run (affected, then remaining tests) may take
+TEST_TIMEOUT = 300
+
 
 class WorkflowState:
     """Manages the workflow state for pause/resume functionality."""
@@ -118,6 +125,12 @@ class EnhancedImplementationProcessor:
         # Initialize workflow state
         self.state = WorkflowState(self.workflow_dir)
 
+        # Runs affected tests first; timings are kept across PRs to balance
+        # parallel test processes
+        self.test_runner = TestImpactRunner(
+            self.repo_path, timings_path=self.workflow_dir / "test_timings.json"
+        )
+
         logger.info(
             f"Enhanced implementation processor initialized for PR #{pr_number}"
         )
@@ -252,7 +265,6 @@ Provide complete skeleton code for each file that needs to be created."""
 
     async def _review_skeleton(self, skeleton_result: dict) -> dict:
         """All agents review the architecture skeleton."""
-        reviews = {}
         skeleton_content = skeleton_result.get("content", "")
 
         review_prompt = f"""Review this architecture skeleton:
@@ -268,18 +280,10 @@ REVIEW CRITERIA:
 
 Provide specific feedback on gaps, issues, and improvements needed."""
 
-        context = await self._build_context()
-
         # Get reviews from all agents except architect
-        for agent_name, agent in self.orchestrator.agents.items():
-            if agent_name != "architect":
-                print(f"  - {agent_name} reviewing...")
-                review = await agent.review_code(context, review_prompt)
-                reviews[agent_name] = review
-
-                # Save individual review
-                review_path = self.enhanced_dir / f"skeleton_review_{agent_name}.md"
-                self._save_document(review_path, review.get("content", ""))
+        reviews = await self._review_with_agents(
+            review_prompt, "skeleton_review", exclude="architect"
+        )
 
         return reviews
 
@@ -381,7 +385,6 @@ Provide complete, runnable test code."""
 
     async def _review_tests(self, test_suite: dict) -> dict:
         """All agents review the test suite."""
-        reviews = {}
         test_content = test_suite.get("content", "")
 
         review_prompt = f"""Review this test suite:
@@ -397,18 +400,10 @@ REVIEW CRITERIA:
 
 Provide specific feedback on gaps and improvements."""
 
-        context = await self._build_context()
-
         # Get reviews from all agents except tester
-        for agent_name, agent in self.orchestrator.agents.items():
-            if agent_name != "tester":
-                print(f"  - {agent_name} reviewing...")
-                review = await agent.review_code(context, review_prompt)
-                reviews[agent_name] = review
-
-                # Save individual review
-                review_path = self.enhanced_dir / f"test_review_{agent_name}.md"
-                self._save_document(review_path, review.get("content", ""))
+        reviews = await self._review_with_agents(
+            review_prompt, "test_review", exclude="tester"
+        )
 
         return reviews
 
@@ -526,28 +521,50 @@ Focus on implementing clean, working code based solely on the skeleton and desig
         return result
 
     async def _run_tests_capture_failures(self) -> dict:
-        """Run tests and capture detailed failure information."""
+        """Run the tests affected by the changes first, then the rest.
+
+        Failures in affected tests are returned without waiting for the rest
+        of the suite, which only runs once they pass.
+        """
         print("Running tests and capturing failures...")
 
         try:
-            # Run pytest with detailed output
-            cmd = ["python", "-m", "pytest", "-xvs", "--tb=long"]
-            result = subprocess.run(
-                cmd, cwd=self.repo_path, capture_output=True, text=True, timeout=300
+            changed = await changed_files(self.repo_path)
+            selection, result, remaining = await self.test_runner.run_affected_first(
+                changed, timeout=TEST_TIMEOUT
+            )
+            print(
+                f"Affected tests ({len(selection.affected)} files): "
+                f"{'PASSED' if result.passed else 'FAILED'}"
             )
+            if remaining is not None:
+                print(
+                    f"Remaining tests ({len(selection.remaining)} files): "
+                    f"{'PASSED' if remaining.passed else 'FAILED'}"
+                )
+                result = result.merge(remaining)
 
+            failures = result.failures
             test_results = {
                 "returncode": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "passed": result.returncode == 0,
+                "passed": result.passed,
+                "summary": summarize(result.outcomes),
+                "failures": [group.to_dict() for group in failures],
+                # pytest's own output only matters when no test reported the
+                # failure, such as when pytest could not start
+                "output": ""
+                if result.passed or failures
+                else "\n".join(filter(None, [result.stdout, result.stderr])),
+                "affected_tests": selection.affected,
+                "tests_run": result.test_files,
+                "duration": result.duration,
                 "timestamp": datetime.now().isoformat(),
             }
 
             # Save test results
             results_path = self.enhanced_dir / "test_results.json"
             with open(results_path, "w") as f:
-                json.dump(test_results, f, indent=2)
+                json.dump(test_results, f, separators=(",", ":"))
 
             status = "PASSED" if test_results["passed"] else "FAILED"
             print(f"Test run completed: {status}")
@@ -557,9 +574,9 @@ Focus on implementing clean, working code based solely on the skeleton and desig
             logger.error(f"Test run failed: {e}")
             return {
                 "returncode": -1,
-                "stdout": "",
-                "stderr": str(e),
                 "passed": False,
+                "failures": [],
+                "output": str(e),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -567,14 +584,24 @@ Focus on implementing clean, working code based solely on the skeleton and desig
         """Each agent analyzes test failures."""
         print("Analyzing test failures...")
 
+        # Only the grouped failures go to the agents, not pytest's full output
+        failures = [FailureGroup(**group) for group in test_results["failures"]]
+        details = (
+            format_failures(failures)
+            if failures
+            else f"OUTPUT:\n{test_results.get('output', '')}"
+        )
+        summary = ", ".join(
+            f"{count} {outcome}"
+            for outcome, count in test_results.get("summary", {}).items()
+            if count
+        )
+
         failure_info = f"""TEST RESULTS:
 Return Code: {test_results.get('returncode')}
+Summary: {summary or 'no test results'}
 
-STDOUT:
-{test_results.get('stdout', '')}
-
-STDERR:
-{test_results.get('stderr', '')}"""
+{details}"""
 
         prompt = f"""Analyze these test failures and suggest fixes:
 
@@ -589,17 +616,10 @@ ANALYSIS REQUIREMENTS:
 
 Provide detailed analysis with actionable recommendations."""
 
-        analyses = {}
-        context = await self._build_context()
-
-        for agent_name, agent in self.orchestrator.agents.items():
-            print(f"  - {agent_name} analyzing...")
-            analysis = await agent.review_code(context, prompt)
-            analyses[agent_name] = analysis
-
-            # Save individual analysis
-            analysis_path = self.enhanced_dir / f"failure_analysis_{agent_name}.md"
-            self._save_document(analysis_path, analysis.get("content", ""))
+        # A retry must not get the answer that failed last time from the cache
+        analyses = await self._review_with_agents(
+            prompt, "failure_analysis", use_cache=False
+        )
 
         return analyses
 
@@ -629,7 +649,9 @@ Create detailed, ordered fix plan that addresses all failures."""
         context = await self._build_context()
         senior_engineer = self.orchestrator.agents["senior_engineer"]
 
-        fix_plan = await senior_engineer.implement_code(context, prompt)
+        fix_plan = await senior_engineer.implement_code(
+            context, prompt, use_cache=False
+        )
 
         # Save fix plan
         plan_path = self.enhanced_dir / "fix_plan.md"
@@ -658,7 +680,9 @@ Provide complete updated implementation with all fixes."""
         context = await self._build_context()
         senior_engineer = self.orchestrator.agents["senior_engineer"]
 
-        updated_implementation = await senior_engineer.implement_code(context, prompt)
+        updated_implementation = await senior_engineer.implement_code(
+            context, prompt, use_cache=False
+        )
 
         # Save updated implementation
         updated_path = self.enhanced_dir / "updated_implementation.md"
@@ -839,17 +863,7 @@ ANALYSIS REQUIREMENTS:
 
 Provide detailed analysis with specific recommendations."""
 
-        analyses = {}
-        context = await self._build_context()
-
-        for agent_name, agent in self.orchestrator.agents.items():
-            print(f"  - {agent_name} analyzing...")
-            analysis = await agent.review_code(context, prompt)
-            analyses[agent_name] = analysis
-
-            # Save analysis
-            analysis_path = self.enhanced_dir / f"comment_analysis_{agent_name}.md"
-            self._save_document(analysis_path, analysis.get("content", ""))
+        analyses = await self._review_with_agents(prompt, "comment_analysis")
 
         return analyses
 
@@ -951,6 +965,59 @@ Co-Authored-By: Claude <noreply@anthropic.com>"""
         """Check if all tests are passing."""
         return test_results.get("passed", False)
 
+    async def _review_with_agents(
+        self,
+        prompt: str,
+        document_prefix: str,
+        exclude: str | None = None,
+        use_cache: bool = True,
+    ) -> dict:
+        """Have agents review concurrently and save each agent's review.
+
+        Args:
+            prompt: Review prompt given to every agent
+            document_prefix: Reviews are saved as ``{document_prefix}_{agent}.md``
+            exclude: Agent that does not review, usually the author
+            use_cache: False to ask the agents even if the prompt was seen before
+
+        Returns:
+            Review result per agent; failed or timed out agents get an error
+            result with empty content
+        """
+        context = await self._build_context()
+        agents = {
+            agent_name: agent
+            for agent_name, agent in self.orchestrator.agents.items()
+            if agent_name != exclude
+        }
+        print(f"  - {', '.join(agents)} reviewing...")
+
+        outcomes = await gather_agents(
+            {
+                agent_name: agent.review_code(context, prompt, use_cache)
+                for agent_name, agent in agents.items()
+            },
+            self.orchestrator.agent_timeout,
+        )
+
+        reviews = {}
+        for agent_name, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                logger.error(f"{agent_name} review failed: {outcome}")
+                outcome = {
+                    "content": "",
+                    "suggestions": [],
+                    "status": "error",
+                    "error": str(outcome),
+                }
+            reviews[agent_name] = outcome
+
+            # Save individual review
+            review_path = self.enhanced_dir / f"{document_prefix}_{agent_name}.md"
+            self._save_document(review_path, outcome.get("content", ""))
+
+        return reviews
+
     def _save_document(self, path: Path, content: str):
         """Save document to filesystem."""
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,75 @@
+"""
+Tests for the agent interface's use of the LLM response cache.
+
+Amp personas keep a conversation between calls, so only calls that start a
+new conversation may be answered from the cache.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agent_interface import ArchitectAgent  # noqa: E402
+from coding_personas import CodingPersonas  # noqa: E402
+
+from llm_cache import ResponseCache  # noqa: E402
+
+
+class FakePersona:
+    """Stateful persona stand-in answering with its turn number."""
+
+    system_prompt = "You are an architect."
+
+    def __init__(self):
+        self.has_conversation = False
+        self.prompts: list[str] = []
+
+    def ask(self, message: str) -> str:
+        self.prompts.append(message)
+        self.has_conversation = True
+        return f"answer {len(self.prompts)}"
+
+    def reset_conversation(self) -> None:
+        self.has_conversation = False
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path / "llm_cache.db", enabled=True)
+    with patch("agent_interface.llm_cache", cache):
+        yield cache
+    cache.close()
+
+
+@pytest.fixture
+def persona():
+    persona = FakePersona()
+    with patch.object(CodingPersonas, "architect", return_value=persona):
+        yield persona
+
+
+class TestConversationCaching:
+    """Test which persona calls the response cache may answer."""
+
+    def test_fresh_conversation_answered_from_cache(self, cache, persona):
+        """Test a prompt that starts a conversation is cached."""
+        assert ArchitectAgent()._ask("design it") == "answer 1"
+        persona.reset_conversation()
+
+        assert ArchitectAgent()._ask("design it") == "answer 1"
+        assert persona.prompts == ["design it"]
+
+    def test_continued_conversation_not_cached(self, cache, persona):
+        """Test a prompt inside a conversation always reaches the persona."""
+        agent = ArchitectAgent()
+        agent._ask("design it")
+        assert agent._ask("review it") == "answer 2"
+        assert agent._ask("review it") == "answer 3"
+
+        assert persona.prompts == ["design it", "review it", "review it"]
+        assert cache.stats()["entries"] == 1
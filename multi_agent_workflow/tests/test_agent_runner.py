@@ -0,0 +1,178 @@
+"""
+Tests for concurrent agent execution.
+
+These tests verify that agent rounds fan out to all agents at once, that
+each agent call is bounded by its own timeout, and that one failing agent
+does not affect the results of the others.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agent_runner import (  # noqa: E402
+    AMP_BACKEND,
+    AgentTimeoutError,
+    gather_agents,
+    model_scheduler,
+    run_blocking,
+)
+from workflow_orchestrator import WorkflowOrchestrator  # noqa: E402
+
+AGENT_TYPES = ["architect", "developer", "senior_engineer", "tester"]
+
+
+class SlowAgent:
+    """Agent whose persona takes a fixed time to answer."""
+
+    def __init__(self, agent_type: str, delay: float = 0.2):
+        self.agent_type = agent_type
+        self.delay = delay
+
+    def review_peer_output(self, peer_analyses, context):
+        time.sleep(self.delay)
+        return {
+            "agent_type": self.agent_type,
+            "peer_review": f"{self.agent_type} review",
+            "status": "success",
+        }
+
+
+class TestGatherAgents:
+    """Test concurrent fan-out of agent calls."""
+
+    def test_blocking_calls_run_concurrently(self):
+        """Test a round takes as long as its slowest agent, not the sum."""
+
+        async def run_round():
+            return await gather_agents(
+                {name: run_blocking(time.sleep, 0.2) for name in AGENT_TYPES}
+            )
+
+        start = time.perf_counter()
+        results = asyncio.run(run_round())
+
+        assert time.perf_counter() - start < 0.6
+        assert results == dict.fromkeys(AGENT_TYPES)
+
+    def test_timeout_and_errors_isolated(self):
+        """Test a hung or failing agent leaves the other results intact."""
+
+        async def fails():
+            raise ValueError("bad response")
+
+        async def run_round():
+            return await gather_agents(
+                {
+                    "architect": asyncio.sleep(10),
+                    "developer": fails(),
+                    "tester": asyncio.sleep(0, result="done"),
+                },
+                timeout=0.05,
+            )
+
+        results = asyncio.run(run_round())
+
+        assert list(results) == ["architect", "developer", "tester"]
+        assert isinstance(results["architect"], AgentTimeoutError)
+        assert isinstance(results["developer"], ValueError)
+        assert results["tester"] == "done"
+
+    def test_cancellation_propagates(self):
+        """Test cancelling a round cancels its agent calls."""
+        cancelled = []
+
+        async def agent_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def run_round():
+            round_task = asyncio.create_task(
+                gather_agents({"architect": agent_call(), "tester": agent_call()})
+            )
+            await asyncio.sleep(0.01)
+            round_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await round_task
+
+        asyncio.run(run_round())
+
+        assert cancelled == [True, True]
+
+    def test_timed_out_call_keeps_slot_until_thread_returns(self):
+        """Test an abandoned call's Amp slot is held while its thread runs."""
+        release = threading.Event()
+
+        async def run_round():
+            results = await gather_agents(
+                {"architect": run_blocking(release.wait, 5)}, timeout=0.05
+            )
+            running_after_timeout = model_scheduler.stats()[AMP_BACKEND]["running"]
+            release.set()
+            for _ in range(100):
+                if model_scheduler.stats()[AMP_BACKEND]["running"] == 0:
+                    break
+                await asyncio.sleep(0.01)
+            return results, running_after_timeout
+
+        results, running_after_timeout = asyncio.run(run_round())
+
+        assert isinstance(results["architect"], AgentTimeoutError)
+        assert running_after_timeout == 1
+        assert model_scheduler.stats()[AMP_BACKEND]["running"] == 0
+
+
+class TestOrchestratorRounds:
+    """Test orchestrator rounds use concurrent fan-out."""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path):
+        with (
+            patch("workflow_orchestrator.ArchitectAgent"),
+            patch("workflow_orchestrator.DeveloperAgent"),
+            patch("workflow_orchestrator.SeniorEngineerAgent"),
+            patch("workflow_orchestrator.TesterAgent"),
+            patch.object(WorkflowOrchestrator, "_setup_repository_manager"),
+        ):
+            orchestrator = WorkflowOrchestrator(
+                "owner/repo", str(tmp_path), agent_timeout=1.0
+            )
+        orchestrator.agents = {name: SlowAgent(name) for name in AGENT_TYPES}
+        return orchestrator
+
+    def test_peer_review_round_concurrent(self, orchestrator):
+        """Test peer reviews by four agents overlap."""
+        context = MagicMock()
+        context.analysis_results = {}
+
+        start = time.perf_counter()
+        reviews = asyncio.run(orchestrator._run_peer_review_round(context))
+
+        assert time.perf_counter() - start < 0.6
+        assert [review["status"] for review in reviews.values()] == ["success"] * 4
+
+    def test_peer_review_timeout_recorded(self, orchestrator):
+        """Test an agent over the timeout gets an error review."""
+        orchestrator.agent_timeout = 0.05
+        orchestrator.agents["tester"].delay = 0.5
+        for name in AGENT_TYPES[:3]:
+            orchestrator.agents[name].delay = 0
+        context = MagicMock()
+        context.analysis_results = {}
+
+        reviews = asyncio.run(orchestrator._run_peer_review_round(context))
+
+        assert reviews["architect"]["status"] == "success"
+        assert reviews["tester"]["status"] == "error"
+        assert "did not respond" in reviews["tester"]["error"]
@@ -3,18 +3,39 @@ Tests for AmpCLI wrapper isolation functionality.
 
 These tests verify that multiple AmpCLI instances operate in isolation
 from each other, including separate working directories, thread IDs,
-and environment variables.
+and environment variables, and that the async API streams, times out and
+kills the CLI process.
 """
 
+import asyncio
 import os
 import sys
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from amp_cli_wrapper import AmpCLI  # noqa: E402
+from amp_cli_wrapper import AmpCLI, AmpCLIError  # noqa: E402
+
+# Stand-in for the amp CLI: "threads new" prints a thread id, "-x" prompts
+# print two lines with a pause between them, or fail, hang or print a very
+# long line on request
+FAKE_AMP = """#!/bin/sh
+if [ "$1 $2" = "threads new" ]; then echo T-fake; exit 0; fi
+for last; do :; done
+case "$last" in
+  *fail*) echo "quota exceeded" >&2; exit 1 ;;
+  *hang*) echo $$ > "$AMP_WORK_DIR/pid"; exec sleep 30 ;;
+  *long*) head -c 200000 /dev/zero | tr '\\0' x; echo; echo done; exit 0 ;;
+esac
+echo "thread $3"
+sleep 0.3
+echo "answer: $last"
+"""
 
 
 class TestAmpCLIIsolation:
@@ -325,3 +346,82 @@ class TestAmpCLIIsolation:
 
             # Should not register cleanup
             mock_register.assert_not_called()
+
+
+class TestAmpCLIAsync:
+    """Test the asyncio API against a fake amp executable."""
+
+    @pytest.fixture
+    def amp(self, tmp_path, monkeypatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        fake_amp = bin_dir / "amp"
+        fake_amp.write_text(FAKE_AMP)
+        fake_amp.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+        amp = AmpCLI(isolated=True)
+        yield amp
+        amp._cleanup()
+
+    def test_stream_yields_lines_as_written(self, amp):
+        """Test the first line arrives before the process finishes."""
+
+        async def consume():
+            arrivals = []
+            start = time.perf_counter()
+            async for line in amp.stream("hello"):
+                arrivals.append((line, time.perf_counter() - start))
+            return arrivals
+
+        arrivals = asyncio.run(consume())
+
+        assert [line for line, _ in arrivals] == ["thread T-fake", "answer: hello"]
+        assert arrivals[1][1] - arrivals[0][1] >= 0.2
+        assert amp.has_conversation
+        assert amp.thread_id == "T-fake"
+
+    def test_stream_handles_lines_beyond_reader_limit(self, amp):
+        """Test a line longer than the 64 KiB reader limit is yielded whole."""
+
+        async def consume():
+            return [line async for line in amp.stream("long please")]
+
+        assert asyncio.run(consume()) == ["x" * 200000, "done"]
+
+    def test_ask_async_and_process_stats(self, amp):
+        """Test responses are joined and process timings are recorded."""
+        response = asyncio.run(amp.ask_async("hello"))
+
+        assert response == "thread T-fake\nanswer: hello"
+        stats = amp.process_stats
+        # One process to create the thread, one for the prompt
+        assert stats["processes"] == stats["streamed_processes"] == 2
+        assert 0 < stats["mean_spawn_seconds"] < stats["mean_seconds"]
+
+    def test_warm_up_reuses_thread(self, amp):
+        """Test a thread created ahead of time is used by the first prompt."""
+
+        async def warm_then_ask():
+            await amp.warm_up()
+            assert amp.thread_id == "T-fake"
+            return await amp.ask_async("hello")
+
+        asyncio.run(warm_then_ask())
+
+        assert amp.process_stats["processes"] == 2
+
+    def test_failure_raises_with_stderr(self, amp):
+        """Test a failing command raises AmpCLIError with its stderr."""
+        with pytest.raises(AmpCLIError, match="quota exceeded"):
+            asyncio.run(amp.ask_async("fail please"))
+        assert not amp.has_conversation
+
+    def test_timeout_kills_process(self, amp):
+        """Test a timed out prompt kills the CLI process."""
+        with pytest.raises(TimeoutError):
+            asyncio.run(amp.ask_async("hang please", timeout=0.5))
+
+        pid = int((amp.work_dir / "pid").read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
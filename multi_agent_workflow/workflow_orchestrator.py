@@ -19,6 +19,11 @@ from agent_interface import (  # noqa: E402
     SeniorEngineerAgent,
     TesterAgent,
 )
+from agent_runner import (  # noqa: E402
+    DEFAULT_AGENT_TIMEOUT_SECONDS,
+    gather_agents,
+    run_blocking,
+)
 from codebase_analyzer import CodebaseAnalyzer  # noqa: E402
 from conflict_resolver import ConflictResolver  # noqa: E402
 from dotenv import load_dotenv  # noqa: E402
@@ -38,15 +43,23 @@ logger = logging.getLogger(__name__)
 class WorkflowOrchestrator:
     """Orchestrates multi-agent collaboration workflow."""
 
-    def __init__(self, repo_name: str, repo_path: str):
+    def __init__(
+        self,
+        repo_name: str,
+        repo_path: str,
+        agent_timeout: float | None = DEFAULT_AGENT_TIMEOUT_SECONDS,
+    ):
         """Initialize orchestrator.
 
         Args:
             repo_name: GitHub repository name (org/repo)
             repo_path: Local path to repository
+            agent_timeout: Seconds each agent may take per call in a round,
+                or None to wait indefinitely
         """
         self.repo_name = repo_name
         self.repo_path = Path(repo_path)
+        self.agent_timeout = agent_timeout
         self.agents = {
             "architect": ArchitectAgent(),
             "developer": DeveloperAgent(),
@@ -767,23 +780,24 @@ All analysis documents are in `.workflow/round_1_analysis/`
                 f"Running analysis for {len(agents_to_run)} agents: {agents_to_run}"
             )
 
-            # Create analysis tasks for agents that need to run
-            analysis_tasks = []
-            for agent_type in agents_to_run:
-                agent = self.agents[agent_type]
-                task = self._run_agent_analysis(agent, context)
-                analysis_tasks.append((agent_type, task))
-
             # Run analyses in parallel
-            for agent_type, task in analysis_tasks:
-                try:
-                    analysis = await task
-                    results[agent_type] = analysis["analysis"]
-                    context.update_from_analysis(agent_type, analysis)
-                    logger.info(f"{agent_type} analysis complete")
-                except Exception as e:
-                    logger.error(f"{agent_type} analysis failed: {e}")
-                    results[agent_type] = f"Error: {e}"
+            analyses = await gather_agents(
+                {
+                    agent_type: self._run_agent_analysis(
+                        self.agents[agent_type], context
+                    )
+                    for agent_type in agents_to_run
+                },
+                self.agent_timeout,
+            )
+            for agent_type, analysis in analyses.items():
+                if isinstance(analysis, Exception):
+                    logger.error(f"{agent_type} analysis failed: {analysis}")
+                    results[agent_type] = f"Error: {analysis}"
+                    continue
+                results[agent_type] = analysis["analysis"]
+                context.update_from_analysis(agent_type, analysis)
+                logger.info(f"{agent_type} analysis complete")
         else:
             logger.info("All agent analyses already exist, skipping analysis round")
 
@@ -802,10 +816,9 @@ All analysis documents are in `.workflow/round_1_analysis/`
         # Get agent-specific context
         agent_context = context.get_context_for_agent(agent.agent_type)
 
-        # Run analysis (synchronous call in async context)
-        loop = asyncio.get_event_loop()
-        analysis = await loop.run_in_executor(
-            None, agent.analyze_task, agent_context, context.feature_spec.description
+        # Run analysis (synchronous call in the agent thread pool)
+        analysis = await run_blocking(
+            agent.analyze_task, agent_context, context.feature_spec.description
         )
 
         return cast(dict[str, Any], analysis)
@@ -1342,53 +1355,53 @@ Analysis documents available in {self.repo_path}/.workflow/round_1_analysis/
                 f"Pre-feedback: {agent_type} analysis has {len(result.content)} chars"
             )
 
-        for agent_type, agent in self.agents.items():
-            # Filter feedback relevant to this agent (simplified)
-            relevant_feedback = (
-                feedback_items  # In real implementation, could filter by agent
-            )
-
-            if relevant_feedback:
-                logger.info(f"Processing feedback with {agent_type}")
-
-                # Get agent context
-                agent_context = context.get_context_for_agent(agent_type)
-
-                # Convert FeedbackItem objects to dictionaries for agent processing
-                feedback_dicts = []
-                for feedback in relevant_feedback:
-                    feedback_dicts.append(
-                        {
-                            "comment_id": feedback.comment_id,
-                            "author": feedback.author,
-                            "content": feedback.content,
-                            "file_path": feedback.file_path,
-                            "line_number": feedback.line_number,
-                            "created_at": feedback.created_at,
-                        }
-                    )
+        # Convert FeedbackItem objects to dictionaries for agent processing
+        # (every agent sees all feedback; could be filtered by agent)
+        feedback_dicts = [
+            {
+                "comment_id": feedback.comment_id,
+                "author": feedback.author,
+                "content": feedback.content,
+                "file_path": feedback.file_path,
+                "line_number": feedback.line_number,
+                "created_at": feedback.created_at,
+            }
+            for feedback in feedback_items
+        ]
 
-                # Process feedback
-                response = agent.incorporate_human_feedback(
-                    feedback_dicts, agent_context
+        # Process feedback with all agents in parallel
+        logger.info(f"Processing feedback with {', '.join(self.agents)}")
+        responses = await gather_agents(
+            {
+                agent_type: run_blocking(
+                    agent.incorporate_human_feedback,
+                    feedback_dicts,
+                    context.get_context_for_agent(agent_type),
                 )
+                for agent_type, agent in self.agents.items()
+            },
+            self.agent_timeout,
+        )
 
-                if response.get("status") == "success":
-                    updated_content = response.get("updated_analysis", "")
-
-                    # Only update analysis if we got meaningful content back
-                    if updated_content and len(updated_content.strip()) > 10:
-                        context.analysis_results[agent_type].content = updated_content
-                        logger.info(f"{agent_type} successfully incorporated feedback")
-                        # Don't post individual agent replies - we'll post a consolidated reply later
-                    else:
-                        logger.warning(
-                            f"{agent_type} generated empty feedback response, keeping original analysis"
-                        )
+        for agent_type, response in responses.items():
+            if isinstance(response, Exception):
+                logger.error(f"{agent_type} failed to process feedback: {response}")
+            elif response.get("status") == "success":
+                updated_content = response.get("updated_analysis", "")
+
+                # Only update analysis if we got meaningful content back
+                if updated_content and len(updated_content.strip()) > 10:
+                    context.analysis_results[agent_type].content = updated_content
+                    logger.info(f"{agent_type} successfully incorporated feedback")
+                    # Don't post individual agent replies - we'll post a consolidated reply later
                 else:
-                    logger.error(
-                        f"{agent_type} failed to process feedback: {response.get('error')}"
+                    logger.warning(
+                        f"{agent_type} generated empty feedback response, keeping original analysis"
                     )
+            else:
+                logger.error(
+                    f"{agent_type} failed to process feedback: {response.get('error')}"
+                )
 
     async def _run_peer_review_round(self, context: TaskContext) -> dict[str, dict]:
         """Run peer review round where agents review each other's work."""
@@ -1401,25 +1414,27 @@ Analysis documents available in {self.repo_path}/.workflow/round_1_analysis/
                 peer_analyses[agent_type] = result.content
 
         # Run peer reviews in parallel
-        review_tasks = []
-        for agent_type, agent in self.agents.items():
-            task = self._run_agent_peer_review(agent, peer_analyses, context)
-            review_tasks.append((agent_type, task))
+        reviews = await gather_agents(
+            {
+                agent_type: self._run_agent_peer_review(agent, peer_analyses, context)
+                for agent_type, agent in self.agents.items()
+            },
+            self.agent_timeout,
+        )
 
         peer_reviews = {}
-        for agent_type, task in review_tasks:
-            try:
-                review = await task
-                peer_reviews[agent_type] = review
-                logger.info(f"{agent_type} peer review complete")
-            except Exception as e:
-                logger.error(f"{agent_type} peer review failed: {e}")
+        for agent_type, review in reviews.items():
+            if isinstance(review, Exception):
+                logger.error(f"{agent_type} peer review failed: {review}")
                 peer_reviews[agent_type] = {
                     "agent_type": agent_type,
                     "peer_review": "",
                     "status": "error",
-                    "error": str(e),
+                    "error": str(review),
                 }
+                continue
+            peer_reviews[agent_type] = review
+            logger.info(f"{agent_type} peer review complete")
 
         return peer_reviews
 
@@ -1436,10 +1451,9 @@ Analysis documents available in {self.repo_path}/.workflow/round_1_analysis/
         for agent_type, analysis in peer_analyses.items():
             logger.info(f"  {agent_type}: {len(analysis)} chars")
 
-        # Run peer review (synchronous call in async context)
-        loop = asyncio.get_event_loop()
-        review = await loop.run_in_executor(
-            None, agent.review_peer_output, peer_analyses, agent_context
+        # Run peer review (synchronous call in the agent thread pool)
+        review = await run_blocking(
+            agent.review_peer_output, peer_analyses, agent_context
         )
 
         logger.info(
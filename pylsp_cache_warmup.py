@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""
+pylsp Cache Warm-up
+Pre-parses a workspace and its interpreter's libraries into Jedi's on-disk
+parso cache so that the first pylsp query after a restart does not pay for
+parsing site-packages from scratch.
+
+This script runs under the repository's own Python interpreter (the configured
+python_path), so it may only depend on the standard library and Jedi/parso,
+which are always present alongside pylsp. Jedi derives its cache directory from
+XDG_CACHE_HOME, which the caller points at the per-repository cache directory.
+"""
+
+import argparse
+import json
+import os
+import sys
+import sysconfig
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import jedi
+import parso
+
+SKIP_DIRS = {
+    ".git",
+    "__pycache__",
+    "node_modules",
+    ".venv",
+    "venv",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".tox",
+    "build",
+    "dist",
+}
+
+
+def iter_python_files(root: Path) -> Iterator[Path]:
+    """Yield every .py/.pyi file under root, skipping tool and VCS directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            if filename.endswith((".py", ".pyi")):
+                yield Path(dirpath) / filename
+
+
+def get_library_roots() -> list[Path]:
+    """Return the interpreter's site-packages directories."""
+    paths = sysconfig.get_paths()
+    roots = []
+    for key in ("purelib", "platlib"):
+        path = Path(paths[key])
+        if path.is_dir() and path not in roots:
+            roots.append(path)
+    return roots
+
+
+def warm(
+    roots: list[Path], max_files: int, parent_pid: int | None = None
+) -> dict[str, int | float | str]:
+    """Parse files under roots with parso's pickle cache enabled.
+
+    Stops early once the process is no longer the child of ``parent_pid``,
+    so a warm-up does not outlive the worker that started it.
+    """
+    grammar = parso.load_grammar()
+    cache_path = Path(jedi.settings.cache_directory)
+    start = time.perf_counter()
+    parsed = errors = 0
+
+    for root in roots:
+        for path in iter_python_files(root):
+            if parsed >= max_files:
+                break
+            if parent_pid is not None and os.getppid() != parent_pid:
+                return {"files": parsed, "errors": errors, "orphaned": 1}
+            try:
+                # Unchanged files are loaded from the pickle cache, so repeated
+                # warm-ups after a restart only re-parse modified files
+                grammar.parse(path=path, cache=True, cache_path=cache_path)
+                parsed += 1
+            except Exception:
+                errors += 1
+
+    return {
+        "files": parsed,
+        "errors": errors,
+        "seconds": round(time.perf_counter() - start, 3),
+        "cache_directory": str(cache_path),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Warm Jedi's parso cache")
+    parser.add_argument("workspace", help="Repository workspace to pre-parse")
+    parser.add_argument(
+        "--max-files", type=int, default=20000, help="Upper bound on parsed files"
+    )
+    parser.add_argument(
+        "--skip-site-packages",
+        action="store_true",
+        help="Only pre-parse the workspace",
+    )
+    args = parser.parse_args()
+
+    roots = [Path(args.workspace)]
+    if not args.skip_site_packages:
+        roots.extend(get_library_roots())
+
+    json.dump(warm(roots, args.max_files, os.getppid()), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,27 +6,50 @@ It provides lifecycle management, workspace configuration, and Python-specific
 capabilities for LSP-based code analysis.
 """
 
+import hashlib
+import json
 import logging
+import os
 import subprocess
 from pathlib import Path
 from typing import Any
 
+from constants import LSP_CACHE_DIR
 from lsp_server_manager import LSPCommunicationMode, LSPServerManager
 
+WARMUP_SCRIPT = Path(__file__).parent / "pylsp_cache_warmup.py"
+WARMUP_TIMEOUT_SECONDS = 600
+
+
+def get_lsp_cache_dir(workspace_path: str, python_path: str) -> Path:
+    """Get the persistent Jedi cache directory for a workspace/interpreter pair."""
+    key = hashlib.sha256(f"{workspace_path}\0{python_path}".encode()).hexdigest()
+    return LSP_CACHE_DIR / f"{Path(workspace_path).name}-{key[:12]}"
+
+
+def build_lsp_cache_env(cache_dir: Path) -> dict[str, str]:
+    """Build a pylsp process environment that keeps Jedi's cache in cache_dir."""
+    # Jedi stores its parso pickle cache under $XDG_CACHE_HOME/jedi
+    return {**os.environ, "XDG_CACHE_HOME": str(cache_dir)}
+
 
 class PylspManager(LSPServerManager):
     """LSP Server Manager for Python LSP Server (pylsp)."""
 
-    def __init__(self, workspace_path: str, python_path: str):
+    def __init__(
+        self, workspace_path: str, python_path: str, cache_dir: Path | None = None
+    ):
         """
         Initialize the pylsp Manager.
 
         Args:
             workspace_path: Path to the Python workspace/project
             python_path: Path to the Python interpreter
+            cache_dir: Persistent Jedi cache directory (defaults to one under DATA_DIR)
         """
         self.workspace_path = Path(workspace_path)
         self.python_path = python_path
+        self.cache_dir = cache_dir or get_lsp_cache_dir(workspace_path, python_path)
         self.logger = logging.getLogger(__name__)
 
         # Check if pylsp is available
@@ -120,14 +143,55 @@ class PylspManager(LSPServerManager):
 
     def prepare_workspace(self) -> bool:
         """Prepare the workspace for pylsp."""
-        # pylsp doesn't require special workspace preparation
-        # It works with any Python project
+        # pylsp works with any Python project; it only needs its cache directory
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(
+                f"Could not create pylsp cache dir {self.cache_dir}: {e}"
+            )
         self.logger.info(f"Workspace prepared for pylsp: {self.workspace_path}")
         return True
 
+    def get_server_environment(self) -> dict[str, str] | None:
+        """Get the pylsp process environment pointing Jedi at the warm cache."""
+        return build_lsp_cache_env(self.cache_dir)
+
+    def warm_cache(self) -> bool:
+        """Pre-parse the workspace and site-packages into Jedi's disk cache."""
+        self.logger.info(f"Warming pylsp cache for {self.workspace_path}")
+        try:
+            result = subprocess.run(
+                [self.python_path, str(WARMUP_SCRIPT), str(self.workspace_path)],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=self.get_server_environment(),
+                timeout=WARMUP_TIMEOUT_SECONDS,
+            )
+        except subprocess.TimeoutExpired:
+            self.logger.warning(
+                f"pylsp cache warm-up timed out after {WARMUP_TIMEOUT_SECONDS}s"
+            )
+            return False
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            stderr = getattr(e, "stderr", "") or ""
+            self.logger.warning(f"pylsp cache warm-up failed: {e} {stderr.strip()}")
+            return False
+
+        try:
+            stats = json.loads(result.stdout)
+        except json.JSONDecodeError:
+            stats = {}
+        self.logger.info(
+            f"pylsp cache warm: {stats.get('files', '?')} files in "
+            f"{stats.get('seconds', '?')}s ({self.cache_dir})"
+        )
+        return True
+
     def cleanup_workspace(self) -> bool:
         """Clean up pylsp-specific workspace artifacts."""
-        # pylsp doesn't create persistent artifacts that need cleanup
+        # The Jedi cache lives under DATA_DIR and is kept across restarts
         self.logger.info("Workspace cleanup completed for pylsp")
         return True
 
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+"""
+Pytest Result Capture
+Structured per-test outcomes read from pytest's JUnit XML reports, so test
+runs can be stored and handed to agents without pytest's full output.
+
+Failures raised by the same error at the same place are grouped, so a
+broken helper or fixture shared by many tests is reported once with the
+tests it breaks. Tracebacks, captured output and the failure digest given to
+agents are truncated to bounded sizes.
+"""
+
+import re
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+from xml.etree import ElementTree
+
+# Arguments making pytest write the report read by read_junit_report: file
+# attributes on test cases, and captured output for failing tests only
+JUNIT_ARGS = (
+    "-o",
+    "junit_family=xunit1",
+    "-o",
+    "junit_logging=out-err",
+    "-o",
+    "junit_log_passing_tests=False",
+)
+MAX_TRACEBACK_CHARS = 4000
+MAX_CAPTURED_CHARS = 2000
+# Tail of pytest's own output kept per run, for failures outside any test
+MAX_OUTPUT_CHARS = 8000
+# Failure digest handed to agents
+MAX_DIGEST_CHARS = 12000
+
+# "path/to/file.py:12: ExceptionType" lines pytest ends traceback entries with
+_LOCATION = re.compile(r"^(\S+\.py):(\d+): \w", re.MULTILINE)
+_ADDRESS = re.compile(r"0x[0-9a-fA-F]+")
+# Header pytest puts above captured output in reports
+_CAPTURED_HEADER = re.compile(r"^-+ Captured \w+ -+\n", re.MULTILINE)
+
+
+class Outcome(str, Enum):
+    """Outcome of a single test."""
+
+    PASSED = "passed"
+    FAILED = "failed"
+    ERROR = "error"
+    SKIPPED = "skipped"
+
+
+def truncate(text: str, limit: int) -> str:
+    """Shorten text to about ``limit`` characters, keeping its start and end."""
+    if len(text) <= limit:
+        return text
+    half = limit // 2
+    omitted = len(text) - 2 * half
+    return f"{text[:half]}\n... [{omitted} characters truncated] ...\n{text[-half:]}"
+
+
+@dataclass
+class TestOutcome:
+    """Outcome of one test, with its failure details if it failed."""
+
+    __test__ = False
+
+    node_id: str
+    outcome: Outcome
+    duration: float
+    message: str = ""
+    traceback: str = ""
+    # Output the test printed, recorded for failing tests only
+    captured: str = ""
+
+    @property
+    def failed(self) -> bool:
+        return self.outcome in (Outcome.FAILED, Outcome.ERROR)
+
+    @property
+    def signature(self) -> tuple[str, str]:
+        """Where and with what error the test failed, ignoring test details."""
+        locations = _LOCATION.findall(self.traceback)
+        location = ":".join(locations[-1]) if locations else ""
+        first_line = self.message.split("\n", 1)[0]
+        return location, _ADDRESS.sub("0x?", first_line)
+
+
+@dataclass
+class FailureGroup:
+    """Failing tests that share an error, reported once."""
+
+    message: str
+    traceback: str
+    tests: list[str] = field(default_factory=list)
+    captured: str = ""
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _node_id(case: ElementTree.Element) -> str:
+    test_file = case.get("file", "")
+    name = case.get("name", "")
+    classname = case.get("classname", "")
+    if not test_file:
+        return f"{classname}::{name}" if classname else name
+    if not classname:
+        # Collection errors are reported against the module itself
+        return test_file
+    # The class name is the module's dotted path plus any test classes
+    module = Path(test_file).with_suffix("").as_posix().replace("/", ".")
+    classes = classname[len(module) :].strip(".").split(".")
+    return "::".join([test_file, *filter(None, classes), name])
+
+
+def _captured(case: ElementTree.Element) -> str:
+    parts = []
+    for tag in ("system-out", "system-err"):
+        text = _CAPTURED_HEADER.sub("", case.findtext(tag) or "").strip()
+        if text:
+            parts.append(text)
+    return truncate("\n".join(parts), MAX_CAPTURED_CHARS)
+
+
+def read_junit_report(report: Path) -> list[TestOutcome]:
+    """Read the test outcomes from a JUnit report written with JUNIT_ARGS.
+
+    Returns:
+        Outcomes in report order; empty if the report is missing or invalid
+    """
+    try:
+        tree = ElementTree.parse(report)
+    except (ElementTree.ParseError, OSError):
+        return []
+    outcomes = []
+    for case in tree.iter("testcase"):
+        outcome = TestOutcome(
+            node_id=_node_id(case),
+            outcome=Outcome.PASSED,
+            duration=float(case.get("time") or 0),
+        )
+        for tag, result in (
+            ("failure", Outcome.FAILED),
+            ("error", Outcome.ERROR),
+            ("skipped", Outcome.SKIPPED),
+        ):
+            detail = case.find(tag)
+            if detail is not None:
+                outcome.outcome = result
+                outcome.message = detail.get("message", "")
+                if result != Outcome.SKIPPED:
+                    outcome.traceback = truncate(detail.text or "", MAX_TRACEBACK_CHARS)
+                    outcome.captured = _captured(case)
+                break
+        outcomes.append(outcome)
+    return outcomes
+
+
+def summarize(outcomes: list[TestOutcome]) -> dict[str, int]:
+    """Count the tests per outcome."""
+    counts = dict.fromkeys([outcome.value for outcome in Outcome], 0)
+    for outcome in outcomes:
+        counts[outcome.outcome.value] += 1
+    return counts
+
+
+def group_failures(outcomes: list[TestOutcome]) -> list[FailureGroup]:
+    """Group failing tests by the error they failed with.
+
+    The first test of each group provides the traceback and captured output.
+    """
+    groups: dict[tuple[str, str], FailureGroup] = {}
+    for outcome in outcomes:
+        if not outcome.failed:
+            continue
+        group = groups.get(outcome.signature)
+        if group is None:
+            group = groups[outcome.signature] = FailureGroup(
+                message=outcome.message,
+                traceback=outcome.traceback,
+                captured=outcome.captured,
+            )
+        group.tests.append(outcome.node_id)
+    return list(groups.values())
+
+
+def format_failures(groups: list[FailureGroup], limit: int = MAX_DIGEST_CHARS) -> str:
+    """Describe failure groups for a prompt, within ``limit`` characters.
+
+    Groups that do not fit are listed by their tests only.
+    """
+    sections: list[str] = []
+    used = 0
+    omitted: list[str] = []
+    for number, group in enumerate(groups, 1):
+        tests = ", ".join(group.tests[:10])
+        if len(group.tests) > 10:
+            tests += f" and {len(group.tests) - 10} more"
+        headline = group.message.split("\n", 1)[0]
+        section = f"FAILURE {number}: {headline}\n"
+        section += f"Tests ({len(group.tests)}): {tests}\n\n{group.traceback}\n"
+        if group.captured:
+            section += f"\nCaptured output:\n{group.captured}\n"
+        if used + len(section) > limit and sections:
+            omitted.extend(group.tests)
+            continue
+        sections.append(section)
+        used += len(section)
+    if omitted:
+        sections.append(
+            f"{len(omitted)} more failing tests not shown: {', '.join(omitted[:20])}"
+        )
+    return "\n".join(sections)
@@ -11,7 +11,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 
 from python_symbol_extractor import AbstractSymbolExtractor
-from symbol_storage import AbstractSymbolStorage
+from symbol_storage import AbstractSymbolStorage, SymbolSink
 
 logger = logging.getLogger(__name__)
 
@@ -151,10 +151,6 @@ class PythonRepositoryIndexer(AbstractRepositoryIndexer):
             f"Indexing configuration: max_file_size_mb={self.max_file_size_bytes / 1024 / 1024:.1f}, exclude_patterns={self.exclude_patterns}"
         )
 
-        # Clear existing data for this repository
-        logger.info(f"Clearing existing index data for repository: {repository_id}")
-        self.clear_repository_index(repository_id)
-
         result = IndexingResult()
         logger.debug("Initialized indexing result tracking")
 
@@ -162,21 +158,26 @@ class PythonRepositoryIndexer(AbstractRepositoryIndexer):
         python_files = self._find_python_files(repo_path)
         logger.info(f"Found {len(python_files)} Python files to process")
 
-        # Process each Python file
-        for python_file in python_files:
-            logger.info(f"Processing file: {python_file}")
-            try:
-                self._process_file(python_file, repository_id, result)
-            except (MemoryError, KeyboardInterrupt, SystemExit):
-                # Critical system errors that should always propagate immediately
-                raise
-            except Exception as e:
-                # All unexpected errors from _process_file are logged but don't fail entire indexing
-                # This includes database errors, symbol extraction errors, etc.
-                # File-level errors (permissions, syntax errors) are already handled in _process_file
-                error_msg = f"Unexpected error processing {python_file}: {e}"
-                logger.error(error_msg)
-                result.add_failed_file(str(python_file), error_msg)
+        # Process each Python file; the storage swaps the new symbols in for the
+        # repository's existing ones once every file has been processed
+        logger.info(f"Rebuilding index data for repository: {repository_id}")
+        with self.symbol_storage.rebuild_repository(repository_id) as store_symbols:
+            for python_file in python_files:
+                logger.info(f"Processing file: {python_file}")
+                try:
+                    self._process_file(
+                        python_file, repository_id, result, store_symbols
+                    )
+                except (MemoryError, KeyboardInterrupt, SystemExit):
+                    # Critical system errors that should always propagate immediately
+                    raise
+                except Exception as e:
+                    # All unexpected errors from _process_file are logged but don't fail entire indexing
+                    # This includes database errors, symbol extraction errors, etc.
+                    # File-level errors (permissions, syntax errors) are already handled in _process_file
+                    error_msg = f"Unexpected error processing {python_file}: {e}"
+                    logger.error(error_msg)
+                    result.add_failed_file(str(python_file), error_msg)
 
         logger.info(f"Indexing completed for repository {repository_id}")
         logger.info(
@@ -271,7 +272,11 @@ class PythonRepositoryIndexer(AbstractRepositoryIndexer):
         return False
 
     def _process_file(
-        self, file_path: Path, repository_id: str, result: IndexingResult
+        self,
+        file_path: Path,
+        repository_id: str,
+        result: IndexingResult,
+        store_symbols: SymbolSink | None = None,
     ) -> None:
         """Process a single Python file.
 
@@ -279,6 +284,8 @@ class PythonRepositoryIndexer(AbstractRepositoryIndexer):
             file_path: Path to the Python file
             repository_id: Repository identifier
             result: Result object to update
+            store_symbols: Sink for extracted symbols, defaults to inserting
+                them directly into the symbol storage
         """
         file_str = str(file_path)
 
@@ -311,7 +318,7 @@ class PythonRepositoryIndexer(AbstractRepositoryIndexer):
 
             # Store symbols in database
             if symbols:
-                self.symbol_storage.insert_symbols(symbols)
+                (store_symbols or self.symbol_storage.insert_symbols)(symbols)
                 logger.debug(f"Extracted {len(symbols)} symbols from {file_str}")
             else:
                 logger.debug(f"No symbols found in {file_str}")
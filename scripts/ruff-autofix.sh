@@ -3,6 +3,12 @@ set -o pipefail
 
 # Ruff auto-fix script
 # Runs ruff --fix and format, detects if changes were made
+# Usage: ruff-autofix.sh [PATH...]  (defaults to the whole repository)
+if [ $# -gt 0 ]; then
+    paths=("$@")
+else
+    paths=(.)
+fi
 echo "🔧 Running Ruff auto-fix..."
 
 # Create output directory
@@ -16,13 +22,13 @@ git status --porcelain > ruff_autofix_output/git-status-before.txt
 echo "========================================="
 echo "Running ruff check --fix..."
 echo "========================================="
-ruff check --fix . 2>&1 | tee ruff_autofix_output/ruff-fix.log
+ruff check --fix "${paths[@]}" 2>&1 | tee ruff_autofix_output/ruff-fix.log
 ruff_fix_exit=$?
 
 echo "========================================="
 echo "Running ruff format..."
 echo "========================================="
-ruff format . 2>&1 | tee ruff_autofix_output/ruff-format.log
+ruff format "${paths[@]}" 2>&1 | tee ruff_autofix_output/ruff-format.log
 ruff_format_exit=$?
 
 # Check what changed
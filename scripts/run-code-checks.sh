@@ -7,6 +7,12 @@ set -o pipefail
 # Runs ruff, mypy, and bandit checks
 # Continues running all checks even if one fails
 # Returns non-zero exit code if any check fails
+# Usage: run-code-checks.sh [PATH...]  (defaults to the whole repository)
+if [ $# -gt 0 ]; then
+    paths=("$@")
+else
+    paths=(.)
+fi
 
 echo "Starting combined code checks..."
 
@@ -20,7 +26,7 @@ mkdir -p code_check_output/{ruff,mypy,bandit}
 echo "========================================="
 echo "Running Ruff linting..."
 echo "========================================="
-ruff check . --output-format=github 2>&1 | tee code_check_output/ruff/ruff-check.log
+ruff check "${paths[@]}" --output-format=github 2>&1 | tee code_check_output/ruff/ruff-check.log
 ruff_check_exit=$?
 if [ $ruff_check_exit -eq 0 ]; then
     echo "✅ Ruff check passed"
@@ -34,7 +40,7 @@ else
     exit_code=1
 fi
 
-ruff format --check . 2>&1 | tee code_check_output/ruff/ruff-format.log
+ruff format --check "${paths[@]}" 2>&1 | tee code_check_output/ruff/ruff-format.log
 ruff_format_exit=$?
 if [ $ruff_format_exit -eq 0 ]; then
     echo "✅ Ruff format check passed"
@@ -49,12 +55,12 @@ else
 fi
 
 # Also run with JSON output for artifact
-ruff check . --output-format=json > code_check_output/ruff/ruff-check.json 2>/dev/null || true
+ruff check "${paths[@]}" --output-format=json > code_check_output/ruff/ruff-check.json 2>/dev/null || true
 
 echo "========================================="
 echo "Running mypy type checking..."
 echo "========================================="
-mypy . --ignore-missing-imports --show-error-codes 2>&1 | tee code_check_output/mypy/mypy-results.log
+mypy "${paths[@]}" --ignore-missing-imports --show-error-codes 2>&1 | tee code_check_output/mypy/mypy-results.log
 mypy_exit=$?
 if [ $mypy_exit -eq 0 ]; then
     echo "✅ mypy type checking passed"
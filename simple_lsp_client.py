@@ -6,25 +6,34 @@ No persistent connections, no complex async coordination - just works.
 """
 
 import asyncio
-import json
 import logging
+from pathlib import Path
 from typing import Any
 
+from lsp_jsonrpc import LSPStreamReader, encode_lsp_message
+from pylsp_manager import build_lsp_cache_env, get_lsp_cache_dir
+from tracing import tracer
+
 
 class SimpleLSPClient:
     """Simple LSP client using direct subprocess calls."""
 
-    def __init__(self, workspace_root: str, python_path: str):
+    def __init__(
+        self, workspace_root: str, python_path: str, cache_dir: Path | None = None
+    ):
         """Initialize the simple LSP client.
 
         Args:
             workspace_root: Path to the workspace/project root
             python_path: Path to the Python interpreter with pylsp
+            cache_dir: Persistent Jedi cache directory shared with the warm-up
         """
         self.workspace_root = workspace_root
         self.python_path = python_path
+        self.cache_dir = cache_dir or get_lsp_cache_dir(workspace_root, python_path)
         self.logger = logging.getLogger("simple-lsp")
 
+    @tracer.traced("lsp", "textDocument/definition")
     async def get_definition(
         self, file_uri: str, line: int, character: int, timeout: float = 10.0
     ) -> list[dict[str, Any]]:
@@ -43,17 +52,20 @@ class SimpleLSPClient:
 
         try:
             # Start fresh pylsp process
-            proc = await asyncio.create_subprocess_exec(
-                self.python_path,
-                "-m",
-                "pylsp",
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=self.workspace_root,
-            )
+            with tracer.span("lsp", "spawn"):
+                proc = await asyncio.create_subprocess_exec(
+                    self.python_path,
+                    "-m",
+                    "pylsp",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self.workspace_root,
+                    env=build_lsp_cache_env(self.cache_dir),
+                )
 
             self.logger.debug(f"Started pylsp process {proc.pid}")
+            reader = self._create_reader(proc)
 
             # Send initialize request
             init_request = {
@@ -69,12 +81,13 @@ class SimpleLSPClient:
                 },
             }
 
-            await self._send_message(proc, init_request)
+            with tracer.span("lsp", "initialize"):
+                await self._send_message(proc, init_request)
 
-            # Read initialize response
-            response = await asyncio.wait_for(
-                self._read_response(proc), timeout=timeout / 2
-            )
+                # Read initialize response
+                response = await asyncio.wait_for(
+                    self._read_response(reader), timeout=timeout / 2
+                )
 
             if "error" in response:
                 raise Exception(f"Initialize failed: {response['error']}")
@@ -103,7 +116,7 @@ class SimpleLSPClient:
 
             # Read definition response
             response = await asyncio.wait_for(
-                self._read_response(proc), timeout=timeout / 2
+                self._read_response(reader), timeout=timeout / 2
             )
 
             if "error" in response:
@@ -146,6 +159,7 @@ class SimpleLSPClient:
                 self.logger.warning(f"Cleanup error: {cleanup_error}")
                 # Don't re-raise cleanup errors
 
+    @tracer.traced("lsp", "textDocument/references")
     async def get_references(
         self, file_uri: str, line: int, character: int, timeout: float = 10.0
     ) -> list[dict[str, Any]]:
@@ -164,15 +178,18 @@ class SimpleLSPClient:
 
         try:
             # Start fresh pylsp process
-            proc = await asyncio.create_subprocess_exec(
-                self.python_path,
-                "-m",
-                "pylsp",
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=self.workspace_root,
-            )
+            with tracer.span("lsp", "spawn"):
+                proc = await asyncio.create_subprocess_exec(
+                    self.python_path,
+                    "-m",
+                    "pylsp",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self.workspace_root,
+                    env=build_lsp_cache_env(self.cache_dir),
+                )
+            reader = self._create_reader(proc)
 
             # Initialize
             init_request = {
@@ -188,8 +205,9 @@ class SimpleLSPClient:
                 },
             }
 
-            await self._send_message(proc, init_request)
-            await asyncio.wait_for(self._read_response(proc), timeout=timeout / 2)
+            with tracer.span("lsp", "initialize"):
+                await self._send_message(proc, init_request)
+                await asyncio.wait_for(self._read_response(reader), timeout=timeout / 2)
 
             # Send initialized notification
             await self._send_message(
@@ -210,7 +228,7 @@ class SimpleLSPClient:
 
             await self._send_message(proc, ref_request)
             response = await asyncio.wait_for(
-                self._read_response(proc), timeout=timeout / 2
+                self._read_response(reader), timeout=timeout / 2
             )
 
             if "error" in response:
@@ -253,6 +271,7 @@ class SimpleLSPClient:
                 self.logger.warning(f"Cleanup error: {cleanup_error}")
                 # Don't re-raise cleanup errors
 
+    @tracer.traced("lsp", "textDocument/hover")
     async def get_hover(
         self, file_uri: str, line: int, character: int, timeout: float = 10.0
     ) -> dict[str, Any] | None:
@@ -271,15 +290,18 @@ class SimpleLSPClient:
 
         try:
             # Start fresh pylsp process
-            proc = await asyncio.create_subprocess_exec(
-                self.python_path,
-                "-m",
-                "pylsp",
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=self.workspace_root,
-            )
+            with tracer.span("lsp", "spawn"):
+                proc = await asyncio.create_subprocess_exec(
+                    self.python_path,
+                    "-m",
+                    "pylsp",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self.workspace_root,
+                    env=build_lsp_cache_env(self.cache_dir),
+                )
+            reader = self._create_reader(proc)
 
             # Initialize
             init_request = {
@@ -295,8 +317,9 @@ class SimpleLSPClient:
                 },
             }
 
-            await self._send_message(proc, init_request)
-            await asyncio.wait_for(self._read_response(proc), timeout=timeout / 2)
+            with tracer.span("lsp", "initialize"):
+                await self._send_message(proc, init_request)
+                await asyncio.wait_for(self._read_response(reader), timeout=timeout / 2)
 
             # Send initialized notification
             await self._send_message(
@@ -316,7 +339,7 @@ class SimpleLSPClient:
 
             await self._send_message(proc, hover_request)
             response = await asyncio.wait_for(
-                self._read_response(proc), timeout=timeout / 2
+                self._read_response(reader), timeout=timeout / 2
             )
 
             if "error" in response:
@@ -359,6 +382,12 @@ class SimpleLSPClient:
                 self.logger.warning(f"Cleanup error: {cleanup_error}")
                 # Don't re-raise cleanup errors
 
+    def _create_reader(self, proc: asyncio.subprocess.Process) -> LSPStreamReader:
+        """Create a framed message reader over the process stdout."""
+        if proc.stdout is None:
+            raise Exception("Process stdout is not available")
+        return LSPStreamReader(proc.stdout)
+
     async def _send_message(
         self, proc: asyncio.subprocess.Process, message: dict[str, Any]
     ) -> None:
@@ -366,45 +395,21 @@ class SimpleLSPClient:
         if proc.stdin is None:
             raise Exception("Process stdin is not available")
 
-        content = json.dumps(message)
-        message_bytes = f"Content-Length: {len(content)}\r\n\r\n{content}".encode()
-
-        proc.stdin.write(message_bytes)
+        proc.stdin.write(encode_lsp_message(message))
         await proc.stdin.drain()
 
         self.logger.debug(f"Sent {message.get('method', 'response')} message")
 
-    async def _read_response(self, proc: asyncio.subprocess.Process) -> dict[str, Any]:
-        """Read LSP response from process."""
-        if proc.stdout is None:
-            raise Exception("Process stdout is not available")
-
-        # Read headers
-        headers = {}
-        while True:
-            line = await proc.stdout.readline()
-            if not line:
-                raise Exception("Process ended unexpectedly")
-
-            line_str = line.decode().strip()
-            if not line_str:  # Empty line indicates end of headers
-                break
-
-            if ":" in line_str:
-                key, value = line_str.split(":", 1)
-                headers[key.strip()] = value.strip()
-
-        # Read content
-        content_length = int(headers.get("Content-Length", 0))
-        if content_length == 0:
-            raise Exception("No Content-Length header")
-
-        content_bytes = await proc.stdout.read(content_length)
-        content = content_bytes.decode()
+    async def _read_response(self, reader: LSPStreamReader) -> dict[str, Any]:
+        """Read the next LSP message from the process."""
+        try:
+            message = await reader.read_message()
+        except EOFError as e:
+            raise Exception("Process ended unexpectedly") from e
 
-        self.logger.debug(f"Read response: {len(content)} chars")
+        self.logger.debug(f"Read response: {type(message).__name__}")
 
-        return json.loads(content)
+        return message
 
 
 # Factory function for easy integration
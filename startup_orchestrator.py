@@ -229,11 +229,8 @@ class CodebaseStartupOrchestrator(AbstractStartupOrchestrator):
         status.start_time = time.time()
 
         try:
-            # Clear existing data for this repository
-            logger.debug(f"Clearing existing index for {repo_config.name}")
-            self.indexer.clear_repository_index(repo_config.name)
-
-            # Index the repository
+            # Index the repository; existing symbols are replaced atomically
+            # once indexing finishes, so searches keep working meanwhile
             logger.debug(f"Indexing repository at {repo_config.workspace}")
             result = self.indexer.index_repository(
                 repo_config.workspace, repo_config.name
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+"""
+Subprocess Output Helpers
+Reading and cleanup for asyncio subprocesses, shared by the model CLI
+runners, the workflow's quality commands and the test impact runner.
+
+Iterating a StreamReader directly fails on lines longer than its 64 KiB
+limit, and a single line of model or tool output can be longer than that, so
+output is read in chunks and split into lines here. Processes are started in
+their own session, so killing their process group also stops any tools they
+started.
+"""
+
+import asyncio
+import os
+import signal
+from collections.abc import AsyncIterator
+
+# Bytes read from a process's output at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+async def read_lines(
+    stream: asyncio.StreamReader, keepends: bool = False
+) -> AsyncIterator[bytes]:
+    """Yield the lines of a stream as they complete, however long they are.
+
+    Args:
+        stream: Output of a subprocess
+        keepends: Keep each line's trailing newline
+
+    Yields:
+        Lines of the stream; the last one may have no newline
+    """
+    pending = bytearray()
+    while chunk := await stream.read(STREAM_CHUNK_SIZE):
+        pending += chunk
+        *lines, rest = pending.split(b"\n")
+        for line in lines:
+            yield bytes(line + b"\n") if keepends else bytes(line)
+        pending = rest
+    if pending:
+        yield bytes(pending)
+
+
+async def kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill a process started with ``start_new_session`` and its children.
+
+    Does nothing if the process has already exited; otherwise waits until
+    it has been reaped.
+    """
+    if process.returncode is None:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
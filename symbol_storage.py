@@ -5,21 +5,54 @@ This module provides the core database schema and operations for storing
 and retrieving Python symbols from repositories.
 """
 
+import asyncio
+import functools
 import logging
+import queue
 import sqlite3
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from constants import DATA_DIR
 
 logger = logging.getLogger(__name__)
 
+# Read pool tuning: readers share the OS page cache through mmap and keep a
+# larger private page cache since they never hold dirty pages
+DEFAULT_READ_POOL_SIZE = 4
+READ_POOL_TIMEOUT_SECONDS = 30.0
+READER_MMAP_SIZE = 256 * 1024 * 1024
+READER_CACHE_SIZE_KIB = 64 * 1024
+
+# Secondary indexes on the symbols table, shared by schema creation and bulk
+# rebuilds that drop and recreate them around large loads
+SYMBOL_INDEXES: dict[str, str] = {
+    "idx_symbols_name": "(name)",
+    "idx_symbols_repository_id": "(repository_id)",
+    "idx_symbols_kind": "(kind)",
+    "idx_symbols_file_path": "(file_path, repository_id)",
+    "idx_symbols_name_repo": "(name, repository_id)",
+}
+SYMBOL_INSERT_COLUMNS = (
+    "name, kind, file_path, line_number, column_number, repository_id, docstring"
+)
+# Rebuild indexes from scratch when a repository's new rows are at least this
+# fraction of the rows already in the table; below it, indexed inserts
+# are cheaper than re-sorting the whole table
+BULK_INDEX_REBUILD_RATIO = 0.5
+BULK_STAGING_CACHE_SIZE_KIB = 128 * 1024
+
+T = TypeVar("T")
+
 
 class SymbolKind(Enum):
     """Enumeration of Python symbol types."""
@@ -85,6 +118,10 @@ class CommentReply:
         return cls(**data)
 
 
+# Callable that accepts a batch of symbols during a repository rebuild
+SymbolSink = Callable[[list[Symbol]], None]
+
+
 class AbstractSymbolStorage(ABC):
     """Abstract base class for symbol storage operations."""
 
@@ -118,6 +155,23 @@ class AbstractSymbolStorage(ABC):
         """Delete all symbols for a specific repository."""
         pass
 
+    @contextmanager
+    def rebuild_repository(self, repository_id: str) -> Iterator[SymbolSink]:
+        """Replace every symbol of a repository with the symbols fed to the sink.
+
+        The default implementation clears the repository up front and inserts
+        each batch as it arrives. Storages that support it may stage the batches
+        and swap them in atomically when the block exits without an error.
+
+        Args:
+            repository_id: Repository whose symbols are replaced
+
+        Yields:
+            Callable accepting batches of symbols for the repository
+        """
+        self.delete_symbols_by_repository(repository_id)
+        yield self.insert_symbols
+
     @abstractmethod
     def search_symbols(
         self,
@@ -205,7 +259,11 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
     """SQLite implementation of symbol storage with error handling and resilience."""
 
     def __init__(
-        self, db_path: str | Path, max_retries: int = 3, retry_delay: float = 0.1
+        self,
+        db_path: str | Path,
+        max_retries: int = 3,
+        retry_delay: float = 0.1,
+        read_pool_size: int = 0,
     ):
         """Initialize SQLite symbol storage.
 
@@ -213,13 +271,25 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
             db_path: Path to SQLite database file
             max_retries: Maximum number of retry attempts for database operations
             retry_delay: Delay between retry attempts in seconds
+            read_pool_size: Number of dedicated read-only connections. With 0 all
+                operations share one connection; otherwise writes use a single
+                writer connection and reads borrow from a pool of query-only WAL
+                connections so they never wait behind indexing writes.
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._connection: sqlite3.Connection | None = None
         self._connection_lock = threading.Lock()
+        # Serializes use of the writer connection across threads
+        self._write_lock = threading.RLock()
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.read_pool_size = read_pool_size
+        self._read_pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._read_pool_lock = threading.Lock()
+        self._read_pool_created = 0
+        # Bumped by close() so connections borrowed before it are discarded
+        self._read_pool_generation = 0
         self.create_schema()
 
     def _get_connection(self) -> sqlite3.Connection:
@@ -229,15 +299,22 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
                 self._connection = self._create_connection()
             return self._connection
 
-    def _create_connection(self) -> sqlite3.Connection:
+    def _create_connection(self, read_only: bool = False) -> sqlite3.Connection:
         """Create a new database connection with error handling."""
         for attempt in range(self.max_retries + 1):
             try:
-                conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+                # Thread-safety is provided by the write lock and the read pool
+                conn = sqlite3.connect(
+                    str(self.db_path), timeout=30.0, check_same_thread=False
+                )
                 conn.row_factory = sqlite3.Row
                 conn.execute("PRAGMA foreign_keys = ON")
                 conn.execute("PRAGMA journal_mode = WAL")
                 conn.execute("PRAGMA synchronous = NORMAL")
+                if read_only:
+                    conn.execute("PRAGMA query_only = ON")
+                    conn.execute(f"PRAGMA mmap_size = {READER_MMAP_SIZE}")
+                    conn.execute(f"PRAGMA cache_size = -{READER_CACHE_SIZE_KIB}")
                 return conn
             except sqlite3.DatabaseError as e:
                 if attempt < self.max_retries:
@@ -268,17 +345,104 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
                 finally:
                     self._connection = None
 
+        with self._read_pool_lock:
+            self._read_pool_generation += 1
+            self._read_pool_created = 0
+            while True:
+                try:
+                    reader = self._read_pool.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    reader.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"Error closing read connection: {e}")
+
+    @contextmanager
+    def _write_connection(self) -> Iterator[sqlite3.Connection]:
+        """Use the writer connection as a transaction, one thread at a time."""
+        with self._write_lock, self._get_connection() as conn:
+            yield conn
+
+    def _acquire_read_connection(self) -> tuple[sqlite3.Connection, int]:
+        """Borrow a pooled reader, opening a new one while under the pool size."""
+        try:
+            return self._read_pool.get_nowait(), self._read_pool_generation
+        except queue.Empty:
+            pass
+
+        with self._read_pool_lock:
+            generation = self._read_pool_generation
+            can_create = self._read_pool_created < self.read_pool_size
+            if can_create:
+                self._read_pool_created += 1
+
+        if can_create:
+            try:
+                return self._create_connection(read_only=True), generation
+            except Exception:
+                with self._read_pool_lock:
+                    if generation == self._read_pool_generation:
+                        self._read_pool_created -= 1
+                raise
+
+        try:
+            reader = self._read_pool.get(timeout=READ_POOL_TIMEOUT_SECONDS)
+        except queue.Empty as e:
+            raise sqlite3.OperationalError(
+                f"Timed out waiting for one of {self.read_pool_size} read connections"
+            ) from e
+        return reader, self._read_pool_generation
+
+    def _release_read_connection(
+        self, reader: sqlite3.Connection, generation: int, broken: bool
+    ) -> None:
+        """Return a reader to the pool, or close it if it is stale or broken."""
+        with self._read_pool_lock:
+            if not broken and generation == self._read_pool_generation:
+                self._read_pool.put(reader)
+                return
+            if generation == self._read_pool_generation:
+                self._read_pool_created -= 1
+        reader.close()
+
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Get a connection for queries that never modify the database."""
+        if self.read_pool_size <= 0:
+            with self._write_connection() as conn:
+                yield conn
+            return
+
+        reader, generation = self._acquire_read_connection()
+        broken = False
+        try:
+            yield reader
+        except sqlite3.DatabaseError:
+            # Drop this reader only; the writer and other readers are unaffected
+            broken = True
+            raise
+        finally:
+            self._release_read_connection(reader, generation, broken)
+
     def health_check(self) -> bool:
         """Check if the symbol storage is accessible and functional."""
         try:
-            conn = self._get_connection()
-            # Simple query to verify database is accessible
-            conn.execute("SELECT 1").fetchone()
+            with self._read_connection() as conn:
+                # Simple query to verify database is accessible
+                conn.execute("SELECT 1").fetchone()
             return True
         except Exception:
             return False
 
-    def _execute_with_retry(self, operation_name: str, operation_func, *args, **kwargs):
+    def _execute_with_retry(
+        self,
+        operation_name: str,
+        operation_func,
+        *args,
+        read_only: bool = False,
+        **kwargs,
+    ):
         """Execute a database operation with retry logic."""
         for attempt in range(self.max_retries + 1):
             try:
@@ -289,8 +453,10 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
                         f"{operation_name} attempt {attempt + 1} failed: {e}. Retrying in {self.retry_delay}s..."
                     )
                     time.sleep(self.retry_delay)
-                    # Reset connection on database errors
-                    self._connection = None
+                    # Reset connection on database errors. Pooled readers discard
+                    # their own broken connection, so reads leave the writer alone.
+                    if not (read_only and self.read_pool_size > 0):
+                        self._connection = None
                 else:
                     logger.error(
                         f"{operation_name} failed after {self.max_retries + 1} attempts: {e}"
@@ -330,8 +496,7 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
     def create_schema(self) -> None:
         """Create the database schema for symbol storage."""
 
-        def _create_schema():
-            conn = self._get_connection()
+        def _create_tables(conn: sqlite3.Connection) -> None:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS symbols (
@@ -350,40 +515,10 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
             )
 
             # Create indexes for common query patterns
-            conn.execute(
-                """
-            CREATE INDEX IF NOT EXISTS idx_symbols_name
-            ON symbols(name)
-            """
-            )
-
-            conn.execute(
-                """
-            CREATE INDEX IF NOT EXISTS idx_symbols_repository_id
-            ON symbols(repository_id)
-            """
-            )
-
-            conn.execute(
-                """
-            CREATE INDEX IF NOT EXISTS idx_symbols_kind
-            ON symbols(kind)
-            """
-            )
-
-            conn.execute(
-                """
-            CREATE INDEX IF NOT EXISTS idx_symbols_file_path
-            ON symbols(file_path, repository_id)
-            """
-            )
-
-            conn.execute(
-                """
-            CREATE INDEX IF NOT EXISTS idx_symbols_name_repo
-            ON symbols(name, repository_id)
-            """
-            )
+            for index_name, index_columns in SYMBOL_INDEXES.items():
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON symbols{index_columns}"
+                )
 
             # Create comment replies table
             conn.execute(
@@ -418,6 +553,10 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
             conn.commit()
             logger.info(f"Created symbol storage schema in {self.db_path}")
 
+        def _create_schema():
+            with self._write_lock:
+                _create_tables(self._get_connection())
+
         try:
             self._execute_with_retry("Schema creation", _create_schema)
         except sqlite3.DatabaseError as e:
@@ -431,7 +570,7 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
         """Insert a symbol into the database."""
 
         def _insert_symbol():
-            with self._get_connection() as conn:
+            with self._write_connection() as conn:
                 conn.execute(
                     """
                     INSERT INTO symbols (name, kind, file_path, line_number,
@@ -466,7 +605,7 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
 
             def _insert_batch(batch_symbols=batch):
                 nonlocal total_inserted
-                with self._get_connection() as conn:
+                with self._write_connection() as conn:
                     data = [
                         (
                             s.name,
@@ -507,7 +646,7 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
 
     def update_symbol(self, symbol: Symbol) -> None:
         """Update an existing symbol in the database."""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             conn.execute(
                 """
                 UPDATE symbols
@@ -533,13 +672,13 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
 
     def delete_symbol(self, symbol_id: int) -> None:
         """Delete a symbol from the database."""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             conn.execute("DELETE FROM symbols WHERE id = ?", (symbol_id,))
             conn.commit()
 
     def delete_symbols_by_repository(self, repository_id: str) -> None:
         """Delete all symbols for a specific repository."""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             result = conn.execute(
                 "DELETE FROM symbols WHERE repository_id = ?", (repository_id,)
             )
@@ -548,6 +687,107 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
                 f"Deleted {result.rowcount} symbols for repository {repository_id}"
             )
 
+    @contextmanager
+    def rebuild_repository(self, repository_id: str) -> Iterator[SymbolSink]:
+        """Bulk-load a repository's symbols and swap them in atomically.
+
+        Batches are written to an unindexed TEMP staging table on a dedicated
+        connection, so loading never takes the database write lock. When the
+        block exits, one transaction deletes the old rows and copies the staged
+        rows in; for large loads the secondary indexes are dropped first and
+        rebuilt once afterwards. WAL readers keep seeing the previous symbols
+        until that transaction commits. If the block raises, the staging data
+        is discarded and the existing symbols are left untouched.
+        """
+        if str(self.db_path) == ":memory:":
+            # A second connection would open a different in-memory database
+            with super().rebuild_repository(repository_id) as insert_symbols:
+                yield insert_symbols
+            return
+
+        conn = self._create_connection()
+        staged_count = 0
+        try:
+            conn.execute(f"PRAGMA cache_size = -{BULK_STAGING_CACHE_SIZE_KIB}")
+            conn.execute(
+                """
+                CREATE TEMP TABLE symbols_staging (
+                    name TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    line_number INTEGER NOT NULL,
+                    column_number INTEGER NOT NULL,
+                    repository_id TEXT NOT NULL,
+                    docstring TEXT
+                )
+                """
+            )
+
+            def _stage(symbols: list[Symbol]) -> None:
+                nonlocal staged_count
+                conn.executemany(
+                    f"INSERT INTO temp.symbols_staging ({SYMBOL_INSERT_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            s.name,
+                            s.kind.value,
+                            s.file_path,
+                            s.line_number,
+                            s.column_number,
+                            repository_id,
+                            s.docstring,
+                        )
+                        for s in symbols
+                    ],
+                )
+                # Temp tables are private and not fsynced; committing keeps the
+                # connection free to open the swap transaction later
+                conn.commit()
+                staged_count += len(symbols)
+
+            yield _stage
+            self._swap_staged_symbols(conn, repository_id, staged_count)
+        finally:
+            conn.close()
+
+    def _swap_staged_symbols(
+        self, conn: sqlite3.Connection, repository_id: str, staged_count: int
+    ) -> None:
+        """Replace a repository's rows with the staged rows in one transaction."""
+        start = time.perf_counter()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            total_rows = conn.execute("SELECT COUNT(*) FROM symbols").fetchone()[0]
+            rebuild_indexes = staged_count >= BULK_INDEX_REBUILD_RATIO * total_rows
+            if rebuild_indexes:
+                for index_name in SYMBOL_INDEXES:
+                    conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+            deleted = conn.execute(
+                "DELETE FROM symbols WHERE repository_id = ?", (repository_id,)
+            ).rowcount
+            # Sorted inserts keep index pages local when indexes stay live
+            conn.execute(
+                f"INSERT INTO symbols ({SYMBOL_INSERT_COLUMNS}) "
+                f"SELECT {SYMBOL_INSERT_COLUMNS} FROM temp.symbols_staging "
+                "ORDER BY name"
+            )
+
+            if rebuild_indexes:
+                for index_name, index_columns in SYMBOL_INDEXES.items():
+                    conn.execute(f"CREATE INDEX {index_name} ON symbols{index_columns}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        logger.info(
+            f"Swapped in {staged_count} symbols for repository {repository_id} "
+            f"(replaced {deleted}, indexes rebuilt: {rebuild_indexes}) "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
     def search_symbols(
         self,
         repository_id: str,
@@ -570,7 +810,7 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
             raise ValueError("repository_id is required for symbol search")
 
         def _search_symbols():
-            with self._get_connection() as conn:
+            with self._read_connection() as conn:
                 sql = "SELECT * FROM symbols WHERE repository_id = ? AND name LIKE ?"
                 params: list[Any] = [repository_id, f"%{query}%"]
 
@@ -604,11 +844,13 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
                     for row in rows
                 ]
 
-        return self._execute_with_retry("Search symbols", _search_symbols)
+        return self._execute_with_retry(
+            "Search symbols", _search_symbols, read_only=True
+        )
 
     def get_symbol_by_id(self, symbol_id: int) -> Symbol | None:
         """Get a specific symbol by its ID."""
-        with self._get_connection() as conn:
+        with self._read_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM symbols WHERE id = ?", (symbol_id,)
             ).fetchone()
@@ -628,7 +870,7 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
 
     def get_symbols_by_file(self, file_path: str, repository_id: str) -> list[Symbol]:
         """Get all symbols from a specific file."""
-        with self._get_connection() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM symbols
@@ -655,7 +897,7 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
         """Mark comment as replied using existing retry mechanism."""
 
         def _mark_replied():
-            with self._get_connection() as conn:
+            with self._write_connection() as conn:
                 conn.execute(
                     """INSERT OR REPLACE INTO comment_replies
                        (comment_id, pr_number, repository_id, replied_at)
@@ -675,7 +917,7 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
         """Check if comment is replied using existing retry mechanism."""
 
         def _check_replied():
-            with self._get_connection() as conn:
+            with self._read_connection() as conn:
                 cursor = conn.execute(
                     "SELECT 1 FROM comment_replies WHERE comment_id = ? AND pr_number = ?",
                     (comment_id, pr_number),
@@ -683,13 +925,15 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
                 result = cursor.fetchone()
                 return result is not None
 
-        return self._execute_with_retry("is_comment_replied", _check_replied)
+        return self._execute_with_retry(
+            "is_comment_replied", _check_replied, read_only=True
+        )
 
     def get_replied_comment_ids(self, pr_number: int) -> set[int]:
         """Get all replied comment IDs for a PR using existing retry mechanism."""
 
         def _get_replied_ids():
-            with self._get_connection() as conn:
+            with self._read_connection() as conn:
                 cursor = conn.execute(
                     "SELECT comment_id FROM comment_replies WHERE pr_number = ?",
                     (pr_number,),
@@ -697,13 +941,15 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
                 rows = cursor.fetchall()
                 return {row[0] for row in rows}
 
-        return self._execute_with_retry("get_replied_comment_ids", _get_replied_ids)
+        return self._execute_with_retry(
+            "get_replied_comment_ids", _get_replied_ids, read_only=True
+        )
 
     def cleanup_old_comment_replies(self, days_old: int = 30) -> int:
         """Clean up old comment reply records."""
 
         def _cleanup_old_replies():
-            with self._get_connection() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.execute(
                     """DELETE FROM comment_replies
                        WHERE julianday('now') - julianday(replied_at) > ?""",
@@ -720,11 +966,15 @@ class SQLiteSymbolStorage(AbstractSymbolStorage):
 class ProductionSymbolStorage(SQLiteSymbolStorage):
     """Production symbol storage that uses standard data directory and database name."""
 
-    def __init__(self):
-        """Initialize with standard production database path."""
+    def __init__(self, read_pool_size: int = 0):
+        """Initialize with standard production database path.
+
+        Args:
+            read_pool_size: Number of dedicated read-only connections (0 disables)
+        """
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         db_path = DATA_DIR / "symbols.db"
-        super().__init__(str(db_path))
+        super().__init__(str(db_path), read_pool_size=read_pool_size)
 
     @classmethod
     def create_with_schema(cls) -> "ProductionSymbolStorage":
@@ -737,3 +987,123 @@ class ProductionSymbolStorage(SQLiteSymbolStorage):
         storage = cls()
         storage.create_schema()
         return storage
+
+
+_storage_executor: ThreadPoolExecutor | None = None
+_storage_executor_lock = threading.Lock()
+
+
+def get_storage_executor() -> ThreadPoolExecutor:
+    """Get the process-wide thread pool used for blocking storage calls."""
+    global _storage_executor
+    with _storage_executor_lock:
+        if _storage_executor is None:
+            # One thread per pooled reader plus one for the writer
+            _storage_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_READ_POOL_SIZE + 1,
+                thread_name_prefix="symbol-storage",
+            )
+        return _storage_executor
+
+
+class AsyncSymbolStorage:
+    """Awaitable facade over an AbstractSymbolStorage.
+
+    Every call runs on a thread pool so that slow queries, lock waits and WAL
+    checkpoints never block the event loop. Method names, arguments and return
+    values mirror AbstractSymbolStorage.
+    """
+
+    def __init__(
+        self,
+        storage: AbstractSymbolStorage,
+        executor: ThreadPoolExecutor | None = None,
+    ):
+        """Initialize the facade.
+
+        Args:
+            storage: Synchronous storage that performs the actual work
+            executor: Thread pool to run calls on (defaults to a shared pool)
+        """
+        self.storage = storage
+        self._executor = executor
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking storage call on the executor."""
+        loop = asyncio.get_running_loop()
+        executor = self._executor or get_storage_executor()
+        return await loop.run_in_executor(
+            executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def create_schema(self) -> None:
+        """Create the database schema for symbol storage."""
+        await self._run(self.storage.create_schema)
+
+    async def insert_symbol(self, symbol: Symbol) -> None:
+        """Insert a symbol into the database."""
+        await self._run(self.storage.insert_symbol, symbol)
+
+    async def insert_symbols(self, symbols: list[Symbol]) -> None:
+        """Insert multiple symbols into the database."""
+        await self._run(self.storage.insert_symbols, symbols)
+
+    async def update_symbol(self, symbol: Symbol) -> None:
+        """Update an existing symbol in the database."""
+        await self._run(self.storage.update_symbol, symbol)
+
+    async def delete_symbol(self, symbol_id: int) -> None:
+        """Delete a symbol from the database."""
+        await self._run(self.storage.delete_symbol, symbol_id)
+
+    async def delete_symbols_by_repository(self, repository_id: str) -> None:
+        """Delete all symbols for a specific repository."""
+        await self._run(self.storage.delete_symbols_by_repository, repository_id)
+
+    async def search_symbols(
+        self,
+        repository_id: str,
+        query: str,
+        symbol_kind: str | None = None,
+        limit: int = 50,
+    ) -> list[Symbol]:
+        """Search for symbols by name."""
+        return await self._run(
+            self.storage.search_symbols,
+            repository_id=repository_id,
+            query=query,
+            symbol_kind=symbol_kind,
+            limit=limit,
+        )
+
+    async def get_symbol_by_id(self, symbol_id: int) -> Symbol | None:
+        """Get a specific symbol by its ID."""
+        return await self._run(self.storage.get_symbol_by_id, symbol_id)
+
+    async def get_symbols_by_file(
+        self, file_path: str, repository_id: str
+    ) -> list[Symbol]:
+        """Get all symbols from a specific file."""
+        return await self._run(
+            self.storage.get_symbols_by_file, file_path, repository_id
+        )
+
+    async def health_check(self) -> bool:
+        """Check if the symbol storage is accessible and functional."""
+        return await self._run(self.storage.health_check)
+
+    async def mark_comment_replied(self, comment_reply: CommentReply) -> None:
+        """Mark a comment as replied."""
+        await self._run(self.storage.mark_comment_replied, comment_reply)
+
+    async def is_comment_replied(self, comment_id: int, pr_number: int) -> bool:
+        """Check if a comment has been replied to."""
+        return await self._run(self.storage.is_comment_replied, comment_id, pr_number)
+
+    async def get_replied_comment_ids(self, pr_number: int) -> set[int]:
+        """Get all replied comment IDs for a PR."""
+        return await self._run(self.storage.get_replied_comment_ids, pr_number)
+
+    async def cleanup_old_comment_replies(self, days_old: int = 30) -> int:
+        """Clean up old comment reply records."""
+        return await self._run(self.storage.cleanup_old_comment_replies, days_old)
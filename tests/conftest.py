@@ -3,9 +3,13 @@ Pytest configuration and shared fixtures for shutdown system tests.
 """
 
 import socket
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from mcp_master import MCPMaster, WorkerProcess
+
 # async_lsp_client imports removed - using SimpleLSPClient directly
 from symbol_storage import (
     SQLiteSymbolStorage,
@@ -42,9 +46,62 @@ def find_free_port(start_port: int = 8081, max_attempts: int = 100) -> int:
     )
 
 
+@pytest.fixture
+def free_port() -> Callable[[], int]:
+    """
+    Return a factory for unused ports on 127.0.0.1.
+
+    Unlike find_free_port, every call asks the OS for an ephemeral port, so a
+    test that needs several ports does not get the same one twice before the
+    first is bound.
+    """
+
+    def allocate() -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    return allocate
+
+
+@pytest.fixture
+def make_master() -> Callable[..., MCPMaster]:
+    """
+    Return a factory for a running MCPMaster with mocked collaborators.
+
+    The factory takes the workers dict and any extra MCPMaster keyword
+    arguments, such as gateway_port or unix_sockets.
+    """
+
+    def create(workers: dict[str, WorkerProcess] | None = None, **kwargs) -> MCPMaster:
+        shutdown_coordinator = MagicMock()
+        shutdown_coordinator.is_shutting_down.return_value = False
+        master = MCPMaster(
+            repository_manager=MagicMock(),
+            workers={} if workers is None else workers,
+            startup_orchestrator=MagicMock(),
+            symbol_storage=MagicMock(),
+            codebase_tools=MagicMock(),
+            shutdown_coordinator=shutdown_coordinator,
+            health_monitor=MagicMock(),
+            **kwargs,
+        )
+        master.running = True
+        master.transport = MagicMock(discard=AsyncMock())
+        return master
+
+    return create
+
+
 # All fixtures have been moved to tests/fixtures.py
 
 
+@pytest.fixture(autouse=True)
+def temporary_lsp_cache(monkeypatch, tmp_path):
+    """Keep LSP clients from writing Jedi caches to the real LSP_CACHE_DIR."""
+    monkeypatch.setattr("pylsp_manager.LSP_CACHE_DIR", tmp_path / "lsp_cache")
+
+
 # Custom assertions for shutdown testing
 def assert_clean_shutdown(shutdown_result, exit_code_manager, expected_exit_code=None):
     """Assert that a shutdown completed cleanly."""
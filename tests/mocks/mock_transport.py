@@ -10,7 +10,7 @@ class MockTransport:
         self.should_fail = should_fail
         self.sent_data: list[bytes] = []
         self.closed = False
-        self.write_delay = 0  # Simulate slow writes
+        self.write_delay = 0.0  # Simulate slow writes
 
     def write(self, data: bytes) -> None:
         """Mock write method"""
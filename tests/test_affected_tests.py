@@ -0,0 +1,273 @@
+"""
+Tests for test impact analysis and incremental test runs.
+"""
+
+import asyncio
+import sqlite3
+import subprocess
+
+import pytest
+
+from affected_tests import (
+    TestImpactAnalyzer,
+    TestImpactRunner,
+    TestTimings,
+    changed_files,
+    plan_shards,
+)
+
+FILES = {
+    "pyproject.toml": '[tool.pytest.ini_options]\ntestpaths = ["tests"]\n',
+    "pkg/__init__.py": "",
+    "pkg/util.py": "def double(x):\n    return 2 * x\n",
+    "pkg/core.py": "from .util import double\n\n\ndef quad(x):\n    return double(double(x))\n",
+    "other.py": "VALUE = 1\n",
+    "loader.py": "DATA = 'data'\n",
+    "tests/conftest.py": "",
+    "tests/test_core.py": "from pkg.core import quad\n\n\ndef test_quad():\n    assert quad(1) == 4\n",
+    "tests/test_util.py": "from pkg import util\n\n\ndef test_double():\n    assert util.double(2) == 4\n",
+    "tests/test_other.py": "import other\n\n\ndef test_value():\n    assert other.VALUE == 1\n",
+    "scripts/test_manual.py": "import other\n",
+}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    for name, content in FILES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+def select(repo, changed):
+    return TestImpactAnalyzer(repo).select(changed)
+
+
+def collect_test_files(repo):
+    analyzer = TestImpactAnalyzer(repo)
+    analyzer.graph.refresh()
+    return analyzer.test_files()
+
+
+class TestSelection:
+    """Test which tests a change selects."""
+
+    def test_dependents_through_import_graph(self, repo):
+        """Test direct and indirect importers of a changed module are affected."""
+        selection = select(repo, ["pkg/util.py"])
+
+        assert selection.affected == ["tests/test_core.py", "tests/test_util.py"]
+        assert selection.remaining == ["tests/test_other.py"]
+
+    def test_changed_test_file_selected(self, repo):
+        """Test a changed test file selects itself and nothing else."""
+        selection = select(repo, ["tests/test_other.py", "README.md"])
+
+        assert selection.affected == ["tests/test_other.py"]
+
+    def test_everything_affected_when_changes_unknown(self, repo):
+        """Test unknown changes and suite configuration changes select all tests."""
+        all_tests = ["tests/test_core.py", "tests/test_other.py", "tests/test_util.py"]
+
+        assert select(repo, None).affected == all_tests
+        assert select(repo, ["pyproject.toml"]).affected == all_tests
+        assert select(repo, ["tests/conftest.py"]).affected == all_tests
+
+    def test_deleted_module_selects_former_importers(self, repo):
+        """Test deleting a module selects the tests that imported it."""
+        (repo / "other.py").unlink()
+
+        assert select(repo, ["other.py"]).affected == ["tests/test_other.py"]
+
+    def test_modified_imports_picked_up(self, repo):
+        """Test the shared graph re-parses files whose imports changed."""
+        analyzer = TestImpactAnalyzer(repo)
+        assert analyzer.select(["other.py"]).affected == ["tests/test_other.py"]
+
+        (repo / "tests/test_core.py").write_text("import other\nimport pkg.core\n")
+        assert analyzer.select(["other.py"]).affected == [
+            "tests/test_core.py",
+            "tests/test_other.py",
+        ]
+
+    def test_coverage_contexts_add_tests(self, repo):
+        """Test per-test coverage selects tests that reach a file without importing it."""
+        with sqlite3.connect(repo / ".coverage") as db:
+            db.executescript(
+                """
+                CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT);
+                CREATE TABLE context (id INTEGER PRIMARY KEY, context TEXT);
+                CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER,
+                                        numbits BLOB);
+                """
+            )
+            db.execute("INSERT INTO file VALUES (1, ?)", (str(repo / "loader.py"),))
+            db.execute(
+                "INSERT INTO context VALUES (1, 'tests/test_other.py::test_value|run')"
+            )
+            db.execute("INSERT INTO line_bits VALUES (1, 1, x'01')")
+        db.close()
+
+        assert select(repo, ["loader.py"]).affected == ["tests/test_other.py"]
+
+    def test_pytest_ini_takes_precedence_over_pyproject(self, repo):
+        """Test testpaths come from the config file pytest itself would use."""
+        (repo / "pytest.ini").write_text("[pytest]\naddopts = -q\n")
+
+        # pytest.ini has no testpaths, so pyproject's are ignored
+        assert "scripts/test_manual.py" in collect_test_files(repo)
+
+        (repo / "pytest.ini").write_text("[pytest]\ntestpaths = scripts\n")
+
+        assert collect_test_files(repo) == ["scripts/test_manual.py"]
+
+    def test_tox_ini_before_setup_cfg(self, repo):
+        """Test tox.ini is read before setup.cfg when pyproject has no options."""
+        (repo / "pyproject.toml").write_text("[project]\nname = 'repo'\n")
+        (repo / "setup.cfg").write_text("[tool:pytest]\ntestpaths = tests\n")
+        (repo / "tox.ini").write_text("[pytest]\ntestpaths = scripts\n")
+
+        assert collect_test_files(repo) == ["scripts/test_manual.py"]
+
+
+class TestScheduling:
+    """Test splitting runs across processes by saved timings."""
+
+    def test_shards_balanced_by_duration(self, tmp_path):
+        """Test the slowest files are spread over the shards."""
+        timings = TestTimings(tmp_path / "timings.json")
+        timings.update(
+            {
+                "tests/test_a.py::test_one": 5.0,
+                "tests/test_a.py::test_two": 5.0,
+                "tests/test_b.py::test_one": 6.0,
+                "tests/test_c.py::test_one": 3.0,
+                "tests/test_d.py::test_one": 2.0,
+            }
+        )
+
+        shards = plan_shards(
+            [
+                "tests/test_a.py",
+                "tests/test_b.py",
+                "tests/test_c.py",
+                "tests/test_d.py",
+            ],
+            2,
+            timings,
+        )
+
+        assert shards == [
+            ["tests/test_a.py"],
+            ["tests/test_b.py", "tests/test_c.py", "tests/test_d.py"],
+        ]
+        assert TestTimings(tmp_path / "timings.json").file_duration(
+            "tests/test_a.py"
+        ) == pytest.approx(10.0)
+
+
+class TestRunner:
+    """Test incremental runs of a real test suite."""
+
+    @pytest.fixture(autouse=True)
+    def fast_pytest(self, monkeypatch):
+        """Skip loading installed plugins in the pytest processes under test."""
+        monkeypatch.setenv("PYTEST_DISABLE_PLUGIN_AUTOLOAD", "1")
+
+    def test_affected_tests_run_first(self, repo):
+        """Test the rest runs after affected tests pass."""
+        runner = TestImpactRunner(repo, workers=2, pytest_args=("-q",))
+
+        selection, affected, remaining = asyncio.run(
+            runner.run_affected_first(["pkg/util.py"])
+        )
+
+        assert affected.passed
+        assert affected.test_files == selection.affected
+        assert remaining is not None and remaining.passed
+        assert remaining.test_files == ["tests/test_other.py"]
+        assert set(runner.timings.tests) == {
+            "tests/test_core.py::test_quad",
+            "tests/test_util.py::test_double",
+            "tests/test_other.py::test_value",
+        }
+        assert (repo / ".pytest_cache" / "test_timings.json").exists()
+
+    def test_failing_affected_tests_skip_the_rest(self, repo):
+        """Test affected failures are reported without running the rest."""
+        (repo / "pkg/util.py").write_text("def double(x):\n    return x\n")
+        runner = TestImpactRunner(repo, pytest_args=("-q",))
+
+        _, affected, remaining = asyncio.run(runner.run_affected_first(["pkg/util.py"]))
+
+        assert not affected.passed
+        assert remaining is None
+        assert sorted(group.tests for group in affected.failures) == [
+            ["tests/test_core.py::test_quad"],
+            ["tests/test_util.py::test_double"],
+        ]
+        assert any("assert 1 == 4" in group.traceback for group in affected.failures)
+
+    def test_parallel_processes_use_their_own_coverage_file(self, repo):
+        """Test parallel processes never write the repository's .coverage."""
+        for name in ("test_core.py", "test_util.py"):
+            (repo / "tests" / name).write_text(
+                "import os\n\n\n"
+                "def test_coverage_file():\n"
+                "    print('COVERAGE_FILE=' + os.environ['COVERAGE_FILE'])\n"
+            )
+        runner = TestImpactRunner(repo, workers=2, pytest_args=("-q", "-s"))
+
+        result = asyncio.run(runner.run(["tests/test_core.py", "tests/test_util.py"]))
+
+        assert result.passed
+        coverage_files = {
+            line.split("=", 1)[1]
+            for line in result.stdout.splitlines()
+            if line.startswith("COVERAGE_FILE=")
+        }
+        assert len(coverage_files) == 2
+        assert all(not path.startswith(str(repo)) for path in coverage_files)
+
+    def test_parallel_coverage_combined_into_repository(self, repo):
+        """Test per-test coverage from parallel processes is kept for selection."""
+        runner = TestImpactRunner(
+            repo,
+            workers=2,
+            pytest_args=("-q", "-p", "pytest_cov", "--cov=pkg", "--cov-context=test"),
+        )
+
+        result = asyncio.run(runner.run(["tests/test_core.py", "tests/test_util.py"]))
+
+        assert result.passed
+        assert runner.analyzer.coverage_tests()["pkg/util.py"] == {
+            "tests/test_core.py",
+            "tests/test_util.py",
+        }
+
+
+def test_changed_files_from_git(repo):
+    """Test modified and untracked files are reported as changed."""
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+    git("init")
+    git("add", ".")
+    git(
+        "-c",
+        "user.name=test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "-m",
+        "init",
+    )
+    (repo / "other.py").write_text("VALUE = 2\n")
+    (repo / "new.py").write_text("")
+
+    changed = asyncio.run(changed_files(repo))
+    assert changed is not None
+    assert sorted(changed) == ["new.py", "other.py"]
+    assert asyncio.run(changed_files(repo / "pkg" / "missing")) is None
@@ -18,6 +18,7 @@ from client_manager import (
     ClientState,
     DisconnectionReason,
     MCPClient,
+    SlowClientPolicy,
 )
 from tests.mocks import MockTransport
 
@@ -527,6 +528,94 @@ class TestGracefulShutdown(unittest.TestCase):
         self.assertTrue(self.manager._closed)
 
 
+class TestBroadcastDelivery(unittest.IsolatedAsyncioTestCase):
+    """Test concurrent broadcast through per-client send queues"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.logger = logging.getLogger(f"test_broadcast_{int(time.time() * 1000000)}")
+        self.fast = MockTransport()
+        self.slow = MockTransport()
+        self.slow.write_delay = 10
+
+    def make_manager(self, **kwargs) -> ClientConnectionManager:
+        manager = ClientConnectionManager(
+            self.logger, send_queue_size=1, send_timeout=1.0, **kwargs
+        )
+        manager.add_client("fast", self.fast)
+        manager.add_client("slow", self.slow)
+        return manager
+
+    async def test_slow_client_does_not_delay_others(self):
+        """Test a broadcast waits for slow clients at most the timeout"""
+        manager = self.make_manager()
+
+        start = time.perf_counter()
+        results = await manager.broadcast_notification("test", {}, timeout=0.05)
+
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(results, {"fast": True, "slow": False})
+        self.assertEqual(len(self.fast.sent_data), 1)
+        delivery = manager.get_status()["delivery"]
+        self.assertEqual(delivery["delivered"], 1)
+        self.assertEqual(delivery["timed_out"], 1)
+        self.assertEqual(delivery["latency_seconds"]["count"], 1)
+
+    async def test_late_delivery_counted_once(self):
+        """Test a delivery that completes after the timeout stays timed out"""
+        self.slow.write_delay = 0.05
+        manager = self.make_manager()
+
+        results = await manager.broadcast_notification("test", {}, timeout=0.01)
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(results, {"fast": True, "slow": False})
+        self.assertEqual(len(self.slow.sent_data), 1)
+        delivery = manager.get_status()["delivery"]
+        self.assertEqual(delivery["delivered"], 1)
+        self.assertEqual(delivery["timed_out"], 1)
+        self.assertEqual(delivery["failed"], 0)
+
+    async def test_send_timeout(self):
+        """Test a write that exceeds the send timeout counts as failed"""
+        client = MCPClient("slow", self.slow, self.logger, send_timeout=0.01)
+
+        self.assertFalse(await client.send_notification("test", {}))
+        self.assertEqual(client.info.error_count, 1)
+
+    async def test_full_queue_drops(self):
+        """Test notifications are dropped once a slow client's queue is full"""
+        manager = self.make_manager()
+
+        # The first notification is being written, the second waits in the
+        # queue and the third has nowhere to go
+        for _ in range(3):
+            results = await manager.broadcast_notification("test", {}, timeout=0.01)
+
+        self.assertEqual(results, {"fast": True, "slow": False})
+        slow_client = manager.get_client("slow")
+        assert slow_client is not None
+        self.assertEqual(slow_client.info.dropped_messages, 1)
+        status = manager.get_status()
+        self.assertEqual(status["delivery"]["dropped"], 1)
+        self.assertEqual(status["delivery"]["slow_client_policy"], "drop")
+        self.assertEqual(status["statistics"]["total_queued_messages"], 1)
+
+    async def test_full_queue_disconnects(self):
+        """Test the disconnect policy removes clients that cannot keep up"""
+        manager = self.make_manager(slow_client_policy=SlowClientPolicy.DISCONNECT)
+
+        for _ in range(3):
+            await manager.broadcast_notification("test", {}, timeout=0.01)
+
+        self.assertIsNone(manager.get_client("slow"))
+        self.assertTrue(self.slow.closed)
+        self.assertEqual(manager.get_status()["delivery"]["slow_disconnects"], 1)
+        self.assertEqual(
+            await manager.broadcast_notification("test", {}), {"fast": True}
+        )
+
+
 async def run_async_tests():
     """Run async tests manually"""
     print("Running async tests:")
@@ -15,6 +15,7 @@ from unittest.mock import Mock, patch
 from python_symbol_extractor import PythonSymbolExtractor
 from repository_indexer import PythonRepositoryIndexer
 from symbol_storage import SQLiteSymbolStorage, Symbol, SymbolKind
+from tests.mocks import MockSymbolStorage
 
 
 class TestDatabaseErrorHandling(unittest.TestCase):
@@ -259,7 +260,7 @@ class TestRepositoryIndexerErrorHandling(unittest.TestCase):
         self.temp_repo.mkdir()
 
         # Create mock storage and extractor
-        self.mock_storage = Mock()
+        self.mock_storage = MockSymbolStorage()
         self.mock_extractor = Mock()
 
         self.indexer = PythonRepositoryIndexer(
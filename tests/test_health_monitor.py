@@ -3,12 +3,14 @@ Tests for health monitoring functionality.
 """
 
 import json
+import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 from health_monitor import (
+    HealthMonitor,
     HealthReport,
     ServerStatus,
     ShutdownPhase,
@@ -372,6 +374,60 @@ class TestHealthMonitor:
 
         monitor.start_monitoring()
 
+    def test_only_state_changes_mark_changed(self, monitor):
+        """Test activity and repeated values do not trigger a file write."""
+        monitor.update_worker_status("w1", 100, 8080, "running")
+        monitor._changed.clear()
+
+        monitor.update_worker_status("w1", 100, 8080, "running")
+        monitor.set_server_status(ServerStatus.STARTING)
+        monitor.add_client("c1", "w1")
+        monitor._changed.clear()
+        monitor.update_client_activity("c1")
+        assert not monitor._changed.is_set()
+
+        monitor.update_worker_status("w1", 100, 8080, "stopping")
+        assert monitor._changed.is_set()
+
+    def test_monitoring_loop_writes_on_transition(self, test_logger, temp_health_file):
+        """Test the thread rewrites the file on changes, not on a timer."""
+        monitor = HealthMonitor(test_logger, temp_health_file, sample_interval=60)
+
+        def wait_for_writes(count):
+            deadline = time.monotonic() + 5
+            while monitor._health_file_writes < count:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+        with patch.object(monitor, "_update_resource_status"):
+            monitor.start_monitoring()
+            try:
+                wait_for_writes(1)
+                monitor.update_client_activity("c1")
+                time.sleep(0.2)
+                assert monitor._health_file_writes == 1
+
+                monitor.set_server_status(ServerStatus.RUNNING)
+                wait_for_writes(2)
+            finally:
+                monitor.stop_monitoring()
+
+        with open(temp_health_file) as f:
+            assert json.load(f)["server_status"] in ["running", "ServerStatus.RUNNING"]
+
+    def test_render_metrics(self, monitor):
+        """Test the in-memory state is exposed as Prometheus metrics."""
+        monitor.set_server_status(ServerStatus.RUNNING)
+        monitor.update_worker_status("w1", 100, 8080, "running")
+        monitor.add_error("boom")
+
+        rendered = monitor.render_metrics()
+
+        assert 'mcp_server_status{status="running"} 1' in rendered
+        assert 'mcp_server_status{status="starting"} 0' in rendered
+        assert 'mcp_workers{status="running"} 1' in rendered
+        assert "mcp_errors_total 1" in rendered
+
     def test_cleanup_health_file(self, monitor, temp_health_file, test_logger, caplog):
         """Test cleaning up health file."""
         # Create the file
@@ -459,6 +515,35 @@ class TestHealthStatusFunctions:
 
         assert result is False
 
+    def test_is_server_healthy_old_report_live_process(self, tmp_path):
+        """Test an unchanged report stays healthy while its writer is alive."""
+        health_file = tmp_path / "health.json"
+        old_time = datetime.now() - timedelta(hours=1)
+        test_data = {
+            "server_status": "running",
+            "timestamp": old_time.isoformat(),
+            "pid": os.getpid(),
+        }
+
+        with open(health_file, "w") as f:
+            json.dump(test_data, f)
+
+        assert is_server_healthy(str(health_file)) is True
+
+    def test_is_server_healthy_false_dead_process(self, tmp_path):
+        """Test a report from a process that exited is not healthy."""
+        health_file = tmp_path / "health.json"
+        test_data = {
+            "server_status": "running",
+            "timestamp": datetime.now().isoformat(),
+            "pid": 2**22 + 1,
+        }
+
+        with open(health_file, "w") as f:
+            json.dump(test_data, f)
+
+        assert is_server_healthy(str(health_file)) is False
+
     def test_is_server_healthy_false_status(self, tmp_path):
         """Test server healthy check returning false for bad status."""
         health_file = tmp_path / "health.json"
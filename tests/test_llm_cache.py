@@ -0,0 +1,181 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from llm_cache import ResponseCache, cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path / "llm_cache.db", enabled=True)
+    yield cache
+    cache.close()
+
+
+class Model:
+    """Model stand-in counting its calls."""
+
+    def __init__(self, response="answer"):
+        self.response = response
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return self.response
+
+
+class TestCacheKey:
+    """Test what distinguishes cached calls."""
+
+    def test_every_field_is_part_of_the_key(self):
+        """Test backend, model, system prompt, temperature and prompt matter."""
+        base = cache_key("ollama", "prompt", "qwen3:8b", "system", 0.7)
+        assert base == cache_key("ollama", "prompt", "qwen3:8b", "system", 0.7)
+        assert base != cache_key("amp", "prompt", "qwen3:8b", "system", 0.7)
+        assert base != cache_key("ollama", "other", "qwen3:8b", "system", 0.7)
+        assert base != cache_key("ollama", "prompt", "llama3.1", "system", 0.7)
+        assert base != cache_key("ollama", "prompt", "qwen3:8b", None, 0.7)
+        assert base != cache_key("ollama", "prompt", "qwen3:8b", "system", 0.3)
+
+
+class TestResponseCache:
+    """Test lookups, expiry, eviction and statistics."""
+
+    def test_repeated_call_served_from_cache(self, cache):
+        """Test the model is only called once for a repeated prompt."""
+        model = Model()
+
+        assert cache.call("ollama", model, "prompt") == "answer"
+        assert cache.call("ollama", model, "prompt") == "answer"
+
+        assert model.calls == 1
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    def test_cache_persists_across_instances(self, cache, tmp_path):
+        """Test a resumed process sees responses cached by an earlier one."""
+        cache.call("amp", Model("stored"), "prompt", system_prompt="architect")
+        cache.close()
+
+        reopened = ResponseCache(tmp_path / "llm_cache.db", enabled=True)
+        model = Model()
+        assert (
+            reopened.call("amp", model, "prompt", system_prompt="architect") == "stored"
+        )
+        assert model.calls == 0
+        reopened.close()
+
+    def test_opt_out(self, cache, tmp_path):
+        """Test use_cache=False and a disabled cache always call the model."""
+        model = Model()
+        cache.call("ollama", model, "prompt", use_cache=False)
+        cache.call("ollama", model, "prompt", use_cache=False)
+        assert model.calls == 2
+        assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+        disabled = ResponseCache(tmp_path / "disabled.db", enabled=False)
+        disabled.call("ollama", model, "prompt")
+        disabled.call("ollama", model, "prompt")
+        assert model.calls == 4
+        assert not (tmp_path / "disabled.db").exists()
+
+    def test_disabled_by_environment(self, tmp_path, monkeypatch):
+        """Test LLM_CACHE=off disables caching."""
+        monkeypatch.setenv("LLM_CACHE", "off")
+        assert not ResponseCache(tmp_path / "llm_cache.db").enabled
+
+    def test_expired_entries_ignored(self, cache):
+        """Test responses older than the TTL are fetched again."""
+        cache.ttl_seconds = 0
+        model = Model()
+
+        cache.call("ollama", model, "prompt")
+        cache.call("ollama", model, "prompt")
+
+        assert model.calls == 2
+
+    def test_failures_and_empty_responses_not_cached(self, cache):
+        """Test only successful, non-empty responses are stored."""
+
+        def fails() -> str:
+            raise RuntimeError("model unavailable")
+
+        with pytest.raises(RuntimeError):
+            cache.call("ollama", fails, "prompt")
+        cache.call("ollama", Model(""), "prompt")
+
+        model = Model()
+        assert cache.call("ollama", model, "prompt") == "answer"
+        assert model.calls == 1
+
+    def test_least_recently_used_evicted(self, cache):
+        """Test the cache stays under its size limit by evicting old entries."""
+        cache.max_bytes = 25
+        cache.call("ollama", Model("a" * 10), "first")
+        cache.call("ollama", Model("b" * 10), "second")
+        # Touch the first entry so the second is the least recently used
+        cache.call("ollama", Model(), "first")
+        cache.call("ollama", Model("c" * 10), "third")
+
+        model = Model()
+        cache.call("ollama", model, "first")
+        cache.call("ollama", model, "third")
+        assert model.calls == 0
+        cache.call("ollama", model, "second")
+        assert model.calls == 1
+        assert cache.stats()["evictions"] >= 1
+        assert cache.stats()["bytes"] <= 25
+
+    def test_async_call(self, cache):
+        """Test awaitable model calls are cached too."""
+        calls = []
+
+        async def ask() -> str:
+            calls.append(True)
+            return "async answer"
+
+        async def run():
+            first = await cache.call_async("amp", ask, "prompt")
+            second = await cache.call_async("amp", ask, "prompt")
+            return first, second
+
+        assert asyncio.run(run()) == ("async answer", "async answer")
+        assert len(calls) == 1
+
+    def test_async_call_keeps_sqlite_off_the_event_loop(self, cache):
+        """Test async lookups and stores run outside the event loop thread."""
+        threads = []
+        get, put = cache.get, cache.put
+
+        def record_get(key):
+            threads.append(threading.get_ident())
+            return get(key)
+
+        def record_put(*args):
+            threads.append(threading.get_ident())
+            return put(*args)
+
+        async def ask() -> str:
+            return "async answer"
+
+        async def run():
+            await cache.call_async("amp", ask, "prompt")
+            return threading.get_ident()
+
+        with (
+            patch.object(cache, "get", side_effect=record_get),
+            patch.object(cache, "put", side_effect=record_put),
+        ):
+            loop_thread = asyncio.run(run())
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
@@ -2,8 +2,10 @@
 Unit tests for LSP JSON-RPC protocol implementation.
 """
 
+import asyncio
 import json
 import logging
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -15,6 +17,9 @@ from lsp_jsonrpc import (
     JSONRPCProtocol,
     JSONRPCRequest,
     JSONRPCResponse,
+    LSPFrameDecoder,
+    LSPStreamReader,
+    encode_lsp_message,
 )
 
 
@@ -405,3 +410,133 @@ class TestJSONRPCError:
         assert error.code == LSPErrorCode.INVALID_REQUEST
         assert error.message == "Invalid request"
         assert error.data is None
+
+
+class TestLSPFrameDecoder:
+    """Test incremental LSP frame decoding."""
+
+    def test_encode_uses_byte_length(self):
+        """Test Content-Length counts encoded bytes, not characters."""
+        message = {"jsonrpc": "2.0", "method": "test", "params": {"name": "héllo"}}
+        encoded = encode_lsp_message(message)
+
+        header, body = encoded.split(b"\r\n\r\n", 1)
+        assert header == f"Content-Length: {len(body)}".encode()
+        assert json.loads(body) == message
+
+    def test_decode_single_message(self):
+        """Test decoding one complete frame."""
+        message = {"jsonrpc": "2.0", "id": 1, "result": [1, 2, 3]}
+        decoder = LSPFrameDecoder()
+
+        assert decoder.decode(encode_lsp_message(message)) == [message]
+        assert decoder.buffered_bytes == 0
+
+    def test_decode_multiple_messages_in_one_chunk(self):
+        """Test several frames delivered in a single read."""
+        messages: list[dict[str, Any]] = [
+            {"jsonrpc": "2.0", "method": "window/logMessage", "params": {"x": 1}},
+            {"jsonrpc": "2.0", "id": 2, "result": None},
+        ]
+        data = b"".join(encode_lsp_message(m) for m in messages)
+
+        assert LSPFrameDecoder().decode(data) == messages
+
+    def test_decode_byte_at_a_time(self):
+        """Test frames split at every possible boundary."""
+        message = {"jsonrpc": "2.0", "id": 3, "result": {"uri": "file:///ü.py"}}
+        data = encode_lsp_message(message) * 2
+        decoder = LSPFrameDecoder()
+
+        decoded = []
+        for i in range(len(data)):
+            decoded.extend(decoder.decode(data[i : i + 1]))
+
+        assert decoded == [message, message]
+        assert decoder.buffered_bytes == 0
+
+    def test_next_frame_returns_headers(self):
+        """Test headers are returned alongside the decoded message."""
+        body = b'{"jsonrpc":"2.0","id":1,"result":true}'
+        decoder = LSPFrameDecoder()
+        decoder.feed(
+            b"Content-Length: %d\r\nContent-Type: application/json\r\n\r\n" % len(body)
+            + body
+        )
+
+        frame = decoder.next_frame()
+
+        assert frame is not None
+        headers, message = frame
+        assert headers["Content-Type"] == "application/json"
+        assert message["result"] is True
+        assert decoder.next_frame() is None
+
+    def test_decode_without_orjson(self, monkeypatch):
+        """Test the stdlib JSON fallback decodes the same frames."""
+        import lsp_jsonrpc
+
+        monkeypatch.setattr(lsp_jsonrpc, "orjson", None)
+        message = {"jsonrpc": "2.0", "id": 4, "result": [{"uri": "file:///a.py"}]}
+
+        assert LSPFrameDecoder().decode(encode_lsp_message(message)) == [message]
+
+    def test_missing_content_length(self):
+        """Test frames without Content-Length are rejected."""
+        decoder = LSPFrameDecoder()
+        decoder.feed(b"Content-Type: application/json\r\n\r\n{}")
+
+        with pytest.raises(JSONRPCError) as exc_info:
+            decoder.next_frame()
+
+        assert exc_info.value.code == LSPErrorCode.PARSE_ERROR
+
+    def test_oversized_header(self):
+        """Test a stream without a header terminator is rejected."""
+        decoder = LSPFrameDecoder(max_header_size=16)
+        decoder.feed(b"X" * 32)
+
+        with pytest.raises(JSONRPCError):
+            decoder.next_frame()
+
+    def test_invalid_json_is_consumed(self):
+        """Test a malformed body raises but the next frame still decodes."""
+        good = {"jsonrpc": "2.0", "id": 1, "result": 1}
+        decoder = LSPFrameDecoder()
+        decoder.feed(b"Content-Length: 3\r\n\r\n{x}" + encode_lsp_message(good))
+
+        with pytest.raises(JSONRPCError):
+            decoder.next_frame()
+
+        frame = decoder.next_frame()
+        assert frame is not None
+        assert frame[1] == good
+        assert decoder.buffered_bytes == 0
+
+
+class TestLSPStreamReader:
+    """Test reading framed messages from an asyncio stream."""
+
+    @pytest.mark.asyncio
+    async def test_read_messages_across_chunks(self):
+        """Test messages are reassembled from small reads."""
+        messages = [
+            {"jsonrpc": "2.0", "id": i, "result": list(range(50))} for i in range(3)
+        ]
+        stream = asyncio.StreamReader()
+        stream.feed_data(b"".join(encode_lsp_message(m) for m in messages))
+        stream.feed_eof()
+
+        reader = LSPStreamReader(stream, chunk_size=7)
+
+        assert [await reader.read_message() for _ in messages] == messages
+
+    @pytest.mark.asyncio
+    async def test_read_message_eof(self):
+        """Test EOF in the middle of a frame raises EOFError."""
+        stream = asyncio.StreamReader()
+        stream.feed_data(encode_lsp_message({"jsonrpc": "2.0", "id": 1})[:-2])
+        stream.feed_eof()
+
+        with pytest.raises(EOFError):
+            await LSPStreamReader(stream).read_message()
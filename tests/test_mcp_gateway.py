@@ -0,0 +1,176 @@
+"""
+Tests for the single-port MCP gateway.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from mcp_gateway import (
+    DEFAULT_GATEWAY_PORT,
+    GATEWAY_PORT_ENV,
+    MCPGateway,
+    Upstream,
+    gateway_port_from_env,
+)
+from worker_transport import WorkerTransport
+
+
+@dataclass
+class FakeWorker:
+    """Worker stub whose SSE stream waits for release_second_event."""
+
+    url: str
+    release_second_event: asyncio.Event = field(default_factory=asyncio.Event)
+    seen_headers: list[dict[str, str]] = field(default_factory=list)
+
+
+class TestGatewayPortFromEnv:
+    """Test gateway port selection."""
+
+    def test_default_port(self, monkeypatch):
+        """Test the gateway is enabled on the default port."""
+        monkeypatch.delenv(GATEWAY_PORT_ENV, raising=False)
+        assert gateway_port_from_env() == DEFAULT_GATEWAY_PORT
+
+    def test_zero_disables_gateway(self, monkeypatch):
+        """Test port 0 turns the gateway off."""
+        monkeypatch.setenv(GATEWAY_PORT_ENV, "0")
+        assert gateway_port_from_env() is None
+
+    def test_custom_port(self, monkeypatch):
+        """Test an explicit port is used."""
+        monkeypatch.setenv(GATEWAY_PORT_ENV, "9000")
+        assert gateway_port_from_env() == 9000
+
+
+class TestMCPGateway:
+    """Test routing and streaming through the gateway to a fake worker."""
+
+    @pytest_asyncio.fixture
+    async def fake_worker(self, free_port):
+        """Run a fake worker serving the MCP endpoints."""
+        port = free_port()
+        worker = FakeWorker(url=f"http://127.0.0.1:{port}")
+
+        async def sse(request):
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            await response.write(b"event: endpoint\ndata: first\n\n")
+            await worker.release_second_event.wait()
+            await response.write(b"event: message\ndata: second\n\n")
+            return response
+
+        async def post(request):
+            worker.seen_headers.append(dict(request.headers))
+            body = await request.json()
+            return web.json_response({"echo": body, "query": dict(request.query)})
+
+        worker_app = web.Application()
+        worker_app.router.add_get("/mcp/", sse)
+        worker_app.router.add_post("/mcp/", post)
+        worker_runner = web.AppRunner(worker_app)
+        await worker_runner.setup()
+        await web.TCPSite(worker_runner, "127.0.0.1", port).start()
+        yield worker
+        worker.release_second_event.set()
+        await worker_runner.cleanup()
+
+    @pytest_asyncio.fixture
+    async def gateway(self, fake_worker, free_port):
+        """Run a gateway routing "repo" to the fake worker."""
+        upstreams = {
+            "repo": Upstream(fake_worker.url, ready=True),
+            "starting": Upstream(fake_worker.url, ready=False),
+            "down": Upstream(f"http://127.0.0.1:{free_port()}", ready=True),
+        }
+        transport = WorkerTransport()
+        gateway = MCPGateway(
+            upstreams.get,
+            lambda: list(upstreams),
+            transport,
+            host="127.0.0.1",
+            port=free_port(),
+        )
+        await gateway.start()
+        yield gateway
+        await gateway.close()
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_post_forwarded_with_gateway_headers(self, gateway, fake_worker):
+        """Test a JSON-RPC POST reaches the worker and its reply returns."""
+        url = f"http://127.0.0.1:{gateway.port}/mcp/repo/?trace=1"
+        async with aiohttp.ClientSession() as session:
+            async with session.post(url, json={"method": "tools/list"}) as response:
+                assert response.status == 200
+                assert await response.json() == {
+                    "echo": {"method": "tools/list"},
+                    "query": {"trace": "1"},
+                }
+
+        headers = fake_worker.seen_headers[0]
+        assert headers["X-Forwarded-Prefix"] == "/mcp/repo"
+        assert headers["X-Forwarded-Host"] == f"127.0.0.1:{gateway.port}"
+        assert headers["X-Request-ID"]
+        assert gateway.metrics["repo"].requests == 1
+        assert gateway.metrics["repo"].active == 0
+
+    @pytest.mark.asyncio
+    async def test_sse_streamed_without_buffering(self, gateway, fake_worker):
+        """Test SSE events reach the client before the stream finishes."""
+        url = f"http://127.0.0.1:{gateway.port}/mcp/repo/"
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                assert response.headers["Content-Type"] == "text/event-stream"
+                first = await asyncio.wait_for(response.content.readuntil(b"\n\n"), 5)
+                assert first == b"event: endpoint\ndata: first\n\n"
+                assert gateway.metrics["repo"].active == 1
+
+                fake_worker.release_second_event.set()
+                second = await asyncio.wait_for(response.content.readuntil(b"\n\n"), 5)
+                assert second == b"event: message\ndata: second\n\n"
+
+    @pytest.mark.asyncio
+    async def test_unknown_repository_lists_available(self, gateway):
+        """Test an unknown repository is a 404 naming the configured ones."""
+        url = f"http://127.0.0.1:{gateway.port}/mcp/missing/"
+        async with aiohttp.ClientSession() as session:
+            async with session.post(url, json={}) as response:
+                assert response.status == 404
+                body = await response.json()
+
+        assert body["available_repositories"] == ["down", "repo", "starting"]
+
+    @pytest.mark.asyncio
+    async def test_unready_and_unreachable_workers(self, gateway):
+        """Test unready workers get a 503 and unreachable ones a 502."""
+        base = f"http://127.0.0.1:{gateway.port}/mcp"
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{base}/starting/", json={}) as response:
+                assert response.status == 503
+                assert response.headers["Retry-After"] == "1"
+            async with session.post(f"{base}/down/", json={}) as response:
+                assert response.status == 502
+
+        assert gateway.metrics["starting"].rejected == 1
+        assert gateway.metrics["down"].errors == 1
+
+    @pytest.mark.asyncio
+    async def test_prometheus_metrics(self, gateway):
+        """Test /metrics exposes the per-repository request counters."""
+        base = f"http://127.0.0.1:{gateway.port}"
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{base}/mcp/repo/", json={}) as response:
+                assert response.status == 200
+            async with session.get(f"{base}/metrics") as response:
+                assert response.status == 200
+                assert response.content_type == "text/plain"
+                text = await response.text()
+
+        assert 'mcp_gateway_requests_total{repository="repo"} 1' in text
+        assert 'mcp_gateway_active_requests{repository="repo"} 0' in text
@@ -23,14 +23,14 @@ import json
 import socket
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 import github_tools
-import mcp_master
 from constants import Language
 from repository_manager import RepositoryManager
+from worker_transport import create_listen_socket
 
 
 def find_free_port() -> int:
@@ -128,17 +128,21 @@ class TestMCPIntegration:
         # PHASE 2: Worker Startup Simulation (Mocked)
         # ============================================================================
 
-        # Mock subprocess.Popen to simulate worker startup without actually
+        # Mock the subprocess launcher to simulate worker startup without actually
         # spawning processes. This is critical because:
         # 1. We don't want to interfere with production processes
         # 2. Actual worker startup would bind to ports and could conflict
         # 3. We want to test the startup logic, not the actual process management
         mock_process = MagicMock()
-        mock_process.poll.return_value = None  # Simulate running process
         mock_process.pid = 12345  # Fake PID for logging
         mock_process.returncode = None  # Still running
+        mock_process.stdout = None  # No output streams to pump
+        mock_process.stderr = None
 
-        with patch("subprocess.Popen", return_value=mock_process) as mock_popen:
+        with patch(
+            "asyncio.create_subprocess_exec",
+            new=AsyncMock(return_value=mock_process),
+        ) as mock_popen:
             # Test that master can start a worker with our configuration
             # This validates the worker startup logic without actual process creation
 
@@ -162,7 +166,7 @@ class TestMCPIntegration:
             worker = WorkerProcess(repository_config=test_repo_config)
 
             # Use the same master instance from the first phase
-            worker_started = master.start_worker(worker)
+            worker_started = await master.start_worker(worker)
 
             # Verify worker startup was attempted with correct parameters
             assert worker_started is True
@@ -170,7 +174,7 @@ class TestMCPIntegration:
 
             # Verify the command line arguments passed to the worker
             args, kwargs = mock_popen.call_args
-            command = args[0]
+            command = list(args)
 
             # The worker should be started with correct arguments
             assert "mcp_worker.py" in " ".join(command)
@@ -361,8 +365,8 @@ class TestMCPIntegration:
             port = find_free_port()
             ports.append(port)
 
-            # Verify port is actually free using the same logic as the master
-            assert mcp_master.is_port_free(port) is True
+            # Verify the master could bind the port for a worker
+            create_listen_socket(port).close()
 
         # All allocated ports should be different
         assert len(set(ports)) == len(ports)
@@ -5,6 +5,8 @@ Tests for the unified MCP worker
 """
 
 
+import os
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -131,6 +133,72 @@ class TestMCPWorker:
         assert "github" in data["tool_categories"]
         assert "codebase" in data["tool_categories"]
 
+    def test_ready_endpoint(self, temp_git_repo, mock_github_token, mock_subprocess):
+        """Test readiness follows server start and shutdown"""
+        from unittest.mock import MagicMock
+
+        from repository_manager import RepositoryConfig
+
+        repo_config = RepositoryConfig.create_repository_config(
+            name="test-repo",
+            workspace=temp_git_repo,
+            description="Test repository",
+            language=Language.PYTHON,
+            port=8080,
+            python_path="/usr/bin/python3",
+        )
+        mock_github_context = MockGitHubAPIContext(
+            repo_name="test/test-repo", github_token="fake_token_for_testing"
+        )
+        worker = MCPWorker(repo_config, github_context=mock_github_context)
+        client = TestClient(worker.app)
+
+        # Not serving yet
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["ready"] is False
+
+        worker.server = MagicMock(started=True)
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["server_started"] is True
+        assert response.json()["pid"] == os.getpid()
+
+        # Draining for shutdown
+        worker.shutdown_event.set()
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["shutting_down"] is True
+
+    def test_serves_inherited_listen_socket(
+        self, temp_git_repo, mock_github_token, mock_subprocess
+    ):
+        """Test a worker given a listening socket by the master serves on it"""
+        from repository_manager import RepositoryConfig
+        from worker_transport import create_listen_socket
+
+        repo_config = RepositoryConfig.create_repository_config(
+            name="test-repo",
+            workspace=temp_git_repo,
+            description="Test repository",
+            language=Language.PYTHON,
+            port=8080,
+            python_path="/usr/bin/python3",
+        )
+        listener = create_listen_socket(0, host="127.0.0.1")
+        try:
+            worker = MCPWorker(
+                repo_config,
+                github_context=MockGitHubAPIContext(
+                    repo_name="test/test-repo", github_token="fake_token_for_testing"
+                ),
+                listen_fd=os.dup(listener.fileno()),
+            )
+            with worker._create_server_socket() as served:
+                assert served.getsockname() == listener.getsockname()
+        finally:
+            listener.close()
+
     def test_mcp_initialize(self, temp_git_repo, mock_github_token, mock_subprocess):
         """Test MCP initialize method"""
         from repository_manager import RepositoryConfig
@@ -171,6 +239,36 @@ class TestMCPWorker:
         assert "result" in response_data
         assert response_data["result"]["serverInfo"]["name"] == "mcp-agent-test-repo"
 
+    def test_metrics_endpoint(self, temp_git_repo, mock_github_token, mock_subprocess):
+        """Test /metrics counts MCP requests in the Prometheus text format"""
+        from repository_manager import RepositoryConfig
+
+        repo_config = RepositoryConfig.create_repository_config(
+            name="test-repo",
+            workspace=temp_git_repo,
+            description="Test repository",
+            language=Language.PYTHON,
+            port=8080,
+            python_path="/usr/bin/python3",
+        )
+        mock_github_context = MockGitHubAPIContext(
+            repo_name="test/test-repo", github_token="fake_token_for_testing"
+        )
+        worker = MCPWorker(repo_config, github_context=mock_github_context)
+        client = TestClient(worker.app)
+
+        client.post("/mcp/", json={"jsonrpc": "2.0", "id": 1, "method": "initialize"})
+        for method in ("made/up", "also/made/up"):
+            client.post("/mcp/", json={"jsonrpc": "2.0", "id": 2, "method": method})
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'mcp_worker_requests_total{method="initialize"} 1' in response.text
+        assert 'mcp_worker_requests_total{method="other"} 2' in response.text
+        assert "made/up" not in response.text
+        assert "process_resident_memory_bytes " in response.text
+
     def test_mcp_tools_list(self, temp_git_repo, mock_github_token, mock_subprocess):
         """Test MCP tools/list method"""
         from repository_manager import RepositoryConfig
@@ -377,6 +475,46 @@ class TestMCPWorker:
         assert '"error"' in result_text
         assert "not implemented" in result_text
 
+    def test_request_id_and_stats(
+        self, temp_git_repo, mock_github_token, mock_subprocess
+    ):
+        """Test tool calls echo the request id and appear in /stats"""
+        from repository_manager import RepositoryConfig
+
+        repo_config = RepositoryConfig.create_repository_config(
+            name="test-repo",
+            workspace=temp_git_repo,
+            description="Test repository",
+            language=Language.PYTHON,
+            port=8080,
+            python_path="/usr/bin/python3",
+        )
+        mock_github_context = MockGitHubAPIContext(
+            repo_name="test/test-repo", github_token="fake_token_for_testing"
+        )
+        worker = MCPWorker(repo_config, github_context=mock_github_context)
+        client = TestClient(worker.app)
+
+        response = client.post(
+            "/mcp/",
+            json={
+                "jsonrpc": "2.0",
+                "id": 5,
+                "method": "tools/call",
+                "params": {"name": "stats_probe_tool", "arguments": {}},
+            },
+            headers={"X-Request-ID": "trace-me"},
+        )
+        assert response.headers["X-Request-ID"] == "trace-me"
+
+        stats = client.get("/stats").json()
+        assert stats["repository"] == "test-repo"
+        # Unregistered tool names are not used as labels
+        assert "stats_probe_tool" not in stats["tools"]
+        assert stats["tools"]["other"]["count"] >= 1
+        assert stats["requests"]["tools/call"]["count"] >= 1
+        assert "mcp_tool_duration_seconds_bucket" in client.get("/metrics").text
+
     def test_shutdown_endpoint(self, temp_git_repo, mock_github_token, mock_subprocess):
         """Test the shutdown endpoint"""
         from repository_manager import RepositoryConfig
@@ -0,0 +1,155 @@
+"""
+Tests for the in-memory metrics registry and its Prometheus rendering.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from constants import Language
+from mcp_master import MCPMaster, WorkerProcess
+from metrics import MetricFamily, MetricsRegistry, log_buckets, process_collector
+from repository_manager import RepositoryConfig
+
+
+class TestMetricsRegistry:
+    """Test counters, gauges, histograms and collectors."""
+
+    def test_counter_and_gauge_render(self):
+        """Test labelled values render with HELP and TYPE lines."""
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ["method"])
+        active = registry.gauge("active", "Active requests")
+
+        requests.inc(method="tools/call")
+        requests.inc(2, method="tools/call")
+        active.inc()
+        active.inc()
+        active.dec()
+
+        assert requests.value(method="tools/call") == 3
+        assert registry.render() == (
+            "# HELP requests_total Requests\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{method="tools/call"} 3\n'
+            "# HELP active Active requests\n"
+            "# TYPE active gauge\n"
+            "active 1\n"
+        )
+
+    def test_counter_rejects_decrease(self):
+        """Test counters only go up."""
+        counter = MetricsRegistry().counter("events_total", "Events")
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+
+    def test_labels_must_match(self):
+        """Test values need exactly the declared labels."""
+        gauge = MetricsRegistry().gauge("depth", "Queue depth", ["queue"])
+        with pytest.raises(ValueError):
+            gauge.set(1)
+
+    def test_label_values_escaped(self):
+        """Test quotes, backslashes and newlines in label values are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("hits_total", "Hits", ["path"]).inc(path='a"b\\c\nd')
+
+        assert 'hits_total{path="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+    def test_collectors_run_on_render(self):
+        """Test collector values are read at scrape time."""
+        registry = MetricsRegistry()
+        state = {"ready": 0}
+
+        def collect():
+            family = MetricFamily("ready", "gauge", "Readiness")
+            family.add(state["ready"], repository="repo")
+            family.add(0.25, suffix="_seconds", repository="repo")
+            return [family]
+
+        registry.register_collector(collect)
+        assert 'ready{repository="repo"} 0\n' in registry.render()
+
+        state["ready"] = 1
+        rendered = registry.render()
+        assert 'ready{repository="repo"} 1\n' in rendered
+        assert 'ready_seconds{repository="repo"} 0.25\n' in rendered
+
+    def test_histogram_buckets_and_summary(self):
+        """Test cumulative buckets render and percentiles are estimated."""
+        registry = MetricsRegistry()
+        latency = registry.histogram(
+            "latency_seconds", "Latency", ["tool"], buckets=(0.01, 0.1, 1.0)
+        )
+        for value in (0.005, 0.05, 0.05, 2.0):
+            latency.observe(value, tool="t")
+
+        rendered = registry.render()
+        assert 'latency_seconds_bucket{tool="t",le="0.01"} 1' in rendered
+        assert 'latency_seconds_bucket{tool="t",le="0.1"} 3' in rendered
+        assert 'latency_seconds_bucket{tool="t",le="1"} 3' in rendered
+        assert 'latency_seconds_bucket{tool="t",le="+Inf"} 4' in rendered
+        assert 'latency_seconds_count{tool="t"} 4' in rendered
+
+        [(labels, summary)] = latency.summaries()
+        assert labels == {"tool": "t"}
+        assert summary["count"] == 4
+        assert 0.01 <= summary["p50"] <= 0.1
+        assert summary["p99"] == summary["max"] == 2.0
+
+    def test_log_buckets_have_constant_ratio(self):
+        """Test default buckets cover 100us to 100s with equal relative width."""
+        buckets = log_buckets()
+        assert buckets[0] == 0.0001
+        assert buckets[-1] == 100.0
+        assert len(buckets) == 31
+
+    def test_process_collector(self):
+        """Test process metrics are reported for the current process."""
+        families = {family.name: family for family in process_collector()()}
+
+        assert families["process_resident_memory_bytes"].samples[0][2] > 0
+        assert families["process_cpu_seconds_total"].type == "counter"
+
+
+class TestMasterWorkerMetrics:
+    """Test the master's worker gauges."""
+
+    def test_worker_probe_state_exposed(self):
+        """Test readiness, restarts and probe latency come from worker state."""
+        config = RepositoryConfig(
+            name="metrics-repo",
+            workspace="/tmp",
+            description="Metrics test repo",
+            language=Language.PYTHON,
+            port=8766,
+            python_path=sys.executable,
+            github_owner="test-owner",
+            github_repo="metrics-repo",
+        )
+        worker = WorkerProcess(
+            repository_config=config,
+            process=MagicMock(returncode=None),
+            ready=True,
+            restart_count=2,
+            last_probe_latency=0.5,
+        )
+        master = MCPMaster(
+            repository_manager=MagicMock(),
+            workers={"metrics-repo": worker},
+            startup_orchestrator=MagicMock(),
+            symbol_storage=MagicMock(),
+            codebase_tools=MagicMock(),
+            shutdown_coordinator=MagicMock(),
+            health_monitor=MagicMock(),
+        )
+
+        rendered = master.metrics.render()
+
+        assert 'mcp_worker_up{repository="metrics-repo"} 1' in rendered
+        assert 'mcp_worker_ready{repository="metrics-repo"} 1' in rendered
+        assert 'mcp_worker_restarts_total{repository="metrics-repo"} 2' in rendered
+        assert 'mcp_worker_probe_latency_seconds{repository="metrics-repo"} 0.5' in (
+            rendered
+        )
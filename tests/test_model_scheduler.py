@@ -0,0 +1,169 @@
+"""
+Tests for the model call scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from model_scheduler import ModelScheduler, scheduling_context
+
+
+async def _hold(scheduler, order, name, release, **kwargs):
+    """Take a slot, record the order it was granted in and wait for release."""
+    async with scheduler.slot("ollama", **kwargs):
+        order.append(name)
+        await release.wait()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestModelScheduler:
+    """Test limits, ordering and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_limit_enforced(self):
+        """Test no more than the limit run at once."""
+        scheduler = ModelScheduler({"ollama": 2})
+        running = 0
+        peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with scheduler.slot("ollama"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        stats = scheduler.stats()["ollama"]
+        assert stats["calls"] == 6
+        assert stats["running"] == stats["waiting"] == 0
+        assert stats["queue_seconds"]["max"] > 0
+
+    @pytest.mark.asyncio
+    async def test_priority_then_fair_share(self):
+        """Test higher priority goes first, then owners with fewer running calls."""
+        scheduler = ModelScheduler({"ollama": 2})
+        order: list[str] = []
+        long_call = asyncio.Event()
+        release = asyncio.Event()
+
+        # busy holds one slot for the whole test
+        tasks = [
+            asyncio.create_task(
+                _hold(scheduler, order, "long", long_call, owner="busy")
+            ),
+            asyncio.create_task(
+                _hold(scheduler, order, "first", release, owner="busy")
+            ),
+        ]
+        await _settle()
+        for name, owner, priority in [
+            ("busy-low", "busy", 0),
+            ("quiet-low", "quiet", 0),
+            ("busy-high", "busy", 5),
+        ]:
+            tasks.append(
+                asyncio.create_task(
+                    _hold(
+                        scheduler,
+                        order,
+                        name,
+                        release,
+                        owner=owner,
+                        priority=priority,
+                    )
+                )
+            )
+        await _settle()
+
+        release.set()
+        await _settle()
+        long_call.set()
+        await asyncio.gather(*tasks)
+
+        assert order == ["long", "first", "busy-high", "quiet-low", "busy-low"]
+
+    @pytest.mark.asyncio
+    async def test_context_defaults(self):
+        """Test owner and priority come from the scheduling context."""
+        scheduler = ModelScheduler({"ollama": 1})
+        order: list[str] = []
+        release = asyncio.Event()
+
+        blocker = asyncio.create_task(_hold(scheduler, order, "blocker", release))
+        await _settle()
+        low = asyncio.create_task(_hold(scheduler, order, "low", release))
+        with scheduling_context(owner="thread-2", priority=3):
+            high = asyncio.create_task(_hold(scheduler, order, "high", release))
+        await _settle()
+
+        release.set()
+        await asyncio.gather(blocker, low, high)
+
+        assert order == ["blocker", "high", "low"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_frees_queue(self):
+        """Test a cancelled call leaves the queue and the slot passes on."""
+        scheduler = ModelScheduler({"ollama": 1})
+        order: list[str] = []
+        release = asyncio.Event()
+
+        blocker = asyncio.create_task(_hold(scheduler, order, "blocker", release))
+        await _settle()
+        cancelled = asyncio.create_task(_hold(scheduler, order, "cancelled", release))
+        waiting = asyncio.create_task(_hold(scheduler, order, "waiting", release))
+        await _settle()
+        assert scheduler.stats()["ollama"]["waiting"] == 2
+
+        cancelled.cancel()
+        await _settle()
+        release.set()
+        await asyncio.gather(blocker, waiting)
+
+        assert order == ["blocker", "waiting"]
+        assert scheduler.stats()["ollama"]["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_dispatches_waiters(self):
+        """Test raising a limit starts waiting calls at once."""
+        scheduler = ModelScheduler({"claude_code": 1})
+        release = asyncio.Event()
+
+        async def call():
+            async with scheduler.slot("claude_code"):
+                await release.wait()
+
+        tasks = [asyncio.create_task(call()) for _ in range(3)]
+        await _settle()
+        assert scheduler.stats()["claude_code"]["running"] == 1
+
+        scheduler.set_limit("claude_code", 3)
+        assert scheduler.stats()["claude_code"]["running"] == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    def test_invalid_limit_rejected(self):
+        """Test limits below one are rejected."""
+        with pytest.raises(ValueError):
+            ModelScheduler().set_limit("ollama", 0)
+
+    @pytest.mark.asyncio
+    async def test_metrics_rendered(self):
+        """Test limits, load and queue time are exposed as metrics."""
+        scheduler = ModelScheduler({"ollama": 4})
+        assert await scheduler.run("ollama", lambda: asyncio.sleep(0, result=1)) == 1
+
+        rendered = scheduler.registry.render()
+        assert 'model_call_limit{backend="ollama"} 4' in rendered
+        assert 'model_calls_running{backend="ollama"} 0' in rendered
+        assert 'model_call_queue_seconds_count{backend="ollama"} 1' in rendered
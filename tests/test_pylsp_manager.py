@@ -0,0 +1,130 @@
+"""
+Tests for pylsp LSP Manager
+
+Tests the persistent Jedi cache handling of PylspManager and the warm-up
+stage driven through LSPServerFactory.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from lsp_server_factory import LSPServerFactory
+from pylsp_manager import (
+    WARMUP_SCRIPT,
+    PylspManager,
+    build_lsp_cache_env,
+    get_lsp_cache_dir,
+)
+
+
+class TestPylspCache(unittest.TestCase):
+    """Test cases for the pylsp warm cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.workspace_path = Path(self.temp_dir) / "test_workspace"
+        self.workspace_path.mkdir()
+        (self.workspace_path / "main.py").write_text("def hello():\n    pass\n")
+        self.cache_dir = Path(self.temp_dir) / "cache"
+        self.python_path = sys.executable
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _create_manager(self) -> PylspManager:
+        with patch("pylsp_manager.subprocess.run") as mock_run:
+            mock_run.return_value = Mock(stdout="pylsp 1.0.0", returncode=0)
+            return PylspManager(
+                str(self.workspace_path), self.python_path, cache_dir=self.cache_dir
+            )
+
+    def test_cache_dir_is_stable_per_workspace_and_interpreter(self):
+        """Test cache directories are keyed by workspace and python_path."""
+        first = get_lsp_cache_dir("/repos/app", "/venv/bin/python")
+
+        self.assertEqual(first, get_lsp_cache_dir("/repos/app", "/venv/bin/python"))
+        self.assertNotEqual(first, get_lsp_cache_dir("/repos/app", "/usr/bin/python"))
+        self.assertTrue(first.name.startswith("app-"))
+
+    def test_cache_env_sets_xdg_cache_home(self):
+        """Test the server environment redirects Jedi's cache."""
+        env = build_lsp_cache_env(self.cache_dir)
+
+        self.assertEqual(env["XDG_CACHE_HOME"], str(self.cache_dir))
+        self.assertIn("PATH", env)
+
+    def test_prepare_workspace_creates_cache_dir(self):
+        """Test preparing the workspace creates the cache directory."""
+        manager = self._create_manager()
+
+        self.assertTrue(manager.prepare_workspace())
+        self.assertTrue(self.cache_dir.is_dir())
+        env = manager.get_server_environment()
+        assert env is not None
+        self.assertEqual(env["XDG_CACHE_HOME"], str(self.cache_dir))
+
+    @patch("pylsp_manager.subprocess.run")
+    def test_warm_cache_runs_warmup_script(self, mock_run):
+        """Test warm_cache runs the warm-up script with the cache environment."""
+        manager = self._create_manager()
+        mock_run.return_value = Mock(stdout=json.dumps({"files": 3, "seconds": 0.1}))
+
+        self.assertTrue(manager.warm_cache())
+
+        args, kwargs = mock_run.call_args
+        self.assertEqual(
+            args[0], [self.python_path, str(WARMUP_SCRIPT), str(self.workspace_path)]
+        )
+        self.assertEqual(kwargs["env"]["XDG_CACHE_HOME"], str(self.cache_dir))
+
+    @patch("pylsp_manager.subprocess.run")
+    def test_warm_cache_failure_is_not_fatal(self, mock_run):
+        """Test a failing warm-up reports False instead of raising."""
+        manager = self._create_manager()
+        mock_run.side_effect = subprocess.CalledProcessError(1, "python", stderr="x")
+
+        self.assertFalse(manager.warm_cache())
+
+    def test_warmup_script_populates_cache(self):
+        """Test the warm-up script writes parso pickles for the workspace."""
+        result = subprocess.run(
+            [
+                self.python_path,
+                str(WARMUP_SCRIPT),
+                str(self.workspace_path),
+                "--skip-site-packages",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=build_lsp_cache_env(self.cache_dir),
+        )
+
+        stats = json.loads(result.stdout)
+        self.assertEqual(stats["files"], 1)
+        self.assertEqual(stats["errors"], 0)
+        self.assertTrue(list((self.cache_dir / "jedi").rglob("*.pkl")))
+
+    @patch("pyright_lsp_manager.subprocess.run")
+    def test_factory_warm_for_pyright_has_no_cache(self, mock_run):
+        """Test pyright reports no persistent cache to warm."""
+        mock_run.return_value = Mock(stdout="pyright 1.1.0", returncode=0)
+
+        warmed = LSPServerFactory.warm_workspace_cache(
+            "pyright", str(self.workspace_path), self.python_path
+        )
+
+        self.assertFalse(warmed)
+
+
+if __name__ == "__main__":
+    unittest.main()
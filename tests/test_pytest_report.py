@@ -0,0 +1,121 @@
+"""
+Tests for structured pytest result capture.
+"""
+
+from pytest_report import (
+    FailureGroup,
+    Outcome,
+    format_failures,
+    group_failures,
+    read_junit_report,
+    summarize,
+    truncate,
+)
+
+TRACEBACK = """v = {value}
+
+    def test_a(v):
+&gt;       helper(v)
+
+tests/test_x.py:7:
+_ _ _ _ _ _ _ _ _ _
+
+    def helper(x):
+&gt;       assert x == 1, "bad value"
+E       AssertionError: bad value
+E       assert {value} == 1
+
+tests/test_x.py:3: AssertionError"""
+
+REPORT = f"""<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest">
+<testcase classname="tests.test_x" name="test_a[2]" file="tests/test_x.py" time="0.5">
+<failure message="AssertionError: bad value&#10;assert 2 == 1">{TRACEBACK.format(value=2)}</failure>
+<system-out>----------- Captured Out -----------
+printed 2
+</system-out>
+<system-err>----------- Captured Err -----------
+</system-err>
+</testcase>
+<testcase classname="tests.test_x" name="test_a[3]" file="tests/test_x.py" time="0.25">
+<failure message="AssertionError: bad value&#10;assert 3 == 1">{TRACEBACK.format(value=3)}</failure>
+</testcase>
+<testcase classname="tests.test_x.TestK" name="test_b" file="tests/test_x.py" time="1.0"/>
+<testcase classname="tests.test_x.TestK" name="test_s" file="tests/test_x.py" time="0">
+<skipped message="not today">tests/test_x.py:10: not today</skipped>
+</testcase>
+<testcase classname="" name="test_broken" file="tests/test_broken.py" time="0">
+<error message="collection failure">E   ModuleNotFoundError: No module named 'nonexist'</error>
+</testcase>
+</testsuite></testsuites>
+"""
+
+
+def read(tmp_path):
+    report = tmp_path / "report.xml"
+    report.write_text(REPORT)
+    return read_junit_report(report)
+
+
+def test_outcomes_read_per_test(tmp_path):
+    """Test each test case becomes an outcome with its node ID."""
+    outcomes = read(tmp_path)
+
+    assert [(outcome.node_id, outcome.outcome) for outcome in outcomes] == [
+        ("tests/test_x.py::test_a[2]", Outcome.FAILED),
+        ("tests/test_x.py::test_a[3]", Outcome.FAILED),
+        ("tests/test_x.py::TestK::test_b", Outcome.PASSED),
+        ("tests/test_x.py::TestK::test_s", Outcome.SKIPPED),
+        ("tests/test_broken.py", Outcome.ERROR),
+    ]
+    assert outcomes[0].duration == 0.5
+    assert outcomes[0].captured == "printed 2"
+    assert outcomes[3].traceback == ""
+    assert summarize(outcomes) == {"passed": 1, "failed": 2, "error": 1, "skipped": 1}
+
+
+def test_missing_report_has_no_outcomes(tmp_path):
+    """Test a run that wrote no report yields no outcomes."""
+    assert read_junit_report(tmp_path / "missing.xml") == []
+
+
+def test_failures_with_the_same_error_grouped(tmp_path):
+    """Test parametrized failures in one helper are reported once."""
+    groups = group_failures(read(tmp_path))
+
+    assert [group.tests for group in groups] == [
+        ["tests/test_x.py::test_a[2]", "tests/test_x.py::test_a[3]"],
+        ["tests/test_broken.py"],
+    ]
+    assert "assert 2 == 1" in groups[0].traceback
+
+
+def test_long_text_truncated():
+    """Test truncation keeps the start and end of long text."""
+    text = "start" + "x" * 1000 + "end"
+
+    truncated = truncate(text, 100)
+
+    assert len(truncated) < 150
+    assert truncated.startswith("start")
+    assert truncated.endswith("end")
+    assert "characters truncated" in truncated
+    assert truncate("short", 100) == "short"
+
+
+def test_digest_bounded():
+    """Test failures beyond the digest limit are only listed by name."""
+    groups = [
+        FailureGroup(
+            message=f"Error {number}", traceback="x" * 500, tests=[f"test_{number}"]
+        )
+        for number in range(10)
+    ]
+
+    digest = format_failures(groups, limit=1200)
+
+    assert "FAILURE 1: Error 0" in digest
+    assert "FAILURE 2: Error 1" in digest
+    assert "Error 3" not in digest
+    assert "8 more failing tests not shown: test_2, test_3" in digest
+    assert len(digest) < 1400
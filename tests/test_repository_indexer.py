@@ -384,6 +384,22 @@ def helper():
             assert "CONSTANT" in symbol_names
             assert "helper" in symbol_names
 
+    def test_reindex_replaces_stale_symbols(self, temp_database):
+        """Test re-indexing swaps out symbols from files that changed."""
+        indexer = PythonRepositoryIndexer(PythonSymbolExtractor(), temp_database)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            repo_path = Path(tmp_dir)
+            module = repo_path / "module.py"
+            module.write_text("def old_function():\n    pass\n")
+            indexer.index_repository(str(repo_path), "reindex-test")
+
+            module.write_text("def new_function():\n    pass\n")
+            indexer.index_repository(str(repo_path), "reindex-test")
+
+            names = [s.name for s in temp_database.search_symbols("reindex-test", "")]
+            assert names == ["new_function"]
+
     def test_mock_indexer_default_result(self, mock_repository_indexer):
         """Test mock indexer with default result."""
         result = mock_repository_indexer.index_repository("/test/path", "test-repo")
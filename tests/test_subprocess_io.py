@@ -0,0 +1,79 @@
+"""
+Tests for the shared subprocess output helpers.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from subprocess_io import kill_process_group, read_lines
+
+
+async def _lines(script: str, keepends: bool = False) -> list[bytes]:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", script, stdout=asyncio.subprocess.PIPE
+    )
+    assert process.stdout is not None
+    lines = [line async for line in read_lines(process.stdout, keepends)]
+    await process.wait()
+    return lines
+
+
+def _running(pid: int) -> bool:
+    """Return whether a process is alive; an unreaped zombie is not."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rpartition(")")[2].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+class TestReadLines:
+    """Test splitting process output into lines."""
+
+    @pytest.mark.asyncio
+    async def test_lines_beyond_reader_limit(self):
+        """Test lines longer than a StreamReader's limit are read whole."""
+        lines = await _lines("print('x' * 200000); print('after', end='')")
+
+        assert lines == [b"x" * 200000, b"after"]
+
+    @pytest.mark.asyncio
+    async def test_keepends(self):
+        """Test lines can keep their newlines, so output is reassembled exactly."""
+        lines = await _lines("print('one'); print('two', end='')", keepends=True)
+
+        assert lines == [b"one\n", b"two"]
+
+
+class TestKillProcessGroup:
+    """Test killing a process together with the processes it started."""
+
+    @pytest.mark.asyncio
+    async def test_children_killed(self):
+        """Test a child of the process is killed with it."""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            "import subprocess, sys, time\n"
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+            "print(child.pid, flush=True)\n"
+            "time.sleep(60)",
+            stdout=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        assert process.stdout is not None
+        child = int(await process.stdout.readline())
+
+        await kill_process_group(process)
+
+        assert process.returncode is not None
+        # The child dies once the kill is delivered to it, which can lag a
+        # moment behind its parent being reaped
+        for _ in range(100):
+            if not _running(child):
+                break
+            await asyncio.sleep(0.02)
+        else:
+            pytest.fail("Child process survived its group being killed")
@@ -2,11 +2,21 @@
 Unit tests for symbol storage functionality.
 """
 
+import asyncio
+import sqlite3
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 from symbol_storage import (
+    SYMBOL_INDEXES,
     AbstractSymbolStorage,
+    AsyncSymbolStorage,
+    CommentReply,
     SQLiteSymbolStorage,
     Symbol,
     SymbolKind,
@@ -396,3 +406,232 @@ class TestSQLiteSymbolStorage:
                 assert result is True
             finally:
                 storage.close()
+
+
+class TestSQLiteSymbolStorageReadPool:
+    """Test the dedicated writer plus read pool storage mode."""
+
+    @pytest.fixture
+    def pooled_storage(self):
+        """Create a temporary storage with a read pool of two connections."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = SQLiteSymbolStorage(
+                Path(temp_dir) / "pooled.db", read_pool_size=2
+            )
+            yield storage
+            storage.close()
+
+    def test_pooled_reads_see_committed_writes(self, pooled_storage):
+        """Test reads through the pool return symbols written by the writer."""
+        pooled_storage.insert_symbols(
+            [Symbol("pooled_func", SymbolKind.FUNCTION, "a.py", 1, 0, "repo")]
+        )
+
+        results = pooled_storage.search_symbols("repo", "pooled")
+
+        assert [s.name for s in results] == ["pooled_func"]
+        assert pooled_storage.health_check() is True
+
+    def test_readers_are_query_only(self, pooled_storage):
+        """Test pooled connections reject writes."""
+        with pytest.raises(sqlite3.OperationalError):
+            with pooled_storage._read_connection() as conn:
+                conn.execute("DELETE FROM symbols")
+
+    def test_reads_do_not_wait_for_open_write_transaction(self, pooled_storage):
+        """Test searches complete while the writer holds a transaction open."""
+        pooled_storage.insert_symbol(
+            Symbol("committed", SymbolKind.CLASS, "a.py", 1, 0, "repo")
+        )
+        release_writer = threading.Event()
+        writer_started = threading.Event()
+
+        def hold_write_transaction():
+            with pooled_storage._write_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "INSERT INTO symbols (name, kind, file_path, line_number, "
+                    "column_number, repository_id) "
+                    "VALUES ('pending', 'class', 'b.py', 1, 0, 'repo')"
+                )
+                writer_started.set()
+                release_writer.wait(timeout=5)
+
+        writer = threading.Thread(target=hold_write_transaction)
+        writer.start()
+        try:
+            assert writer_started.wait(timeout=5)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(pooled_storage.search_symbols, "repo", "")
+                results = future.result(timeout=2)
+        finally:
+            release_writer.set()
+            writer.join()
+
+        # The reader sees the last committed snapshot, not the pending row
+        assert [s.name for s in results] == ["committed"]
+
+    def test_pool_size_is_bounded(self, pooled_storage):
+        """Test concurrent readers never open more connections than the pool size."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda _: pooled_storage.search_symbols("repo", "x"), range(32)
+                )
+            )
+
+        assert pooled_storage._read_pool_created <= 2
+
+    def test_close_discards_pool_and_storage_remains_usable(self, pooled_storage):
+        """Test closing resets the pool and later reads reopen connections."""
+        pooled_storage.search_symbols("repo", "x")
+        pooled_storage.close()
+
+        assert pooled_storage._read_pool_created == 0
+        assert pooled_storage.search_symbols("repo", "x") == []
+
+
+class TestSQLiteSymbolStorageRebuild:
+    """Test the staged bulk-load path used when re-indexing a repository."""
+
+    @pytest.fixture
+    def file_storage(self):
+        """Create a file-backed storage so staging uses its own connection."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = SQLiteSymbolStorage(
+                Path(temp_dir) / "rebuild.db", read_pool_size=2
+            )
+            yield storage
+            storage.close()
+
+    @staticmethod
+    def _symbols(repository_id, names):
+        return [
+            Symbol(name, SymbolKind.FUNCTION, f"{name}.py", 1, 0, repository_id)
+            for name in names
+        ]
+
+    @staticmethod
+    def _index_names(storage):
+        with storage._read_connection() as conn:
+            rows = conn.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = 'symbols'"
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def test_rebuild_replaces_only_target_repository(self, file_storage):
+        """Test the swap replaces one repository and keeps the others."""
+        file_storage.insert_symbols(self._symbols("repo", ["old_a", "old_b"]))
+        file_storage.insert_symbols(self._symbols("other", ["kept"]))
+
+        with file_storage.rebuild_repository("repo") as store_symbols:
+            store_symbols(self._symbols("repo", ["new_a"]))
+            store_symbols(self._symbols("repo", ["new_b", "new_c"]))
+
+        repo_names = {s.name for s in file_storage.search_symbols("repo", "")}
+        other_names = {s.name for s in file_storage.search_symbols("other", "")}
+        assert repo_names == {"new_a", "new_b", "new_c"}
+        assert other_names == {"kept"}
+
+    def test_old_symbols_visible_until_swap(self, file_storage):
+        """Test searches see the previous symbols while staging is in progress."""
+        file_storage.insert_symbols(self._symbols("repo", ["old_a"]))
+
+        with file_storage.rebuild_repository("repo") as store_symbols:
+            store_symbols(self._symbols("repo", ["new_a"]))
+            during = [s.name for s in file_storage.search_symbols("repo", "")]
+
+        after = [s.name for s in file_storage.search_symbols("repo", "")]
+        assert during == ["old_a"]
+        assert after == ["new_a"]
+
+    def test_failed_rebuild_keeps_existing_symbols(self, file_storage):
+        """Test an error while staging leaves the repository untouched."""
+        file_storage.insert_symbols(self._symbols("repo", ["old_a"]))
+
+        with pytest.raises(RuntimeError):
+            with file_storage.rebuild_repository("repo") as store_symbols:
+                store_symbols(self._symbols("repo", ["new_a"]))
+                raise RuntimeError("indexing failed")
+
+        names = [s.name for s in file_storage.search_symbols("repo", "")]
+        assert names == ["old_a"]
+
+    def test_indexes_present_after_large_rebuild(self, file_storage):
+        """Test indexes dropped for a large load are recreated."""
+        file_storage.insert_symbols(self._symbols("other", ["kept"]))
+
+        with file_storage.rebuild_repository("repo") as store_symbols:
+            store_symbols(self._symbols("repo", [f"f{i}" for i in range(50)]))
+
+        assert set(SYMBOL_INDEXES) <= self._index_names(file_storage)
+        assert len(file_storage.search_symbols("repo", "f", limit=100)) == 50
+
+    def test_in_memory_storage_falls_back_to_direct_inserts(self):
+        """Test in-memory databases rebuild through the default path."""
+        storage = SQLiteSymbolStorage(":memory:")
+        try:
+            storage.insert_symbols(self._symbols("repo", ["old_a"]))
+
+            with storage.rebuild_repository("repo") as store_symbols:
+                store_symbols(self._symbols("repo", ["new_a"]))
+
+            names = [s.name for s in storage.search_symbols("repo", "")]
+            assert names == ["new_a"]
+        finally:
+            storage.close()
+
+
+class TestAsyncSymbolStorage:
+    """Test the awaitable storage facade."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_facade(self, storage):
+        """Test symbols and comment replies round-trip through awaitable calls."""
+        from datetime import UTC, datetime
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            async_storage = AsyncSymbolStorage(storage, executor=executor)
+            await async_storage.insert_symbols(
+                [Symbol("async_func", SymbolKind.FUNCTION, "a.py", 3, 0, "repo")]
+            )
+            await async_storage.mark_comment_replied(
+                CommentReply(7, 1, datetime.now(UTC), "repo")
+            )
+
+            results = await async_storage.search_symbols("repo", "async")
+
+            assert [s.name for s in results] == ["async_func"]
+            assert await async_storage.health_check() is True
+            assert await async_storage.is_comment_replied(7, 1) is True
+            assert await async_storage.get_replied_comment_ids(1) == {7}
+
+    @pytest.mark.asyncio
+    async def test_slow_query_does_not_block_event_loop(self):
+        """Test the event loop keeps running while a storage call blocks."""
+        from tests.mocks import MockSymbolStorage
+
+        class SlowStorage(MockSymbolStorage):
+            def search_symbols(self, *args, **kwargs):
+                time.sleep(0.3)
+                return []
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                await AsyncSymbolStorage(SlowStorage(), executor).search_symbols(
+                    "repo", "x"
+                )
+        finally:
+            ticker_task.cancel()
+
+        assert ticks >= 5
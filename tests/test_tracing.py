@@ -0,0 +1,140 @@
+"""
+Tests for request tracing, latency histograms and span export.
+"""
+
+import json
+import logging
+
+import pytest
+
+from tracing import (
+    RequestIdFilter,
+    SpanFileExporter,
+    Tracer,
+    current_request_id,
+)
+
+
+@pytest.fixture
+def tracer():
+    """Tracer with its own registry and no export."""
+    return Tracer()
+
+
+class TestTracer:
+    """Test spans, request ids and statistics."""
+
+    def test_spans_nest_within_request(self, tracer):
+        """Test tool and backend spans share the request's trace and id."""
+        with tracer.request("tools/call", "req-1") as request_span:
+            assert current_request_id() == "req-1"
+            with tracer.tool("find_definition") as tool_span:
+                with tracer.span("lsp", "spawn") as backend_span:
+                    pass
+
+        assert current_request_id() is None
+        assert tool_span.trace_id == request_span.trace_id
+        assert tool_span.parent_span_id == request_span.span_id
+        assert backend_span.parent_span_id == tool_span.span_id
+        assert backend_span.request_id == "req-1"
+
+    def test_errors_counted_and_reraised(self, tracer):
+        """Test failing calls are recorded as errors and still raise."""
+        with pytest.raises(RuntimeError), tracer.span("git", "rev-parse"):
+            raise RuntimeError("not a repository")
+
+        stats = tracer.stats()
+        assert stats["backends"]["git"]["rev-parse"]["count"] == 1
+        assert stats["backends"]["git"]["rev-parse"]["errors"] == 1
+
+    def test_stats_summarize_tools(self, tracer):
+        """Test the stats endpoint payload has per-tool percentiles."""
+        for _ in range(3):
+            with tracer.tool("search_symbols"):
+                pass
+
+        summary = tracer.stats()["tools"]["search_symbols"]
+        assert summary["count"] == 3
+        assert summary["errors"] == 0
+        assert summary["p50"] <= summary["p99"] <= summary["max"]
+
+    @pytest.mark.asyncio
+    async def test_traced_decorator(self, tracer):
+        """Test functions and coroutine functions are timed by name."""
+
+        @tracer.traced("sqlite")
+        def query():
+            return 1
+
+        @tracer.traced("github", "get_pull")
+        async def fetch():
+            return 2
+
+        assert query() == 1
+        assert await fetch() == 2
+
+        backends = tracer.stats()["backends"]
+        assert backends["sqlite"]["query"]["count"] == 1
+        assert backends["github"]["get_pull"]["count"] == 1
+
+    def test_histograms_exposed_as_metrics(self, tracer):
+        """Test latencies render as Prometheus histograms."""
+        with tracer.tool("codebase_health_check"):
+            pass
+
+        rendered = tracer.registry.render()
+        assert "# TYPE mcp_tool_duration_seconds histogram" in rendered
+        assert (
+            'mcp_tool_duration_seconds_bucket{tool="codebase_health_check",le="+Inf"} 1'
+            in rendered
+        )
+        assert 'mcp_tool_duration_seconds_count{tool="codebase_health_check"} 1' in (
+            rendered
+        )
+
+
+class TestRequestIdFilter:
+    """Test request ids in log records."""
+
+    def test_request_id_added_to_records(self, tracer):
+        """Test records carry the current request id or a placeholder."""
+        log_filter = RequestIdFilter()
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", (), None)
+
+        log_filter.filter(record)
+        # The filter sets an attribute LogRecord does not declare
+        assert record.__dict__["request_id"] == "-"
+
+        with tracer.request("tools/call", "req-2"):
+            log_filter.filter(record)
+        assert record.__dict__["request_id"] == "req-2"
+
+
+class TestSpanFileExporter:
+    """Test OTLP/JSON span export."""
+
+    def test_spans_written_as_otlp_lines(self, tmp_path):
+        """Test each finished span is one OTLP export request per line."""
+        path = tmp_path / "spans.jsonl"
+        exporter = SpanFileExporter(path)
+        tracer = Tracer(exporter=exporter)
+
+        with tracer.request("tools/call", "req-3"):
+            with pytest.raises(ValueError), tracer.span("sqlite", "search_symbols"):
+                raise ValueError("bad query")
+        exporter.close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        spans = [
+            line["resourceSpans"][0]["scopeSpans"][0]["spans"][0] for line in lines
+        ]
+        backend, request = spans
+        assert backend["name"] == "sqlite search_symbols"
+        assert backend["parentSpanId"] == request["spanId"]
+        assert backend["traceId"] == request["traceId"]
+        assert backend["status"]["code"] == 2
+        assert request["status"] == {"code": 1}
+        assert {
+            "key": "mcp.request_id",
+            "value": {"stringValue": "req-3"},
+        } in request["attributes"]
@@ -0,0 +1,279 @@
+"""
+Tests for worker liveness/readiness probing and restart backoff.
+"""
+
+import asyncio
+import socket
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from constants import Language
+from mcp_master import MCPMaster, WorkerProcess
+from repository_manager import RepositoryConfig
+from worker_health import (
+    LIVENESS_FAILURE_THRESHOLD,
+    ProbeResult,
+    RestartBackoff,
+    probe_endpoint,
+)
+from worker_transport import create_listen_socket
+
+
+class TestRestartBackoff:
+    """Test exponential restart backoff."""
+
+    def test_delay_doubles_up_to_maximum(self):
+        """Test delays grow exponentially and are capped."""
+        backoff = RestartBackoff(initial_delay=1.0, max_delay=5.0, multiplier=2.0)
+
+        delays = [backoff.next_delay() for _ in range(5)]
+
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_stable_uptime_resets_backoff(self):
+        """Test a long enough run starts the backoff over."""
+        backoff = RestartBackoff(initial_delay=1.0, reset_after=60.0)
+        backoff.next_delay(uptime=1.0)
+        backoff.next_delay(uptime=1.0)
+
+        assert backoff.next_delay(uptime=120.0) == 1.0
+        assert backoff.next_delay(uptime=1.0) == 2.0
+
+
+class TestProbeEndpoint:
+    """Test HTTP probe classification against a local server."""
+
+    @pytest_asyncio.fixture
+    async def server_url(self, free_port):
+        """Serve /ok, /unavailable and /slow on a local port."""
+
+        async def ok(request):
+            return web.json_response({"status": "healthy"})
+
+        async def unavailable(request):
+            return web.json_response({"ready": False}, status=503)
+
+        async def slow(request):
+            await asyncio.sleep(0.2)
+            return web.json_response({"status": "healthy"})
+
+        app = web.Application()
+        app.router.add_get("/ok", ok)
+        app.router.add_get("/unavailable", unavailable)
+        app.router.add_get("/slow", slow)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        port = free_port()
+        site = web.TCPSite(runner, "127.0.0.1", port)
+        await site.start()
+        yield f"http://127.0.0.1:{port}"
+        await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_successful_probe(self, server_url):
+        """Test a 200 response is reported as ok with its latency."""
+        async with aiohttp.ClientSession() as session:
+            result = await probe_endpoint(session, f"{server_url}/ok")
+
+        assert result.ok is True
+        assert result.status_code == 200
+        assert result.latency >= 0
+        assert result.payload == {"status": "healthy"}
+
+    @pytest.mark.asyncio
+    async def test_non_200_is_failure(self, server_url):
+        """Test an error status fails the probe."""
+        async with aiohttp.ClientSession() as session:
+            result = await probe_endpoint(session, f"{server_url}/unavailable")
+
+        assert result.ok is False
+        assert result.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_slow_response_exceeds_latency_threshold(self, server_url):
+        """Test a response slower than the threshold fails the probe."""
+        async with aiohttp.ClientSession() as session:
+            result = await probe_endpoint(
+                session, f"{server_url}/slow", latency_threshold=0.05
+            )
+
+        assert result.ok is False
+        assert result.error is not None
+        assert "slow response" in result.error
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_refused_connection(self, server_url, free_port):
+        """Test timeouts and refused connections are failures, not exceptions."""
+        async with aiohttp.ClientSession() as session:
+            timed_out = await probe_endpoint(
+                session, f"{server_url}/slow", timeout=0.05
+            )
+            refused = await probe_endpoint(
+                session, f"http://127.0.0.1:{free_port()}/health"
+            )
+
+        assert timed_out.ok is False
+        assert timed_out.error == "timeout"
+        assert refused.ok is False
+        assert refused.error
+
+
+def _make_worker(started_ago: float = 120.0) -> WorkerProcess:
+    config = RepositoryConfig(
+        name="probe-repo",
+        workspace="/tmp",
+        description="Probe test repo",
+        language=Language.PYTHON,
+        port=8765,
+        python_path=sys.executable,
+        github_owner="test-owner",
+        github_repo="probe-repo",
+    )
+    worker = WorkerProcess(repository_config=config)
+    worker.process = MagicMock(returncode=None)
+    worker.start_time = time.time() - started_ago
+    return worker
+
+
+def _results(live: bool, ready: bool) -> list[ProbeResult]:
+    return [
+        ProbeResult(live, 0.01, 200 if live else None, None if live else "timeout"),
+        ProbeResult(ready, 0.01, 200 if ready else 503),
+    ]
+
+
+class TestMasterProbing:
+    """Test how MCPMaster reacts to probe results."""
+
+    @pytest.fixture
+    def master(self, make_master) -> MCPMaster:
+        return make_master()
+
+    @pytest.fixture
+    def restart_worker(self, master):
+        """Record restarts instead of relaunching the worker."""
+        with patch.object(master, "_restart_worker") as restart_worker:
+            yield restart_worker
+
+    @pytest.mark.asyncio
+    async def test_readiness_tracked_separately_from_liveness(
+        self, master, restart_worker, monkeypatch
+    ):
+        """Test a live but unready worker is neither ready nor restarted."""
+        worker = _make_worker()
+        monkeypatch.setattr(
+            "mcp_master.probe_endpoint", AsyncMock(side_effect=_results(True, False))
+        )
+
+        await master.probe_worker(worker)
+
+        assert worker.ready is False
+        assert worker.liveness_failures == 0
+        restart_worker.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hung_worker_restarted_after_threshold(
+        self, master, restart_worker, monkeypatch
+    ):
+        """Test consecutive liveness failures schedule a restart."""
+        worker = _make_worker()
+        monkeypatch.setattr(
+            "mcp_master.probe_endpoint",
+            AsyncMock(side_effect=_results(False, False) * LIVENESS_FAILURE_THRESHOLD),
+        )
+
+        for _ in range(LIVENESS_FAILURE_THRESHOLD):
+            await master.probe_worker(worker)
+        assert worker.restart_task is not None
+        await worker.restart_task
+
+        assert worker.liveness_failures == LIVENESS_FAILURE_THRESHOLD
+        assert master.is_worker_healthy(worker) is False
+        restart_worker.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failures_ignored_during_startup_grace(
+        self, master, restart_worker, monkeypatch
+    ):
+        """Test a freshly started worker is given time to come up."""
+        worker = _make_worker(started_ago=1.0)
+        monkeypatch.setattr(
+            "mcp_master.probe_endpoint", AsyncMock(side_effect=_results(False, False))
+        )
+
+        await master.probe_worker(worker)
+
+        assert worker.liveness_failures == 0
+        restart_worker.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_restart_does_not_wait_for_port(self, master):
+        """Test a worker is started again as soon as the old process exited."""
+        worker = _make_worker()
+        worker.backoff = RestartBackoff(initial_delay=0.0)
+
+        with (
+            patch.object(master, "stop_worker", return_value=True),
+            patch.object(master, "start_worker", return_value=True) as start_worker,
+        ):
+            start = time.perf_counter()
+            await master._restart_worker(worker, "test")
+
+        assert time.perf_counter() - start < 0.5
+        start_worker.assert_awaited_once_with(worker)
+        assert worker.restart_count == 1
+
+    @pytest.mark.asyncio
+    async def test_exit_watcher_restarts_crashed_worker(self, master, restart_worker):
+        """Test a worker that exits on its own is restarted immediately."""
+        worker = _make_worker()
+        worker.process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", "raise SystemExit(3)"
+        )
+
+        await master._watch_worker_exit(worker, worker.process)
+        assert worker.restart_task is not None
+        await worker.restart_task
+
+        restart_worker.assert_awaited_once()
+        assert "code 3" in restart_worker.call_args.args[1]
+
+    @pytest.mark.asyncio
+    async def test_exit_watcher_ignores_deliberate_stop(self, master, restart_worker):
+        """Test a worker stopped by the master is not restarted."""
+        worker = _make_worker()
+        worker.process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", "pass"
+        )
+        worker.stopping = True
+
+        await master._watch_worker_exit(worker, worker.process)
+
+        assert worker.restart_task is None
+        restart_worker.assert_not_called()
+
+
+class TestPortRelease:
+    """Test port reuse after a worker exits."""
+
+    def test_time_wait_does_not_block_rebind(self, free_port):
+        """Test connections left in TIME_WAIT do not keep a port from binding."""
+        port = free_port()
+        listener = create_listen_socket(port)
+
+        client = socket.create_connection(("127.0.0.1", port))
+        connection, _ = listener.accept()
+        # The server side closes first, leaving its end in TIME_WAIT
+        connection.close()
+        client.close()
+        with pytest.raises(OSError):
+            create_listen_socket(port)
+        listener.close()
+
+        create_listen_socket(port).close()
@@ -226,6 +226,10 @@ sys.path.insert(0, "{Path(__file__).parent.parent}")
 from constants import Language
 from mcp_worker import MCPWorker
 from repository_manager import RepositoryConfig
+import pylsp_manager
+
+# Keep the worker's Jedi cache out of the real LSP_CACHE_DIR
+pylsp_manager.LSP_CACHE_DIR = Path("{Path(self.temp_dir.name) / "lsp_cache"}")
 
 # Create repository configuration
 repo_config = RepositoryConfig(
@@ -0,0 +1,116 @@
+"""
+Tests for the worker output pump.
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from worker_output import WorkerOutputPump
+
+
+async def _run_with_pump(
+    script: str, log_path: Path, tail_lines: int = 5, limit: int = 2**16
+) -> tuple[WorkerOutputPump, int]:
+    """Run a Python snippet with its output pumped and return the exit code."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=limit,
+    )
+    pump = WorkerOutputPump("test-repo", log_path, tail_lines=tail_lines)
+    pump.start(process)
+    exit_code = await asyncio.wait_for(process.wait(), timeout=10)
+    await pump.close()
+    return pump, exit_code
+
+
+class TestWorkerOutputPump:
+    """Test continuous draining of worker output."""
+
+    @pytest.mark.asyncio
+    async def test_chatty_worker_does_not_block_on_full_pipe(self):
+        """Test a worker writing far more than a pipe buffer still exits."""
+        script = (
+            "import sys\n"
+            "for i in range(10000):\n"
+            "    print(f'line {i} ' + 'x' * 40)\n"
+            "    print(f'err {i}', file=sys.stderr)\n"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "test-repo.output.log"
+            pump, exit_code = await _run_with_pump(script, log_path)
+
+            assert exit_code == 0
+            log_lines = log_path.read_text().splitlines()
+            assert len(log_lines) == 20000
+            assert "[stdout] line 9999 " + "x" * 40 in log_lines
+
+    @pytest.mark.asyncio
+    async def test_tail_keeps_most_recent_lines(self):
+        """Test the in-memory tail is bounded and keeps the newest output."""
+        script = (
+            "import sys\n"
+            "for i in range(10):\n"
+            "    print(i, flush=True)\n"
+            "print('fatal', file=sys.stderr)\n"
+            "sys.exit(3)\n"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pump, exit_code = await _run_with_pump(
+                script, Path(temp_dir) / "out.log", tail_lines=3
+            )
+
+        assert exit_code == 3
+        assert len(pump.tail) == 3
+        assert "[stderr] fatal" in pump.tail
+        assert "[stdout] 9" in pump.format_tail()
+
+    @pytest.mark.asyncio
+    async def test_overlong_line_is_dropped_and_pumping_continues(self):
+        """Test a line beyond the reader limit does not stop the pump."""
+        script = "print('a' * 5000)\nprint('after')\n"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pump, exit_code = await _run_with_pump(
+                script, Path(temp_dir) / "out.log", limit=1024
+            )
+
+        assert exit_code == 0
+        assert pump.tail[-1] == "[stdout] after"
+        assert any("exceeded output limit" in line for line in pump.tail)
+
+    @pytest.mark.asyncio
+    async def test_log_file_rotates(self):
+        """Test the output log is rotated once it reaches the size limit."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "out.log"
+            pump = WorkerOutputPump("test-repo", log_path, max_bytes=200)
+            for i in range(50):
+                pump._record("stdout", f"message {i}")
+            await pump.close()
+
+            assert log_path.exists()
+            assert Path(f"{log_path}.1").exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_rotation_keeps_logging(self):
+        """Test output is still logged after a rotation fails to rename files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "out.log"
+            pump = WorkerOutputPump("test-repo", log_path, max_bytes=200)
+            with patch("worker_output.os.replace", side_effect=OSError("busy")):
+                for i in range(20):
+                    pump._record("stdout", f"message {i}")
+            pump._record("stdout", "after rotation failed")
+            await pump.close()
+
+            logged = Path(f"{log_path}.1").read_text() + log_path.read_text()
+            assert "message 19" in logged
+            assert "after rotation failed" in logged
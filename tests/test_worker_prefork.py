@@ -0,0 +1,100 @@
+"""
+Tests for launching workers through the pre-forking zygote.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from worker_prefork import (
+    WORKER_PREFORK_ENV,
+    ForkedWorkerProcess,
+    WorkerZygote,
+    prefork_enabled,
+)
+
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+class TestPreforkEnabled:
+    """Test the environment switch for prefork mode."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("1", True), ("true", True), ("YES", True), ("0", False), ("", False)],
+    )
+    def test_env_values(self, monkeypatch, value, expected):
+        """Test which values enable prefork."""
+        monkeypatch.setenv(WORKER_PREFORK_ENV, value)
+        assert prefork_enabled() is expected
+
+
+class TestForkedWorkerProcess:
+    """Test the process handle returned for forked workers."""
+
+    @pytest.mark.asyncio
+    async def test_exit_resolves_wait_and_blocks_signals(self):
+        """Test a reported exit completes wait() and stops further signals."""
+        process = ForkedWorkerProcess(
+            pid=999999, stdout=asyncio.StreamReader(), stderr=asyncio.StreamReader()
+        )
+
+        process._set_exited(-15)
+
+        assert await process.wait() == -15
+        assert process.returncode == -15
+        with pytest.raises(ProcessLookupError):
+            process.terminate()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="needs pidfd_open")
+    async def test_exit_detected_after_pid_reuse(self):
+        """Test an exited worker is not reported alive once its PID is reused."""
+        exited = await asyncio.create_subprocess_exec(sys.executable, "-c", "pass")
+        pidfd = os.pidfd_open(exited.pid)
+        await exited.wait()
+        # Our own PID stands in for an unrelated process that reused the PID
+        process = ForkedWorkerProcess(
+            pid=os.getpid(),
+            stdout=asyncio.StreamReader(),
+            stderr=asyncio.StreamReader(),
+            pidfd=pidfd,
+        )
+
+        assert process.is_alive() is False
+        process._set_exited(-1)
+
+
+class TestWorkerZygote:
+    """Test forking real workers from a zygote."""
+
+    @pytest.mark.asyncio
+    async def test_spawn_runs_worker_main_with_own_output_pipes(self):
+        """Test forked workers run mcp_worker.main with the requested argv."""
+        env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+        zygote = WorkerZygote(sys.executable, env, REPO_ROOT)
+        preload_seconds = await zygote.start()
+        try:
+            assert preload_seconds > 0
+
+            help_worker, bad_worker = await asyncio.gather(
+                zygote.spawn(["mcp_worker.py", "--help"], limit=2**16),
+                zygote.spawn(["mcp_worker.py", "--port", "x"], limit=2**16),
+            )
+            help_output = await help_worker.stdout.read()
+            bad_output = await bad_worker.stderr.read()
+
+            assert help_worker.pid != bad_worker.pid
+            assert await asyncio.wait_for(help_worker.wait(), timeout=10) == 0
+            assert await asyncio.wait_for(bad_worker.wait(), timeout=10) == 2
+            assert b"MCP Worker Process" in help_output
+            assert b"invalid int value" in bad_output
+        finally:
+            await zygote.close()
+
+        assert zygote.is_running is False
+        with pytest.raises(RuntimeError):
+            await zygote.spawn(["mcp_worker.py", "--help"], limit=2**16)
@@ -0,0 +1,257 @@
+"""
+Tests for configuration hot-reload and rolling worker restarts in MCPMaster.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from constants import Language
+from mcp_master import WorkerProcess
+from repository_manager import RepositoryConfig
+from worker_health import ProbeResult
+
+
+def _config(name: str, port: int, description: str = "Reload test repo"):
+    return RepositoryConfig(
+        name=name,
+        workspace=f"/tmp/{name}",
+        description=description,
+        language=Language.PYTHON,
+        port=port,
+        python_path=sys.executable,
+        github_owner="test-owner",
+        github_repo=name,
+    )
+
+
+def _running_worker(config: RepositoryConfig, pid: int) -> WorkerProcess:
+    worker = WorkerProcess(repository_config=config)
+    worker.process = MagicMock(returncode=None, pid=pid)
+    return worker
+
+
+class TestReloadWorkers:
+    """Test reconciling workers with a reloaded configuration."""
+
+    @pytest.mark.asyncio
+    async def test_added_removed_and_changed_repositories(self, make_master):
+        """Test each kind of configuration change gets its own action."""
+        kept = _running_worker(_config("kept", 8101), pid=101)
+        removed = _running_worker(_config("removed", 8102), pid=102)
+        changed = _running_worker(_config("changed", 8103), pid=103)
+        master = make_master({"kept": kept, "removed": removed, "changed": changed})
+        new_changed = _config("changed", 8103, description="Updated")
+        added = _config("added", 8104)
+        master.repository_manager = MagicMock(
+            repositories={
+                "kept": _config("kept", 8101),
+                "changed": new_changed,
+                "added": added,
+            }
+        )
+
+        with (
+            patch.object(master, "_remove_worker") as remove_worker,
+            patch.object(master, "_add_worker") as add_worker,
+            patch.object(master, "rolling_restart", return_value=True) as restart,
+            patch.object(master, "initialize_repository_indexes") as index,
+        ):
+            await master.reload_workers()
+
+        remove_worker.assert_awaited_once_with(removed)
+        add_worker.assert_awaited_once_with(added)
+        restart.assert_awaited_once_with(changed, new_changed)
+        # Only the new repository needs indexing; the changed one did not move
+        index.assert_awaited_once_with([added])
+
+    @pytest.mark.asyncio
+    async def test_unchanged_configuration_is_a_no_op(self, make_master):
+        """Test a reload that changes nothing leaves workers alone."""
+        worker = _running_worker(_config("kept", 8101), pid=101)
+        master = make_master({"kept": worker})
+        master.repository_manager = MagicMock(
+            repositories={"kept": _config("kept", 8101)}
+        )
+
+        with (
+            patch.object(master, "rolling_restart") as restart,
+            patch.object(master, "initialize_repository_indexes") as index,
+        ):
+            await master.reload_workers()
+
+        restart.assert_not_called()
+        index.assert_not_called()
+        assert master.workers == {"kept": worker}
+
+    @pytest.mark.asyncio
+    async def test_removed_worker_drained_via_shutdown_endpoint(self, make_master):
+        """Test a removed repository is drained and its symbols dropped."""
+        worker = _running_worker(_config("removed", 8102), pid=102)
+        symbol_storage = MagicMock()
+        master = make_master({"removed": worker})
+        master.symbol_storage = symbol_storage
+
+        with patch.object(master, "shutdown_worker", return_value=True) as shutdown:
+            await master._remove_worker(worker)
+
+        assert "removed" not in master.workers
+        shutdown.assert_awaited_once_with(worker)
+        symbol_storage.delete_symbols_by_repository.assert_called_once_with("removed")
+
+
+class TestRollingRestart:
+    """Test replacing a worker while the old one keeps serving."""
+
+    @pytest.fixture
+    def old(self) -> WorkerProcess:
+        return _running_worker(_config("repo", 8101), pid=101)
+
+    @pytest.fixture
+    def events(self) -> list[str]:
+        return []
+
+    @pytest.fixture
+    def master(self, make_master, old, events):
+        """A master whose worker launches and stops are recorded in events."""
+        master = make_master({old.repo_name: old})
+
+        async def start_worker(replacement):
+            events.append(f"start {replacement.port}")
+            replacement.process = MagicMock(returncode=None, pid=202)
+            return True
+
+        async def stop_worker(stopped, timeout=5):
+            events.append(f"stop {stopped.process.pid}")
+            return True
+
+        with (
+            patch.object(master, "start_worker", side_effect=start_worker),
+            patch.object(master, "stop_worker", side_effect=stop_worker),
+            patch.object(master, "shutdown_worker", return_value=True),
+        ):
+            yield master
+
+    @pytest.mark.asyncio
+    async def test_replacement_ready_before_old_worker_drains(
+        self, master, old, events
+    ):
+        """Test the old worker keeps serving until the replacement is ready."""
+
+        async def wait_ready(worker):
+            events.append(f"ready {worker.process.pid}")
+            return True
+
+        new_config = _config("repo", 8101, description="Updated")
+        with patch.object(master, "_wait_worker_ready", side_effect=wait_ready):
+            assert await master.rolling_restart(old, new_config) is True
+
+        assert events == ["start 8101", "ready 202", "stop 101"]
+        assert master.workers["repo"] is not old
+        assert master.workers["repo"].repository_config == new_config
+        master.shutdown_worker.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_port_change_drains_old_port_via_shutdown(self, master, old, events):
+        """Test a worker moving ports is drained through /shutdown."""
+        with patch.object(master, "_wait_worker_ready", return_value=True):
+            assert await master.rolling_restart(old, _config("repo", 8201)) is True
+
+        assert events == ["start 8201"]
+        master.shutdown_worker.assert_awaited_once_with(old)
+        assert master.workers["repo"].port == 8201
+
+    @pytest.mark.asyncio
+    async def test_unready_replacement_is_discarded(self, master, old, events):
+        """Test a replacement that never becomes ready leaves the old worker."""
+        with patch.object(master, "_wait_worker_ready", return_value=False):
+            assert await master.rolling_restart(old) is False
+
+        assert events == ["start 8101", "stop 202"]
+        assert master.workers["repo"] is old
+
+
+class TestSharedListener:
+    """Test the listening socket the master shares between workers on a port."""
+
+    @pytest.mark.asyncio
+    async def test_worker_launched_on_master_listener(self, make_master, free_port):
+        """Test a TCP worker is handed the master's socket for its port."""
+        port = free_port()
+        worker = WorkerProcess(repository_config=_config("repo", port))
+        master = make_master({"repo": worker})
+
+        with patch(
+            "mcp_master.asyncio.create_subprocess_exec", new=AsyncMock()
+        ) as create_subprocess_exec:
+            await master._launch_worker_process(worker)
+
+        listener = master._worker_listener(port)
+        fd = listener.fileno()
+        args, kwargs = create_subprocess_exec.call_args
+        assert args[-2:] == ("--listen-fd", str(fd))
+        assert kwargs["pass_fds"] == (fd,)
+
+        master._release_listener(port)
+        assert master._worker_listener(port) is listener
+        master.workers.clear()
+        master._release_listener(port)
+        assert listener.fileno() == -1
+
+    def test_queued_connections_survive_old_worker_exit(self, make_master, free_port):
+        """Test connections queued when the old worker exits reach the replacement."""
+        port = free_port()
+        master = make_master({"repo": _running_worker(_config("repo", port), 101)})
+        listener = master._worker_listener(port)
+        old_worker = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            pass_fds=(listener.fileno(),),
+        )
+        clients = [socket.create_connection(("127.0.0.1", port)) for _ in range(3)]
+        # The replacement holds its own copy of the socket, as a worker does
+        replacement = socket.socket(fileno=os.dup(listener.fileno()))
+        try:
+            old_worker.terminate()
+            old_worker.wait(timeout=10)
+
+            replacement.settimeout(5)
+            for client in clients:
+                connection, _ = replacement.accept()
+                with connection:
+                    connection.sendall(b"ok")
+                client.settimeout(5)
+                assert client.recv(2) == b"ok"
+        finally:
+            for client in clients:
+                client.close()
+            replacement.close()
+            listener.close()
+
+
+class TestWaitWorkerReady:
+    """Test readiness polling on a port shared by two workers."""
+
+    @pytest.mark.asyncio
+    async def test_ready_answer_from_other_process_ignored(
+        self, make_master, monkeypatch
+    ):
+        """Test only the worker's own pid counts as ready."""
+        worker = _running_worker(_config("repo", 8101), pid=202)
+        master = make_master({"repo": worker})
+        probe = AsyncMock(
+            side_effect=[
+                ProbeResult(True, 0.01, 200, payload={"ready": True, "pid": 101}),
+                ProbeResult(True, 0.01, 200, payload={"ready": True, "pid": 202}),
+            ]
+        )
+        monkeypatch.setattr("mcp_master.probe_endpoint", probe)
+        monkeypatch.setattr("mcp_master.READY_POLL_INTERVAL_SECONDS", 0)
+
+        assert await master._wait_worker_ready(worker) is True
+
+        assert probe.await_count == 2
+        assert worker.ready is True
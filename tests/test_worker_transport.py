@@ -0,0 +1,154 @@
+"""
+Tests for the master-to-worker transport over TCP and Unix domain sockets.
+"""
+
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from constants import Language
+from mcp_master import MCPMaster, WorkerProcess
+from mcp_worker import create_unix_listen_socket
+from repository_manager import RepositoryConfig
+from worker_transport import (
+    WORKER_UNIX_SOCKETS_ENV,
+    WorkerTransport,
+    unix_sockets_enabled,
+    worker_socket_path,
+)
+
+
+@pytest.fixture
+def socket_dir():
+    """Short temporary directory; Unix socket paths are limited to ~100 bytes."""
+    with tempfile.TemporaryDirectory(dir="/tmp") as directory:
+        yield Path(directory)
+
+
+class TestUnixSocketsEnabled:
+    """Test the transport environment switch."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test workers use TCP unless asked otherwise."""
+        monkeypatch.delenv(WORKER_UNIX_SOCKETS_ENV, raising=False)
+        assert unix_sockets_enabled() is False
+
+    @pytest.mark.parametrize("value", ["1", "true", "YES"])
+    def test_enabled(self, monkeypatch, value):
+        """Test truthy values enable Unix socket workers."""
+        monkeypatch.setenv(WORKER_UNIX_SOCKETS_ENV, value)
+        assert unix_sockets_enabled() is True
+
+
+class TestWorkerTransport:
+    """Test shared sessions against a server on a Unix socket."""
+
+    @pytest_asyncio.fixture
+    async def unix_server(self, socket_dir):
+        """Serve /ready on a Unix socket."""
+
+        async def ready(request):
+            return web.json_response({"ready": True, "pid": os.getpid()})
+
+        app = web.Application()
+        app.router.add_get("/ready", ready)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        path = socket_dir / "repo.sock"
+        await web.UnixSite(runner, str(path)).start()
+        yield path
+        await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_requests_over_unix_socket_reuse_session(self, unix_server):
+        """Test a Unix socket worker is reached through one long-lived session."""
+        transport = WorkerTransport()
+        try:
+            session = transport.session(unix_server)
+            url = transport.base_url(8080, unix_server) + "/ready"
+            for _ in range(2):
+                async with session.get(url) as response:
+                    assert (await response.json())["pid"] == os.getpid()
+
+            assert transport.session(unix_server) is session
+            assert transport.session() is not session
+
+            await transport.discard(unix_server)
+            assert session.closed
+        finally:
+            await transport.close()
+
+    def test_base_url(self):
+        """Test TCP URLs carry the port and socket URLs do not."""
+        assert WorkerTransport.base_url(8081) == "http://localhost:8081"
+        assert WorkerTransport.base_url(8081, Path("/x.sock")) == "http://localhost"
+
+
+class TestUnixListenSocket:
+    """Test the worker's atomic Unix socket handoff."""
+
+    def test_replacement_takes_over_path(self, socket_dir):
+        """Test new connections reach the replacement once it has bound."""
+        path = str(socket_dir / "repo.sock")
+        old, old_inode = create_unix_listen_socket(path)
+        new, new_inode = create_unix_listen_socket(path)
+        try:
+            assert old_inode != new_inode
+            assert os.stat(path).st_ino == new_inode
+            assert os.listdir(socket_dir) == ["repo.sock"]
+
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(path)
+                new.settimeout(1)
+                connection, _ = new.accept()
+                connection.close()
+        finally:
+            old.close()
+            new.close()
+
+
+class TestMasterUnixSockets:
+    """Test how the master assigns Unix sockets to workers."""
+
+    def _make_master(self, make_master, gateway_port: int | None) -> MCPMaster:
+        config = RepositoryConfig(
+            name="socket-repo",
+            workspace="/tmp",
+            description="Socket test repo",
+            language=Language.PYTHON,
+            port=8765,
+            python_path=sys.executable,
+            github_owner="test-owner",
+            github_repo="socket-repo",
+        )
+        master = make_master(
+            {"socket-repo": WorkerProcess(repository_config=config)},
+            gateway_port=gateway_port,
+            unix_sockets=True,
+        )
+        # Worker URLs are built by the transport; it opens no sessions here
+        master.transport = WorkerTransport()
+        return master
+
+    def test_workers_get_socket_paths(self, make_master):
+        """Test every worker is assigned its socket path."""
+        master = self._make_master(make_master, gateway_port=8079)
+        worker = master.workers["socket-repo"]
+
+        assert worker.unix_socket == worker_socket_path("socket-repo")
+        assert master._worker_url(worker, "/ready") == "http://localhost/ready"
+
+    def test_unix_sockets_require_gateway(self, make_master):
+        """Test socket-only workers fall back to TCP without the gateway."""
+        master = self._make_master(make_master, gateway_port=None)
+        worker = master.workers["socket-repo"]
+
+        assert master.unix_sockets is False
+        assert worker.unix_socket is None
+        assert master._worker_url(worker, "/ready") == "http://localhost:8765/ready"
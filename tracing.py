@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+
+"""
+Request Tracing
+Per-request ids, latency histograms and optional span export for MCP tool
+calls and the backend calls they make (git, SQLite, LSP, GitHub).
+
+Every ``tools/call`` gets a request id that is added to log records and
+returned to the client. Tool and backend latencies are recorded in
+histograms, exposed through ``/metrics`` and summarized by ``/stats``. When
+``MCP_TRACE_FILE`` is set, finished spans are also appended to that file as
+OTLP/JSON, one export request per line, which the OpenTelemetry Collector's
+file receiver and compatible tools can read.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# Header carrying the request id between client, gateway and worker
+REQUEST_ID_HEADER = "X-Request-ID"
+# Environment variable naming the span export file; unset disables export
+TRACE_FILE_ENV = "MCP_TRACE_FILE"
+SERVICE_NAME = "github-agent"
+
+_current_span: ContextVar["Span | None"] = ContextVar("mcp_current_span", default=None)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def new_request_id() -> str:
+    """Return a new random request id."""
+    return secrets.token_hex(8)
+
+
+def current_request_id() -> str | None:
+    """Return the id of the request being handled in this context, if any."""
+    span = _current_span.get()
+    return span.request_id if span is not None else None
+
+
+class RequestIdFilter(logging.Filter):
+    """Adds ``request_id`` to log records, ``-`` outside a request."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = current_request_id() or "-"
+        return True
+
+
+@dataclass
+class Span:
+    """One timed operation within a request."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    request_id: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Return the span in OTLP/JSON form."""
+        otlp: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [
+                _otlp_attribute(key, value)
+                for key, value in {
+                    "mcp.request_id": self.request_id,
+                    **self.attributes,
+                }.items()
+            ],
+            "status": (
+                {"code": 2, "message": self.error}
+                if self.error is not None
+                else {"code": 1}
+            ),
+        }
+        if self.parent_span_id is not None:
+            otlp["parentSpanId"] = self.parent_span_id
+        return otlp
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    typed: dict[str, Any]
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+class SpanFileExporter:
+    """Appends finished spans to a file as OTLP/JSON lines."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "a", buffering=1)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Write one span."""
+        line = json.dumps(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": {
+                            "attributes": [
+                                _otlp_attribute("service.name", SERVICE_NAME),
+                                _otlp_attribute("process.pid", os.getpid()),
+                            ]
+                        },
+                        "scopeSpans": [
+                            {"scope": {"name": __name__}, "spans": [span.to_otlp()]}
+                        ],
+                    }
+                ]
+            },
+            separators=(",", ":"),
+        )
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        """Close the export file."""
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """Times requests, tools and backend calls"""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry | None = None,
+        exporter: SpanFileExporter | None = None,
+    ):
+        """Initialize the tracer.
+
+        Args:
+            registry: Registry the latency histograms are created in
+            exporter: Receives every finished span; None disables export
+        """
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.exporter = exporter
+        self.request_latency = self.registry.histogram(
+            "mcp_request_duration_seconds", "MCP request handling time", ["method"]
+        )
+        self.tool_latency = self.registry.histogram(
+            "mcp_tool_duration_seconds", "Tool call time", ["tool"]
+        )
+        self.tool_errors = self.registry.counter(
+            "mcp_tool_errors_total", "Tool calls that raised", ["tool"]
+        )
+        self.backend_latency = self.registry.histogram(
+            "mcp_backend_call_duration_seconds",
+            "Time spent in git, SQLite, LSP and GitHub calls",
+            ["backend", "operation"],
+        )
+        self.backend_errors = self.registry.counter(
+            "mcp_backend_call_errors_total",
+            "Backend calls that raised",
+            ["backend", "operation"],
+        )
+
+    @contextmanager
+    def _span(self, name: str, request_id: str | None = None) -> Iterator[Span]:
+        """Time a span nested under the current one, starting a trace if none."""
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_span_id=parent.span_id if parent is not None else None,
+            request_id=request_id
+            or (parent.request_id if parent is not None else new_request_id()),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+            if self.exporter is not None:
+                try:
+                    self.exporter.export(span)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Failed to export span {name}: {e}")
+
+    @staticmethod
+    def _seconds(span: Span) -> float:
+        return ((span.end_ns or span.start_ns) - span.start_ns) / 1e9
+
+    @contextmanager
+    def request(self, method: str, request_id: str | None = None) -> Iterator[Span]:
+        """Time one MCP request, making ``request_id`` current for its logs.
+
+        Args:
+            method: JSON-RPC method name
+            request_id: Id sent by the client or gateway; a new one if None
+        """
+        with self._span(f"mcp {method}", request_id) as span:
+            span.set_attribute("rpc.method", method)
+            try:
+                yield span
+            finally:
+                span.end_ns = time.time_ns()
+                self.request_latency.observe(self._seconds(span), method=method)
+
+    @contextmanager
+    def tool(self, name: str) -> Iterator[Span]:
+        """Time one tool call."""
+        with self._span(f"tool {name}") as span:
+            span.set_attribute("mcp.tool", name)
+            try:
+                yield span
+            except BaseException:
+                self.tool_errors.inc(tool=name)
+                raise
+            finally:
+                span.end_ns = time.time_ns()
+                self.tool_latency.observe(self._seconds(span), tool=name)
+
+    @contextmanager
+    def span(self, backend: str, operation: str, **attributes: Any) -> Iterator[Span]:
+        """Time one call into a backend such as ``git`` or ``lsp``."""
+        with self._span(f"{backend} {operation}") as span:
+            span.set_attribute("mcp.backend", backend)
+            for key, value in attributes.items():
+                span.set_attribute(key, value)
+            try:
+                yield span
+            except BaseException:
+                self.backend_errors.inc(backend=backend, operation=operation)
+                raise
+            finally:
+                span.end_ns = time.time_ns()
+                self.backend_latency.observe(
+                    self._seconds(span), backend=backend, operation=operation
+                )
+
+    def traced(self, backend: str, operation: str | None = None) -> Callable[[F], F]:
+        """Decorate a function or coroutine function to run inside a span."""
+
+        def decorator(func: F) -> F:
+            name = operation or func.__name__
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    with self.span(backend, name):
+                        return await func(*args, **kwargs)
+
+                return async_wrapper  # type: ignore[return-value]
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.span(backend, name):
+                    return func(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def stats(self) -> dict[str, Any]:
+        """Return latency summaries per request method, tool and backend call."""
+        backends: dict[str, dict[str, Any]] = {}
+        for labels, summary in self.backend_latency.summaries():
+            backends.setdefault(labels["backend"], {})[labels["operation"]] = {
+                **summary,
+                "errors": int(self.backend_errors.value(**labels)),
+            }
+        return {
+            "requests": {
+                labels["method"]: summary
+                for labels, summary in self.request_latency.summaries()
+            },
+            "tools": {
+                labels["tool"]: {
+                    **summary,
+                    "errors": int(self.tool_errors.value(**labels)),
+                }
+                for labels, summary in self.tool_latency.summaries()
+            },
+            "backends": backends,
+        }
+
+
+def _exporter_from_env() -> SpanFileExporter | None:
+    path = os.environ.get(TRACE_FILE_ENV)
+    if not path:
+        return None
+    try:
+        return SpanFileExporter(Path(path))
+    except OSError as e:
+        logger.warning(f"Span export to {path} disabled: {e}")
+        return None
+
+
+# Process-wide tracer; each worker serves one repository, so its tools and
+# backend clients share it without threading it through every constructor
+tracer = Tracer(exporter=_exporter_from_env())
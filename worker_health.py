@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+"""
+Worker Health Probing
+HTTP liveness and readiness probes plus restart backoff used by the master to
+supervise worker processes.
+
+Liveness (``/health``) answers whether a worker's event loop is still serving
+requests; a worker that keeps failing it is hung and gets restarted.
+Readiness (``/ready``) answers whether the worker should receive traffic; a
+worker that is alive but not ready is left alone.
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Probe timing
+PROBE_INTERVAL_SECONDS = 5.0
+PROBE_TIMEOUT_SECONDS = 2.0
+# A liveness probe slower than this counts as a failure even if it succeeds
+LIVENESS_LATENCY_THRESHOLD_SECONDS = 1.0
+# Consecutive liveness failures before a live process is declared hung
+LIVENESS_FAILURE_THRESHOLD = 3
+# Liveness failures are ignored this long after start unless the worker is ready
+STARTUP_GRACE_SECONDS = 60.0
+
+# Startup readiness wait
+WORKER_READY_TIMEOUT_SECONDS = 120.0
+READY_POLL_INTERVAL_SECONDS = 0.25
+
+# Restart backoff
+RESTART_BACKOFF_INITIAL_SECONDS = 1.0
+RESTART_BACKOFF_MAX_SECONDS = 300.0
+RESTART_BACKOFF_MULTIPLIER = 2.0
+# A worker that stayed up this long is considered stable and its backoff resets
+RESTART_BACKOFF_RESET_SECONDS = 600.0
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of a single HTTP probe."""
+
+    ok: bool
+    latency: float
+    status_code: int | None = None
+    error: str | None = None
+    # Decoded JSON body of a successful probe, if it returned JSON
+    payload: dict[str, Any] | None = None
+
+
+def _decode_payload(body: bytes) -> dict[str, Any] | None:
+    """Decode a probe response body, returning None if it is not a JSON object."""
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+async def probe_endpoint(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: float = PROBE_TIMEOUT_SECONDS,
+    latency_threshold: float | None = None,
+) -> ProbeResult:
+    """Issue a GET probe and classify the response.
+
+    Args:
+        session: Shared client session
+        url: Endpoint to probe
+        timeout: Seconds before the probe is abandoned
+        latency_threshold: If set, successful responses slower than this are
+            reported as failures
+
+    Returns:
+        ProbeResult describing the probe
+    """
+    start = time.perf_counter()
+    try:
+        async with session.get(
+            url, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            body = await response.read()
+            latency = time.perf_counter() - start
+            if response.status != 200:
+                return ProbeResult(
+                    False, latency, response.status, f"HTTP {response.status}"
+                )
+            if latency_threshold is not None and latency > latency_threshold:
+                return ProbeResult(
+                    False,
+                    latency,
+                    response.status,
+                    f"slow response ({latency:.2f}s > {latency_threshold:.2f}s)",
+                )
+            return ProbeResult(
+                True, latency, response.status, payload=_decode_payload(body)
+            )
+    except TimeoutError:
+        return ProbeResult(False, time.perf_counter() - start, error="timeout")
+    except aiohttp.ClientError as e:
+        return ProbeResult(False, time.perf_counter() - start, error=str(e))
+
+
+@dataclass
+class RestartBackoff:
+    """Exponential restart delay that resets after a stable run."""
+
+    initial_delay: float = RESTART_BACKOFF_INITIAL_SECONDS
+    max_delay: float = RESTART_BACKOFF_MAX_SECONDS
+    multiplier: float = RESTART_BACKOFF_MULTIPLIER
+    reset_after: float = RESTART_BACKOFF_RESET_SECONDS
+    failures: int = field(default=0, init=False)
+
+    def next_delay(self, uptime: float | None = None) -> float:
+        """Record a failure and return how long to wait before restarting.
+
+        Args:
+            uptime: Seconds the failed process was up; a long enough run
+                resets the backoff before this failure is counted
+
+        Returns:
+            Delay in seconds
+        """
+        if uptime is not None and uptime >= self.reset_after:
+            self.failures = 0
+        delay = min(self.initial_delay * self.multiplier**self.failures, self.max_delay)
+        self.failures += 1
+        return delay
+
+    def reset(self) -> None:
+        """Forget previous failures."""
+        self.failures = 0
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+"""
+Worker Output Pump
+Continuously drains a worker subprocess's stdout and stderr so a chatty worker
+can never block on a full pipe buffer.
+
+Each line is forwarded to a per-worker rotating log file and kept in a bounded
+in-memory tail that the master logs when a worker dies.
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import Protocol, TextIO
+
+logger = logging.getLogger(__name__)
+
+# Lines longer than this are dropped by the reader rather than stalling the pump
+WORKER_OUTPUT_LINE_LIMIT = 1024 * 1024
+DEFAULT_TAIL_LINES = 200
+DEFAULT_LOG_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_LOG_BACKUP_COUNT = 3
+PUMP_CLOSE_TIMEOUT_SECONDS = 5.0
+
+
+class PipedProcess(Protocol):
+    """A worker process whose output streams can be pumped."""
+
+    @property
+    def stdout(self) -> asyncio.StreamReader | None:
+        ...
+
+    @property
+    def stderr(self) -> asyncio.StreamReader | None:
+        ...
+
+
+class WorkerOutputPump:
+    """Forwards a worker's output streams to a rotating log file and a tail buffer."""
+
+    def __init__(
+        self,
+        name: str,
+        log_path: Path,
+        tail_lines: int = DEFAULT_TAIL_LINES,
+        max_bytes: int = DEFAULT_LOG_MAX_BYTES,
+        backup_count: int = DEFAULT_LOG_BACKUP_COUNT,
+    ):
+        """Initialize the pump.
+
+        Args:
+            name: Worker name used in log messages
+            log_path: File that receives every output line, rotated by size
+            tail_lines: Number of most recent lines kept in memory
+            max_bytes: Size at which the log file is rotated
+            backup_count: Number of rotated log files to keep
+        """
+        self.name = name
+        self.log_path = log_path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.tail: deque[str] = deque(maxlen=tail_lines)
+        self._tasks: list[asyncio.Task[None]] = []
+        # Opened on first output so idle workers leave no empty files behind
+        self._log_file: TextIO | None = None
+        self._log_size = 0
+
+    def start(self, process: PipedProcess) -> None:
+        """Start pumping the process's stdout and stderr pipes.
+
+        Args:
+            process: Worker process created with piped output streams
+        """
+        for stream_name, stream in (
+            ("stdout", process.stdout),
+            ("stderr", process.stderr),
+        ):
+            if stream is not None:
+                self._tasks.append(
+                    asyncio.create_task(
+                        self._pump(stream_name, stream),
+                        name=f"output-pump-{self.name}-{stream_name}",
+                    )
+                )
+
+    async def _pump(self, stream_name: str, stream: asyncio.StreamReader) -> None:
+        """Read lines from one stream until EOF."""
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # The over-long line was discarded by the reader; keep pumping
+                self._record(stream_name, "<line exceeded output limit, dropped>")
+                continue
+            if not line:
+                return
+            self._record(stream_name, line.decode(errors="replace").rstrip("\r\n"))
+
+    def _record(self, stream_name: str, text: str) -> None:
+        """Store one output line in the tail buffer and the log file."""
+        line = f"[{stream_name}] {text}"
+        self.tail.append(line)
+        try:
+            self._write_log_line(line)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Failed to write output of worker {self.name}: {e}")
+
+    def _write_log_line(self, line: str) -> None:
+        """Append a line to the log file, rotating it once it is full.
+
+        Writes go straight to a line-buffered file rather than through a
+        logging handler; building a LogRecord per line made the pump the
+        bottleneck for chatty workers.
+        """
+        if self._log_file is None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log_file = open(self.log_path, "a", encoding="utf-8", buffering=1)
+            self._log_size = self._log_file.tell()
+        data = line + "\n"
+        if self._log_size and self._log_size + len(data) > self.max_bytes:
+            self._rotate_log()
+        self._log_file.write(data)
+        self._log_size += len(data)
+
+    def _rotate_log(self) -> None:
+        """Shift ``log.N`` to ``log.N+1`` and start a fresh log file.
+
+        If the files cannot be renamed, output keeps being appended to the
+        current log file instead.
+        """
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        try:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.log_path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.log_path}.{index + 1}")
+            if self.backup_count > 0:
+                os.replace(self.log_path, f"{self.log_path}.1")
+        except OSError as e:
+            logger.debug(f"Failed to rotate output log of worker {self.name}: {e}")
+        # If opening fails, the file is opened again for the next line
+        self._log_file = open(self.log_path, "a", encoding="utf-8", buffering=1)
+        self._log_size = self._log_file.tell()
+
+    def format_tail(self) -> str:
+        """Return the buffered tail as a single newline-separated string."""
+        return "\n".join(self.tail)
+
+    async def close(self, timeout: float = PUMP_CLOSE_TIMEOUT_SECONDS) -> None:
+        """Drain remaining output, then stop the readers and close the log file.
+
+        Args:
+            timeout: Seconds to wait for the streams to reach EOF before the
+                readers are cancelled
+        """
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self._tasks.clear()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+
+"""
+Pre-forked Worker Launching
+A zygote process imports the worker modules (FastAPI, uvicorn, PyGithub, the
+tool modules) once and forks a ready-to-run child per repository, so starting
+N workers no longer pays N cold imports.
+
+The master talks to the zygote over a Unix datagram socket pair:
+- zygote -> master: {"type": "ready", "preload_seconds": ...} once imports finish
+- master -> zygote: {"type": "spawn", "id": ..., "argv": [...], "cwd": ...}
+  with the write ends of the child's stdout/stderr pipes attached, followed
+  by the worker's listening socket for TCP workers
+- zygote -> master: {"type": "spawned", "id": ..., "pid": ...} or
+  {"type": "spawn_failed", "id": ..., "error": ...}
+- zygote -> master: {"type": "exited", "pid": ..., "returncode": ...}
+- master -> zygote: {"type": "exit"} to stop the zygote; it also exits on its
+  own if the master dies
+
+Forked workers are children of the zygote, so the zygote reaps them and
+reports exits; the master wraps each one in a ForkedWorkerProcess that mirrors
+the parts of asyncio.subprocess.Process the master uses.
+
+Run as ``python worker_prefork.py <control-fd>`` to start a zygote.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import selectors
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Set to "1" or "true" to launch workers through a zygote
+WORKER_PREFORK_ENV = "MCP_WORKER_PREFORK"
+ZYGOTE_START_TIMEOUT_SECONDS = 60.0
+ZYGOTE_SPAWN_TIMEOUT_SECONDS = 10.0
+# Control messages are small JSON documents; this bounds a single datagram
+MAX_CONTROL_MESSAGE_SIZE = 64 * 1024
+# How often orphaned workers are polled once the zygote itself has gone away
+ORPHAN_POLL_INTERVAL_SECONDS = 1.0
+# How often the zygote checks that the master that started it is still alive
+PARENT_CHECK_INTERVAL_SECONDS = 1.0
+
+
+def prefork_enabled() -> bool:
+    """Return whether the environment asks for pre-forked workers."""
+    return os.environ.get(WORKER_PREFORK_ENV, "").lower() in ("1", "true", "yes")
+
+
+class ForkedWorkerProcess:
+    """Handle for a worker forked by the zygote.
+
+    Mirrors the subset of asyncio.subprocess.Process used by the master:
+    ``pid``, ``returncode``, ``stdout``, ``stderr``, ``wait()``,
+    ``send_signal()``, ``terminate()`` and ``kill()``.
+    """
+
+    def __init__(
+        self,
+        pid: int,
+        stdout: asyncio.StreamReader,
+        stderr: asyncio.StreamReader,
+        pidfd: int | None = None,
+    ):
+        self.pid = pid
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode: int | None = None
+        self._exited: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        # Refers to this process even after its PID is reused; Linux only
+        self._pidfd = pidfd
+
+    def _set_exited(self, returncode: int) -> None:
+        if self.returncode is None:
+            self.returncode = returncode
+            self._exited.set_result(returncode)
+        if self._pidfd is not None:
+            os.close(self._pidfd)
+            self._pidfd = None
+
+    def _signal(self, sig: int) -> None:
+        if self._pidfd is not None:
+            signal.pidfd_send_signal(self._pidfd, sig)
+        else:
+            os.kill(self.pid, sig)
+
+    def is_alive(self) -> bool:
+        """Return whether the worker process still exists.
+
+        Without a pidfd, a PID reused by an unrelated process after the
+        worker exited is reported as alive.
+        """
+        try:
+            self._signal(0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    async def wait(self) -> int:
+        """Wait for the worker to exit and return its exit code."""
+        return await asyncio.shield(self._exited)
+
+    def send_signal(self, sig: int) -> None:
+        if self.returncode is not None:
+            raise ProcessLookupError(f"Worker {self.pid} has already exited")
+        self._signal(sig)
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+
+# Either kind of worker process the master can supervise
+WorkerHandle = asyncio.subprocess.Process | ForkedWorkerProcess
+
+
+class WorkerZygote:
+    """Master-side controller for the zygote process."""
+
+    def __init__(self, python_executable: str, env: dict[str, str], cwd: str):
+        """Initialize the controller.
+
+        Args:
+            python_executable: Interpreter used to run the zygote
+            env: Environment inherited by the zygote and every forked worker
+            cwd: Working directory of the zygote
+        """
+        self.python_executable = python_executable
+        self.env = env
+        self.cwd = cwd
+        self.preload_seconds: float | None = None
+        self._process: asyncio.subprocess.Process | None = None
+        self._socket: socket.socket | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._ready: asyncio.Future[float] | None = None
+        self._pending: dict[int, asyncio.Future[int]] = {}
+        self._children: dict[int, ForkedWorkerProcess] = {}
+        self._early_exits: dict[int, int] = {}
+        self._next_request_id = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._reader_task is not None and not self._reader_task.done()
+
+    async def start(self, timeout: float = ZYGOTE_START_TIMEOUT_SECONDS) -> float:
+        """Start the zygote and wait until it has imported the worker modules.
+
+        Returns:
+            Seconds the zygote spent importing
+        """
+        loop = asyncio.get_running_loop()
+        master_sock, zygote_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                self.python_executable,
+                os.path.abspath(__file__),
+                str(zygote_sock.fileno()),
+                env=self.env,
+                cwd=self.cwd,
+                pass_fds=(zygote_sock.fileno(),),
+            )
+        except Exception:
+            master_sock.close()
+            raise
+        finally:
+            zygote_sock.close()
+
+        master_sock.setblocking(False)
+        self._socket = master_sock
+        self._ready = loop.create_future()
+        self._reader_task = asyncio.create_task(
+            self._serve(), name="worker-zygote-reader"
+        )
+        try:
+            self.preload_seconds = await asyncio.wait_for(
+                asyncio.shield(self._ready), timeout=timeout
+            )
+        except BaseException:
+            await self.close()
+            raise
+
+        logger.info(
+            f"Worker zygote ready (PID: {self._process.pid}, "
+            f"preloaded in {self.preload_seconds:.2f}s)"
+        )
+        return self.preload_seconds
+
+    async def spawn(
+        self,
+        argv: list[str],
+        limit: int,
+        timeout: float = ZYGOTE_SPAWN_TIMEOUT_SECONDS,
+        listener: socket.socket | None = None,
+    ) -> ForkedWorkerProcess:
+        """Fork a worker from the zygote.
+
+        Args:
+            argv: ``sys.argv`` for the worker's ``main()``
+            limit: Line length limit of the returned output stream readers
+            timeout: Seconds to wait for the zygote to report the child PID
+            listener: Listening socket the worker serves on; its descriptor
+                number in the child is appended to argv as ``--listen-fd``
+
+        Returns:
+            Handle for the forked worker
+        """
+        if not self.is_running or self._socket is None:
+            raise RuntimeError("Worker zygote is not running")
+
+        loop = asyncio.get_running_loop()
+        self._next_request_id += 1
+        request_id = self._next_request_id
+        reply: asyncio.Future[int] = loop.create_future()
+        self._pending[request_id] = reply
+
+        stdout_read, stdout_write = os.pipe()
+        stderr_read, stderr_write = os.pipe()
+        try:
+            message = json.dumps(
+                {"type": "spawn", "id": request_id, "argv": argv, "cwd": self.cwd}
+            ).encode()
+            fds = [stdout_write, stderr_write]
+            if listener is not None:
+                fds.append(listener.fileno())
+            socket.send_fds(self._socket, [message], fds)
+        except BaseException:
+            self._pending.pop(request_id, None)
+            os.close(stdout_read)
+            os.close(stderr_read)
+            raise
+        finally:
+            # Only the child keeps the write ends open, so EOF means it exited
+            os.close(stdout_write)
+            os.close(stderr_write)
+
+        try:
+            stdout = await self._open_reader(stdout_read, limit)
+            stderr = await self._open_reader(stderr_read, limit)
+            pid = await asyncio.wait_for(reply, timeout=timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+        # The zygote has not reaped the child before it reports the exit, so
+        # the PID cannot have been reused yet unless it is in _early_exits
+        pidfd = None if pid in self._early_exits else _open_pidfd(pid)
+        child = ForkedWorkerProcess(pid, stdout, stderr, pidfd)
+        self._children[pid] = child
+        # A very short-lived child can exit before its spawn reply is handled
+        if pid in self._early_exits:
+            self._reap_child(pid, self._early_exits.pop(pid))
+        return child
+
+    async def _open_reader(self, fd: int, limit: int) -> asyncio.StreamReader:
+        """Wrap a pipe read end in an asyncio StreamReader."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=limit, loop=loop)
+        pipe = os.fdopen(fd, "rb", buffering=0)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader, loop=loop), pipe
+        )
+        return reader
+
+    async def _serve(self) -> None:
+        """Dispatch control messages until the zygote process exits.
+
+        Datagram sockets never report EOF, so the zygote's exit is observed
+        through its process handle instead.
+        """
+        assert self._process is not None and self._socket is not None
+        reader = asyncio.create_task(self._read_messages(self._socket))
+        exited = asyncio.create_task(self._process.wait())
+        try:
+            await asyncio.wait([reader, exited], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (reader, exited):
+                task.cancel()
+            await asyncio.gather(reader, exited, return_exceptions=True)
+            self._drain_messages(self._socket)
+            self._on_zygote_lost()
+
+    async def _read_messages(self, sock: socket.socket) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                data = await loop.sock_recv(sock, MAX_CONTROL_MESSAGE_SIZE)
+                self._handle_message(json.loads(data))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Lost connection to worker zygote: {e}")
+
+    def _drain_messages(self, sock: socket.socket) -> None:
+        """Handle messages the zygote sent just before it exited."""
+        while True:
+            try:
+                data = sock.recv(MAX_CONTROL_MESSAGE_SIZE)
+            except (BlockingIOError, OSError):
+                return
+            try:
+                self._handle_message(json.loads(data))
+            except ValueError:
+                return
+
+    def _handle_message(self, message: dict[str, Any]) -> None:
+        kind = message.get("type")
+        if kind == "ready":
+            if self._ready is not None and not self._ready.done():
+                self._ready.set_result(message["preload_seconds"])
+        elif kind == "spawned":
+            reply = self._pending.get(message["id"])
+            if reply is not None and not reply.done():
+                reply.set_result(message["pid"])
+        elif kind == "spawn_failed":
+            reply = self._pending.get(message["id"])
+            if reply is not None and not reply.done():
+                reply.set_exception(RuntimeError(message["error"]))
+        elif kind == "exited":
+            self._reap_child(message["pid"], message["returncode"])
+
+    def _reap_child(self, pid: int, returncode: int) -> None:
+        child = self._children.pop(pid, None)
+        if child is None:
+            self._early_exits[pid] = returncode
+            return
+        child._set_exited(returncode)
+
+    def _on_zygote_lost(self) -> None:
+        """Fail outstanding requests and keep tracking orphaned workers."""
+        error = RuntimeError("Worker zygote exited")
+        if self._ready is not None and not self._ready.done():
+            self._ready.set_exception(error)
+        for reply in self._pending.values():
+            if not reply.done():
+                reply.set_exception(error)
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if self._children:
+            logger.warning(
+                f"Worker zygote exited with {len(self._children)} live workers; "
+                "polling them for exit"
+            )
+            asyncio.get_running_loop().create_task(self._watch_orphans())
+
+    async def _watch_orphans(self) -> None:
+        """Detect exits of workers whose zygote can no longer report them."""
+        while self._children:
+            await asyncio.sleep(ORPHAN_POLL_INTERVAL_SECONDS)
+            for pid, child in list(self._children.items()):
+                if not child.is_alive():
+                    # The real exit status went to init; report it as unknown
+                    self._reap_child(pid, -1)
+
+    async def close(self) -> None:
+        """Stop the zygote. Workers it already forked keep running."""
+        if self._socket is not None:
+            try:
+                _send(self._socket, {"type": "exit"})
+            except OSError as e:
+                logger.debug(f"Could not ask worker zygote to exit: {e}")
+        if self._process is not None and self._process.returncode is None:
+            try:
+                await asyncio.wait_for(self._process.wait(), timeout=5)
+            except TimeoutError:
+                self._process.kill()
+                await self._process.wait()
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+
+
+def _open_pidfd(pid: int) -> int | None:
+    """Open a pidfd for a process, or return None where they are unsupported."""
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError as e:
+        logger.debug(f"Could not open pidfd for worker {pid}: {e}")
+        return None
+
+
+def _send(sock: socket.socket, message: dict[str, Any]) -> None:
+    sock.send(json.dumps(message).encode())
+
+
+def _reap_children(sock: socket.socket) -> None:
+    """Report every child that has exited since the last SIGCHLD."""
+    while True:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        _send(
+            sock,
+            {
+                "type": "exited",
+                "pid": pid,
+                "returncode": os.waitstatus_to_exitcode(status),
+            },
+        )
+
+
+def _run_forked_worker(
+    request: dict[str, Any], fds: list[int], inherited_fds: list[int]
+) -> None:
+    """Child side of a fork: become the requested worker, never return."""
+    exit_code = 1
+    try:
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        for fd in inherited_fds:
+            os.close(fd)
+        os.dup2(fds[0], 1)
+        os.dup2(fds[1], 2)
+        for fd in fds[:2]:
+            os.close(fd)
+        os.chdir(request["cwd"])
+        sys.argv = request["argv"]
+        if len(fds) == 3:
+            sys.argv += ["--listen-fd", str(fds[2])]
+
+        import mcp_worker
+
+        try:
+            mcp_worker.main()
+            exit_code = 0
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def zygote_main(control_fd: int) -> None:
+    """Preload the worker modules, then fork workers on request."""
+    start = time.perf_counter()
+    import mcp_worker  # noqa: F401
+
+    preload_seconds = time.perf_counter() - start
+
+    sock = socket.socket(fileno=control_fd)
+    wake_read, wake_write = os.pipe()
+    os.set_blocking(wake_read, False)
+    os.set_blocking(wake_write, False)
+    signal.set_wakeup_fd(wake_write)
+    # A Python-level handler is needed for the wakeup fd to see SIGCHLD
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+    selector = selectors.DefaultSelector()
+    selector.register(sock, selectors.EVENT_READ)
+    selector.register(wake_read, selectors.EVENT_READ)
+    _send(sock, {"type": "ready", "preload_seconds": preload_seconds})
+
+    master_pid = os.getppid()
+    while True:
+        if os.getppid() != master_pid:
+            # Reparented: the master died without asking us to exit
+            return
+        for key, _ in selector.select(timeout=PARENT_CHECK_INTERVAL_SECONDS):
+            if key.fileobj == wake_read:
+                try:
+                    os.read(wake_read, 4096)
+                except BlockingIOError:
+                    pass
+                _reap_children(sock)
+                continue
+
+            try:
+                data, fds, _, _ = socket.recv_fds(sock, MAX_CONTROL_MESSAGE_SIZE, 3)
+            except InterruptedError:
+                continue
+            request = json.loads(data)
+            if request.get("type") == "exit":
+                # Workers already forked keep running
+                for fd in fds:
+                    os.close(fd)
+                return
+            if len(fds) not in (2, 3):
+                for fd in fds:
+                    os.close(fd)
+                _send(
+                    sock,
+                    {
+                        "type": "spawn_failed",
+                        "id": request.get("id"),
+                        "error": "spawn request without output pipes",
+                    },
+                )
+                continue
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            try:
+                pid = os.fork()
+            except OSError as e:
+                _send(
+                    sock,
+                    {"type": "spawn_failed", "id": request["id"], "error": str(e)},
+                )
+                pid = -1
+            if pid == 0:
+                _run_forked_worker(
+                    request,
+                    fds,
+                    [sock.fileno(), selector.fileno(), wake_read, wake_write],
+                )
+            for fd in fds:
+                os.close(fd)
+            if pid > 0:
+                _send(sock, {"type": "spawned", "id": request["id"], "pid": pid})
+
+
+if __name__ == "__main__":
+    zygote_main(int(sys.argv[1]))
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+"""
+Worker Transport
+Long-lived HTTP client sessions the master uses to talk to its workers, over
+TCP localhost or over per-worker Unix domain sockets.
+
+With Unix sockets enabled, workers listen on ``WORKER_SOCKETS_DIR/<repo>.sock``
+instead of a TCP port and clients reach them through the master's gateway. This
+skips TCP connection setup on every master-to-worker request and removes the
+dependency on free ports in the worker port range.
+
+TCP workers serve on a listening socket the master binds once per port and
+passes to every worker on that port, so a replacement worker accepts from the
+same queue as the worker it replaces.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from pathlib import Path
+
+import aiohttp
+
+from constants import WORKER_SOCKETS_DIR
+
+logger = logging.getLogger(__name__)
+
+# Environment variable enabling Unix domain socket workers
+WORKER_UNIX_SOCKETS_ENV = "MCP_WORKER_UNIX_SOCKETS"
+
+# Idle worker connections are kept this long for reuse
+WORKER_KEEPALIVE_SECONDS = 60.0
+WORKER_CONNECT_TIMEOUT_SECONDS = 5.0
+
+
+def unix_sockets_enabled() -> bool:
+    """Return whether the environment asks for Unix domain socket workers."""
+    return os.environ.get(WORKER_UNIX_SOCKETS_ENV, "").lower() in ("1", "true", "yes")
+
+
+def worker_socket_path(repo_name: str) -> Path:
+    """Return the Unix domain socket path for a repository's worker."""
+    return WORKER_SOCKETS_DIR / f"{repo_name}.sock"
+
+
+def create_listen_socket(port: int, host: str = "0.0.0.0") -> socket.socket:
+    """Bind and listen on a worker TCP port.
+
+    Connections waiting in the accept queue belong to the socket, not to a
+    process, so they survive any one worker closing its copy of it.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.listen(socket.SOMAXCONN)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class WorkerTransport:
+    """Shared client sessions for requests from the master to workers
+
+    TCP workers share one session. Each Unix socket path needs its own
+    connector, so it gets its own session, created on first use and kept
+    for the master's lifetime.
+    """
+
+    def __init__(self) -> None:
+        self._tcp_session: aiohttp.ClientSession | None = None
+        self._unix_sessions: dict[str, aiohttp.ClientSession] = {}
+
+    @staticmethod
+    def base_url(port: int, unix_socket: Path | None = None) -> str:
+        """Return the base URL for a worker's HTTP endpoints.
+
+        Args:
+            port: Worker TCP port, used when no Unix socket is given
+            unix_socket: Worker Unix socket path; the URL host is then ignored
+
+        Returns:
+            URL without a trailing slash
+        """
+        if unix_socket is not None:
+            return "http://localhost"
+        return f"http://localhost:{port}"
+
+    def session(self, unix_socket: Path | None = None) -> aiohttp.ClientSession:
+        """Return the session for a TCP worker or a Unix socket worker.
+
+        Args:
+            unix_socket: Worker Unix socket path, or None for TCP
+
+        Returns:
+            Long-lived client session; callers must not close it
+        """
+        if unix_socket is None:
+            if self._tcp_session is None or self._tcp_session.closed:
+                self._tcp_session = self._create_session(
+                    aiohttp.TCPConnector(
+                        limit=0, keepalive_timeout=WORKER_KEEPALIVE_SECONDS
+                    )
+                )
+            return self._tcp_session
+
+        key = str(unix_socket)
+        session = self._unix_sessions.get(key)
+        if session is None or session.closed:
+            session = self._create_session(
+                aiohttp.UnixConnector(
+                    path=key, limit=0, keepalive_timeout=WORKER_KEEPALIVE_SECONDS
+                )
+            )
+            self._unix_sessions[key] = session
+        return session
+
+    @staticmethod
+    def _create_session(connector: aiohttp.BaseConnector) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(
+            connector=connector,
+            # Streams to workers may stay open indefinitely, so only connecting
+            # is bounded here; callers pass per-request timeouts
+            timeout=aiohttp.ClientTimeout(
+                total=None, sock_connect=WORKER_CONNECT_TIMEOUT_SECONDS
+            ),
+        )
+
+    async def discard(self, unix_socket: Path | None) -> None:
+        """Close the session of a Unix socket worker that was removed."""
+        if unix_socket is None:
+            return
+        session = self._unix_sessions.pop(str(unix_socket), None)
+        if session is not None:
+            await session.close()
+
+    async def close(self) -> None:
+        """Close every session."""
+        sessions = list(self._unix_sessions.values())
+        if self._tcp_session is not None:
+            sessions.append(self._tcp_session)
+        self._unix_sessions.clear()
+        self._tcp_session = None
+        await asyncio.gather(
+            *(session.close() for session in sessions), return_exceptions=True
+        )